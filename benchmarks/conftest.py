@@ -0,0 +1,88 @@
+
+"""
+    Copyright (C) 2026 The University of Sydney, Australia
+
+    This program is free software; you can redistribute it and/or modify it under
+    the terms of the GNU General Public License, version 2, as published by
+    the Free Software Foundation.
+
+    This program is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+
+#
+# Benchmarks of the pyBacktrack hot paths (using the 'pytest-benchmark' plugin, installed with 'pip install pytest-benchmark').
+#
+# Run the benchmarks, and store the results as a baseline (in the '.benchmarks' directory), with:
+#
+#     pytest benchmarks --benchmark-autosave
+#
+# Then, after making changes, compare against the most recently stored baseline (failing any benchmark whose fastest run is more than 10% slower) with:
+#
+#     pytest benchmarks --benchmark-compare --benchmark-compare-fail=min:10%
+#
+# And list (and compare) the stored baselines with:
+#
+#     pytest-benchmark compare
+#
+# Benchmarks that sample grids require GMT (and the bundled grids) and are skipped if they're not available.
+#
+
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy as np
+import os.path
+import py
+import pybacktrack
+import pytest
+import shutil
+
+
+# Test data directory is inside the 'tests' directory.
+TEST_DATA_DIR = py.path.local(__file__).dirpath().dirpath('tests', 'test_data')
+
+# Skip benchmarks that sample grids (using GMT) if GMT is not installed.
+requires_gmt = pytest.mark.skipif(shutil.which('gmt') is None, reason='GMT is not installed')
+
+
+def requires_files(*filenames):
+    """
+    Skip a benchmark if any of the files (such as bundled grids) do not exist.
+    """
+    
+    missing_filenames = [filename for filename in filenames if not os.path.exists(filename)]
+    return pytest.mark.skipif(bool(missing_filenames), reason='Missing {0}'.format(', '.join(missing_filenames)))
+
+
+@pytest.fixture(scope='session')
+def lithologies():
+    return pybacktrack.read_lithologies_files([pybacktrack.PRIMARY_BUNDLE_LITHOLOGY_FILENAME, pybacktrack.EXTENDED_BUNDLE_LITHOLOGY_FILENAME])
+
+
+@pytest.fixture(scope='session')
+def well(lithologies):
+    # The Sunrise well (used by the backstrip example).
+    return pybacktrack.read_well_file(
+        str(TEST_DATA_DIR.join('sunrise_lithology.txt')),
+        lithologies,
+        lithology_column=4,
+        other_columns={'min_water_depth': 2, 'max_water_depth': 3})
+
+
+@pytest.fixture(scope='session')
+def paleo_bathymetry_points():
+    # Coarse (5 degree) global points with a random bathymetry at each of 11 times.
+    lon_lat_points = np.array(pybacktrack.generate_lon_lat_points(5.0), dtype=float)
+    random_state = np.random.RandomState(0)
+    return dict((float(time), np.column_stack((lon_lat_points, random_state.uniform(-6000.0, 0.0, len(lon_lat_points)))))
+                for time in range(11))
@@ -0,0 +1,98 @@
+
+"""
+    Copyright (C) 2026 The University of Sydney, Australia
+
+    This program is free software; you can redistribute it and/or modify it under
+    the terms of the GNU General Public License, version 2, as published by
+    the Free Software Foundation.
+
+    This program is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+
+#
+# Measure the startup time of the pyBacktrack command-line scripts.
+#
+# Each script is run (with '--help') in a new Python process several times and the fastest and median
+# wall-clock times are reported, along with the time to start Python itself (with no imports).
+#
+# For example:
+#
+#     python benchmarks/startup.py -r 10
+#
+
+import argparse
+import os.path
+import subprocess
+import sys
+import timeit
+
+
+# The command-line scripts (modules run with 'python -m').
+DEFAULT_CLI_MODULES = [
+    'pybacktrack.age_to_depth_cli',
+    'pybacktrack.stratigraphic_depth_to_age_cli',
+    'pybacktrack.util.interpolate_cli',
+    'pybacktrack.backstrip_cli',
+    'pybacktrack.backtrack_cli',
+    'pybacktrack.well_catalogue_cli',
+    'pybacktrack.dynamic_topography_cli',
+    'pybacktrack.paleo_bathymetry_cli',
+    'pybacktrack.util.static_polygon_raster_cli',
+    'pybacktrack.server_cli']
+
+# Directory containing the 'pybacktrack' package in this source tree (so it's used instead of any installed version).
+_SOURCE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def time_command(command_line, num_repeats):
+    """Run 'command_line' 'num_repeats' times and return the sorted wall-clock times (in seconds)."""
+
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(path for path in (_SOURCE_DIR, environment.get('PYTHONPATH')) if path)
+
+    times = []
+    for _ in range(num_repeats):
+        start_time = timeit.default_timer()
+        subprocess.check_call(command_line, stdout=subprocess.DEVNULL, env=environment)
+        times.append(timeit.default_timer() - start_time)
+
+    return sorted(times)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description='Measure the startup time of the pyBacktrack command-line scripts.')
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=5,
+        help='Number of times to run each script. Defaults to 5.')
+    parser.add_argument(
+        '-m', '--modules', nargs='+', default=DEFAULT_CLI_MODULES,
+        help='The command-line modules to run. Defaults to all command-line scripts.')
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        raise ValueError('Number of repeats must be at least one.')
+
+    # The time to start Python itself (which is included in the time of each script).
+    times = time_command([sys.executable, '-c', 'pass'], args.repeat)
+    print('{0:<45} min {1:7.3f}s  median {2:7.3f}s'.format('(python startup)', times[0], times[len(times) // 2]))
+
+    for module in args.modules:
+        times = time_command([sys.executable, '-m', module, '--help'], args.repeat)
+        print('{0:<45} min {1:7.3f}s  median {2:7.3f}s'.format(module, times[0], times[len(times) // 2]))
+
+
+if __name__ == '__main__':
+    main()
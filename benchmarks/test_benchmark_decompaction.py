@@ -0,0 +1,64 @@
+
+"""
+    Copyright (C) 2026 The University of Sydney, Australia
+
+    This program is free software; you can redistribute it and/or modify it under
+    the terms of the GNU General Public License, version 2, as published by
+    the Free Software Foundation.
+
+    This program is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+
+import numpy as np
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+
+def test_decompact(benchmark, well):
+    """Benchmark decompacting a well at the top age of each of its stratigraphic units."""
+    
+    decompacted_wells = benchmark(well.decompact)
+    assert len(decompacted_wells) == len(well.stratigraphic_units)
+
+
+def test_decompact_at_age(benchmark, well):
+    """Benchmark decompacting a well at a single age."""
+    
+    decompacted_well = benchmark(well.decompact, 30.0)
+    assert decompacted_well is not None
+
+
+def test_calc_decompacted_thickness(benchmark, well):
+    """Benchmark decompacting the deepest stratigraphic unit of a well at many depths."""
+    
+    stratigraphic_unit = well.stratigraphic_units[-1]
+    decompacted_depths_to_top = [float(depth) for depth in range(0, 5000, 10)]
+    
+    def calc_decompacted_thicknesses():
+        return [stratigraphic_unit.calc_decompacted_thickness(depth) for depth in decompacted_depths_to_top]
+    
+    benchmark(calc_decompacted_thicknesses)
+
+
+def test_calc_decompacted_thicknesses(benchmark, well):
+    """Benchmark decompacting the deepest stratigraphic unit of a well at many depths (together, using arrays)."""
+    
+    well_arrays = well.get_arrays()
+    decompacted_depths_to_top = np.arange(0.0, 5000.0, 10.0)
+    unit_indices = np.full(len(decompacted_depths_to_top), len(well_arrays) - 1)
+    
+    decompacted_thicknesses = benchmark(well_arrays.calc_decompacted_thicknesses, decompacted_depths_to_top, unit_indices)
+    assert len(decompacted_thicknesses) == len(decompacted_depths_to_top)
@@ -0,0 +1,75 @@
+
+"""
+    Copyright (C) 2026 The University of Sydney, Australia
+
+    This program is free software; you can redistribute it and/or modify it under
+    the terms of the GNU General Public License, version 2, as published by
+    the Free Software Foundation.
+
+    This program is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+
+from conftest import requires_gmt
+import numpy as np
+import pybacktrack
+import pybacktrack.age_to_depth as age_to_depth
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.mark.parametrize(
+    'model', [model for model, _, _ in age_to_depth.ALL_MODELS],
+    ids=[model_name for _, model_name, _ in age_to_depth.ALL_MODELS])
+def test_convert_age_to_depth(benchmark, model):
+    """Benchmark converting ocean basin ages to depths using each age-to-depth model."""
+    
+    ages = [float(age) for age in np.arange(0.0, 200.0, 0.5)]
+    
+    def convert_age_to_depth():
+        return [pybacktrack.convert_age_to_depth(age, model) for age in ages]
+    
+    benchmark(convert_age_to_depth)
+
+
+def test_sea_level_get_average_level(benchmark):
+    """Benchmark averaging sea level over many time intervals."""
+    
+    sea_level = pybacktrack.SeaLevel.create_from_bundled_model('Haq87_SealevelCurve_Longterm')
+    time_intervals = [(float(time + 1), float(time)) for time in range(0, 250)]
+    
+    def get_average_levels():
+        return [sea_level.get_average_level(begin_time, end_time) for begin_time, end_time in time_intervals]
+    
+    benchmark(get_average_levels)
+
+
+def test_estimate_beta(benchmark):
+    """Benchmark estimating the rift stretching factor (beta)."""
+    
+    beta, _ = benchmark(pybacktrack.estimate_rift_beta, 3000.0, 20000.0, 100.0)
+    assert beta > 1.0
+
+
+@requires_gmt
+def test_dynamic_topography_sample(benchmark):
+    """Benchmark sampling a bundled dynamic topography model at a location over many times."""
+    
+    dynamic_topography = pybacktrack.DynamicTopography.create_from_bundled_model('M2', 110.0, -20.0, 100.0)
+    
+    def sample():
+        return [dynamic_topography.sample(float(time)) for time in range(0, 100, 10)]
+    
+    benchmark(sample)
@@ -0,0 +1,108 @@
+
+"""
+    Copyright (C) 2026 The University of Sydney, Australia
+
+    This program is free software; you can redistribute it and/or modify it under
+    the terms of the GNU General Public License, version 2, as published by
+    the Free Software Foundation.
+
+    This program is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+
+from conftest import requires_files, requires_gmt
+import numpy as np
+import pybacktrack
+import pybacktrack.paleo_bathymetry as paleo_bathymetry
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+
+@requires_gmt
+@requires_files(pybacktrack.BUNDLE_TOTAL_SEDIMENT_THICKNESS_FILENAME)
+def test_read_grid(benchmark):
+    """Benchmark sampling a bundled grid at coarse (2 degree) global points."""
+    
+    lon_lat_points = pybacktrack.generate_lon_lat_points(2.0)
+    
+    benchmark(paleo_bathymetry._read_grid_array, lon_lat_points, pybacktrack.BUNDLE_TOTAL_SEDIMENT_THICKNESS_FILENAME)
+
+
+@requires_gmt
+@requires_files(
+    pybacktrack.BUNDLE_AGE_GRID_FILENAME,
+    pybacktrack.BUNDLE_TOPOGRAPHY_FILENAME,
+    pybacktrack.BUNDLE_TOTAL_SEDIMENT_THICKNESS_FILENAME,
+    pybacktrack.BUNDLE_CRUSTAL_THICKNESS_FILENAME)
+def test_reconstruct_backtrack_bathymetry(benchmark):
+    """Benchmark reconstructing paleo bathymetry at coarse (10 degree) global points."""
+    
+    lon_lat_points = pybacktrack.generate_lon_lat_points(10.0)
+    
+    benchmark.pedantic(pybacktrack.reconstruct_paleo_bathymetry, (lon_lat_points, 20.0), rounds=3)
+
+
+def test_reconstruct_backtrack_bathymetry_time_windows(benchmark, lithologies):
+    """Benchmark reconstructing (and backtracking) prepared grid samples through time (excludes sampling grids)."""
+    
+    lithology_components = [(pybacktrack.DEFAULT_PALEO_BATHYMETRY_LITHOLOGY_NAME, 1.0)]
+    
+    # Random oceanic and continental grid samples (with plate ID 701 and random ages, sediment thicknesses, etc).
+    random_state = np.random.RandomState(0)
+    oceanic_grid_samples = [
+        (random_state.uniform(-30.0, 30.0), random_state.uniform(-30.0, 0.0), random_state.uniform(0.0, 2000.0),
+         random_state.uniform(1000.0, 6000.0), 701, random_state.uniform(0.0, 30.0))
+        for _ in range(500)]
+    continental_grid_samples = []
+    for _ in range(100):
+        rift_start_age = random_state.uniform(5.0, 50.0)
+        continental_grid_samples.append(
+            (random_state.uniform(-30.0, 30.0), random_state.uniform(-30.0, 0.0), random_state.uniform(0.0, 3000.0),
+             random_state.uniform(0.0, 3000.0), 701, random_state.uniform(10.0, 100.0), random_state.uniform(15000.0, 35000.0),
+             rift_start_age, random_state.uniform(0.0, rift_start_age)))
+    
+    time_range = [float(time) for time in range(0, 21)]
+    oceanic_grid_samples = paleo_bathymetry._prepare_oceanic_grid_samples(
+        oceanic_grid_samples, time_range[-1], pybacktrack.AGE_TO_DEPTH_DEFAULT_MODEL, lithologies, lithology_components)
+    continental_grid_samples = paleo_bathymetry._prepare_continental_grid_samples(
+        continental_grid_samples, time_range[-1], lithologies, lithology_components, None)
+    
+    def reconstruct_backtrack_bathymetry():
+        return list(paleo_bathymetry._reconstruct_backtrack_bathymetry_time_windows(
+            None,  # no multiprocessing pool
+            oceanic_grid_samples,
+            continental_grid_samples,
+            time_range,
+            paleo_bathymetry.DEFAULT_TIMES_PER_WINDOW,
+            pybacktrack.AGE_TO_DEPTH_DEFAULT_MODEL,
+            lithologies,
+            lithology_components,
+            None,  # no dynamic topography
+            None,  # no sea levels
+            pybacktrack.BUNDLE_RECONSTRUCTION_ROTATION_FILENAMES,
+            0,  # anchor plate
+            False))
+    
+    paleo_bathymetry_list = benchmark(reconstruct_backtrack_bathymetry)
+    assert len(paleo_bathymetry_list) == len(time_range)
+
+
+def test_write_bathymetry_grids(benchmark, paleo_bathymetry_points, tmpdir):
+    """Benchmark gridding (and writing) paleo bathymetry at coarse (5 degree) global points at 11 times."""
+    
+    output_file_prefix = str(tmpdir.join('paleo_bathymetry'))
+    
+    benchmark(pybacktrack.write_paleo_bathymetry_grids, paleo_bathymetry_points, 5.0, output_file_prefix)
+    assert tmpdir.join('paleo_bathymetry_10.0.nc').check()
@@ -2,99 +2,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-#
-# Public API
-#
-
-from .backtrack import \
-    backtrack_well, \
-    write_well as write_backtrack_well, \
-    backtrack_and_write_well, \
-    DEFAULT_DECOMPACTED_COLUMNS as BACKTRACK_DEFAULT_DECOMPACTED_COLUMNS, \
-    COLUMN_AGE as BACKTRACK_COLUMN_AGE, \
-    COLUMN_DECOMPACTED_THICKNESS as BACKTRACK_COLUMN_DECOMPACTED_THICKNESS, \
-    COLUMN_DECOMPACTED_DENSITY as BACKTRACK_COLUMN_DECOMPACTED_DENSITY, \
-    COLUMN_TECTONIC_SUBSIDENCE as BACKTRACK_COLUMN_TECTONIC_SUBSIDENCE, \
-    COLUMN_WATER_DEPTH as BACKTRACK_COLUMN_WATER_DEPTH, \
-    COLUMN_COMPACTED_THICKNESS as BACKTRACK_COLUMN_COMPACTED_THICKNESS, \
-    COLUMN_LITHOLOGY as BACKTRACK_COLUMN_LITHOLOGY, \
-    COLUMN_COMPACTED_DEPTH as BACKTRACK_COLUMN_COMPACTED_DEPTH, \
-    COLUMN_DECOMPACTED_SEDIMENT_RATE as BACKTRACK_COLUMN_DECOMPACTED_SEDIMENT_RATE, \
-    COLUMN_DECOMPACTED_DEPTH as BACKTRACK_COLUMN_DECOMPACTED_DEPTH, \
-    COLUMN_DYNAMIC_TOPOGRAPHY as BACKTRACK_COLUMN_DYNAMIC_TOPOGRAPHY
-
-from .backstrip import \
-    backstrip_well, \
-    write_well as write_backstrip_well, \
-    backstrip_and_write_well, \
-    DEFAULT_DECOMPACTED_COLUMNS as BACKSTRIP_DEFAULT_DECOMPACTED_COLUMNS, \
-    COLUMN_AGE as BACKSTRIP_COLUMN_AGE, \
-    COLUMN_DECOMPACTED_THICKNESS as BACKSTRIP_COLUMN_DECOMPACTED_THICKNESS, \
-    COLUMN_DECOMPACTED_DENSITY as BACKSTRIP_COLUMN_DECOMPACTED_DENSITY, \
-    COLUMN_AVERAGE_TECTONIC_SUBSIDENCE as BACKSTRIP_COLUMN_AVERAGE_TECTONIC_SUBSIDENCE, \
-    COLUMN_MIN_TECTONIC_SUBSIDENCE as BACKSTRIP_COLUMN_MIN_TECTONIC_SUBSIDENCE, \
-    COLUMN_MAX_TECTONIC_SUBSIDENCE as BACKSTRIP_COLUMN_MAX_TECTONIC_SUBSIDENCE, \
-    COLUMN_AVERAGE_WATER_DEPTH as BACKSTRIP_COLUMN_AVERAGE_WATER_DEPTH, \
-    COLUMN_MIN_WATER_DEPTH as BACKSTRIP_COLUMN_MIN_WATER_DEPTH, \
-    COLUMN_MAX_WATER_DEPTH as BACKSTRIP_COLUMN_MAX_WATER_DEPTH, \
-    COLUMN_COMPACTED_THICKNESS as BACKSTRIP_COLUMN_COMPACTED_THICKNESS, \
-    COLUMN_LITHOLOGY as BACKSTRIP_COLUMN_LITHOLOGY, \
-    COLUMN_COMPACTED_DEPTH as BACKSTRIP_COLUMN_COMPACTED_DEPTH, \
-    COLUMN_DECOMPACTED_SEDIMENT_RATE as BACKSTRIP_COLUMN_DECOMPACTED_SEDIMENT_RATE, \
-    COLUMN_DECOMPACTED_DEPTH as BACKSTRIP_COLUMN_DECOMPACTED_DEPTH
-
-from .paleo_bathymetry import \
-    reconstruct_backtrack_bathymetry as reconstruct_paleo_bathymetry, \
-    generate_lon_lat_points, \
-    write_bathymetry_grids as write_paleo_bathymetry_grids, \
-    reconstruct_backtrack_bathymetry_and_write_grids as reconstruct_paleo_bathymetry_grids, \
-    DEFAULT_LITHOLOGY_NAME as DEFAULT_PALEO_BATHYMETRY_LITHOLOGY_NAME
-
-from .lithology import \
-    Lithology, \
-    read_lithologies_file, \
-    read_lithologies_files, \
-    create_lithology, \
-    create_lithology_from_components, \
-    DEFAULT_BASE_LITHOLOGY_NAME
-
-from .well import \
-    StratigraphicUnit, \
-    Well, \
-    DecompactedStratigraphicUnit, \
-    DecompactedWell, \
-    read_well_file, \
-    write_well_file, \
-    write_well_metadata
-
-from .age_to_depth import \
-    convert_age_to_depth, \
-    convert_age_to_depth_files, \
-    MODEL_GDH1 as AGE_TO_DEPTH_MODEL_GDH1, \
-    MODEL_CROSBY_2007 as AGE_TO_DEPTH_MODEL_CROSBY_2007, \
-    MODEL_RHCW18 as AGE_TO_DEPTH_MODEL_RHCW18, \
-    DEFAULT_MODEL as AGE_TO_DEPTH_DEFAULT_MODEL
-
-from .stratigraphic_depth_to_age import \
-    convert_stratigraphic_depth_to_age, \
-    convert_stratigraphic_depth_to_age_files
-
-from .rifting import \
-    estimate_beta as estimate_rift_beta, \
-    total_subsidence as total_rift_subsidence, \
-    syn_rift_subsidence, \
-    post_rift_subsidence
-
-from .dynamic_topography import \
-    DynamicTopography, \
-    InterpolateDynamicTopography
-
-from .sea_level import \
-    SeaLevel
-
-from .util.interpolate import \
-    read_curve_function as read_interpolate_function, \
-    interpolate_file
+import importlib as _importlib
+import sys as _sys
 
 # From bundle_data module.
 #
@@ -108,6 +17,144 @@ from .install_supplementary import install as install_supplementary
 
 from .version import __version__, VERSION
 
+#
+# Public API
+#
+# The public functions and classes are imported lazily (when first accessed) using a module '__getattr__' (PEP 562).
+# This avoids importing every module (and their dependencies such as pygplates and scipy) when only a few are needed,
+# such as when running a command-line script (eg, 'python -m pybacktrack.age_to_depth_cli').
+#
+
+# Map each public name to the module (relative to this package) containing it and its name in that module.
+_LAZY_ATTRIBUTES = {
+    # From backtrack module...
+    'backtrack_well': ('.backtrack', 'backtrack_well'),
+    'write_backtrack_well': ('.backtrack', 'write_well'),
+    'backtrack_and_write_well': ('.backtrack', 'backtrack_and_write_well'),
+    'BACKTRACK_DEFAULT_DECOMPACTED_COLUMNS': ('.backtrack', 'DEFAULT_DECOMPACTED_COLUMNS'),
+    'BACKTRACK_COLUMN_AGE': ('.backtrack', 'COLUMN_AGE'),
+    'BACKTRACK_COLUMN_DECOMPACTED_THICKNESS': ('.backtrack', 'COLUMN_DECOMPACTED_THICKNESS'),
+    'BACKTRACK_COLUMN_DECOMPACTED_DENSITY': ('.backtrack', 'COLUMN_DECOMPACTED_DENSITY'),
+    'BACKTRACK_COLUMN_TECTONIC_SUBSIDENCE': ('.backtrack', 'COLUMN_TECTONIC_SUBSIDENCE'),
+    'BACKTRACK_COLUMN_WATER_DEPTH': ('.backtrack', 'COLUMN_WATER_DEPTH'),
+    'BACKTRACK_COLUMN_COMPACTED_THICKNESS': ('.backtrack', 'COLUMN_COMPACTED_THICKNESS'),
+    'BACKTRACK_COLUMN_LITHOLOGY': ('.backtrack', 'COLUMN_LITHOLOGY'),
+    'BACKTRACK_COLUMN_COMPACTED_DEPTH': ('.backtrack', 'COLUMN_COMPACTED_DEPTH'),
+    'BACKTRACK_COLUMN_DECOMPACTED_SEDIMENT_RATE': ('.backtrack', 'COLUMN_DECOMPACTED_SEDIMENT_RATE'),
+    'BACKTRACK_COLUMN_DECOMPACTED_DEPTH': ('.backtrack', 'COLUMN_DECOMPACTED_DEPTH'),
+    'BACKTRACK_COLUMN_DYNAMIC_TOPOGRAPHY': ('.backtrack', 'COLUMN_DYNAMIC_TOPOGRAPHY'),
+    # From backstrip module...
+    'backstrip_well': ('.backstrip', 'backstrip_well'),
+    'write_backstrip_well': ('.backstrip', 'write_well'),
+    'backstrip_and_write_well': ('.backstrip', 'backstrip_and_write_well'),
+    'BACKSTRIP_DEFAULT_DECOMPACTED_COLUMNS': ('.backstrip', 'DEFAULT_DECOMPACTED_COLUMNS'),
+    'BACKSTRIP_COLUMN_AGE': ('.backstrip', 'COLUMN_AGE'),
+    'BACKSTRIP_COLUMN_DECOMPACTED_THICKNESS': ('.backstrip', 'COLUMN_DECOMPACTED_THICKNESS'),
+    'BACKSTRIP_COLUMN_DECOMPACTED_DENSITY': ('.backstrip', 'COLUMN_DECOMPACTED_DENSITY'),
+    'BACKSTRIP_COLUMN_AVERAGE_TECTONIC_SUBSIDENCE': ('.backstrip', 'COLUMN_AVERAGE_TECTONIC_SUBSIDENCE'),
+    'BACKSTRIP_COLUMN_MIN_TECTONIC_SUBSIDENCE': ('.backstrip', 'COLUMN_MIN_TECTONIC_SUBSIDENCE'),
+    'BACKSTRIP_COLUMN_MAX_TECTONIC_SUBSIDENCE': ('.backstrip', 'COLUMN_MAX_TECTONIC_SUBSIDENCE'),
+    'BACKSTRIP_COLUMN_AVERAGE_WATER_DEPTH': ('.backstrip', 'COLUMN_AVERAGE_WATER_DEPTH'),
+    'BACKSTRIP_COLUMN_MIN_WATER_DEPTH': ('.backstrip', 'COLUMN_MIN_WATER_DEPTH'),
+    'BACKSTRIP_COLUMN_MAX_WATER_DEPTH': ('.backstrip', 'COLUMN_MAX_WATER_DEPTH'),
+    'BACKSTRIP_COLUMN_COMPACTED_THICKNESS': ('.backstrip', 'COLUMN_COMPACTED_THICKNESS'),
+    'BACKSTRIP_COLUMN_LITHOLOGY': ('.backstrip', 'COLUMN_LITHOLOGY'),
+    'BACKSTRIP_COLUMN_COMPACTED_DEPTH': ('.backstrip', 'COLUMN_COMPACTED_DEPTH'),
+    'BACKSTRIP_COLUMN_DECOMPACTED_SEDIMENT_RATE': ('.backstrip', 'COLUMN_DECOMPACTED_SEDIMENT_RATE'),
+    'BACKSTRIP_COLUMN_DECOMPACTED_DEPTH': ('.backstrip', 'COLUMN_DECOMPACTED_DEPTH'),
+    # From paleo_bathymetry module...
+    'reconstruct_paleo_bathymetry': ('.paleo_bathymetry', 'reconstruct_backtrack_bathymetry'),
+    'reconstruct_paleo_bathymetry_iter': ('.paleo_bathymetry', 'reconstruct_backtrack_bathymetry_iter'),
+    'generate_lon_lat_points': ('.paleo_bathymetry', 'generate_lon_lat_points'),
+    'write_paleo_bathymetry_grids': ('.paleo_bathymetry', 'write_bathymetry_grids'),
+    'reconstruct_paleo_bathymetry_grids': ('.paleo_bathymetry', 'reconstruct_backtrack_bathymetry_and_write_grids'),
+    'DEFAULT_PALEO_BATHYMETRY_LITHOLOGY_NAME': ('.paleo_bathymetry', 'DEFAULT_LITHOLOGY_NAME'),
+    'DEFAULT_PALEO_BATHYMETRY_TIMES_PER_WINDOW': ('.paleo_bathymetry', 'DEFAULT_TIMES_PER_WINDOW'),
+    # From lithology module...
+    'Lithology': ('.lithology', 'Lithology'),
+    'read_lithologies_file': ('.lithology', 'read_lithologies_file'),
+    'read_lithologies_files': ('.lithology', 'read_lithologies_files'),
+    'create_lithology': ('.lithology', 'create_lithology'),
+    'create_lithology_from_components': ('.lithology', 'create_lithology_from_components'),
+    'DEFAULT_BASE_LITHOLOGY_NAME': ('.lithology', 'DEFAULT_BASE_LITHOLOGY_NAME'),
+    # From well module...
+    'StratigraphicUnit': ('.well', 'StratigraphicUnit'),
+    'Well': ('.well', 'Well'),
+    'WellArrays': ('.well', 'WellArrays'),
+    'DecompactedStratigraphicUnit': ('.well', 'DecompactedStratigraphicUnit'),
+    'DecompactedWell': ('.well', 'DecompactedWell'),
+    'DecompactionResult': ('.well', 'DecompactionResult'),
+    'read_well_file': ('.well', 'read_well_file'),
+    'read_well_files': ('.well', 'read_well_files'),
+    'write_well_file': ('.well', 'write_well_file'),
+    'write_well_metadata': ('.well', 'write_well_metadata'),
+    # From well_catalogue module...
+    'WellCatalogue': ('.well_catalogue', 'WellCatalogue'),
+    'write_well_catalogue': ('.well_catalogue', 'write_well_catalogue'),
+    'create_well_catalogue': ('.well_catalogue', 'create_well_catalogue'),
+    'WELL_CATALOGUE_DEFAULT_WELL_ATTRIBUTES': ('.well_catalogue', 'DEFAULT_WELL_ATTRIBUTES'),
+    # From age_to_depth module...
+    'convert_age_to_depth': ('.age_to_depth', 'convert_age_to_depth'),
+    'convert_age_to_depth_files': ('.age_to_depth', 'convert_age_to_depth_files'),
+    'AGE_TO_DEPTH_MODEL_GDH1': ('.age_to_depth', 'MODEL_GDH1'),
+    'AGE_TO_DEPTH_MODEL_CROSBY_2007': ('.age_to_depth', 'MODEL_CROSBY_2007'),
+    'AGE_TO_DEPTH_MODEL_RHCW18': ('.age_to_depth', 'MODEL_RHCW18'),
+    'AGE_TO_DEPTH_DEFAULT_MODEL': ('.age_to_depth', 'DEFAULT_MODEL'),
+    # From stratigraphic_depth_to_age module...
+    'convert_stratigraphic_depth_to_age': ('.stratigraphic_depth_to_age', 'convert_stratigraphic_depth_to_age'),
+    'convert_stratigraphic_depth_to_age_files': ('.stratigraphic_depth_to_age', 'convert_stratigraphic_depth_to_age_files'),
+    # From rifting module...
+    'estimate_rift_beta': ('.rifting', 'estimate_beta'),
+    'total_rift_subsidence': ('.rifting', 'total_subsidence'),
+    'syn_rift_subsidence': ('.rifting', 'syn_rift_subsidence'),
+    'post_rift_subsidence': ('.rifting', 'post_rift_subsidence'),
+    # From dynamic_topography module...
+    'DynamicTopography': ('.dynamic_topography', 'DynamicTopography'),
+    'InterpolateDynamicTopography': ('.dynamic_topography', 'InterpolateDynamicTopography'),
+    # From sea_level module...
+    'SeaLevel': ('.sea_level', 'SeaLevel'),
+    # From interpolate module...
+    'read_interpolate_function': ('.util.interpolate', 'read_curve_function'),
+    'interpolate_file': ('.util.interpolate', 'interpolate_file'),
+    # From server module...
+    'BacktrackServer': ('.server', 'BacktrackServer'),
+    'BacktrackClient': ('.server', 'BacktrackClient')}
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        # Not a public name, so see if it's a submodule (eg, 'pybacktrack.age_to_depth' after only 'import pybacktrack').
+        if name.startswith('__'):
+            raise AttributeError("module '{0}' has no attribute '{1}'".format(__name__, name))
+        try:
+            # Note: Importing a submodule also sets it as an attribute of this package.
+            return _importlib.import_module('.' + name, __name__)
+        except ImportError as error:
+            # Only the submodule itself not existing means there's no such attribute
+            # (an import error inside an existing submodule, such as a missing dependency, should be raised as is).
+            if getattr(error, 'name', None) != __name__ + '.' + name:
+                raise
+            raise AttributeError("module '{0}' has no attribute '{1}'".format(__name__, name))
+    
+    attribute = getattr(_importlib.import_module(module_name, __name__), attribute_name)
+    
+    # Cache the attribute so that '__getattr__()' is not called again for it.
+    globals()[name] = attribute
+    
+    return attribute
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+# Module '__getattr__' is only supported in Python 3.7 and above, so import everything now for earlier versions.
+if _sys.version_info < (3, 7):
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
+
 
 # List public interface in case client does "from pybacktrack import *".
 __all__ = [
@@ -148,10 +195,12 @@ __all__ = [
     'BACKSTRIP_COLUMN_DECOMPACTED_DEPTH',
     # From paleo_bathymetry module...
     'reconstruct_paleo_bathymetry',
+    'reconstruct_paleo_bathymetry_iter',
     'generate_lon_lat_points',
     'write_paleo_bathymetry_grids',
     'reconstruct_paleo_bathymetry_grids',
     'DEFAULT_PALEO_BATHYMETRY_LITHOLOGY_NAME',
+    'DEFAULT_PALEO_BATHYMETRY_TIMES_PER_WINDOW',
     # From lithology module...
     'Lithology',
     'read_lithologies_file',
@@ -162,11 +211,19 @@ __all__ = [
     # From well module...
     'StratigraphicUnit',
     'Well',
+    'WellArrays',
     'DecompactedStratigraphicUnit',
     'DecompactedWell',
+    'DecompactionResult',
     'read_well_file',
+    'read_well_files',
     'write_well_file',
     'write_well_metadata',
+    # From well_catalogue module...
+    'WellCatalogue',
+    'write_well_catalogue',
+    'create_well_catalogue',
+    'WELL_CATALOGUE_DEFAULT_WELL_ATTRIBUTES',
     # From age_to_depth module...
     'convert_age_to_depth',
     'convert_age_to_depth_files',
@@ -190,6 +247,9 @@ __all__ = [
     # From interpolate module...
     'read_interpolate_function',
     'interpolate_file',
+    # From server module...
+    'BacktrackServer',
+    'BacktrackClient',
     # From bundle_data module...
     'BUNDLE_SEA_LEVEL_MODELS',
     'BUNDLE_PATH',
@@ -32,9 +32,11 @@ import pybacktrack.bundle_data
 from pybacktrack.lithology import read_lithologies_file, read_lithologies_files, DEFAULT_BASE_LITHOLOGY_NAME
 from pybacktrack.sea_level import SeaLevel
 from pybacktrack.util.call_system_command import call_system_command
+from pybacktrack.util.decompacted_output import DECOMPACTED_FORMAT_PARQUET, DECOMPACTED_FORMAT_TEXT, DECOMPACTED_FORMATS, format_lithology_components, write_decompacted_columns
 import pybacktrack.version
-from pybacktrack.well import read_well_file, write_well_file, write_well_metadata
+from pybacktrack.well import DecompactionResult, _get_well_metadata, read_well_file, write_well_file
 import math
+import numpy as np
 import sys
 import warnings
 
@@ -79,9 +81,9 @@ def backstrip_well(
         Can be explicitly set to None if well site is known to be drilled to basement depth
         (and hence total sediment thickness grid should be ignored). Note that this is different
         than not specifying a filename (since that will use the default bundled total sediment thickness grid).
-    sea_level_model : string, optional
+    sea_level_model : string or :class:`pybacktrack.SeaLevel`, optional
         Used to obtain sea levels relative to present day.
-        Can be either the name of a bundled sea level model, or a sea level filename.
+        Can be either the name of a bundled sea level model, or a sea level filename, or an already loaded :class:`pybacktrack.SeaLevel`.
         Bundled sea level models include ``Haq87_SealevelCurve`` and ``Haq87_SealevelCurve_Longterm``.
     base_lithology_name : string, optional
         Lithology name of the stratigraphic unit at the base of the well (must be present in lithologies file).
@@ -109,9 +111,10 @@ def backstrip_well(
     :class:`pybacktrack.Well`
         The well read from ``well_filename``.
         It may also be amended with a base stratigraphic unit from the bottom of the well to basement.
-    list of :class:`pybacktrack.DecompactedWell`
-        The decompacted wells associated with the well.
+    :class:`pybacktrack.DecompactionResult`
+        The decompacted wells associated with the well (a sequence of :class:`pybacktrack.DecompactedWell`).
         There is one decompacted well per age, in same order (and ages) as the well units (youngest to oldest).
+        The decompacted well data is also available as columns (numpy arrays) of all ages.
     
     Raises
     ------
@@ -126,7 +129,12 @@ def backstrip_well(
     which column it should be read from.
     
     The min/max paleo water depths at each age (of decompacted wells) are added as
-    *min_water_depth* and *max_water_depth* attributes to each decompacted well returned.
+    *min_water_depth* and *max_water_depth* attributes to each decompacted well returned
+    (and are also available as the *min_water_depths* and *max_water_depths* columns).
+    
+    .. versionchanged:: 1.5
+        - Returns a :class:`pybacktrack.DecompactionResult` (instead of a list of :class:`pybacktrack.DecompactedWell`).
+        - ``lithology_filenames`` can also be already read lithologies, and ``sea_level_model`` an already loaded sea level model.
     """
     
     # Read the lithologies from one or more text files.
@@ -135,6 +143,9 @@ def backstrip_well(
     if isinstance(lithology_filenames, str if sys.version_info[0] >= 3 else basestring):  # Python 2 vs 3.
         lithology_filename = lithology_filenames
         lithologies = read_lithologies_file(lithology_filename)
+    elif isinstance(lithology_filenames, dict):
+        # The lithologies have already been read (eg, by a server that handles many wells).
+        lithologies = lithology_filenames
     else:
         # Read all the lithology files and merge their dicts.
         # Subsequently specified files override previous files in the list.
@@ -238,8 +249,9 @@ def backstrip_well(
         base_unit_lithology_components, lithologies,
         base_unit_other_attributes)
         
-    # Each decompacted well (in returned list) represents decompaction at the age of a stratigraphic unit in the well.
-    decompacted_wells = well.decompact()
+    # Each decompacted well (in returned sequence) represents decompaction at the age of a stratigraphic unit in the well.
+    # Note: All ages are decompacted together (and the decompacted wells are only created if they are accessed).
+    decompacted_wells = DecompactionResult(well)
     
     # Calculate sea level (relative to present day) for each decompaction age (unpacking of stratigraphic units)
     # that is an average over the decompacted surface layer's period of deposition.
@@ -248,11 +260,13 @@ def backstrip_well(
         sea_level = SeaLevel.create_from_model_or_bundled_model_name(sea_level_model)
         
         # The sea level (relative to present day) is integrated over the period of deposition of each
-        # stratigraphic layer (in decompacted wells) and added as a 'sea_level' attribute to each decompacted well.
-        for decompacted_well in decompacted_wells:
-            decompacted_well.sea_level = sea_level.get_average_level(
-                decompacted_well.surface_unit.bottom_age,
-                decompacted_well.surface_unit.top_age)
+        # stratigraphic layer (in decompacted wells) and stored in the 'sea_levels' column of the decompacted wells.
+        #
+        # Note: The surface unit of each decompacted well is the well unit at the same index.
+        well_arrays = decompacted_wells.well_arrays
+        decompacted_wells.sea_levels = np.array([
+            sea_level.get_average_level(surface_unit_bottom_age, surface_unit_top_age)
+            for surface_unit_bottom_age, surface_unit_top_age in zip(well_arrays.bottom_ages.tolist(), well_arrays.top_ages.tolist())])
     
     return well, decompacted_wells
 
@@ -293,7 +307,8 @@ COLUMN_COMPACTED_DEPTH = 11
 COLUMN_DECOMPACTED_SEDIMENT_RATE = 12
 COLUMN_DECOMPACTED_DEPTH = 13
 
-_DECOMPACTED_COLUMNS_DICT = {
+# Map the name of each decompacted column (as used by the '-d' command-line option) to its enumeration (eg, 'age' to COLUMN_AGE).
+DECOMPACTED_COLUMNS_BY_NAME = {
     'age': COLUMN_AGE,
     'decompacted_thickness': COLUMN_DECOMPACTED_THICKNESS,
     'decompacted_density': COLUMN_DECOMPACTED_DENSITY,
@@ -308,11 +323,12 @@ _DECOMPACTED_COLUMNS_DICT = {
     'compacted_depth': COLUMN_COMPACTED_DEPTH,
     'decompacted_sediment_rate': COLUMN_DECOMPACTED_SEDIMENT_RATE,
     'decompacted_depth': COLUMN_DECOMPACTED_DEPTH}
-_DECOMPACTED_COLUMN_NAMES_DICT = dict([(v, k) for k, v in _DECOMPACTED_COLUMNS_DICT.items()])
-_DECOMPACTED_COLUMN_NAMES = sorted(_DECOMPACTED_COLUMNS_DICT.keys())
+_DECOMPACTED_COLUMN_NAMES_DICT = dict([(v, k) for k, v in DECOMPACTED_COLUMNS_BY_NAME.items()])
+_DECOMPACTED_COLUMN_NAMES = sorted(DECOMPACTED_COLUMNS_BY_NAME.keys())
 
-_DEFAULT_DECOMPACTED_COLUMN_NAMES = ['age', 'decompacted_thickness']
-DEFAULT_DECOMPACTED_COLUMNS = [_DECOMPACTED_COLUMNS_DICT[column_name] for column_name in _DEFAULT_DECOMPACTED_COLUMN_NAMES]
+# The names (and enumerations) of the decompacted columns written by default.
+DEFAULT_DECOMPACTED_COLUMN_NAMES = ['age', 'decompacted_thickness']
+DEFAULT_DECOMPACTED_COLUMNS = [DECOMPACTED_COLUMNS_BY_NAME[column_name] for column_name in DEFAULT_DECOMPACTED_COLUMN_NAMES]
 
 
 def write_well(
@@ -320,21 +336,23 @@ def write_well(
         decompacted_wells_filename,
         well,
         well_attributes=None,
-        decompacted_columns=DEFAULT_DECOMPACTED_COLUMNS):
+        decompacted_columns=DEFAULT_DECOMPACTED_COLUMNS,
+        output_format=DECOMPACTED_FORMAT_TEXT):
     """write_backstrip_well(\
         decompacted_wells,\
         decompacted_wells_filename,\
         well,\
         well_attributes=None,\
-        decompacted_columns=pybacktrack.BACKTRACK_DEFAULT_DECOMPACTED_COLUMNS):
-    Write decompacted parameters as columns in a text file.
+        decompacted_columns=pybacktrack.BACKTRACK_DEFAULT_DECOMPACTED_COLUMNS,\
+        output_format='txt'):
+    Write decompacted parameters as columns in a text file (or optionally a CSV, Parquet or NetCDF file).
     
     Parameters
     ----------
-    decompacted_wells : sequence of :class:`pybacktrack.DecompactedWell`
+    decompacted_wells : :class:`pybacktrack.DecompactionResult`, or sequence of :class:`pybacktrack.DecompactedWell`
         The decompacted wells returned by :func:`pybacktrack.backstrip_well`.
     decompacted_wells_filename : string
-        Name of output text file.
+        Name of output file.
     well : :class:`pybacktrack.Well`
         The well to extract metadata from.
     well_attributes : dict, optional
@@ -362,6 +380,11 @@ def write_well(
         * pybacktrack.BACKSTRIP_COLUMN_COMPACTED_THICKNESS
         * pybacktrack.BACKSTRIP_COLUMN_LITHOLOGY
         * pybacktrack.BACKSTRIP_COLUMN_COMPACTED_DEPTH
+    output_format : {'txt', 'csv', 'parquet', 'nc'}, optional
+        Format of ``decompacted_wells_filename``. Defaults to a text file.
+        A CSV file contains a header row (of column names) followed by full precision values (but no metadata).
+        A Parquet file (requires the ``pyarrow`` package) stores the metadata in its schema metadata, and
+        a NetCDF file stores the metadata in global attributes (each column is a variable along the ``row`` dimension).
     
     Raises
     ------
@@ -369,6 +392,19 @@ def write_well(
         If an unrecognised value is encountered in ``decompacted_columns``.
     ValueError
         If ``pybacktrack.BACKSTRIP_COLUMN_LITHOLOGY`` is specified in ``decompacted_columns`` but is not the last column.
+    ValueError
+        If ``output_format`` is not recognised.
+    ImportError
+        If ``output_format`` is ``'parquet'`` and the ``pyarrow`` package is not installed.
+    
+    Notes
+    -----
+    ``decompacted_wells`` can also be a :class:`pybacktrack.DecompactionResult`, in which case its columns are written directly
+    (without accessing each :class:`pybacktrack.DecompactedWell`).
+    
+    .. versionchanged:: 1.5
+        - Columns are formatted together (rather than value by value), which is significantly faster for wells with many units.
+        - Added ``output_format`` argument.
     """
     
     # If 'COLUMN_LITHOLOGY' is specified then it must be the last column.
@@ -376,96 +412,99 @@ def write_well(
         decompacted_columns.index(COLUMN_LITHOLOGY) != len(decompacted_columns) - 1):
         raise ValueError('Lithology columns must be the last column in the decompacted well file.')
     
-    with open(decompacted_wells_filename, 'w') as file:
-        
-        # Write the same metadata that comes from the original well file.
-        write_well_metadata(file, well, well_attributes)
-        file.write('#\n')
-        
-        field_width = 9
-        str_format_string = '{0:<{width}}'
-        float_format_string = '{0:<{width}.3f}'
-        
-        # Write a header showing each column name.
-        column_widths = []
-        for column_index, decompacted_column in enumerate(decompacted_columns):
-            decompacted_column_name = _DECOMPACTED_COLUMN_NAMES_DICT[decompacted_column]
-            
-            if column_index == 0:
-                column_name_format_string = '# ' + str_format_string
-            else:
-                column_name_format_string = ' ' + str_format_string
-            
-            column_width = max(field_width, len(decompacted_column_name))
-            column_widths.append(column_width)
-            
-            file.write(column_name_format_string.format(decompacted_column_name, width=column_width))
-        
-        file.write('\n')
+    if isinstance(decompacted_wells, DecompactionResult):
+        decompaction_result = decompacted_wells
+    else:
+        decompaction_result = DecompactionResult.from_decompacted_wells(decompacted_wells)
+    
+    # Each column is built as an array (one value per decompacted well) and then all columns are formatted together.
+    columns = get_decompacted_columns(decompaction_result, decompacted_columns)
+    
+    # Write the same metadata that comes from the original well file.
+    write_decompacted_columns(
+        decompacted_wells_filename,
+        [_DECOMPACTED_COLUMN_NAMES_DICT[decompacted_column] for decompacted_column in decompacted_columns],
+        columns,
+        _get_well_metadata(well, well_attributes),
+        output_format)
+
+
+def get_decompacted_columns(decompaction_result, decompacted_columns):
+    """get_decompacted_columns(decompaction_result, decompacted_columns)
+    Return the values of the decompacted columns at each age of a decompaction result (the same values written by :func:`pybacktrack.write_backstrip_well`).
+    
+    Parameters
+    ----------
+    decompaction_result : :class:`pybacktrack.DecompactionResult`
+        The decompacted wells returned by :func:`pybacktrack.backstrip_well`.
+    decompacted_columns : list of column enumerations
+        The decompacted columns (eg, ``pybacktrack.BACKSTRIP_COLUMN_AGE``).
+        Use ``pybacktrack.backstrip.DECOMPACTED_COLUMNS_BY_NAME`` to convert column names (as used by the ``-d`` command-line option).
+    
+    Returns
+    -------
+    list
+        The values of each decompacted column (one value per decompacted well). Each column is a numpy array of floats,
+        except the lithology column which is a list of strings.
+    
+    Raises
+    ------
+    ValueError
+        If an unrecognised value is encountered in ``decompacted_columns``.
+    
+    Notes
+    -----
+    .. versionadded:: 1.5
+    """
+    
+    # The surface stratigraphic unit of each decompacted well (ie, at the top age of each stratigraphic unit).
+    surface_units = decompaction_result.well_arrays
+    
+    columns = []
+    for decompacted_column in decompacted_columns:
+        if decompacted_column == COLUMN_AGE:
+            column = decompaction_result.ages
+        elif decompacted_column == COLUMN_DECOMPACTED_THICKNESS:
+            column = decompaction_result.total_decompacted_thicknesses
+        elif decompacted_column == COLUMN_DECOMPACTED_DENSITY:
+            column = decompaction_result.average_decompacted_densities
+        elif decompacted_column == COLUMN_AVERAGE_TECTONIC_SUBSIDENCE:
+            min_tectonic_subsidences, max_tectonic_subsidences = decompaction_result.get_min_max_tectonic_subsidences()
+            column = (min_tectonic_subsidences + max_tectonic_subsidences) / 2.0
+        elif decompacted_column == COLUMN_MIN_TECTONIC_SUBSIDENCE:
+            column, _ = decompaction_result.get_min_max_tectonic_subsidences()
+        elif decompacted_column == COLUMN_MAX_TECTONIC_SUBSIDENCE:
+            _, column = decompaction_result.get_min_max_tectonic_subsidences()
+        elif decompacted_column == COLUMN_AVERAGE_WATER_DEPTH:
+            # Use extra attributes (min/max water depth) loaded into original well...
+            column = (surface_units.other_attributes['min_water_depth'] + surface_units.other_attributes['max_water_depth']) / 2.0
+        elif decompacted_column == COLUMN_MIN_WATER_DEPTH:
+            # Use extra attributes (min/max water depth) loaded into original well...
+            column = surface_units.other_attributes['min_water_depth']
+        elif decompacted_column == COLUMN_MAX_WATER_DEPTH:
+            # Use extra attributes (min/max water depth) loaded into original well...
+            column = surface_units.other_attributes['max_water_depth']
+        elif decompacted_column == COLUMN_COMPACTED_THICKNESS:
+            column = decompaction_result.total_compacted_thicknesses
+        elif decompacted_column == COLUMN_LITHOLOGY:
+            # The original lithology components of the surface stratigraphic unit.
+            column = format_lithology_components(surface_units.lithology_components)
+        elif decompacted_column == COLUMN_COMPACTED_DEPTH:
+            # Depth of the top of the first/surface stratigraphic unit.
+            # This matches the age (which is also the top of the first/surface stratigraphic unit).
+            column = surface_units.top_depths
+        elif decompacted_column == COLUMN_DECOMPACTED_SEDIMENT_RATE:
+            # Get sediment rate of surface stratigraphic unit.
+            column = surface_units.get_decompacted_sediment_rates()
+        elif decompacted_column == COLUMN_DECOMPACTED_DEPTH:
+            # Get fully decompacted depth (assumes overlying stratigraphic units are also fully decompacted).
+            column = surface_units.decompacted_top_depths
+        else:
+            raise ValueError('Unrecognised value for "decompacted_columns".')
         
-        # Each decompacted well (ie, at the top age of a stratigraphic unit) is written as a separate row.
-        for decompacted_well in decompacted_wells:
-            
-            for column_index, decompacted_column in enumerate(decompacted_columns):
-                if column_index == 0:
-                    # Extra space to account for '#' in header.
-                    column_float_format_string = '  ' + float_format_string
-                    column_str_format_string = '  ' + str_format_string
-                else:
-                    column_float_format_string = ' ' + float_format_string
-                    column_str_format_string = ' ' + str_format_string
-                column_width = column_widths[column_index]
-                
-                if decompacted_column == COLUMN_AGE:
-                    column_str = column_float_format_string.format(decompacted_well.get_age(), width=column_width)
-                elif decompacted_column == COLUMN_DECOMPACTED_THICKNESS:
-                    column_str = column_float_format_string.format(decompacted_well.total_decompacted_thickness, width=column_width)
-                elif decompacted_column == COLUMN_DECOMPACTED_DENSITY:
-                    average_decompacted_density = decompacted_well.get_average_decompacted_density()
-                    column_str = column_float_format_string.format(average_decompacted_density, width=column_width)
-                elif decompacted_column == COLUMN_AVERAGE_TECTONIC_SUBSIDENCE:
-                    min_tectonic_subsidence, max_tectonic_subsidence = decompacted_well.get_min_max_tectonic_subsidence()
-                    average_tectonic_subsidence = (min_tectonic_subsidence + max_tectonic_subsidence) / 2.0
-                    column_str = column_float_format_string.format(average_tectonic_subsidence, width=column_width)
-                elif decompacted_column == COLUMN_MIN_TECTONIC_SUBSIDENCE:
-                    min_tectonic_subsidence, max_tectonic_subsidence = decompacted_well.get_min_max_tectonic_subsidence()
-                    column_str = column_float_format_string.format(min_tectonic_subsidence, width=column_width)
-                elif decompacted_column == COLUMN_MAX_TECTONIC_SUBSIDENCE:
-                    min_tectonic_subsidence, max_tectonic_subsidence = decompacted_well.get_min_max_tectonic_subsidence()
-                    column_str = column_float_format_string.format(max_tectonic_subsidence, width=column_width)
-                elif decompacted_column == COLUMN_AVERAGE_WATER_DEPTH:
-                    # Use extra attributes (min/max water depth) loaded into original well...
-                    average_water_depth = (decompacted_well.surface_unit.min_water_depth + decompacted_well.surface_unit.max_water_depth) / 2.0
-                    column_str = column_float_format_string.format(average_water_depth, width=column_width)
-                elif decompacted_column == COLUMN_MIN_WATER_DEPTH:
-                    # Use extra attributes (min/max water depth) loaded into original well...
-                    column_str = column_float_format_string.format(decompacted_well.surface_unit.min_water_depth, width=column_width)
-                elif decompacted_column == COLUMN_MAX_WATER_DEPTH:
-                    # Use extra attributes (min/max water depth) loaded into original well...
-                    column_str = column_float_format_string.format(decompacted_well.surface_unit.max_water_depth, width=column_width)
-                elif decompacted_column == COLUMN_COMPACTED_THICKNESS:
-                    column_str = column_float_format_string.format(decompacted_well.total_compacted_thickness, width=column_width)
-                elif decompacted_column == COLUMN_LITHOLOGY:
-                    # Write the original lithology components of the surface stratigraphic unit.
-                    lithology_string = ''.join('{0:<15} {1:<10.2f} '.format(lithology_name, fraction)
-                                               for lithology_name, fraction in decompacted_well.surface_unit.lithology_components)
-                    column_str = column_str_format_string.format(lithology_string, width=column_width)
-                elif decompacted_column == COLUMN_COMPACTED_DEPTH:
-                    # Depth of the top of the first/surface stratigraphic unit.
-                    # This matches the age (which is also the top of the first/surface stratigraphic unit).
-                    column_str = column_float_format_string.format(decompacted_well.surface_unit.top_depth, width=column_width)
-                elif decompacted_column == COLUMN_DECOMPACTED_SEDIMENT_RATE:
-                    # Get sediment rate of surface stratigraphic unit.
-                    column_str = column_float_format_string.format(decompacted_well.surface_unit.get_decompacted_sediment_rate(), width=column_width)
-                elif decompacted_column == COLUMN_DECOMPACTED_DEPTH:
-                    # Get fully decompacted depth (assumes overlying stratigraphic units are also fully decompacted).
-                    column_str = column_float_format_string.format(decompacted_well.surface_unit.decompacted_top_depth, width=column_width)
-                else:
-                    raise ValueError('Unrecognised value for "decompacted_columns".')
-                
-                file.write(column_str)
-            
-            file.write('\n')
+        columns.append(column)
+    
+    return columns
 
 
 def backstrip_and_write_well(
@@ -482,7 +521,8 @@ def backstrip_and_write_well(
         well_min_water_depth_column=2,
         well_max_water_depth_column=3,
         well_lithology_column=4,
-        ammended_well_output_filename=None):
+        ammended_well_output_filename=None,
+        decompacted_output_format=DECOMPACTED_FORMAT_TEXT):
     # Adding function signature on first line of docstring otherwise Sphinx autodoc will print out
     # the expanded values of the bundle filenames.
     """backstrip_and_write_well(\
@@ -499,7 +539,8 @@ def backstrip_and_write_well(
         well_min_water_depth_column=2,\
         well_max_water_depth_column=3,\
         well_lithology_column=4,\
-        ammended_well_output_filename=None)
+        ammended_well_output_filename=None,\
+        decompacted_output_format='txt')
     Same as :func:`pybacktrack.backstrip_well` but also writes decompacted results to a text file.
     
     Also optionally write amended well data (ie, including extra stratigraphic base unit from well bottom to ocean basement)
@@ -511,8 +552,10 @@ def backstrip_and_write_well(
         Name of text file to write decompacted results to.
     well_filename : string
         Name of well text file.
-    lithology_filenames: list of string, optional
+    lithology_filenames: list of string or dict, optional
         One or more text files containing lithologies.
+        Can also be a dict mapping lithology names to :class:`pybacktrack.Lithology` objects
+        (as returned by :func:`pybacktrack.read_lithologies_files`) if the lithologies have already been read.
     total_sediment_thickness_filename : string, optional
         Total sediment thickness filename.
         Used to obtain total sediment thickness at well location.
@@ -562,6 +605,8 @@ def backstrip_and_write_well(
         The column of well file containing lithology(s). Defaults to 4.
     ammended_well_output_filename: string, optional
         Amended well data filename. Useful if an extra stratigraphic base unit is added from well bottom to ocean basement.
+    decompacted_output_format : {'txt', 'csv', 'parquet', 'nc'}, optional
+        Format of ``decompacted_output_filename`` (see :func:`pybacktrack.write_backstrip_well`). Defaults to a text file.
     
     Raises
     ------
@@ -577,6 +622,9 @@ def backstrip_and_write_well(
     
     The min/max paleo water depths at each age (of decompacted wells) are added as
     *min_water_depth* and *max_water_depth* attributes to each decompacted well returned.
+    
+    .. versionchanged:: 1.5
+        - Added ``decompacted_output_format`` argument.
     """
     
     # Decompact the well.
@@ -612,7 +660,8 @@ def backstrip_and_write_well(
         well,
         # Attributes of well object to write to file as metadata...
         well_attributes,
-        decompacted_columns)
+        decompacted_columns,
+        decompacted_output_format)
 
 
 #
@@ -787,14 +836,21 @@ def main():
              'Defaults to 0 1 2 3 4.')
     
     parser.add_argument(
-        '-d', '--decompacted_columns', type=str, nargs='+', default=_DEFAULT_DECOMPACTED_COLUMN_NAMES,
+        '-d', '--decompacted_columns', type=str, nargs='+', default=DEFAULT_DECOMPACTED_COLUMN_NAMES,
         metavar='decompacted_column_name',
         help='The columns to output in the decompacted file. '
              'Choices include {0}. '
              'Age has units Ma. Density has units kg/m3. Thickness/subsidence/depth have units metres. '
              'Defaults to "{1}".'.format(
                  ', '.join(_DECOMPACTED_COLUMN_NAMES),
-                 ' '.join(_DEFAULT_DECOMPACTED_COLUMN_NAMES)))
+                 ' '.join(DEFAULT_DECOMPACTED_COLUMN_NAMES)))
+    
+    parser.add_argument(
+        '--decompacted_output_format', type=str, default=DECOMPACTED_FORMAT_TEXT, choices=DECOMPACTED_FORMATS,
+        help='The format of the decompacted output file. '
+             'Choices include {0}. The "{1}" format requires the "pyarrow" package. '
+             'Defaults to "{2}" (a text file).'.format(
+                 ', '.join(DECOMPACTED_FORMATS), DECOMPACTED_FORMAT_PARQUET, DECOMPACTED_FORMAT_TEXT))
     
     parser.add_argument(
         '-b', '--base_lithology_name', type=str, default=DEFAULT_BASE_LITHOLOGY_NAME,
@@ -860,7 +916,7 @@ def main():
     try:
         decompacted_columns = []
         for column_name in args.decompacted_columns:
-            decompacted_columns.append(_DECOMPACTED_COLUMNS_DICT[column_name])
+            decompacted_columns.append(DECOMPACTED_COLUMNS_BY_NAME[column_name])
     except KeyError:
         raise argparse.ArgumentTypeError("%s is not a valid decompacted column name" % column_name)
     
@@ -916,7 +972,8 @@ def main():
         well,
         # Attributes of well object to write to file as metadata...
         well_attributes,
-        decompacted_columns)
+        decompacted_columns,
+        args.decompacted_output_format)
 
 
 if __name__ == '__main__':
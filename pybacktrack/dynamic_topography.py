@@ -33,6 +33,7 @@ import numpy as np
 import os.path
 import pybacktrack.bundle_data
 from pybacktrack.util.call_system_command import call_system_command
+from pybacktrack.util.static_polygon_raster import partition_points
 import pygplates
 import sys
 import warnings
@@ -69,10 +70,10 @@ class DynamicTopography(object):
         ----------
         grid_list_filename : str
             The filename of the grid list file.
-        static_polygon_filename : str
-            The filename of the static polygons file.
-        rotation_filenames : list of str
-            The list of rotation filenames.
+        static_polygon_filename : str or pygplates.FeatureCollection
+            The filename of the static polygons file (or the already loaded static polygons).
+        rotation_filenames : list of str or pygplates.RotationModel
+            The list of rotation filenames (or the already loaded rotation model).
         longitude : float or list of float
             Longitude of the point location, or list of longitudes (if multiple point locations).
         latitude : float or list of float
@@ -110,6 +111,9 @@ class DynamicTopography(object):
 
            - Added ability to specify a list of point locations (as an alternative to specifying a single location).
            - Raises ``ValueError`` if there's no present day grid or if any age is negative.
+        
+        .. versionchanged:: 1.5
+           The static polygons and rotations can also be already loaded (eg, to avoid loading them for each well).
         """
         
         # For interpolating dynamic topography grids at reconstructed locations.
@@ -117,9 +121,6 @@ class DynamicTopography(object):
 
         # Rotation model for reconstructing locations.
         self.rotation_model = pygplates.RotationModel(rotation_filenames)
-        
-        # Find the plate ID of the static polygon containing the location (or zero if not in any plates).
-        plate_partitioner = pygplates.PlatePartitioner(static_polygon_filename, self.rotation_model)
 
         # See if we've been provided a single location or a sequence of locations (by seeing if we can iterate over longitude or not).
         try:
@@ -177,24 +178,21 @@ class DynamicTopography(object):
                 # Turn into a sequence of ages (a sequence containing a single age).
                 self._ages = [age]
 
-        self.reconstruction_plate_id =  []
-
         # Assign a plate ID to each location (and optionally an age if not already provided).
-        for point in self._locations:
-            partitioning_plate = plate_partitioner.partition_point(point)
-            if partitioning_plate:
-                reconstruction_plate_id = partitioning_plate.get_feature().get_reconstruction_plate_id()
-            else:
-                reconstruction_plate_id = 0
-            self.reconstruction_plate_id.append(reconstruction_plate_id)
-        
-            # Use the age of the containing static polygon if age not provided (eg, if outside age grid).
-            if age is None:
-                if partitioning_plate:
-                    time_of_appearance, _ = partitioning_plate.get_feature().get_valid_time()
-                else:
-                    time_of_appearance = 0.0
-                self._ages.append(time_of_appearance)
+        #
+        # Find the plate ID of the static polygon containing each location (or zero if not in any plates).
+        # This uses a cached raster of the static polygons (if available) to avoid partitioning most locations exactly.
+        reconstruction_plate_ids, times_of_appearance, _ = partition_points(
+            static_polygon_filename,
+            rotation_filenames,
+            [point.to_lat_lon()[1] for point in self._locations],
+            [point.to_lat_lon()[0] for point in self._locations])
+        self.reconstruction_plate_id = [int(reconstruction_plate_id) for reconstruction_plate_id in reconstruction_plate_ids]
+        
+        # Use the age of the containing static polygon if age not provided (eg, if outside age grid).
+        # Note: Locations not in any static polygon get an age of zero.
+        if age is None:
+            self._ages = [float(time_of_appearance) for time_of_appearance in times_of_appearance]
         
         if any(a < 0 for a in self._ages):
             raise ValueError('Dynamic topography: age values must not be negative')
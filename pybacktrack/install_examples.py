@@ -17,8 +17,6 @@
 #
 
 import os.path
-import pkg_resources
-from distutils import dir_util
 
 
 def install(
@@ -30,6 +28,11 @@ def install(
     is chosen to make collision less likely / problematic.
     """
 
+    # Note: These are imported here (rather than at the top of this module) since they are slow to import and
+    #       this module is imported whenever pybacktrack is imported.
+    import pkg_resources
+    from distutils import dir_util
+
     # The example data source and destination paths.
     example_data_src_path = pkg_resources.resource_filename('pybacktrack', 'example_data')
     example_data_dest_path = os.path.join(dest_path, 'example_data')
@@ -17,8 +17,6 @@
 #
 
 import os.path
-import pkg_resources
-from distutils import dir_util
 
 
 def install(
@@ -32,6 +30,11 @@ def install(
     is chosen to make collision less likely / problematic.
     """
 
+    # Note: These are imported here (rather than at the top of this module) since they are slow to import and
+    #       this module is imported whenever pybacktrack is imported.
+    import pkg_resources
+    from distutils import dir_util
+
     supplementary_src_path = pkg_resources.resource_filename('pybacktrack', 'supplementary')
     supplementary_dest_path = dest_path
 
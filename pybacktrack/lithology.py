@@ -220,17 +220,44 @@ def create_lithology_from_components(components, lithologies):
         If all fractions do not add up to 1.0.
     KeyError
         If a lithology name is not found in ``lithologies``.
+    
+    Notes
+    -----
+    Combined lithologies are cached, so the same components (with the same lithology densities, surface porosities and
+    porosity decays) return the same combined lithology object. The returned lithology is shared and hence cannot be
+    modified (its attributes are read-only).
+    
+    .. versionchanged:: 1.5
+        - Returns a shared (read-only) combined lithology for the same components and component lithologies.
     """
     
+    # Note: Convert to a list in case 'components' is an iterator (since it's iterated over more than once).
+    components = list(components)
+    
+    component_lithologies = []
+    for name, _ in components:
+        lithology = lithologies.get(name)
+        if not lithology:
+            raise KeyError('Lithology name "{0}" does not exist in lithology dictionary.'.format(name))
+        component_lithologies.append(lithology)
+    
+    # Look up the combined lithology in the cache.
+    #
+    # The key contains the component lithology values (rather than the lithology objects) so that modifying a lithology
+    # (in the 'lithologies' dictionary) is not hidden by the cache, and re-reading the same lithologies still uses the cache.
+    cache_key = tuple(
+        (name, fraction, lithology.density, lithology.surface_porosity, lithology.porosity_decay)
+        for (name, fraction), lithology in zip(components, component_lithologies))
+    try:
+        return _combined_lithology_cache[cache_key]
+    except KeyError:
+        pass
+    
     density = 0
     surface_porosity = 0
     porosity_decay = 0
     total_fraction = 0
-    for name, fraction in components:
-        lithology = lithologies.get(name)
-        if not lithology:
-            raise KeyError('Lithology name "{0}" does not exist in lithology dictionary.'.format(name))
-        
+    for (name, fraction), lithology in zip(components, component_lithologies):
         density += fraction * lithology.density
         surface_porosity += fraction * lithology.surface_porosity
         porosity_decay += fraction * lithology.porosity_decay
@@ -240,7 +267,35 @@ def create_lithology_from_components(components, lithologies):
     if total_fraction < 1 - 1e-6 or total_fraction > 1 + 1e-6:
         raise ValueError('Lithology fractions do not add up to one for {0}.'.format(components))
     
-    return Lithology(density, surface_porosity, porosity_decay)
+    combined_lithology = _SharedLithology(density, surface_porosity, porosity_decay)
+    
+    # Keep the cache bounded (simply start again when it's full).
+    if len(_combined_lithology_cache) >= _MAX_COMBINED_LITHOLOGY_CACHE_SIZE:
+        _combined_lithology_cache.clear()
+    _combined_lithology_cache[cache_key] = combined_lithology
+    
+    return combined_lithology
+
+
+class _SharedLithology(Lithology):
+    # A combined lithology that is shared (via the cache in 'create_lithology_from_components()') and hence read-only.
+    
+    def __init__(self, density, surface_porosity, porosity_decay):
+        # Bypass '__setattr__()'.
+        self.__dict__.update(density=density, surface_porosity=surface_porosity, porosity_decay=porosity_decay)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError('Cannot modify a shared combined lithology (create a new pybacktrack.Lithology instead).')
+    
+    def __delattr__(self, name):
+        raise AttributeError('Cannot modify a shared combined lithology (create a new pybacktrack.Lithology instead).')
+
+
+# Cache of combined lithologies.
+#
+# Maps a tuple of (name, fraction, density, surface porosity, porosity decay) for each component to the combined lithology.
+_combined_lithology_cache = {}
+_MAX_COMBINED_LITHOLOGY_CACHE_SIZE = 4096
 
 
 #################################################################
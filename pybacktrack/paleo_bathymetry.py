@@ -20,6 +20,8 @@
 
 :func:`pybacktrack.reconstruct_paleo_bathymetry` reconstructs and backtracks sediment-covered crust through time to get paleo bathymetry.
 
+:func:`pybacktrack.reconstruct_paleo_bathymetry_iter` is the same but generates paleo bathymetry one time at a time (to limit memory usage).
+
 :func:`pybacktrack.generate_lon_lat_points` generates a global grid of points uniformly spaced in longitude and latitude.
 
 :func:`pybacktrack.write_paleo_bathymetry_grids` grid paleo bathymetry into NetCDF grids files.
@@ -35,7 +37,6 @@ from __future__ import print_function
 from functools import partial
 import itertools
 import math
-import multiprocessing
 import numpy as np
 import os
 import os.path
@@ -45,13 +46,27 @@ from pybacktrack.dynamic_topography import DynamicTopography
 from pybacktrack.lithology import read_lithologies_files
 import pybacktrack.rifting as rifting
 from pybacktrack.sea_level import SeaLevel
+from pybacktrack.util.cache import get_cache_directory, get_cache_key, get_file_signature, load_arrays as load_cached_arrays, save_arrays as save_cached_arrays
 from pybacktrack.util.call_system_command import call_system_command
+from pybacktrack.util.checkpoint import Checkpoint
+from pybacktrack.util.gridding import NearNeighborGridder, write_netcdf_grid, write_netcdf_grid_cube
+from pybacktrack.util.profiling import add_stage_time, count, profiling, stage, timer
+from pybacktrack.util.spatial_index import GeometryVertexIndex, LatLonCells, lon_lat_to_xyz
+from pybacktrack.util.static_polygon_raster import get_static_polygon_raster, partition_points_exactly
+from pybacktrack.util.worker_pool import DEFAULT_WORKER_POOL_BACKEND, WORKER_POOL_BACKENDS, WorkerPool, get_num_cpus, use_worker_pool
+from pybacktrack.util.xyz import XYZ_FORMAT_TEXT, XYZ_FORMATS, write_xyz
 import pybacktrack.version
 from pybacktrack.well import Well
 import pygplates
 import sys
 import warnings
 
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # Python < 3.8 (paleo bathymetry is then transferred from pool processes to the main process by pickling).
+    shared_memory = None
+
 
 # Default name of the lithology of all sediment (the total sediment thickness at all sediment locations
 # consists of a single lithology). This lithology is the average of the ocean floor sediment.
@@ -59,6 +74,25 @@ import warnings
 # below the CCD where shale dominates.
 DEFAULT_LITHOLOGY_NAME = 'Average_ocean_floor_sediment'
 
+# Default number of times reconstructed/backtracked together by 'reconstruct_backtrack_bathymetry_iter()'.
+# Only the paleo bathymetry at this many times is held in memory at once.
+DEFAULT_TIMES_PER_WINDOW = 10
+
+# Names of the checkpoints (see 'pybacktrack.util.checkpoint.Checkpoint') of the grid samples
+# after assigning plate IDs (and excluding near trenches), and after calculating their time-independent parameters.
+_GRID_SAMPLES_CHECKPOINT_NAME = 'paleo_bathymetry_grid_samples'
+_PREPARED_GRID_SAMPLES_CHECKPOINT_NAME = 'paleo_bathymetry_prepared_grid_samples'
+
+# Name of the default checkpoint directory (in the pybacktrack cache directory) used by the command-line script.
+_CHECKPOINT_DIRECTORY_NAME = 'checkpoints'
+
+# Gridders used to grid the reconstructed paleo bathymetry points (at each time) into NetCDF grids.
+GRIDDER_NATIVE = 'native'  # in-process (see 'pybacktrack.util.gridding')
+GRIDDER_GMT = 'gmt'  # GMT 'nearneighbor' and 'grdmath' (requires GMT to be installed)
+GRIDDERS = (GRIDDER_NATIVE, GRIDDER_GMT)
+
+DEFAULT_GRIDDER = GRIDDER_NATIVE
+
 # Default grid spacing (in degrees) when generating uniform lon/lat spacing of sample points.
 DEFAULT_GRID_SPACING_DEGREES = 1.0
 DEFAULT_GRID_SPACING_MINUTES = 60.0 * DEFAULT_GRID_SPACING_DEGREES
@@ -71,6 +105,10 @@ DEFAULT_GRID_SPACING_MINUTES = 60.0 * DEFAULT_GRID_SPACING_DEGREES
 #       is getting too large and consequently pre-rift crustal thickness too close to the lithospheric thickness.
 _MAX_TECTONIC_SUBSIDENCE_RIFTING_RESIDUAL_ERROR = 10.0
 
+# Preparing a continental grid sample (which estimates its rifting stretching factor) costs roughly this many times
+# more than preparing an oceanic grid sample. This is used to divide both into groups (tasks) of roughly equal cost.
+_CONTINENTAL_PREPARATION_RELATIVE_COST = 7.0
+
 # There's a static polygon (from the static polygons file) in the W Pacific that is stationary through time.
 # This is because the age grid determines the age on oceanic crust (static polygons only determine plate ID) and
 # in this region the age grid suffers from an interpolation artefact (in the age grid generation process) where it
@@ -85,6 +123,27 @@ _MAX_TECTONIC_SUBSIDENCE_RIFTING_RESIDUAL_ERROR = 10.0
 # - 40 Myr removes most of it (a small sliver remains) without creating issues in the Atlantic.
 _MAX_AGE_GRID_ALLOWED_TO_EXCEED_OCEANIC_STATIC_POLYGON_AGE = 40.0
 
+# The trench exclusion regions (near trenches) are rasterised (and cached on disk) at this resolution (in degrees).
+# Grid samples are then excluded by looking up the raster, and only those in cells straddling the boundary of an
+# exclusion region need to be tested exactly against the trenches.
+_TRENCH_EXCLUSION_RASTER_RESOLUTION_DEGREES = 0.1
+
+# The trench exclusion raster takes a while to create (although it only needs to be created once, and is then cached).
+# So only create it if there are at least this many grid samples (otherwise it's faster to test the grid samples exactly).
+# Once created (and cached) it is used regardless of the number of grid samples.
+_MIN_GRID_SAMPLES_TO_CREATE_TRENCH_EXCLUSION_RASTER = 1000000
+
+# The states of cells in the trench exclusion raster.
+_TRENCH_EXCLUSION_RASTER_INCLUDED = 0  # all points in cell are included (not near trenches)
+_TRENCH_EXCLUSION_RASTER_EXCLUDED = 1  # all points in cell are excluded (near trenches)
+_TRENCH_EXCLUSION_RASTER_BOUNDARY = 2  # cell straddles an exclusion boundary (points in cell must be tested exactly)
+
+# Models loaded from files (such as rotation models) are cached in each process (including each worker process)
+# so that they are loaded once per process (instead of once per task, such as once per window of times).
+# The cache is cleared when it contains this many models.
+_MAX_CACHED_MODELS = 8
+_cached_models = {}
+
 
 def reconstruct_backtrack_bathymetry(
         input_points,  # note: you can use 'generate_input_points_grid()' to generate a global lat/lon grid
@@ -132,8 +191,10 @@ def reconstruct_backtrack_bathymetry(
     
     Parameters
     ----------
-    input_points : sequence of (longitude, latitude) tuples
+    input_points : sequence of (longitude, latitude) tuples, or numpy array
         The point locations to sample bathymetry at present day.
+        Can also be a numpy array of shape (N, 2) containing longitude and latitude columns
+        (such as returned by :func:`pybacktrack.generate_lon_lat_points`).
         Note that any samples outside the masked region of the total sediment thickness grid are ignored.
     oldest_time : float, optional
         The oldest time (in Ma) that output is generated back to (from present day). Value must not be negative.
@@ -215,10 +276,10 @@ def reconstruct_backtrack_bathymetry(
     
     Returns
     -------
-    dict mapping each time to a list of 3-tuple (longitude, latitude, bathymetry)
+    dict mapping each time to a numpy array of shape (N, 3)
         The reconstructed paleo bathymetry points from present day to the oldest time (see ``oldest_time``) in increments of ``time_increment``.
-        Each key in the returned dict is one of those times and each value in the dict is a list of reconstructed paleo bathymetries
-        represented as a 3-tuple containing reconstructed longitude, reconstructed latitude and paleo bathmetry.
+        Each key in the returned dict is one of those times and each value in the dict is a numpy array of reconstructed paleo bathymetries
+        with one row per point containing reconstructed longitude, reconstructed latitude and paleo bathmetry (in that order).
     
     Raises
     ------
@@ -235,184 +296,481 @@ def reconstruct_backtrack_bathymetry(
     .. versionadded:: 1.4
 
     .. versionchanged:: 1.5
-        ``oldest_time`` no longer needs to be specified (defaults to oldest of ocean crust ages and continental rift start ages of input points).
+        - ``oldest_time`` no longer needs to be specified (defaults to oldest of ocean crust ages and continental rift start ages of input points).
+        - Paleo bathymetry at each time is returned as a numpy array with 3 columns (instead of a list of 3-tuples).
+          Iterating over its rows still yields (longitude, latitude, bathymetry).
+        - ``input_points`` can be a numpy array of shape (N, 2).
+
+    .. seealso:: :func:`pybacktrack.reconstruct_paleo_bathymetry_iter` to generate the paleo bathymetry one time at a time
+                 (rather than holding the paleo bathymetry at all times in memory).
+    """
+    
+    # Accumulate the paleo bathymetry of all times.
+    return dict(reconstruct_backtrack_bathymetry_iter(
+        input_points,
+        oldest_time=oldest_time,
+        time_increment=time_increment,
+        lithology_filenames=lithology_filenames,
+        age_grid_filename=age_grid_filename,
+        topography_filename=topography_filename,
+        total_sediment_thickness_filename=total_sediment_thickness_filename,
+        crustal_thickness_filename=crustal_thickness_filename,
+        rotation_filenames=rotation_filenames,
+        static_polygon_filename=static_polygon_filename,
+        dynamic_topography_model=dynamic_topography_model,
+        sea_level_model=sea_level_model,
+        lithology_name=lithology_name,
+        ocean_age_to_depth_model=ocean_age_to_depth_model,
+        exclude_distances_to_trenches_kms=exclude_distances_to_trenches_kms,
+        region_plate_ids=region_plate_ids,
+        anchor_plate_id=anchor_plate_id,
+        output_positive_bathymetry_below_sea_level=output_positive_bathymetry_below_sea_level,
+        use_all_cpus=use_all_cpus))
+
+
+def reconstruct_backtrack_bathymetry_iter(
+        input_points,  # note: you can use 'generate_input_points_grid()' to generate a global lat/lon grid
+        oldest_time=None,
+        time_increment=1,
+        lithology_filenames=[pybacktrack.bundle_data.DEFAULT_BUNDLE_LITHOLOGY_FILENAME],
+        age_grid_filename=pybacktrack.bundle_data.BUNDLE_AGE_GRID_FILENAME,
+        topography_filename=pybacktrack.bundle_data.BUNDLE_TOPOGRAPHY_FILENAME,
+        total_sediment_thickness_filename=pybacktrack.bundle_data.BUNDLE_TOTAL_SEDIMENT_THICKNESS_FILENAME,
+        crustal_thickness_filename=pybacktrack.bundle_data.BUNDLE_CRUSTAL_THICKNESS_FILENAME,
+        rotation_filenames=pybacktrack.bundle_data.BUNDLE_RECONSTRUCTION_ROTATION_FILENAMES,
+        static_polygon_filename=pybacktrack.bundle_data.BUNDLE_RECONSTRUCTION_STATIC_POLYGON_FILENAME,
+        dynamic_topography_model=None,
+        sea_level_model=None,
+        lithology_name=DEFAULT_LITHOLOGY_NAME,
+        ocean_age_to_depth_model=age_to_depth.DEFAULT_MODEL,
+        exclude_distances_to_trenches_kms=None,
+        region_plate_ids=None,
+        anchor_plate_id=0,
+        output_positive_bathymetry_below_sea_level=False,
+        use_all_cpus=False,
+        times_per_window=DEFAULT_TIMES_PER_WINDOW,
+        worker_pool=None,
+        progress_callback=None,
+        checkpoint=None):
+    # Adding function signature on first line of docstring otherwise Sphinx autodoc will print out
+    # the expanded values of the bundle filenames.
+    """reconstruct_paleo_bathymetry_iter(\
+        input_points,\
+        oldest_time=None,\
+        time_increment=1,\
+        ...,\
+        use_all_cpus=False,\
+        times_per_window=pybacktrack.DEFAULT_PALEO_BATHYMETRY_TIMES_PER_WINDOW,\
+        worker_pool=None,\
+        progress_callback=None,\
+        checkpoint=None)
+    Same as :func:`pybacktrack.reconstruct_paleo_bathymetry` but generates the paleo bathymetry one time at a time
+    (instead of returning a dict containing the paleo bathymetry at all times).
+    
+    Parameters
+    ----------
+    input_points, oldest_time, time_increment, ..., use_all_cpus
+        See :func:`pybacktrack.reconstruct_paleo_bathymetry`.
+    times_per_window : int, optional
+        The number of times that are reconstructed/backtracked together (before they are generated).
+        Only the paleo bathymetry at this many times is held in memory at once.
+        Larger values reduce the (time-independent) overhead of setting up each window of times.
+        Defaults to ``pybacktrack.DEFAULT_PALEO_BATHYMETRY_TIMES_PER_WINDOW`` (10).
+    worker_pool : ``pybacktrack.util.worker_pool.WorkerPool``, optional
+        An existing pool of worker processes to distribute CPU processing across (in which case ``use_all_cpus`` is ignored).
+        This allows the same worker processes (and the models they have loaded) to be reused across multiple calls.
+        The pool is not closed when iteration finishes (it is owned by the caller).
+        Defaults to None (a pool is created, and closed when iteration finishes, if ``use_all_cpus`` specifies more than one CPU).
+    progress_callback : callable, optional
+        A function accepting a single argument that is called (in this process) with the fraction (between 0 and 1) of the
+        paleo bathymetry generated so far. The fraction is weighted by the number of times each point is reconstructed/backtracked.
+        Defaults to None (no progress reported).
+    checkpoint : ``pybacktrack.util.checkpoint.Checkpoint``, optional
+        Saves the intermediate grid samples (after assigning plate IDs and excluding near trenches, and after calculating their
+        time-independent parameters) so that a later call with the same checkpoint resumes from them (instead of recalculating them).
+        Also, times that have been recorded as completed in the checkpoint (by the caller) are skipped (not generated).
+        Defaults to None (no checkpoints).
+    
+    Yields
+    ------
+    2-tuple (time, numpy array of shape (N, 3))
+        The reconstructed paleo bathymetry points at each time from present day to the oldest time in increments of ``time_increment``
+        (in that order). Each row of the array contains reconstructed longitude, reconstructed latitude and paleo bathmetry.
+    
+    Raises
+    ------
+    ValueError
+        If ``oldest_time`` is negative (if specified), or if ``time_increment`` or ``times_per_window`` is not positive.
+        This is raised when iteration starts.
+
+    Notes
+    -----
+    This is useful for high resolution grids (and/or many times) where the paleo bathymetry at all times does not fit in memory.
+    For example, each time can be gridded (and written to a file) before the next time is generated:
+    ::
+
+        for time, paleo_bathymetry in pybacktrack.reconstruct_paleo_bathymetry_iter(input_points, oldest_time=250):
+            pybacktrack.write_paleo_bathymetry_grids({time: paleo_bathymetry}, 0.1, 'paleo_bathymetry')
+
+    .. versionadded:: 1.5
     """
    
-    #
     # Determine number of CPUs to use.
-    #
-    if use_all_cpus:
-        # If 'use_all_cpus' is a bool (and therefore is True) then use all available CPUs...
-        if isinstance(use_all_cpus, bool):
-            try:
-                num_cpus = multiprocessing.cpu_count()
-            except NotImplementedError:
-                num_cpus = 1
-        # else 'use_all_cpus' is a positive integer specifying the number of CPUs to use...
-        elif isinstance(use_all_cpus, int) and use_all_cpus > 0:
-            num_cpus = use_all_cpus
-        else:
-            raise TypeError('{} is neither a bool nor a positive integer'.format(use_all_cpus))
-    else:
-        num_cpus = 1
+    num_cpus = get_num_cpus(use_all_cpus)
     
     if (oldest_time is not None and
         oldest_time < 0):
         raise ValueError("'oldest_time' should not be negative")
     if time_increment <= 0:
         raise ValueError("'time_increment' should be positive")
+    if times_per_window <= 0:
+        raise ValueError("'times_per_window' should be positive")
     
-    # Read the lithologies from one or more text files.
+    # Use the same pool of worker processes for all stages below (assigning plate IDs, excluding near trenches,
+    # preparing grid samples and each window of times).
+    # Each worker process loads the rotation model, static polygons and trenches once (when it starts).
     #
-    # Read all the lithology files and merge their dicts.
-    # Subsequently specified files override previous files in the list.
-    # So if the first and second files have the same lithology then the second lithology is used.
-    lithologies = read_lithologies_files(lithology_filenames)
+    # Note: If the caller stops iterating early (before all times are generated) then the pool (if created here)
+    #       is closed when this generator is closed.
+    with use_worker_pool(
+            worker_pool,
+            num_cpus,
+            initializer=_initialise_worker_process,
+            initargs=(rotation_filenames, static_polygon_filename, exclude_distances_to_trenches_kms)) as worker_pool:
+        
+        # Read the lithologies from one or more text files.
+        #
+        # Read all the lithology files and merge their dicts.
+        # Subsequently specified files override previous files in the list.
+        # So if the first and second files have the same lithology then the second lithology is used.
+        lithologies = read_lithologies_files(lithology_filenames)
+
+        # All sediment is represented as a single lithology (of total sediment thickness).
+        lithology_components = [(lithology_name, 1.0)]
+        
+        # Divide the grid samples into a number of groups equal to twice the number of worker processes in case some groups of samples take longer to process than others.
+        num_grid_sample_groups = 2 * worker_pool.num_workers if worker_pool is not None else 1
+
+        # Resume from the prepared grid samples (if a checkpoint of them was saved by a previous interrupted run).
+        prepared_grid_samples_checkpoint = checkpoint.load_arrays(_PREPARED_GRID_SAMPLES_CHECKPOINT_NAME) if checkpoint else None
+        if prepared_grid_samples_checkpoint is not None:
+            oceanic_grid_samples = _grid_samples_from_array(prepared_grid_samples_checkpoint['oceanic_grid_samples'], 4)
+            continental_grid_samples = _grid_samples_from_array(prepared_grid_samples_checkpoint['continental_grid_samples'], 4)
+            time_range = prepared_grid_samples_checkpoint['time_range'].tolist()
+        else:
+            # Resume from the grid samples with assigned plate IDs (if a checkpoint of them was saved by a previous interrupted run).
+            grid_samples_checkpoint = checkpoint.load_arrays(_GRID_SAMPLES_CHECKPOINT_NAME) if checkpoint else None
+            if grid_samples_checkpoint is not None:
+                grid_samples = grid_samples_checkpoint['grid_samples']
+            else:
+                grid_samples = _read_grid_samples_and_assign_plate_ids(
+                    worker_pool,
+                    input_points,
+                    total_sediment_thickness_filename,
+                    rotation_filenames,
+                    static_polygon_filename,
+                    exclude_distances_to_trenches_kms,
+                    region_plate_ids)
+                if checkpoint:
+                    checkpoint.save_arrays(_GRID_SAMPLES_CHECKPOINT_NAME, {'grid_samples': grid_samples})
+            
+            oceanic_grid_samples, continental_grid_samples = _read_oceanic_and_continental_grid_samples(
+                grid_samples, age_grid_filename, topography_filename, crustal_thickness_filename)
+            
+            time_range = _get_time_range(oldest_time, time_increment, oceanic_grid_samples, continental_grid_samples)
+            
+            # Calculate the time-independent parameters of each grid sample (such as the rifting stretching factor of continental grid samples).
+            #
+            # These only need to be calculated once (and not for each window of times below).
+            with stage('preparation'):
+                oceanic_grid_samples, continental_grid_samples = _prepare_grid_samples(
+                    worker_pool,
+                    oceanic_grid_samples,
+                    continental_grid_samples,
+                    time_range[-1],
+                    ocean_age_to_depth_model,
+                    lithologies,
+                    lithology_components,
+                    dynamic_topography_model,
+                    num_grid_sample_groups)
+            if checkpoint:
+                checkpoint.save_arrays(_PREPARED_GRID_SAMPLES_CHECKPOINT_NAME, {
+                    'oceanic_grid_samples': _grid_samples_to_array(oceanic_grid_samples, 7),
+                    'continental_grid_samples': _grid_samples_to_array(continental_grid_samples, 12),
+                    'time_range': np.array(time_range, dtype=float)})
+        
+        # Find the sea levels over the requested time period.
+        if sea_level_model:
+            _sea_level = SeaLevel.create_from_model_or_bundled_model_name(sea_level_model)
+            # Calculate sea level (relative to present day) that is an average over each time increment in the requested time period.
+            # This is a dict indexed by time.
+            sea_levels = {time: _sea_level.get_average_level(time + time_increment, time) for time in time_range}
+        else:
+            sea_levels = None
+        
+        # Skip times that have already been completed (if resuming from a checkpoint saved by a previous interrupted run).
+        completed_times = checkpoint.load_completed_times() if checkpoint else None
+        
+        for paleo_bathymetry_item in _reconstruct_backtrack_bathymetry_time_windows(
+                worker_pool,
+                oceanic_grid_samples,
+                continental_grid_samples,
+                time_range,
+                times_per_window,
+                ocean_age_to_depth_model,
+                lithologies,
+                lithology_components,
+                dynamic_topography_model,
+                sea_levels,
+                rotation_filenames,
+                anchor_plate_id,
+                output_positive_bathymetry_below_sea_level,
+                num_grid_sample_groups=num_grid_sample_groups,
+                progress_callback=progress_callback,
+                completed_times=completed_times):
+            yield paleo_bathymetry_item
 
-    # All sediment is represented as a single lithology (of total sediment thickness).
-    lithology_components = [(lithology_name, 1.0)]
 
+def _read_grid_samples_and_assign_plate_ids(
+        worker_pool,
+        input_points,
+        total_sediment_thickness_filename,
+        rotation_filenames,
+        static_polygon_filename,
+        exclude_distances_to_trenches_kms,
+        region_plate_ids):
+    """
+    Sample the total sediment thickness grid at the input points, assign plate IDs and exclude grid samples near trenches.
+    
+    Returns a (N, 5) numpy array with columns (longitude, latitude, total sediment thickness, reconstruction plate ID, partitioning plate appearance age).
+    If 'worker_pool' is None then all grid samples are processed in the current process.
+    """
+    
     # Sample the total sediment thickness grid.
-    grid_samples = _read_grid(input_points, total_sediment_thickness_filename, force_positive=True)
+    #
+    # Note: The grid samples remain a (N, 3) numpy array until they've been assigned plate IDs
+    #       (since that also excludes many of the input points, eg, those outside the region plate IDs).
+    grid_samples = _read_grid_array(input_points, total_sediment_thickness_filename, force_positive=True)
 
     # Ignore samples outside total sediment thickness grid (masked region) since we can only backtrack where there's sediment.
     #
     # Note: The 3rd value (index 2) of each sample is the total sediment thickness (first two values are longitude and latitude).
     #       A value of NaN means the sample is outside the masked region of the grid.
-    grid_samples = [grid_sample for grid_sample in grid_samples if not math.isnan(grid_sample[2])]
-    
-    #
-    # Assign reconstruction plate IDs.
-    #
-    # This appends to each grid sample:
-    # - a reconstruction plate ID, and
-    # - a partitioning polygon appearance age.
-    #
-    # Also excludes grid samples with plate IDs not in the region plate IDs (if region plate IDs specified).
-    #
-    if num_cpus == 1:
-        grid_samples = _assign_reconstruction_plate_ids(
-                grid_samples, static_polygon_filename, rotation_filenames, region_plate_ids)
-    else:
-        # Divide the grid samples into a number of groups equal to twice the number of CPUs in case some groups of samples take longer to process than others.
-        num_grid_sample_groups = 2 * num_cpus
-        num_grid_samples_per_group = math.ceil(float(len(grid_samples)) / num_grid_sample_groups)
+    grid_samples = grid_samples[~np.isnan(grid_samples[:, 2])]
 
-        # Distribute the groups of grid samples across the multiprocessing pool.
-        with multiprocessing.Pool(num_cpus) as pool:
-            grid_samples_list = pool.map(
-                    partial(
-                        _assign_reconstruction_plate_ids,
-                        static_polygon_filename=static_polygon_filename,
-                        rotation_filenames=rotation_filenames,
-                        region_plate_ids=region_plate_ids),
-                    (
-                        grid_samples[
-                            grid_sample_group_index * num_grid_samples_per_group :
-                            (grid_sample_group_index + 1) * num_grid_samples_per_group]
-                                    for grid_sample_group_index in range(num_grid_sample_groups)
-                    ),
-                    1) # chunksize
+    with stage('plate_partitioning'):
+        count('plate_partitioning.points_in', len(grid_samples))
         
-        # Merge output lists back into one list.
-        grid_samples = list(itertools.chain.from_iterable(grid_samples_list))
-    
-    #
-    # Exclude grid samples near trenches.
-    #
-    if num_cpus == 1:
-        grid_samples = _exclude_grid_samples_near_trenches(
-                grid_samples, pybacktrack.bundle_data.BUNDLE_TRENCHES_FILENAME, pybacktrack.bundle_data.BUNDLE_SUBDUCTING_BOUNDARIES_FILENAME, exclude_distances_to_trenches_kms)
-    else:
-        # Divide the grid samples into a number of groups equal to twice the number of CPUs in case some groups of samples take longer to process than others.
-        num_grid_sample_groups = 2 * num_cpus
-        num_grid_samples_per_group = math.ceil(float(len(grid_samples)) / num_grid_sample_groups)
+        #
+        # Assign reconstruction plate IDs.
+        #
+        # This appends to each grid sample:
+        # - a reconstruction plate ID, and
+        # - a partitioning polygon appearance age.
+        #
+        # Also excludes grid samples with plate IDs not in the region plate IDs (if region plate IDs specified).
+        #
+        # First look up the grid samples in the (cached) static polygon raster.
+        # Only those grid samples in raster cells straddling static polygon boundaries then need to be partitioned exactly.
+        # Note: The raster is only created (and cached) if there are enough grid samples to make it worthwhile.
+        grid_sample_longitudes = grid_samples[:, 0]
+        grid_sample_latitudes = grid_samples[:, 1]
+        static_polygon_raster = get_static_polygon_raster(static_polygon_filename, rotation_filenames, len(grid_samples))
+        if static_polygon_raster is not None:
+            (reconstruction_plate_ids,
+             partitioning_plate_appearance_ages,
+             is_partitioned,
+             is_resolved) = static_polygon_raster.lookup(grid_sample_longitudes, grid_sample_latitudes)
+            # Indices of grid samples that still need to be partitioned exactly.
+            unresolved_grid_sample_indices = np.where(~is_resolved)[0]
+        else:
+            reconstruction_plate_ids = np.zeros(len(grid_samples), dtype=int)
+            partitioning_plate_appearance_ages = np.zeros(len(grid_samples), dtype=float)
+            is_partitioned = np.zeros(len(grid_samples), dtype=bool)
+            # All grid samples need to be partitioned exactly.
+            unresolved_grid_sample_indices = np.arange(len(grid_samples))
+        unresolved_grid_sample_longitudes = grid_sample_longitudes[unresolved_grid_sample_indices]
+        unresolved_grid_sample_latitudes = grid_sample_latitudes[unresolved_grid_sample_indices]
+        count('plate_partitioning.points_partitioned_exactly', len(unresolved_grid_sample_indices))
+
+        if worker_pool is None:
+            unresolved_partitions = _partition_grid_samples_exactly(
+                unresolved_grid_sample_longitudes, unresolved_grid_sample_latitudes, static_polygon_filename, rotation_filenames)
+        else:
+            # Divide the grid samples into a number of groups equal to twice the number of worker processes in case some groups of samples take longer to process than others.
+            num_grid_sample_groups = 2 * worker_pool.num_workers
+            num_grid_samples_per_group = math.ceil(float(len(unresolved_grid_sample_indices)) / num_grid_sample_groups)
 
-        # Distribute the groups of grid samples across the multiprocessing pool.
-        with multiprocessing.Pool(num_cpus) as pool:
-            grid_samples_list = pool.map(
-                    partial(
-                        _exclude_grid_samples_near_trenches,
-                        trench_filename=pybacktrack.bundle_data.BUNDLE_TRENCHES_FILENAME,
-                        subducting_boundary_filename=pybacktrack.bundle_data.BUNDLE_SUBDUCTING_BOUNDARIES_FILENAME,
-                        threshold_distances_to_trenches_kms=exclude_distances_to_trenches_kms),
+            # Distribute the groups of grid samples across the worker pool.
+            unresolved_partitions_list = worker_pool.starmap(
+                partial(
+                    _partition_grid_samples_exactly,
+                    static_polygon_filename=static_polygon_filename,
+                    rotation_filenames=rotation_filenames),
+                [
                     (
-                        grid_samples[
+                        unresolved_grid_sample_longitudes[
+                            grid_sample_group_index * num_grid_samples_per_group:
+                            (grid_sample_group_index + 1) * num_grid_samples_per_group],
+                        unresolved_grid_sample_latitudes[
                             grid_sample_group_index * num_grid_samples_per_group :
                             (grid_sample_group_index + 1) * num_grid_samples_per_group]
-                                    for grid_sample_group_index in range(num_grid_sample_groups)
-                    ),
-                    1) # chunksize
+                    )
+                    for grid_sample_group_index in range(num_grid_sample_groups)
+                ],
+                1)  # chunksize
         
-        # Merge output lists back into one list.
-        grid_samples = list(itertools.chain.from_iterable(grid_samples_list))
+            # Merge output arrays back into one array (for each of plate IDs, appearance ages and whether partitioned).
+            unresolved_partitions = [np.concatenate(unresolved_partition_arrays) for unresolved_partition_arrays in zip(*unresolved_partitions_list)]
+
+        (reconstruction_plate_ids[unresolved_grid_sample_indices],
+         partitioning_plate_appearance_ages[unresolved_grid_sample_indices],
+         is_partitioned[unresolved_grid_sample_indices]) = unresolved_partitions
+        grid_samples, reconstruction_plate_ids, partitioning_plate_appearance_ages = _assign_reconstruction_plate_ids(
+            grid_samples, reconstruction_plate_ids, partitioning_plate_appearance_ages, is_partitioned, region_plate_ids)
+        count('plate_partitioning.points_out', len(grid_samples))
+
+    with stage('trench_exclusion'):
+        count('trench_exclusion.points_in', len(grid_samples))
+        
+        #
+        # Exclude grid samples near trenches.
+        #
+        # First look up the grid samples in the (cached) trench exclusion raster.
+        # Only those grid samples in raster cells straddling the boundary of an exclusion region then need to be tested exactly.
+        # Note: The raster is only created (and cached) if there are enough grid samples to make it worthwhile.
+        trench_exclusion_raster = _get_trench_exclusion_raster(
+            pybacktrack.bundle_data.BUNDLE_TRENCHES_FILENAME,
+            pybacktrack.bundle_data.BUNDLE_SUBDUCTING_BOUNDARIES_FILENAME,
+            exclude_distances_to_trenches_kms,
+            create_if_not_cached=len(grid_samples) >= _MIN_GRID_SAMPLES_TO_CREATE_TRENCH_EXCLUSION_RASTER)
+        if trench_exclusion_raster is not None:
+            trench_exclusion_raster_row_indices, trench_exclusion_raster_column_indices = LatLonCells(
+                _TRENCH_EXCLUSION_RASTER_RESOLUTION_DEGREES).get_cell_indices(grid_samples[:, 0], grid_samples[:, 1])
+            trench_exclusion_raster_cell_states = trench_exclusion_raster[trench_exclusion_raster_row_indices, trench_exclusion_raster_column_indices]
+        
+            near_trenches = (trench_exclusion_raster_cell_states == _TRENCH_EXCLUSION_RASTER_EXCLUDED)
+            # Indices of grid samples that still need to be tested exactly.
+            unresolved_grid_sample_indices = np.where(trench_exclusion_raster_cell_states == _TRENCH_EXCLUSION_RASTER_BOUNDARY)[0]
+            unresolved_grid_samples = grid_samples[unresolved_grid_sample_indices]
+        else:
+            near_trenches = np.zeros(len(grid_samples), dtype=bool)
+            # All grid samples need to be tested exactly.
+            unresolved_grid_sample_indices = np.arange(len(grid_samples))
+            unresolved_grid_samples = grid_samples
+        count('trench_exclusion.points_tested_exactly', len(unresolved_grid_samples))
+
+        if worker_pool is None:
+            unresolved_near_trenches = _find_grid_samples_near_trenches(
+                unresolved_grid_samples, pybacktrack.bundle_data.BUNDLE_TRENCHES_FILENAME, pybacktrack.bundle_data.BUNDLE_SUBDUCTING_BOUNDARIES_FILENAME, exclude_distances_to_trenches_kms)
+        else:
+            # Divide the grid samples into a number of groups equal to twice the number of worker processes in case some groups of samples take longer to process than others.
+            num_grid_sample_groups = 2 * worker_pool.num_workers
+            num_grid_samples_per_group = math.ceil(float(len(unresolved_grid_samples)) / num_grid_sample_groups)
+
+            # Distribute the groups of grid samples across the worker pool.
+            near_trenches_list = worker_pool.map(
+                partial(
+                    _find_grid_samples_near_trenches,
+                    trench_filename=pybacktrack.bundle_data.BUNDLE_TRENCHES_FILENAME,
+                    subducting_boundary_filename=pybacktrack.bundle_data.BUNDLE_SUBDUCTING_BOUNDARIES_FILENAME,
+                    threshold_distances_to_trenches_kms=exclude_distances_to_trenches_kms),
+                [
+                    unresolved_grid_samples[
+                        grid_sample_group_index * num_grid_samples_per_group:
+                        (grid_sample_group_index + 1) * num_grid_samples_per_group]
+                    for grid_sample_group_index in range(num_grid_sample_groups)
+                ],
+                1)  # chunksize
+        
+            # Merge output lists back into one list.
+            unresolved_near_trenches = list(itertools.chain.from_iterable(near_trenches_list))
+
+        near_trenches[unresolved_grid_sample_indices] = unresolved_near_trenches
+        grid_samples = grid_samples[~near_trenches]
+        reconstruction_plate_ids = reconstruction_plate_ids[~near_trenches]
+        partitioning_plate_appearance_ages = partitioning_plate_appearance_ages[~near_trenches]
+        count('trench_exclusion.points_out', len(grid_samples))
+    
+    # Append the assigned reconstruction plate ID and the partitioning polygon appearance age to each grid sample.
+    return np.column_stack((grid_samples, reconstruction_plate_ids, partitioning_plate_appearance_ages))
 
-    # The plate IDs assigned above are integers but get converted to float by '_read_grid()' unless we tell it they are integers.
-    grid_sample_integer_input_columns = [3]
+
+def _read_oceanic_and_continental_grid_samples(
+        grid_samples,
+        age_grid_filename,
+        topography_filename,
+        crustal_thickness_filename):
+    """
+    Sample the age, topography, crustal thickness and rifting grids and separate the grid samples into oceanic and continental.
+    
+    'grid_samples' is a (N, 5) numpy array (see '_read_grid_samples_and_assign_plate_ids()').
+    Returns a 2-tuple of lists (oceanic grid samples, continental grid samples).
+    """
 
     # Add age and topography to the total sediment thickness grid samples.
-    grid_samples = _read_grid(grid_samples, age_grid_filename, integer_input_columns=grid_sample_integer_input_columns, force_positive=True)
-    grid_samples = _read_grid(grid_samples, topography_filename, integer_input_columns=grid_sample_integer_input_columns)
+    grid_samples = _read_grid_array(grid_samples, age_grid_filename, force_positive=True)
+    grid_samples = _read_grid_array(grid_samples, topography_filename)
+    (longitudes, latitudes, total_sediment_thicknesses, reconstruction_plate_ids, partitioning_plate_appearance_ages,
+     age_grid_ages, topographies) = grid_samples.T
+
+    # If topography sampled outside grid then set topography to zero.
+    # Shouldn't happen since topography grid is not masked anywhere.
+    topographies = np.where(np.isnan(topographies), 0.0, topographies)
+
+    # Topography is negative in ocean but water depth is positive.
+    # Clamp water depth so it's below sea level (ie, must be >= 0).
+    water_depths = np.where(topographies < 0.0, -topographies, 0.0)
+
+    # If sampled outside age grid then is on continental crust near a passive margin.
+    is_continental = np.isnan(age_grid_ages)
+
+    # Oceanic grid samples use the age from the age grid unless it is too old
+    # (ie, older than the partitioning static polygon appearance age by a fixed amount).
+    # Continental grid samples use the age from the partitioning static polygon.
+    ages = np.where(
+        is_continental | (age_grid_ages > partitioning_plate_appearance_ages + _MAX_AGE_GRID_ALLOWED_TO_EXCEED_OCEANIC_STATIC_POLYGON_AGE),
+        partitioning_plate_appearance_ages,
+        age_grid_ages)
 
     # Separate grid samples into oceanic and continental.
-    continental_grid_samples = []
-    oceanic_grid_samples = []
-    for longitude, latitude, total_sediment_thickness, reconstruction_plate_id, partitioning_plate_appearance_age, age_grid_age, topography in grid_samples:
-
-        # If topography sampled outside grid then set topography to zero.
-        # Shouldn't happen since topography grid is not masked anywhere.
-        if math.isnan(topography):
-            topography = 0.0
-    
-        # Topography is negative in ocean but water depth is positive.
-        water_depth = -topography
-        # Clamp water depth so it's below sea level (ie, must be >= 0).
-        water_depth = max(0, water_depth)
-
-        # If sampled outside age grid then is on continental crust near a passive margin.
-        if math.isnan(age_grid_age):
-            # Use the age from the partitioning static polygon.
-            age = partitioning_plate_appearance_age
-
-            continental_grid_samples.append(
-                    (longitude, latitude, total_sediment_thickness, water_depth, reconstruction_plate_id, age))
-        else:  # oceanic...
-            # Use the age from the age grid unless it is too old (ie, older than the partitioning static polygon appearance age by a fixed amount).
-            if age_grid_age > partitioning_plate_appearance_age + _MAX_AGE_GRID_ALLOWED_TO_EXCEED_OCEANIC_STATIC_POLYGON_AGE:
-                age = partitioning_plate_appearance_age
-            else:
-                age = age_grid_age
-            
-            oceanic_grid_samples.append(
-                    (longitude, latitude, total_sediment_thickness, water_depth, reconstruction_plate_id, age))
-
-    # The plate IDs assigned above are integers but get converted to float by '_read_grid()' unless we tell it they are integers.
-    continental_grid_sample_integer_input_columns = [4]
+    grid_samples = np.column_stack((longitudes, latitudes, total_sediment_thicknesses, water_depths, reconstruction_plate_ids, ages))
+    oceanic_grid_samples = grid_samples[~is_continental]
+    continental_grid_samples = grid_samples[is_continental]
 
     # Add crustal thickness and builtin rift start/end times to continental grid samples.
     #
     # Note: For some reason we get a GMT error if we combine these grids in a single 'grdtrack' call, so we separate them instead.
-    continental_grid_samples = _read_grid(continental_grid_samples, crustal_thickness_filename, integer_input_columns=continental_grid_sample_integer_input_columns, force_positive=True)
-    continental_grid_samples = _read_grid(continental_grid_samples, pybacktrack.bundle_data.BUNDLE_RIFTING_START_FILENAME, integer_input_columns=continental_grid_sample_integer_input_columns, force_positive=True)
-    continental_grid_samples = _read_grid(continental_grid_samples, pybacktrack.bundle_data.BUNDLE_RIFTING_END_FILENAME, integer_input_columns=continental_grid_sample_integer_input_columns, force_positive=True)
+    continental_grid_samples = _read_grid_array(continental_grid_samples, crustal_thickness_filename, force_positive=True)
+    continental_grid_samples = _read_grid_array(continental_grid_samples, pybacktrack.bundle_data.BUNDLE_RIFTING_START_FILENAME, force_positive=True)
+    continental_grid_samples = _read_grid_array(continental_grid_samples, pybacktrack.bundle_data.BUNDLE_RIFTING_END_FILENAME, force_positive=True)
 
     # Ignore continental samples with no rifting (no rift start/end times) since there is no sediment deposition without rifting and
     # also no tectonic subsidence.
     #
     # Note: The 8th and 9th values (indices 7 and 8) of each sample are the rift start and end ages.
     #       A value of NaN means there is no rifting at the sample location.
-    continental_grid_samples = [grid_sample for grid_sample in continental_grid_samples
-                                    if not (math.isnan(grid_sample[7]) or math.isnan(grid_sample[8]))]
+    continental_grid_samples = continental_grid_samples[~np.isnan(continental_grid_samples[:, 7:9]).any(axis=1)]
+
+    count('preparation.oceanic_points', len(oceanic_grid_samples))
+    count('preparation.continental_points', len(continental_grid_samples))
+
     # Ensure rift start ages are not younger than associated rift end ages (due to filtering during grid sampling).
-    for grid_sample_index in range(len(continental_grid_samples)):
-        grid_sample = continental_grid_samples[grid_sample_index]
-        rift_start_age, rift_end_age = grid_sample[7], grid_sample[8]
-        if rift_start_age < rift_end_age:
-            # Clamp rift start age to the rift end age.
-            rift_start_age = rift_end_age
-            # Create a new tuple with the rift start age replaced.
-            grid_sample = grid_sample[:7] + (rift_start_age,) + grid_sample[8:]
-            continental_grid_samples[grid_sample_index] = grid_sample
+    # Clamp rift start age to the rift end age.
+    continental_grid_samples[:, 7] = np.maximum(continental_grid_samples[:, 7], continental_grid_samples[:, 8])
+    
+    # The plate IDs (column 4) are integers (but are stored as floats in the arrays).
+    return _grid_samples_from_array(oceanic_grid_samples, 4), _grid_samples_from_array(continental_grid_samples, 4)
+
+
+def _get_time_range(
+        oldest_time,
+        time_increment,
+        oceanic_grid_samples,
+        continental_grid_samples):
+    """
+    Return the times from present day to the oldest time (in increments of 'time_increment').
+    """
     
     # If the oldest time was not specified then instead use the oldest of ocean crust ages and continental rift start ages of the input points.
     if oldest_time is None:
@@ -425,117 +783,496 @@ def reconstruct_backtrack_bathymetry(
             # Continental rift start ages (at index 7 of each continental grid sample).
             oldest_continental_time = max(continental_grid_sample[7] for continental_grid_sample in continental_grid_samples)
             oldest_time = max(oldest_time, oldest_continental_time)
-    
+
     # Create times from present day to the oldest requested time in the requested time increments.
     # Note: Using 1e-6 to ensure the oldest time gets included (if it's an exact multiple of the time increment, which it likely will be).
     time_range = [float(time) for time in np.arange(0, oldest_time + 1e-6, time_increment)]
     
-    # Find the sea levels over the requested time period.
-    if sea_level_model:
-        _sea_level = SeaLevel.create_from_model_or_bundled_model_name(sea_level_model)
-        # Calculate sea level (relative to present day) that is an average over each time increment in the requested time period.
-        # This is a dict indexed by time.
-        sea_levels = {time : _sea_level.get_average_level(time + time_increment, time) for time in time_range}
-    else:
-        sea_levels = None
+    return time_range
 
-    # If using a single CPU then just process all ocean/continent points in one call.
-    if num_cpus == 1:
-        oceanic_paleo_bathymetry = _reconstruct_backtrack_oceanic_bathymetry(
-                oceanic_grid_samples,
-                time_range,
-                ocean_age_to_depth_model,
-                lithologies,
-                lithology_components,
-                dynamic_topography_model,
-                sea_levels,
-                rotation_filenames,
-                anchor_plate_id,
-                output_positive_bathymetry_below_sea_level)
-        
-        continental_paleo_bathymetry = _reconstruct_backtrack_continental_bathymetry(
-                continental_grid_samples,
-                time_range,
-                lithologies,
-                lithology_components,
-                dynamic_topography_model,
-                sea_levels,
-                rotation_filenames,
-                anchor_plate_id,
-                output_positive_bathymetry_below_sea_level)
-        
-        # Combine the oceanic and continental paleo bathymetry dicts into a single bathymetry dict.
-        paleo_bathymetry = {time : [] for time in time_range}
-        for paleo_bathymetry_dict in (oceanic_paleo_bathymetry, continental_paleo_bathymetry):
-            for time, bathymetries in paleo_bathymetry_dict.items():
-                paleo_bathymetry[time].extend(bathymetries)
-        
-        return paleo_bathymetry
-     
-    # Divide the oceanic grid samples into a number of groups equal to twice the number of CPUs in case some groups of samples take longer to process than others.
-    num_oceanic_grid_sample_groups = 2 * num_cpus
-    num_oceanic_grid_samples_per_group = math.ceil(float(len(oceanic_grid_samples)) / num_oceanic_grid_sample_groups)
-
-    # Distribute the groups of oceanic points across the multiprocessing pool.
-    with multiprocessing.Pool(num_cpus) as pool:
-        oceanic_paleo_bathymetry_dict_list = pool.map(
-                partial(
-                    _reconstruct_backtrack_oceanic_bathymetry,
-                    time_range=time_range,
-                    ocean_age_to_depth_model=ocean_age_to_depth_model,
-                    lithologies=lithologies,
-                    lithology_components=lithology_components,
-                    dynamic_topography_model=dynamic_topography_model,
-                    sea_levels=sea_levels,
-                    rotation_filenames=rotation_filenames,
-                    anchor_plate_id=anchor_plate_id,
-                    output_positive_bathymetry_below_sea_level=output_positive_bathymetry_below_sea_level),
+
+def _prepare_grid_samples(
+        worker_pool,
+        oceanic_grid_samples,
+        continental_grid_samples,
+        oldest_time,
+        ocean_age_to_depth_model,
+        lithologies,
+        lithology_components,
+        dynamic_topography_model,
+        num_grid_sample_groups):
+    """
+    Calculate the time-independent parameters of each oceanic and continental grid sample.
+    
+    Returns a 2-tuple of lists (prepared oceanic grid samples, prepared continental grid samples).
+    If 'worker_pool' is None then all grid samples are processed in the current process,
+    otherwise they are divided into (roughly) 'num_grid_sample_groups' groups that are distributed across the worker pool.
+    """
+    
+    if worker_pool is None:
+        oceanic_grid_samples = _prepare_oceanic_grid_samples(
+            oceanic_grid_samples,
+            oldest_time,
+            ocean_age_to_depth_model,
+            lithologies,
+            lithology_components)
+        continental_grid_samples = _prepare_continental_grid_samples(
+            continental_grid_samples,
+            oldest_time,
+            lithologies,
+            lithology_components,
+            dynamic_topography_model)
+    else:
+        # Divide the oceanic and continental grid samples into groups of roughly equal cost
+        # (preparing a continental grid sample costs more since it estimates the rifting stretching factor).
+        oceanic_tasks, continental_tasks = _divide_workloads_into_tasks(
+            [
                 (
-                    oceanic_grid_samples[
-                        oceanic_grid_sample_group_index * num_oceanic_grid_samples_per_group :
-                        (oceanic_grid_sample_group_index + 1) * num_oceanic_grid_samples_per_group]
-                                for oceanic_grid_sample_group_index in range(num_oceanic_grid_sample_groups)
+                    partial(
+                        _prepare_oceanic_grid_samples,
+                        oldest_time=oldest_time,
+                        ocean_age_to_depth_model=ocean_age_to_depth_model,
+                        lithologies=lithologies,
+                        lithology_components=lithology_components),
+                    oceanic_grid_samples,
+                    np.ones(len(oceanic_grid_samples))
                 ),
-                1) # chunksize
+                (
+                    partial(
+                        _prepare_continental_grid_samples,
+                        oldest_time=oldest_time,
+                        lithologies=lithologies,
+                        lithology_components=lithology_components,
+                        dynamic_topography_model=dynamic_topography_model),
+                    continental_grid_samples,
+                    np.full(len(continental_grid_samples), _CONTINENTAL_PREPARATION_RELATIVE_COST)
+                )
+            ],
+            num_grid_sample_groups)
+        
+        # Distribute the oceanic and continental groups of grid samples across the worker pool together
+        # (so that the continental groups do not wait for all the oceanic groups to finish).
+        prepared_grid_sample_groups = worker_pool.map(_run_task, oceanic_tasks + continental_tasks, 1)  # chunksize
+        oceanic_grid_samples = list(itertools.chain.from_iterable(prepared_grid_sample_groups[:len(oceanic_tasks)]))
+        continental_grid_samples = list(itertools.chain.from_iterable(prepared_grid_sample_groups[len(oceanic_tasks):]))
     
-    # Divide the continental grid samples into a number of groups equal to twice the number of CPUs in case some groups of samples take longer to process than others.
-    num_continental_grid_sample_groups = 2 * num_cpus
-    num_continental_grid_samples_per_group = math.ceil(float(len(continental_grid_samples)) / num_continental_grid_sample_groups)
+    return oceanic_grid_samples, continental_grid_samples
 
-    # Distribute the groups of continental points across the multiprocessing pool.
-    with multiprocessing.Pool(num_cpus) as pool:
-        continental_paleo_bathymetry_dict_list = pool.map(
-                partial(
-                    _reconstruct_backtrack_continental_bathymetry,
-                    time_range=time_range,
-                    lithologies=lithologies,
-                    lithology_components=lithology_components,
-                    dynamic_topography_model=dynamic_topography_model,
-                    sea_levels=sea_levels,
-                    rotation_filenames=rotation_filenames,
-                    anchor_plate_id=anchor_plate_id,
-                    output_positive_bathymetry_below_sea_level=output_positive_bathymetry_below_sea_level),
-                (
-                    continental_grid_samples[
-                        continental_grid_sample_group_index * num_continental_grid_samples_per_group :
-                        (continental_grid_sample_group_index + 1) * num_continental_grid_samples_per_group]
-                                for continental_grid_sample_group_index in range(num_continental_grid_sample_groups)
-                ),
-                1) # chunksize
+
+def _grid_samples_to_array(grid_samples, num_columns):
+    """
+    Convert a list of grid samples (each a tuple of 'num_columns' numbers) to a 2D array (so it can be checkpointed).
+    """
+    
+    return np.array(grid_samples, dtype=float).reshape(-1, num_columns)
+
+
+def _grid_samples_from_array(grid_samples_array, plate_id_column):
+    """
+    Convert a 2D array (created by '_grid_samples_to_array()') back to a list of grid samples (with an integer plate ID column).
+    """
+    
+    return [grid_sample[:plate_id_column] + (int(grid_sample[plate_id_column]),) + grid_sample[plate_id_column + 1:]
+            for grid_sample in map(tuple, grid_samples_array.tolist())]
+
+
+def _divide_into_groups(sequence, num_groups):
+    """
+    Divide a sequence into a number of (contiguous) groups of roughly equal size (and return a list of the groups).
+    """
+    
+    num_items_per_group = int(math.ceil(float(len(sequence)) / num_groups))
+    
+    return [sequence[group_index * num_items_per_group:(group_index + 1) * num_items_per_group]
+            for group_index in range(num_groups)]
+
+
+def _divide_into_groups_by_cost(sequence, costs, num_groups):
+    """
+    Divide a sequence into a number of (contiguous) groups of roughly equal total cost (and return a list of the groups).
+    
+    'costs' is the (estimated) cost of processing each item in the sequence.
+    Groups that would be empty (because a single item costs more than a group's share) are omitted.
+    """
+    
+    costs = np.asarray(costs, dtype=float)
+    total_cost = costs.sum()
+    if total_cost <= 0:
+        return _divide_into_groups(sequence, num_groups)
+    
+    # Each group starts at the first item whose preceding items (in the sequence) cost at least the group's share of the total cost.
+    preceding_costs = np.cumsum(costs) - costs
+    group_start_indices = np.searchsorted(preceding_costs, total_cost * np.arange(num_groups) / num_groups, side='left')
+    group_end_indices = np.append(group_start_indices[1:], len(sequence))
+    
+    return [sequence[group_start_index:group_end_index]
+            for group_start_index, group_end_index in zip(group_start_indices, group_end_indices)
+            if group_end_index > group_start_index]
+
+
+def _divide_workloads_into_tasks(workloads, num_tasks):
+    """
+    Divide one or more workloads into a total of roughly 'num_tasks' tasks of roughly equal cost.
+    
+    Each workload is a 3-tuple of (function, sequence of grid samples, cost of each grid sample).
+    The function of each workload processes a group of its grid samples (so the workloads can be heterogeneous).
+    
+    Returns a list (one per workload) of lists of tasks, where each task is a 2-tuple of (function, group of grid samples)
+    that can be run with '_run_task()'. The tasks of each workload are in grid sample order.
+    """
+    
+    workload_costs = [float(np.sum(costs)) for _, _, costs in workloads]
+    total_cost = sum(workload_costs)
+    
+    workload_tasks = []
+    for (function, grid_samples, costs), workload_cost in zip(workloads, workload_costs):
+        # Each workload gets a share of the tasks proportional to its share of the total cost
+        # (so that a small workload does not get as many tasks as a large one).
+        if total_cost > 0:
+            num_workload_tasks = max(1, int(math.ceil(num_tasks * workload_cost / total_cost)))
+        else:
+            num_workload_tasks = 1
+        workload_tasks.append(
+            [(function, grid_sample_group) for grid_sample_group in _divide_into_groups_by_cost(grid_samples, costs, num_workload_tasks)])
     
-    # Combine the pool bathymetry dicts into a single bathymetry dict.
-    paleo_bathymetry = {time : [] for time in time_range}
-    for paleo_bathymetry_dict_list in (oceanic_paleo_bathymetry_dict_list, continental_paleo_bathymetry_dict_list):
-        for paleo_bathymetry_dict in paleo_bathymetry_dict_list:
-            for time, bathymetries in paleo_bathymetry_dict.items():
-                paleo_bathymetry[time].extend(bathymetries)
+    return workload_tasks
+
+
+def _run_task(task):
+    """
+    Run a task (a 2-tuple of function and group of grid samples) created by '_divide_workloads_into_tasks()'.
+    """
     
-    return paleo_bathymetry
+    function, grid_samples = task
+    return function(grid_samples)
+
+
+def _get_num_time_steps(ages, time_range):
+    """
+    Return the number of times in 'time_range' (in increasing order) at which each grid sample exists (given the grid sample ages).
+    
+    This is used as the (estimated) cost of reconstructing/backtracking each grid sample.
+    """
+    
+    # A grid sample exists at all times up to (and including) its age.
+    return np.searchsorted(np.asarray(time_range, dtype=float), ages, side='right')
+
+
+def _reconstruct_backtrack_bathymetry_time_windows(
+        worker_pool,
+        oceanic_grid_samples,
+        continental_grid_samples,
+        time_range,
+        times_per_window,
+        ocean_age_to_depth_model,
+        lithologies,
+        lithology_components,
+        dynamic_topography_model,
+        sea_levels,
+        rotation_filenames,
+        anchor_plate_id,
+        output_positive_bathymetry_below_sea_level,
+        num_grid_sample_groups=1,
+        progress_callback=None,
+        completed_times=None):
+    """
+    Generate (time, paleo bathymetry) for each time in 'time_range', processing a window of 'times_per_window' times at a time.
+    
+    Only the paleo bathymetry of the current window of times is in memory at any time.
+    If 'worker_pool' is None then all grid samples are processed in the current process.
+    
+    The grid samples in each window are divided into groups of roughly equal cost, where the cost of a grid sample is the
+    number of times (in the window) that it exists at (older grid samples are reconstructed/backtracked over more times).
+    
+    If 'progress_callback' is specified then it is called with the fraction (between 0 and 1) of the total cost completed so far.
+    
+    Any times in 'completed_times' are skipped (not generated).
+    """
+    
+    # Partitioning plate appearance ages (at index 5 of each oceanic and continental grid sample).
+    # Grid samples are not reconstructed prior to these ages.
+    oceanic_ages = np.array([oceanic_grid_sample[5] for oceanic_grid_sample in oceanic_grid_samples], dtype=float)
+    continental_ages = np.array([continental_grid_sample[5] for continental_grid_sample in continental_grid_samples], dtype=float)
+    
+    oldest_time = time_range[-1]
+    
+    # Skip times that have already been completed.
+    # Note: This happens after getting the oldest time since that's used when backtracking (regardless of which times are generated).
+    if completed_times:
+        time_range = [time for time in time_range if time not in completed_times]
+    
+    # The total cost (over all windows of times) is used to report progress.
+    total_cost = max(1, int(_get_num_time_steps(oceanic_ages, time_range).sum() + _get_num_time_steps(continental_ages, time_range).sum()))
+    completed_cost = 0
+    
+    for window_start_index in range(0, len(time_range), times_per_window):
+        window_time_range = time_range[window_start_index:window_start_index + times_per_window]
+        
+        # Only those grid samples that exist at the youngest time in the current window contribute bathymetry to the window.
+        window_oceanic_grid_sample_indices = np.where(oceanic_ages >= window_time_range[0])[0]
+        window_continental_grid_sample_indices = np.where(continental_ages >= window_time_range[0])[0]
+        window_oceanic_grid_samples = [oceanic_grid_samples[index] for index in window_oceanic_grid_sample_indices]
+        window_continental_grid_samples = [continental_grid_samples[index] for index in window_continental_grid_sample_indices]
+        
+        # The cost of each grid sample in the current window (the number of times in the window it exists at).
+        window_oceanic_costs = _get_num_time_steps(oceanic_ages[window_oceanic_grid_sample_indices], window_time_range)
+        window_continental_costs = _get_num_time_steps(continental_ages[window_continental_grid_sample_indices], window_time_range)
+        window_cost = window_oceanic_costs.sum() + window_continental_costs.sum()
+        count('reconstruction.points_out', int(window_cost))
+        
+        reconstruct_backtrack_oceanic_bathymetry = partial(
+            _reconstruct_backtrack_oceanic_bathymetry,
+            time_range=window_time_range,
+            oldest_time=oldest_time,
+            ocean_age_to_depth_model=ocean_age_to_depth_model,
+            lithologies=lithologies,
+            lithology_components=lithology_components,
+            dynamic_topography_model=dynamic_topography_model,
+            sea_levels=sea_levels,
+            rotation_filenames=rotation_filenames,
+            anchor_plate_id=anchor_plate_id,
+            output_positive_bathymetry_below_sea_level=output_positive_bathymetry_below_sea_level)
+        reconstruct_backtrack_continental_bathymetry = partial(
+            _reconstruct_backtrack_continental_bathymetry,
+            time_range=window_time_range,
+            oldest_time=oldest_time,
+            lithologies=lithologies,
+            lithology_components=lithology_components,
+            dynamic_topography_model=dynamic_topography_model,
+            sea_levels=sea_levels,
+            rotation_filenames=rotation_filenames,
+            anchor_plate_id=anchor_plate_id,
+            output_positive_bathymetry_below_sea_level=output_positive_bathymetry_below_sea_level)
+        
+        if worker_pool is None:
+            with stage('reconstruction'):
+                paleo_bathymetry_dict_list = [
+                    reconstruct_backtrack_oceanic_bathymetry(window_oceanic_grid_samples),
+                    reconstruct_backtrack_continental_bathymetry(window_continental_grid_samples)]
+        else:
+            # Divide the oceanic and continental points into groups of roughly equal cost.
+            # Both are submitted to the worker pool together (as heterogeneous tasks) so that the continental groups
+            # fill in behind the oceanic groups (rather than waiting for all oceanic groups to finish).
+            oceanic_tasks, continental_tasks = _divide_workloads_into_tasks(
+                [
+                    (reconstruct_backtrack_oceanic_bathymetry, window_oceanic_grid_samples, window_oceanic_costs),
+                    (reconstruct_backtrack_continental_bathymetry, window_continental_grid_samples, window_continental_costs)
+                ],
+                num_grid_sample_groups)
+
+            if shared_memory is None:
+                # Distribute the groups of oceanic and continental points across the worker pool.
+                with stage('reconstruction'):
+                    paleo_bathymetry_dict_list = worker_pool.map(_run_task, oceanic_tasks + continental_tasks, 1)  # chunksize
+            else:
+                # Distribute the groups of oceanic and continental points across the worker pool
+                # and have the worker processes write their paleo bathymetries directly into shared memory.
+                def task_completed(task_cost):
+                    if progress_callback:
+                        progress_callback(float(completed_cost + task_cost) / total_cost)
+                with stage('reconstruction'):
+                    paleo_bathymetry_arrays = _reconstruct_backtrack_bathymetry_using_shared_memory(
+                        worker_pool,
+                        window_time_range,
+                        oceanic_tasks + continental_tasks,
+                        task_completed)
+                completed_cost += window_cost
+                for time, paleo_bathymetry_array in zip(window_time_range, paleo_bathymetry_arrays):
+                    yield time, paleo_bathymetry_array
+                continue
+        
+        completed_cost += window_cost
+        if progress_callback:
+            progress_callback(float(completed_cost) / total_cost)
+        
+        # Combine the bathymetry dicts of the current window and generate them in time order.
+        for time in window_time_range:
+            yield time, np.concatenate([paleo_bathymetry_dict[time] for paleo_bathymetry_dict in paleo_bathymetry_dict_list])
+
+
+def _reconstruct_backtrack_bathymetry_using_shared_memory(
+        worker_pool,
+        time_range,
+        tasks,
+        task_completed_callback=None):
+    """
+    Run each task (a 2-tuple of reconstruct/backtrack function and its grid samples) in the worker pool with output in shared memory.
+    
+    Returns a list of (N, 3) arrays of (longitude, latitude, bathymetry) - one per time in 'time_range'.
+    Within each array the rows are in task order (and in grid sample order within each task), which is the same order as
+    combining the dicts returned by the tasks.
+    
+    The most expensive tasks are submitted first, and each worker process is given another task as soon as it finishes one,
+    so the cheaper tasks fill in behind the more expensive ones.
+    If 'task_completed_callback' is specified then it is called (in this process) with the total cost of all tasks completed so far,
+    where the cost of a task is the number of paleo bathymetry points it generates (over all times).
+    """
+    
+    # A grid sample contributes a paleo bathymetry row at each time it exists (up to and including its age at index 5).
+    # So we know in advance how many rows each task writes at each time.
+    time_array = np.array(time_range, dtype=float)
+    task_row_counts = np.array(
+        [[np.count_nonzero(np.array([grid_sample[5] for grid_sample in grid_samples], dtype=float) >= time) for time in time_array]
+         for _, grid_samples in tasks],
+        dtype=np.int64).reshape(len(tasks), len(time_range))
+    
+    # Rows are stored by time (all rows at the youngest time first), then by task.
+    time_row_counts = task_row_counts.sum(axis=0)
+    time_row_offsets = np.concatenate(([0], np.cumsum(time_row_counts)[:-1]))
+    task_row_offsets = time_row_offsets + np.cumsum(task_row_counts, axis=0) - task_row_counts
+    num_rows = int(time_row_counts.sum())
+    
+    # Submit the most expensive tasks first (but tasks can complete in any order since each writes to its own rows).
+    task_costs = task_row_counts.sum(axis=1)
+    task_indices = np.argsort(-task_costs, kind='stable')
+    
+    # Note: Shared memory cannot have zero size.
+    paleo_bathymetry_shared_memory = shared_memory.SharedMemory(create=True, size=max(1, num_rows * 3 * np.dtype(float).itemsize))
+    try:
+        completed_cost = 0
+        for task_index in worker_pool.imap_unordered(
+                _reconstruct_backtrack_bathymetry_into_shared_memory,
+                [
+                    (task_index, tasks[task_index][0], tasks[task_index][1], paleo_bathymetry_shared_memory.name, num_rows,
+                     task_row_offsets[task_index], task_row_counts[task_index])
+                    for task_index in task_indices
+                ],
+                1):  # chunksize
+            completed_cost += task_costs[task_index]
+            if task_completed_callback:
+                task_completed_callback(completed_cost)
+        
+        # Copy out of shared memory (so it can be released).
+        paleo_bathymetry = np.ndarray((num_rows, 3), dtype=float, buffer=paleo_bathymetry_shared_memory.buf)
+        paleo_bathymetry_arrays = [
+            paleo_bathymetry[time_row_offset:time_row_offset + time_row_count].copy()
+            for time_row_offset, time_row_count in zip(time_row_offsets, time_row_counts)]
+        # Release our view of the shared memory buffer (otherwise it cannot be closed).
+        del paleo_bathymetry
+    finally:
+        paleo_bathymetry_shared_memory.close()
+        paleo_bathymetry_shared_memory.unlink()
+    
+    return paleo_bathymetry_arrays
+
+
+def _reconstruct_backtrack_bathymetry_into_shared_memory(
+        task):
+    """
+    Reconstruct/backtrack grid samples and write their paleo bathymetry at each time into the specified rows of shared memory.
+    
+    'task' is a tuple of (task index, reconstruct/backtrack function, grid samples, shared memory name, number of rows in shared memory,
+    row offset at each time, row count at each time). Returns the task index (since tasks can complete in any order).
+    """
+    
+    (task_index,
+     reconstruct_backtrack_bathymetry,
+     grid_samples,
+     shared_memory_name,
+     num_rows,
+     row_offsets,
+     row_counts) = task
+    
+    paleo_bathymetry_dict = reconstruct_backtrack_bathymetry(grid_samples)
+    
+    paleo_bathymetry_shared_memory = shared_memory.SharedMemory(name=shared_memory_name)
+    try:
+        paleo_bathymetry = np.ndarray((num_rows, 3), dtype=float, buffer=paleo_bathymetry_shared_memory.buf)
+        for time_index, time in enumerate(sorted(paleo_bathymetry_dict)):
+            paleo_bathymetry_at_time = paleo_bathymetry_dict[time]
+            if len(paleo_bathymetry_at_time) != row_counts[time_index]:
+                raise RuntimeError('Unexpected number of paleo bathymetry points at {0}Ma.'.format(time))
+            row_offset = row_offsets[time_index]
+            paleo_bathymetry[row_offset:row_offset + len(paleo_bathymetry_at_time)] = paleo_bathymetry_at_time
+        # Release our view of the shared memory buffer (otherwise it cannot be closed).
+        del paleo_bathymetry
+    finally:
+        paleo_bathymetry_shared_memory.close()
+    
+    return task_index
+
+
+def _allocate_paleo_bathymetry_values(ages, time_range):
+    """
+    Allocate the flat (longitude, latitude, bathymetry) values at each time in 'time_range' of the grid samples with the specified ages.
+    
+    Returns a list (one per time) of 1D NumPy arrays with three values for each grid sample that exists at that time
+    (see '_get_num_time_steps()'). Each can be reshaped to a (N, 3) array (with one row per point) once all its values are written.
+    """
+    
+    num_time_steps = _get_num_time_steps(np.asarray(ages, dtype=float), time_range)
+    
+    return [np.empty(3 * np.count_nonzero(num_time_steps > time_index), dtype=float) for time_index in range(len(time_range))]
+
+
+def _prepare_oceanic_grid_samples(
+        oceanic_grid_samples,
+        oldest_time,
+        ocean_age_to_depth_model,
+        lithologies,
+        lithology_components):
+    """
+    Append the time-independent tectonic subsidence model adjustment to each oceanic grid sample.
+    """
+    
+    prepared_oceanic_grid_samples = []
+    
+    # Time spent decompacting (summed here and recorded once, since entering a profiling stage for each grid sample is too costly).
+    decompaction_seconds = 0.0
+    
+    # Iterate over the *oceanic* grid samples.
+    for oceanic_grid_sample in oceanic_grid_samples:
+        _, _, present_day_total_sediment_thickness, present_day_water_depth, _, age = oceanic_grid_sample
+        
+        well = _create_oceanic_well(age, present_day_total_sediment_thickness, oldest_time, lithologies, lithology_components)
+
+        # Unload the present day sediment to get unloaded present day water depth.
+        # Apply an isostatic correction to the total sediment thickness (we decompact the well at present day to find this).
+        # Note that sea level variations don't apply here because they are zero at present day.
+        start_time = timer()
+        present_day_decompacted_well = well.decompact(0.0)
+        decompaction_seconds += timer() - start_time
+        present_day_tectonic_subsidence = present_day_water_depth + present_day_decompacted_well.get_sediment_isostatic_correction()
+
+        # Present-day tectonic subsidence calculated from age-to-depth model.
+        present_day_tectonic_subsidence_from_model = age_to_depth.convert_age_to_depth(age, ocean_age_to_depth_model)
+        
+        # There will be a difference between unloaded water depth and subsidence based on age-to-depth model.
+        # Assume this offset is constant for all ages and use it to adjust the subsidence obtained from age-to-depth model for other ages.
+        tectonic_subsidence_model_adjustment = present_day_tectonic_subsidence - present_day_tectonic_subsidence_from_model
+        
+        prepared_oceanic_grid_samples.append(tuple(oceanic_grid_sample) + (tectonic_subsidence_model_adjustment,))
+    
+    add_stage_time('decompaction', decompaction_seconds, len(oceanic_grid_samples))
+    
+    return prepared_oceanic_grid_samples
+
+
+def _create_oceanic_well(
+        age,
+        present_day_total_sediment_thickness,
+        oldest_time,
+        lithologies,
+        lithology_components):
+    
+    # Create a well at the current grid sample location with a single stratigraphic layer of total sediment thickness
+    # that began sediment deposition at 'age' Ma (and finished at present day).
+    well = Well()
+    well.add_compacted_unit(0.0, age, 0.0, present_day_total_sediment_thickness, lithology_components, lithologies)
+    # If we're reconstructing to times prior to 'age' then add an extra stratigraphic layer with zero thickness to cover the period prior
+    # to ocean crust formation at the mid-ocean ridge. We won't actually reconstruct prior to crust formation, but having this zero thickness layer
+    # means we don't have to test if None is returned by 'well.decompact(decompaction_time)' for special cases like an age grid value of zero
+    # (where we'd still like to create a bathmetry value at present day). Also this extra layer is similar to how it's done with continental crust.
+    if oldest_time >= age:
+        well.add_compacted_unit(age, oldest_time + 1, present_day_total_sediment_thickness, present_day_total_sediment_thickness, lithology_components, lithologies)
+    
+    return well
 
 
 def _reconstruct_backtrack_oceanic_bathymetry(
         oceanic_grid_samples,
         time_range,
+        oldest_time,
         ocean_age_to_depth_model,
         lithologies,
         lithology_components,
@@ -544,16 +1281,22 @@ def _reconstruct_backtrack_oceanic_bathymetry(
         rotation_filenames,
         anchor_plate_id,
         output_positive_bathymetry_below_sea_level):
+    """
+    Reconstruct and backtrack prepared oceanic grid samples (see '_prepare_oceanic_grid_samples()') at the times in 'time_range'.
+    
+    'time_range' can be a window of times within the full time range (that ends at 'oldest_time').
+    """
 
     # Rotation model used to reconstruct the grid points.
     # Cache enough internal reconstruction trees so that we're not constantly recreating them as we move from point to point.
-    rotation_model = pygplates.RotationModel(rotation_filenames, reconstruction_tree_cache_size = len(time_range))
+    # Note: The rotation files are only loaded once per process (this just adapts the cached rotation model to cache the reconstruction trees of 'time_range').
+    rotation_model = pygplates.RotationModel(_get_rotation_model(rotation_filenames), reconstruction_tree_cache_size=len(time_range))
     
     # Create time-dependent grid object for sampling dynamic topography (if requested).
-    if dynamic_topography_model:
+    if dynamic_topography_model and oceanic_grid_samples:
         # Gather all the sample positions and their ages.
         longitudes, latitudes, ages = [], [], []
-        for longitude, latitude, _, _, _, age in oceanic_grid_samples:
+        for longitude, latitude, _, _, _, age, _ in oceanic_grid_samples:
             longitudes.append(longitude)
             latitudes.append(latitude)
             ages.append(age)
@@ -569,35 +1312,28 @@ def _reconstruct_backtrack_oceanic_bathymetry(
     else:
         dynamic_topography = None
     
-    # Paleo bathymetry is stored as a dictionary mapping each age in time range to a list of 3-tuples (lon, lat, bathymetry).
-    paleo_bathymetry = {time : [] for time in time_range}
+    # Paleo bathymetry is written into a flat array of (lon, lat, bathymetry) values at each time in time range
+    # (each allocated up front, since we know how many grid samples exist at each time).
+    #
+    # Note: The 6th value (index 5) of each grid sample is its age.
+    paleo_bathymetry = _allocate_paleo_bathymetry_values([grid_sample[5] for grid_sample in oceanic_grid_samples], time_range)
+    # The offset of the next (lon, lat, bathymetry) values to write at each time.
+    paleo_bathymetry_offsets = [0] * len(time_range)
+    
+    # Time spent decompacting and rotating (summed here and recorded once, since entering a profiling stage for each point and time is too costly).
+    num_decompactions = 0
+    decompaction_seconds = 0.0
+    rotation_seconds = 0.0
 
     # Iterate over the *oceanic* grid samples.
-    for grid_sample_index, (longitude, latitude, present_day_total_sediment_thickness, present_day_water_depth, reconstruction_plate_id, age) in enumerate(oceanic_grid_samples):
-        
-        # Create a well at the current grid sample location with a single stratigraphic layer of total sediment thickness
-        # that began sediment deposition at 'age' Ma (and finished at present day).
-        well = Well()
-        well.add_compacted_unit(0.0, age, 0.0, present_day_total_sediment_thickness, lithology_components, lithologies)
-        # If we're reconstructing to times prior to 'age' then add an extra stratigraphic layer with zero thickness to cover the period prior
-        # to ocean crust formation at the mid-ocean ridge. We won't actually reconstruct prior to crust formation, but having this zero thickness layer
-        # means we don't have to test if None is returned by 'well.decompact(decompaction_time)' for special cases like an age grid value of zero
-        # (where we'd still like to create a bathmetry value at present day). Also this extra layer is similar to how it's done with continental crust. 
-        if time_range[-1] >= age:
-            well.add_compacted_unit(age, time_range[-1] + 1, present_day_total_sediment_thickness, present_day_total_sediment_thickness, lithology_components, lithologies)
-
-        # Unload the present day sediment to get unloaded present day water depth.
-        # Apply an isostatic correction to the total sediment thickness (we decompact the well at present day to find this).
-        # Note that sea level variations don't apply here because they are zero at present day.
-        present_day_decompacted_well = well.decompact(0.0)
-        present_day_tectonic_subsidence = present_day_water_depth + present_day_decompacted_well.get_sediment_isostatic_correction()
-
-        # Present-day tectonic subsidence calculated from age-to-depth model.
-        present_day_tectonic_subsidence_from_model = age_to_depth.convert_age_to_depth(age, ocean_age_to_depth_model)
+    for grid_sample_index, (longitude, latitude, present_day_total_sediment_thickness, present_day_water_depth, reconstruction_plate_id, age,
+                            tectonic_subsidence_model_adjustment) in enumerate(oceanic_grid_samples):
         
-        # There will be a difference between unloaded water depth and subsidence based on age-to-depth model.
-        # Assume this offset is constant for all ages and use it to adjust the subsidence obtained from age-to-depth model for other ages.
-        tectonic_subsidence_model_adjustment = present_day_tectonic_subsidence - present_day_tectonic_subsidence_from_model
+        # If the youngest time has exceeded the age of ocean crust then there's nothing to reconstruct for the current grid sample.
+        if time_range[0] > age:
+            continue
+        
+        well = _create_oceanic_well(age, present_day_total_sediment_thickness, oldest_time, lithologies, lithology_components)
 
         # If we have dynamic topography then get present-day dynamic topography.
         if dynamic_topography:
@@ -605,7 +1341,7 @@ def _reconstruct_backtrack_oceanic_bathymetry(
         
         present_day_location = pygplates.PointOnSphere(latitude, longitude)
         
-        for decompaction_time in time_range:
+        for time_index, decompaction_time in enumerate(time_range):
             # If the decompaction time has exceeded the age of ocean crust (bottom age of well) then we're finished with current well.
             # That is, the current time exceeded the age grid value. Which means the ocean crust at the current point has been reconstructed
             # back prior to the time it was created. So we're finished with it (because the remaining times in the loop are even older).
@@ -613,7 +1349,10 @@ def _reconstruct_backtrack_oceanic_bathymetry(
                 break
 
             # Decompact at the current time.
+            start_time = timer()
             decompacted_well = well.decompact(decompaction_time)
+            decompaction_seconds += timer() - start_time
+            num_decompactions += 1
 
             # Age of the ocean basin at location when it's decompacted to the current decompaction age.
             paleo_age_of_crust_at_decompaction_time = age - decompaction_time
@@ -648,39 +1387,50 @@ def _reconstruct_backtrack_oceanic_bathymetry(
             #
             # NOTE: We specify 'from_time=0' since there could be a non-zero finite rotation at present day (generally there shouldn't be) and
             #       we don't want our present day location to move when 'decompaction_time' is zero (or have this offset for non-zero times).
+            start_time = timer()
             rotation = rotation_model.get_rotation(decompaction_time, reconstruction_plate_id, from_time=0, anchor_plate_id=anchor_plate_id)
             # Reconstruct location to current decompaction time.
             reconstructed_location = rotation * present_day_location
             reconstructed_latitude, reconstructed_longitude = reconstructed_location.to_lat_lon()
+            rotation_seconds += timer() - start_time
 
-            # Add the bathymetry (and its reconstructed location) to the list of bathymetry points for the current decompaction time.
-            paleo_bathymetry[decompaction_time].append((reconstructed_longitude, reconstructed_latitude, bathymetry))
+            # Write the bathymetry (and its reconstructed location) to the bathymetry points for the current decompaction time.
+            #
+            # Note: Writing individual values into a flat array is faster than writing a row into a (N, 3) array.
+            paleo_bathymetry_values = paleo_bathymetry[time_index]
+            paleo_bathymetry_offset = paleo_bathymetry_offsets[time_index]
+            paleo_bathymetry_values[paleo_bathymetry_offset] = reconstructed_longitude
+            paleo_bathymetry_values[paleo_bathymetry_offset + 1] = reconstructed_latitude
+            paleo_bathymetry_values[paleo_bathymetry_offset + 2] = bathymetry
+            paleo_bathymetry_offsets[time_index] = paleo_bathymetry_offset + 3
 
-    return paleo_bathymetry
+    add_stage_time('decompaction', decompaction_seconds, num_decompactions)
+    add_stage_time('rotation', rotation_seconds, num_decompactions)
 
+    return {time: paleo_bathymetry_values.reshape(-1, 3) for time, paleo_bathymetry_values in zip(time_range, paleo_bathymetry)}
 
-def _reconstruct_backtrack_continental_bathymetry(
+
+def _get_dynamic_topography_rift_start_age(rift_start_age):
+    # Use integral rift start ages when caching dynamic topography to avoid an excessive number of dynamic topography samples
+    # (which can happen since the rift start ages are linearly filtered from rift start age grid and can therefore have many different values).
+    return math.ceil(rift_start_age)
+
+
+def _prepare_continental_grid_samples(
         continental_grid_samples,
-        time_range,
+        oldest_time,
         lithologies,
         lithology_components,
-        dynamic_topography_model,
-        sea_levels,
-        rotation_filenames,
-        anchor_plate_id,
-        output_positive_bathymetry_below_sea_level):
-
-    # Rotation model used to reconstruct the grid points.
-    # Cache enough internal reconstruction trees so that we're not constantly recreating them as we move from point to point.
-    rotation_model = pygplates.RotationModel(rotation_filenames, reconstruction_tree_cache_size = len(time_range))
+        dynamic_topography_model):
+    """
+    Append the time-independent rifting stretching factor (beta), pre-rift crustal thickness and
+    dynamic topography at rift start (zero if no dynamic topography model) to each continental grid sample.
     
-    # Use integral rift start ages when caching dynamic topography to avoid an excessive number of dynamic topography samples
-    # (which can happen since the rift start ages are linearly filtered from rift start age grid and can therefore have many different values).
-    def get_dynamic_topography_rift_start_age(rift_start_age):
-        return math.ceil(rift_start_age)
+    Continental grid samples whose stretching factor cannot be estimated accurately enough are excluded.
+    """
     
     # Create time-dependent grid object for sampling dynamic topography (if requested).
-    if dynamic_topography_model:
+    if dynamic_topography_model and continental_grid_samples:
         # Gather all the sample positions and their ages.
         longitudes, latitudes, ages = [], [], []
         dynamic_topography_rift_start_ages = set()
@@ -688,71 +1438,65 @@ def _reconstruct_backtrack_continental_bathymetry(
             longitudes.append(longitude)
             latitudes.append(latitude)
             ages.append(rift_start_age)
-            dynamic_topography_rift_start_ages.add(get_dynamic_topography_rift_start_age(rift_start_age))
+            dynamic_topography_rift_start_ages.add(_get_dynamic_topography_rift_start_age(rift_start_age))
         dynamic_topography_model = DynamicTopography.create_from_model_or_bundled_model_name(dynamic_topography_model, longitudes, latitudes, ages)
 
-        # Pre-calculate dynamic topography for all decompaction times (including present day) and all continent sample points.
+        # Pre-calculate dynamic topography at present day and all (integral) rift start ages for all continent sample points.
         # At each time we have a list of dynamic topographies (one per continent sample point) which is stored in a dictionary (keyed by time).
-        dynamic_topography = {}
-        for decompaction_time in time_range:
-            dynamic_topography[decompaction_time] = dynamic_topography_model.sample(decompaction_time)
-        if 0.0 not in dynamic_topography:  # present day
-            dynamic_topography[0.0] = dynamic_topography_model.sample(0.0)
-        
-        # Also make sure we have dynamic topography for all the (integral) rift start ages since they can be outside
-        # the range (and time increment) of present day to oldest time.
         #
         # Note that we use integral ages to avoid an excessive number of dynamic topography samples
         # (which can happen since the rift start ages are linearly filtered from the rift start age grid and
         # therefore we can get a lot of different values).
+        dynamic_topography = {0.0: dynamic_topography_model.sample(0.0)}
         for dynamic_topography_rift_start_age in dynamic_topography_rift_start_ages:
             if dynamic_topography_rift_start_age not in dynamic_topography:
                 dynamic_topography[dynamic_topography_rift_start_age] = dynamic_topography_model.sample(dynamic_topography_rift_start_age)
     else:
         dynamic_topography = None
     
-    # Paleo bathymetry is stored as a dictionary mapping each age in time range to a list of 3-tuples (lon, lat, bathymetry).
-    paleo_bathymetry = {time : [] for time in time_range}
+    prepared_continental_grid_samples = []
+    
+    # Time spent decompacting and estimating beta (summed here and recorded once, since entering a profiling stage for each grid sample is too costly).
+    decompaction_seconds = 0.0
+    beta_estimation_seconds = 0.0
 
     # Iterate over the *continental* grid samples.
-    for grid_sample_index, (longitude, latitude, present_day_total_sediment_thickness, present_day_water_depth, reconstruction_plate_id, age, present_day_crustal_thickness, rift_start_age, rift_end_age) in enumerate(continental_grid_samples):
-        
-        # Create a well at the current grid sample location with a single stratigraphic layer of total sediment thickness
-        # that began sediment deposition when rifting began (and finished at present day).
-        well = Well()
-        well.add_compacted_unit(0.0, rift_start_age, 0.0, present_day_total_sediment_thickness, lithology_components, lithologies)
-        # If we're reconstructing to times prior to rifting then add an extra stratigraphic layer with zero thickness to cover the period prior to rifting.
-        # Having this zero thickness layer prevents us from prematurely ending bathymetry reconstruction for times prior to rifting by ensuring
-        # 'well.decompact(decompaction_time)' does not return None (when 'decompaction_time >= rift_start_age').
-        # The tectonic subsidence will be zero during this time period.
-        # It also allows us to easily see other effects prior to sediment deposition (eg, sea level, dynamic topography). 
-        if time_range[-1] >= rift_start_age:
-            well.add_compacted_unit(rift_start_age, time_range[-1] + 1, present_day_total_sediment_thickness, present_day_total_sediment_thickness, lithology_components, lithologies)
+    for grid_sample_index, continental_grid_sample in enumerate(continental_grid_samples):
+        (_, _, present_day_total_sediment_thickness, present_day_water_depth, _, _,
+         present_day_crustal_thickness, rift_start_age, rift_end_age) = continental_grid_sample
+        
+        well = _create_continental_well(rift_start_age, present_day_total_sediment_thickness, oldest_time, lithologies, lithology_components)
 
         # Unload the present day sediment to get unloaded present day water depth.
         # Apply an isostatic correction to the total sediment thickness (we decompact the well at present day to find this).
         # Note that sea level variations don't apply here because they are zero at present day.
+        start_time = timer()
         present_day_decompacted_well = well.decompact(0.0)
+        decompaction_seconds += timer() - start_time
         present_day_tectonic_subsidence = present_day_water_depth + present_day_decompacted_well.get_sediment_isostatic_correction()
         
         # If we have dynamic topography then get dynamic topography at rift start and at present day.
         if dynamic_topography:
             dynamic_topography_at_present_day = dynamic_topography[0.0][grid_sample_index]
             # Note that we only guaranteed to have dynamic topography values at *integral* rift start ages
-            # (and obtained using 'get_dynamic_topography_rift_start_age').
-            dynamic_topography_at_rift_start = dynamic_topography[get_dynamic_topography_rift_start_age(rift_start_age)][grid_sample_index]
+            # (and obtained using '_get_dynamic_topography_rift_start_age').
+            dynamic_topography_at_rift_start = dynamic_topography[_get_dynamic_topography_rift_start_age(rift_start_age)][grid_sample_index]
             
             # Estimate how much of present-day subsidence is due to dynamic topography.
             # We crudely remove the relative difference of dynamic topography between rift start and present day
             # so we can see how much subsidence between those two times is due to stretching and thermal subsidence.
             # Dynamic topography is elevation but we want depth (subsidence) so add (instead of subtract).
             present_day_tectonic_subsidence += dynamic_topography_at_present_day - dynamic_topography_at_rift_start
+        else:
+            dynamic_topography_at_rift_start = 0.0
 
         # Attempt to estimate rifting stretching factor (beta) that generates the present day tectonic subsidence.
+        start_time = timer()
         rift_beta, subsidence_residual = rifting.estimate_beta(
             present_day_tectonic_subsidence,
             present_day_crustal_thickness,
             rift_end_age)
+        beta_estimation_seconds += timer() - start_time
         
         # Skip the current grid sample if the rifting stretching factor (beta) estimate results in a
         # tectonic subsidence inaccuracy (at present day) exceeding this amount (in metres).
@@ -761,14 +1505,110 @@ def _reconstruct_backtrack_continental_bathymetry(
         # this subsidence would be unrealistically large and result in a pre-rift crustal thickness that
         # exceeds typical lithospheric thicknesses.
         if math.fabs(subsidence_residual) > _MAX_TECTONIC_SUBSIDENCE_RIFTING_RESIDUAL_ERROR:
+            count('beta_estimation.points_excluded')
             continue
         
         # Initial (pre-rift) crustal thickness is beta times present day crustal thickness.
         pre_rift_crustal_thickness = rift_beta * present_day_crustal_thickness
         
+        prepared_continental_grid_samples.append(
+            tuple(continental_grid_sample) + (rift_beta, pre_rift_crustal_thickness, dynamic_topography_at_rift_start))
+    
+    add_stage_time('decompaction', decompaction_seconds, len(continental_grid_samples))
+    add_stage_time('beta_estimation', beta_estimation_seconds, len(continental_grid_samples))
+    
+    return prepared_continental_grid_samples
+
+
+def _create_continental_well(
+        rift_start_age,
+        present_day_total_sediment_thickness,
+        oldest_time,
+        lithologies,
+        lithology_components):
+    
+    # Create a well at the current grid sample location with a single stratigraphic layer of total sediment thickness
+    # that began sediment deposition when rifting began (and finished at present day).
+    well = Well()
+    well.add_compacted_unit(0.0, rift_start_age, 0.0, present_day_total_sediment_thickness, lithology_components, lithologies)
+    # If we're reconstructing to times prior to rifting then add an extra stratigraphic layer with zero thickness to cover the period prior to rifting.
+    # Having this zero thickness layer prevents us from prematurely ending bathymetry reconstruction for times prior to rifting by ensuring
+    # 'well.decompact(decompaction_time)' does not return None (when 'decompaction_time >= rift_start_age').
+    # The tectonic subsidence will be zero during this time period.
+    # It also allows us to easily see other effects prior to sediment deposition (eg, sea level, dynamic topography).
+    if oldest_time >= rift_start_age:
+        well.add_compacted_unit(rift_start_age, oldest_time + 1, present_day_total_sediment_thickness, present_day_total_sediment_thickness, lithology_components, lithologies)
+    
+    return well
+
+
+def _reconstruct_backtrack_continental_bathymetry(
+        continental_grid_samples,
+        time_range,
+        oldest_time,
+        lithologies,
+        lithology_components,
+        dynamic_topography_model,
+        sea_levels,
+        rotation_filenames,
+        anchor_plate_id,
+        output_positive_bathymetry_below_sea_level):
+    """
+    Reconstruct and backtrack prepared continental grid samples (see '_prepare_continental_grid_samples()') at the times in 'time_range'.
+    
+    'time_range' can be a window of times within the full time range (that ends at 'oldest_time').
+    """
+
+    # Rotation model used to reconstruct the grid points.
+    # Cache enough internal reconstruction trees so that we're not constantly recreating them as we move from point to point.
+    # Note: The rotation files are only loaded once per process (this just adapts the cached rotation model to cache the reconstruction trees of 'time_range').
+    rotation_model = pygplates.RotationModel(_get_rotation_model(rotation_filenames), reconstruction_tree_cache_size=len(time_range))
+    
+    # Create time-dependent grid object for sampling dynamic topography (if requested).
+    if dynamic_topography_model and continental_grid_samples:
+        # Gather all the sample positions and their ages.
+        longitudes, latitudes, ages = [], [], []
+        for longitude, latitude, _, _, _, _, _, rift_start_age, _, _, _, _ in continental_grid_samples:
+            longitudes.append(longitude)
+            latitudes.append(latitude)
+            ages.append(rift_start_age)
+        dynamic_topography_model = DynamicTopography.create_from_model_or_bundled_model_name(dynamic_topography_model, longitudes, latitudes, ages)
+
+        # Pre-calculate dynamic topography for all decompaction times and all continent sample points.
+        # At each time we have a list of dynamic topographies (one per continent sample point) which is stored in a dictionary (keyed by time).
+        dynamic_topography = {}
+        for decompaction_time in time_range:
+            dynamic_topography[decompaction_time] = dynamic_topography_model.sample(decompaction_time)
+    else:
+        dynamic_topography = None
+    
+    # Paleo bathymetry is written into a flat array of (lon, lat, bathymetry) values at each time in time range
+    # (each allocated up front, since we know how many grid samples exist at each time).
+    #
+    # Note: The 6th value (index 5) of each grid sample is its age.
+    paleo_bathymetry = _allocate_paleo_bathymetry_values([grid_sample[5] for grid_sample in continental_grid_samples], time_range)
+    # The offset of the next (lon, lat, bathymetry) values to write at each time.
+    paleo_bathymetry_offsets = [0] * len(time_range)
+    
+    # Time spent decompacting and rotating (summed here and recorded once, since entering a profiling stage for each point and time is too costly).
+    num_decompactions = 0
+    decompaction_seconds = 0.0
+    rotation_seconds = 0.0
+
+    # Iterate over the *continental* grid samples.
+    for grid_sample_index, (longitude, latitude, present_day_total_sediment_thickness, present_day_water_depth, reconstruction_plate_id, age,
+                            present_day_crustal_thickness, rift_start_age, rift_end_age,
+                            rift_beta, pre_rift_crustal_thickness, dynamic_topography_at_rift_start) in enumerate(continental_grid_samples):
+        
+        # If the youngest time has exceeded the age of continental crust then there's nothing to reconstruct for the current grid sample.
+        if time_range[0] > age:
+            continue
+        
+        well = _create_continental_well(rift_start_age, present_day_total_sediment_thickness, oldest_time, lithologies, lithology_components)
+        
         present_day_location = pygplates.PointOnSphere(latitude, longitude)
         
-        for decompaction_time in time_range:
+        for time_index, decompaction_time in enumerate(time_range):
             # If the decompaction time has exceeded the age of continental crust then we're finished with current well.
             # That is, the current time exceeded the begin time of static polygon. Which means the continental crust at the current point has been
             # reconstructed back prior to the time it was created. So we're finished with it (because the remaining times in the loop are even older).
@@ -776,7 +1616,10 @@ def _reconstruct_backtrack_continental_bathymetry(
                 break
 
             # Decompact at the current time.
+            start_time = timer()
             decompacted_well = well.decompact(decompaction_time)
+            decompaction_seconds += timer() - start_time
+            num_decompactions += 1
 
             # Calculate rifting subsidence at decompaction time.
             decompacted_well.tectonic_subsidence = rifting.total_subsidence(
@@ -807,61 +1650,157 @@ def _reconstruct_backtrack_continental_bathymetry(
             #
             # NOTE: We specify 'from_time=0' since there could be a non-zero finite rotation at present day (generally there shouldn't be) and
             #       we don't want our present day location to move when 'decompaction_time' is zero (or have this offset for non-zero times).
+            start_time = timer()
             rotation = rotation_model.get_rotation(decompaction_time, reconstruction_plate_id, from_time=0, anchor_plate_id=anchor_plate_id)
             # Reconstruct location to current decompaction time.
             reconstructed_location = rotation * present_day_location
             reconstructed_latitude, reconstructed_longitude = reconstructed_location.to_lat_lon()
+            rotation_seconds += timer() - start_time
+
+            # Write the bathymetry (and its reconstructed location) to the bathymetry points for the current decompaction time.
+            #
+            # Note: Writing individual values into a flat array is faster than writing a row into a (N, 3) array.
+            paleo_bathymetry_values = paleo_bathymetry[time_index]
+            paleo_bathymetry_offset = paleo_bathymetry_offsets[time_index]
+            paleo_bathymetry_values[paleo_bathymetry_offset] = reconstructed_longitude
+            paleo_bathymetry_values[paleo_bathymetry_offset + 1] = reconstructed_latitude
+            paleo_bathymetry_values[paleo_bathymetry_offset + 2] = bathymetry
+            paleo_bathymetry_offsets[time_index] = paleo_bathymetry_offset + 3
+
+    add_stage_time('decompaction', decompaction_seconds, num_decompactions)
+    add_stage_time('rotation', rotation_seconds, num_decompactions)
+
+    return {time: paleo_bathymetry_values.reshape(-1, 3) for time, paleo_bathymetry_values in zip(time_range, paleo_bathymetry)}
 
-            # Add the bathymetry (and its reconstructed location) to the list of bathymetry points for the current decompaction time.
-            paleo_bathymetry[decompaction_time].append((reconstructed_longitude, reconstructed_latitude, bathymetry))
 
-    return paleo_bathymetry
+def _get_cached_model(
+        model_name,
+        create_model,
+        filenames,
+        *key_items):
+    """
+    Return the model created by 'create_model()' from 'filenames', but only create it once per process (and return the cached model thereafter).
+    
+    The model is cached against the name, the signatures of the files (so a modified file is loaded again) and any extra key items.
+    If any filename is not a filename (eg, it's a pygplates feature collection or rotation model) then the model is not cached.
+    """
+    
+    try:
+        cache_key = (model_name, tuple(get_file_signature(filename) for filename in filenames)) + key_items
+    except (TypeError, OSError):
+        # Not all filenames (or a file does not exist). Let 'create_model()' deal with that (eg, use the loaded model or raise an error).
+        return create_model()
+    
+    model = _cached_models.get(cache_key)
+    if model is None:
+        count('model_cache.misses')
+        model = create_model()
+        if len(_cached_models) >= _MAX_CACHED_MODELS:
+            _cached_models.clear()
+        _cached_models[cache_key] = model
+    else:
+        count('model_cache.hits')
+    
+    return model
 
 
-def _assign_reconstruction_plate_ids(
-        grid_samples,
+def _get_rotation_model(rotation_filenames):
+    """
+    Return the rotation model loaded from 'rotation_filenames' (only loaded once per process).
+    """
+    
+    return _get_cached_model(
+        'rotation_model',
+        partial(pygplates.RotationModel, rotation_filenames),
+        rotation_filenames)
+
+
+def _get_plate_partitioner(
         static_polygon_filename,
+        rotation_filenames):
+    """
+    Return the static polygons partitioner loaded from 'static_polygon_filename' and 'rotation_filenames' (only loaded once per process).
+    """
+    
+    return _get_cached_model(
+        'plate_partitioner',
+        partial(pygplates.PlatePartitioner, static_polygon_filename, rotation_filenames),
+        itertools.chain((static_polygon_filename,), rotation_filenames))
+
+
+def _initialise_worker_process(
         rotation_filenames,
-        region_plate_ids=None):
+        static_polygon_filename,
+        exclude_distances_to_trenches_kms):
+    """
+    Load the models used by the paleo bathymetry tasks, once, when a worker process starts.
+    
+    Subsequent tasks (in all stages and all windows of times) then use the cached models.
+    """
+    
+    try:
+        _get_rotation_model(rotation_filenames)
+        _get_plate_partitioner(static_polygon_filename, rotation_filenames)
+        _get_trenches(
+            pybacktrack.bundle_data.BUNDLE_TRENCHES_FILENAME,
+            pybacktrack.bundle_data.BUNDLE_SUBDUCTING_BOUNDARIES_FILENAME,
+            exclude_distances_to_trenches_kms)
+    except Exception:
+        # Any error is raised later (by the task that uses the model). Raising here would only restart the worker process.
+        pass
+
+
+def _partition_grid_samples_exactly(
+        longitudes,
+        latitudes,
+        static_polygon_filename,
+        rotation_filenames):
     
-    # Static polygons partitioner used to assign plate IDs to the grid points.
-    plate_partitioner = pygplates.PlatePartitioner(static_polygon_filename, rotation_filenames)
+    # Static polygons partitioner used to assign plate IDs to the grid points (only loaded once per process).
+    plate_partitioner = _get_plate_partitioner(static_polygon_filename, rotation_filenames)
 
-    updated_grid_samples = []
-    for grid_sample in grid_samples:
-        # Find the plate ID of the static polygon containing the present day location (or zero if not in any plates, which shouldn't happen).
-        longitude, latitude = grid_sample[0], grid_sample[1]
-        present_day_location = pygplates.PointOnSphere(latitude, longitude)
-        partitioning_plate = plate_partitioner.partition_point(present_day_location)
-        if not partitioning_plate:
-            # Not contained by any plates. Shouldn't happen since static polygons have global coverage,
-            # but might if there's tiny cracks between polygons.
-            continue
+    return partition_points_exactly(plate_partitioner, longitudes, latitudes)
 
-        reconstruction_plate_id = partitioning_plate.get_feature().get_reconstruction_plate_id()
 
-        # If any regions were specified then skip any grid samples outside all specified regions.
-        if region_plate_ids:
-            if reconstruction_plate_id not in region_plate_ids:
-                # Skip current grid sample.
-                continue
+def _assign_reconstruction_plate_ids(
+        grid_samples,
+        reconstruction_plate_ids,
+        partitioning_plate_appearance_ages,
+        is_partitioned,
+        region_plate_ids=None):
+    """
+    Exclude grid samples that are not partitioned or (if 'region_plate_ids' specified) are outside all specified regions.
+    
+    'grid_samples' is a (N, C) numpy array. Returns a 3-tuple of numpy arrays of the included grid samples:
+    (grid samples (M, C), reconstruction plate IDs (M,), partitioning plate appearance ages (M,)).
+    """
 
-        # The appearance age of the partitioning polygon (static polygon covering this point).
-        partitioning_plate_appearance_age, _ = partitioning_plate.get_feature().get_valid_time()
-        
-        # Append the assigned reconstruction plate ID and the partitioning polygon appearance age to the grid sample.
-        updated_grid_sample = tuple(grid_sample) + (reconstruction_plate_id, partitioning_plate_appearance_age)
+    reconstruction_plate_ids = np.asarray(reconstruction_plate_ids, dtype=int)
+    partitioning_plate_appearance_ages = np.asarray(partitioning_plate_appearance_ages, dtype=float)
 
-        updated_grid_samples.append(updated_grid_sample)
+    # Not contained by any plates. Shouldn't happen since static polygons have global coverage,
+    # but might if there's tiny cracks between polygons.
+    is_included = np.array(is_partitioned, dtype=bool)
 
-    return updated_grid_samples
+    # If any regions were specified then skip any grid samples outside all specified regions.
+    if region_plate_ids:
+        is_included &= np.isin(reconstruction_plate_ids, list(region_plate_ids))
 
+    return (
+        np.asarray(grid_samples, dtype=float)[is_included],
+        reconstruction_plate_ids[is_included],
+        partitioning_plate_appearance_ages[is_included])
 
-def _exclude_grid_samples_near_trenches(
-        grid_samples,
+
+def _read_trenches(
         trench_filename,
         subducting_boundary_filename,
         threshold_distances_to_trenches_kms=None):
+    """
+    Read the trench geometries, their exclusion distances (in radians) and their adjoining subducting polygons.
+    
+    Returns a 3-tuple of lists (trench geometries, 2-tuples of subduction/overriding distances, subducting boundary polygons).
+    """
 
     trench_features = pygplates.FeatureCollection(trench_filename)
 
@@ -899,16 +1838,83 @@ def _exclude_grid_samples_near_trenches(
         trench_geometries.append(trench_feature.get_geometry(lambda property: True))
         trench_distances.append((trench_subduction_distance_radians, trench_overriding_distance_radians))
         trench_subducting_boundary_polygons.append(subducting_boundary_polygon)
+    
+    return trench_geometries, trench_distances, trench_subducting_boundary_polygons
+
+
+def _get_trenches(
+        trench_filename,
+        subducting_boundary_filename,
+        threshold_distances_to_trenches_kms=None):
+    """
+    Same as '_read_trenches()' but also returns a spatial index of the trench geometries (as a 4th item), and is cached per process.
+    
+    The spatial index is used so that each grid sample is only tested against nearby trenches (instead of all trenches).
+    """
+    
+    def read_trenches():
+        trench_geometries, trench_distances, trench_subducting_boundary_polygons = _read_trenches(
+            trench_filename, subducting_boundary_filename, threshold_distances_to_trenches_kms)
+        return trench_geometries, trench_distances, trench_subducting_boundary_polygons, GeometryVertexIndex(trench_geometries)
+    
+    return _get_cached_model(
+        'trenches',
+        read_trenches,
+        (trench_filename, subducting_boundary_filename),
+        tuple(threshold_distances_to_trenches_kms) if threshold_distances_to_trenches_kms is not None else None)
+
+
+def _get_max_trench_distance(trench_distances):
+    # The largest of all subduction and overriding distances of all trenches.
+    # Note: Avoiding the 'default' argument of 'max()' since it is not supported in Python 2.
+    return max(
+        [max(trench_subduction_distance_radians, trench_overriding_distance_radians)
+         for trench_subduction_distance_radians, trench_overriding_distance_radians in trench_distances] or [0.0])
+
+
+def _find_grid_samples_near_trenches(
+        grid_samples,
+        trench_filename,
+        subducting_boundary_filename,
+        threshold_distances_to_trenches_kms=None):
+    """
+    Find which grid samples are near trenches (and hence should be excluded).
+    
+    'grid_samples' can be a sequence of (longitude, latitude, [other_values ...]) sequences or a (N, C) numpy array.
+    Returns a list of bool (one per grid sample) that are True for grid samples near trenches.
+    """
+
+    if not len(grid_samples):
+        return []
 
-    included_grid_samples = []
-    for grid_sample in grid_samples:
-        # Extract the grid sample location.
-        grid_longitude, grid_latitude = grid_sample[0], grid_sample[1]
+    # The trenches (and their spatial index) are only read (and built) once per process.
+    trench_geometries, trench_distances, trench_subducting_boundary_polygons, trench_spatial_index = _get_trenches(
+        trench_filename, subducting_boundary_filename, threshold_distances_to_trenches_kms)
+
+    # The candidate trenches returned for a grid sample include all trenches within the largest threshold distance
+    # (of all trenches) of that grid sample. Any trench that is not a candidate is further away than all its threshold distances
+    # and so cannot mask the grid sample. So the results are the same as testing against all trenches.
+    if isinstance(grid_samples, np.ndarray):
+        grid_sample_lon_lats = grid_samples[:, :2]
+    else:
+        grid_sample_lon_lats = np.array([grid_sample[:2] for grid_sample in grid_samples], dtype=float)
+    grid_sample_xyz = lon_lat_to_xyz(grid_sample_lon_lats[:, 0], grid_sample_lon_lats[:, 1])
+    candidate_trench_indices_per_grid_sample = trench_spatial_index.query_candidate_geometries(
+        grid_sample_xyz, _get_max_trench_distance(trench_distances))
+
+    near_trenches = []
+    for (grid_longitude, grid_latitude), candidate_trench_indices in zip(grid_sample_lon_lats.tolist(), candidate_trench_indices_per_grid_sample):
+        # If there are no trenches near the current grid sample then it cannot be masked.
+        if len(candidate_trench_indices) == 0:
+            near_trenches.append(False)
+            continue
+
+        # The grid sample location.
         grid_location = pygplates.PointOnSphere(grid_latitude, grid_longitude)
 
-        # See if current grid sample is near any trenches.
+        # See if current grid sample is near any (candidate) trenches.
         mask_grid_location = False
-        for trench_index in range(len(trench_geometries)):
+        for trench_index in candidate_trench_indices:
             trench_geometry = trench_geometries[trench_index]
             trench_subduction_distance_radians, trench_overriding_distance_radians = trench_distances[trench_index]
             trench_subducting_boundary_polygon = trench_subducting_boundary_polygons[trench_index]
@@ -941,13 +1947,136 @@ def _exclude_grid_samples_near_trenches(
                         # We've got our result so skip all remaining trench segments.
                         break
 
-        # Skip current grid sample if it should be masked.
-        if mask_grid_location:
+        near_trenches.append(mask_grid_location)
+
+    return near_trenches
+
+
+def _exclude_grid_samples_near_trenches(
+        grid_samples,
+        trench_filename,
+        subducting_boundary_filename,
+        threshold_distances_to_trenches_kms=None):
+
+    near_trenches = _find_grid_samples_near_trenches(
+        grid_samples, trench_filename, subducting_boundary_filename, threshold_distances_to_trenches_kms)
+
+    # Skip grid samples that should be masked.
+    return [grid_sample for grid_sample, near_trench in zip(grid_samples, near_trenches) if not near_trench]
+
+
+def _get_trench_exclusion_raster(
+        trench_filename,
+        subducting_boundary_filename,
+        threshold_distances_to_trenches_kms=None,
+        resolution_degrees=_TRENCH_EXCLUSION_RASTER_RESOLUTION_DEGREES,
+        create_if_not_cached=True):
+    """
+    Return the trench exclusion raster (a 2D NumPy array of cell states indexed by row and column of a LatLonCells raster).
+
+    The raster is loaded from the on-disk cache if it has previously been created for the same trench files,
+    threshold distances and resolution. Otherwise it is created (and cached) if 'create_if_not_cached' is True,
+    else None is returned.
+    """
+
+    cache_key = get_cache_key(
+        'trench_exclusion_raster',
+        1,  # version of raster format
+        get_file_signature(trench_filename),
+        get_file_signature(subducting_boundary_filename),
+        tuple(threshold_distances_to_trenches_kms) if threshold_distances_to_trenches_kms is not None else None,
+        resolution_degrees)
+
+    cached_arrays = load_cached_arrays('trench_exclusion_raster', cache_key)
+    if cached_arrays is not None:
+        return cached_arrays['cell_states']
+
+    if not create_if_not_cached:
+        return None
+
+    cell_states = _create_trench_exclusion_raster(
+        trench_filename, subducting_boundary_filename, threshold_distances_to_trenches_kms, resolution_degrees)
+
+    save_cached_arrays('trench_exclusion_raster', cache_key, {'cell_states': cell_states})
+
+    return cell_states
+
+
+def _create_trench_exclusion_raster(
+        trench_filename,
+        subducting_boundary_filename,
+        threshold_distances_to_trenches_kms,
+        resolution_degrees):
+    """
+    Rasterise the regions near trenches into cells that are either entirely included, entirely excluded or
+    straddle the boundary of an exclusion region (in which case the points in the cell need to be tested exactly).
+
+    A cell is only classified as entirely included (or excluded) if it can be proven that *all* points in the cell
+    would be included (or excluded) by '_find_grid_samples_near_trenches()'. So the raster gives the same results.
+    """
+
+    trench_geometries, trench_distances, trench_subducting_boundary_polygons = _read_trenches(
+        trench_filename, subducting_boundary_filename, threshold_distances_to_trenches_kms)
+    max_trench_distance_radians = _get_max_trench_distance(trench_distances)
+    trench_spatial_index = GeometryVertexIndex(trench_geometries)
+
+    cells = LatLonCells(resolution_degrees)
+    cell_states = np.full((cells.num_rows, cells.num_columns), _TRENCH_EXCLUSION_RASTER_INCLUDED, dtype=np.uint8)
+
+    for row_index in range(cells.num_rows):
+        # Slightly expand the cell radius to guard against numerical round-off in the distance calculations.
+        cell_radius = cells.get_row_cell_radius(row_index) + 1e-7
+        cell_centres_xyz = cells.get_row_cell_centres(row_index)
+
+        # Most cells are far from all trenches (and hence entirely included) so only look closer at those cells near trenches.
+        # Any point in a cell is within the cell radius of the cell centre.
+        near_column_indices = np.where(
+            trench_spatial_index.is_near_any_geometry(cell_centres_xyz, max_trench_distance_radians + cell_radius))[0]
+        if len(near_column_indices) == 0:
             continue
-        
-        included_grid_samples.append(grid_sample)
 
-    return included_grid_samples
+        candidate_trench_indices_per_cell = trench_spatial_index.query_candidate_geometries(
+            cell_centres_xyz[near_column_indices], max_trench_distance_radians + cell_radius)
+
+        for column_index, candidate_trench_indices in zip(near_column_indices, candidate_trench_indices_per_cell):
+            cell_centre = pygplates.PointOnSphere(cell_centres_xyz[column_index])
+
+            cell_state = _TRENCH_EXCLUSION_RASTER_INCLUDED
+            for trench_index in candidate_trench_indices:
+                trench_geometry = trench_geometries[trench_index]
+                trench_subduction_distance_radians, trench_overriding_distance_radians = trench_distances[trench_index]
+                trench_subducting_boundary_polygon = trench_subducting_boundary_polygons[trench_index]
+
+                # Distance from cell centre to trench. All points in the cell are within the cell radius of this.
+                distance_to_trench = pygplates.GeometryOnSphere.distance(cell_centre, trench_geometry)
+
+                # If the subducting polygon boundary does not pass through the cell then all points in the cell are on the same
+                # side of the trench (subducting or overriding), in which case only one threshold distance is relevant.
+                if pygplates.GeometryOnSphere.distance(cell_centre, trench_subducting_boundary_polygon) > cell_radius:
+                    if trench_subducting_boundary_polygon.is_point_in_polygon(cell_centre):
+                        relevant_trench_distance_radians = trench_subduction_distance_radians
+                    else:
+                        relevant_trench_distance_radians = trench_overriding_distance_radians
+
+                    # A zero distance means the trench excludes nothing on that side.
+                    if not relevant_trench_distance_radians:
+                        continue
+                    # If all points in the cell are within the threshold distance then they're all excluded.
+                    if distance_to_trench + cell_radius <= relevant_trench_distance_radians:
+                        cell_state = _TRENCH_EXCLUSION_RASTER_EXCLUDED
+                        break
+                    # If some points in the cell are within the threshold distance then the cell straddles the exclusion boundary.
+                    if distance_to_trench - cell_radius <= relevant_trench_distance_radians:
+                        cell_state = _TRENCH_EXCLUSION_RASTER_BOUNDARY
+                else:
+                    # Points in the cell could be on either side of the trench.
+                    # If some points in the cell are within the threshold distance (of either side) then the cell needs exact testing.
+                    if distance_to_trench - cell_radius <= max(trench_subduction_distance_radians, trench_overriding_distance_radians):
+                        cell_state = _TRENCH_EXCLUSION_RASTER_BOUNDARY
+
+            cell_states[row_index, column_index] = cell_state
+
+    return cell_states
 
 
 def generate_lon_lat_points(grid_spacing_degrees):
@@ -961,7 +2090,8 @@ def generate_lon_lat_points(grid_spacing_degrees):
     
     Returns
     -------
-    list of (longitude, latitude) tuples
+    numpy.ndarray
+        Array of shape (N, 2) containing the longitude (first column) and latitude (second column) of each point.
     
     Raises
     ------
@@ -972,28 +2102,27 @@ def generate_lon_lat_points(grid_spacing_degrees):
     -----
     Longitudes start at -180 (dateline) and latitudes start at -90.
     If 180 is an integer multiple of ``grid_spacing_degrees`` then the final longitude is also on the dateline (+180).
+
+    The points are ordered by latitude and then by longitude (longitude varies fastest).
         
     .. versionadded:: 1.4
+
+    .. versionchanged:: 1.5
+        - Returns a (N, 2) numpy array instead of a list of (longitude, latitude) tuples.
     """
     
     if grid_spacing_degrees <= 0:
         raise ValueError('Grid spacing must be positive (and non-zero).')
     
-    input_points = []
-    
     # Data points start *on* dateline (-180).
     # If 180 is an integer multiple of grid spacing then final longitude also lands on dateline (+180).
     num_latitudes = int(math.floor(180.0 / grid_spacing_degrees)) + 1
     num_longitudes = int(math.floor(360.0 / grid_spacing_degrees)) + 1
-    for lat_index in range(num_latitudes):
-        lat = -90 + lat_index * grid_spacing_degrees
-        
-        for lon_index in range(num_longitudes):
-            lon = -180 + lon_index * grid_spacing_degrees
-            
-            input_points.append((lon, lat))
+    longitudes, latitudes = np.meshgrid(
+        -180 + np.arange(num_longitudes) * grid_spacing_degrees,
+        -90 + np.arange(num_latitudes) * grid_spacing_degrees)
     
-    return input_points
+    return np.column_stack((longitudes.ravel(), latitudes.ravel()))
 
 
 def _read_grid(
@@ -1012,63 +2141,101 @@ def _read_grid(
     If input was (longitude, latitude, value) sequences then output is (longitude, latitude, value, sample_grid) tuples.
     """
     
-    # Create a multiline string (one line per lon/lat/value1/etc row).
-    location_data = ''.join(
-            ' '.join(str(item) for item in row) + '\n' for row in input)
+    output_values = _read_grid_array(input, grid_filename, force_positive).tolist()
 
-    # The command-line strings to execute GMT 'grdtrack'.
-    grdtrack_command_line = ["gmt", "grdtrack",
-        # Geographic input/output coordinates...
-        "-fg",
-        # Avoid anti-aliasing...
-        "-n+a+bg+t0.5",
-        "-G{0}".format(grid_filename)]
+    # If any columns should be 'int' (instead of 'float') then convert them to 'int'.
+    if integer_input_columns:
+        return [
+            tuple((int(column_value) if column in integer_input_columns else column_value)
+                  for column, column_value in enumerate(output_value))
+            for output_value in output_values]
     
-    # Call the system command.
-    stdout_data = call_system_command(grdtrack_command_line, stdin=location_data, return_stdout=True)
-
-    # Extract the sampled values.
-    output_values = []
-    for line in stdout_data.splitlines():
-        # Each line returned by GMT grdtrack contains "longitude latitude grid1_value [grid2_value ...]".
-        # Note that if GMT returns "NaN" then we'll return float('nan').
-        
-        # If any columns should be 'int' (instead of 'float') then convert them to 'int'.
-        if integer_input_columns:
-            output_value = tuple(
-                (float(column_value) if column not in integer_input_columns else int(column_value))
-                for column, column_value in enumerate(line.split()))
-        else:
-            # All columns are 'float'.
-            output_value = tuple(float(column_value) for column_value in line.split())
+    return [tuple(output_value) for output_value in output_values]
+
+
+def _read_grid_array(
+        input,
+        grid_filename,
+        force_positive=False):
+    """
+    Samples a grid file at the specified locations.
+    
+    Same as '_read_grid()' except 'input' can also be a (N, C) numpy array (eg, C=2 for longitude and latitude columns),
+    and returns a (N, C+1) numpy array of float values (where the last column contains the samples).
+    """
+    
+    if isinstance(input, np.ndarray):
+        num_output_columns = input.shape[1] + 1
+        # Convert to Python floats so that each value is formatted the same as 'str()' (and with full precision).
+        input = input.tolist()
+    elif len(input):
+        num_output_columns = len(input[0]) + 1
+    else:
+        # No input rows, so assume (longitude, latitude) input columns.
+        num_output_columns = 3
+    
+    if not len(input):
+        return np.empty((0, num_output_columns), dtype=float)
+    
+    with stage('grid_sampling'):
+        count('grid_sampling.points', len(input))
+        
+        # Create a multiline string (one line per lon/lat/value1/etc row).
+        row_format = ' '.join('{{{0}}}'.format(column) for column in range(num_output_columns - 1)) + '\n'
+        location_data = ''.join(itertools.starmap(row_format.format, input))
+
+        # The command-line strings to execute GMT 'grdtrack'.
+        grdtrack_command_line = ["gmt", "grdtrack",
+                                 # Geographic input/output coordinates...
+                                 "-fg",
+                                 # Avoid anti-aliasing...
+                                 "-n+a+bg+t0.5",
+                                 "-G{0}".format(grid_filename)]
+        
+        # Call the system command.
+        stdout_data = call_system_command(grdtrack_command_line, stdin=location_data, return_stdout=True)
+
+        # Extract the sampled values.
+        #
+        # Each line returned by GMT grdtrack contains "longitude latitude [other_values ...] grid_value".
+        # Note that if GMT returns "NaN" then we'll return NaN.
+        output_values = np.array(stdout_data.split(), dtype=float).reshape(-1, num_output_columns)
 
         # If requested to clamp negative samples to zero.
-        # Note: value just sampled is the last column.
-        if force_positive and output_value[-1] < 0.0:
-            # Make last column (just sampled) be zero.
-            output_value = output_value[:-1] + (0.0,)
+        # Note: value just sampled is the last column (and NaN values are not clamped).
+        if force_positive:
+            output_samples = output_values[:, -1]
+            output_samples[output_samples < 0.0] = 0.0
         
-        output_values.append(output_value)
-    
-    return output_values
+        return output_values
 
 
 def _write_grid(
         input,
         grid_spacing_degrees,
         grid_filename,
-        xyz_filename=None):
+        xyz_filename=None,
+        gridder=DEFAULT_GRIDDER,
+        xyz_format=XYZ_FORMAT_TEXT):
     """
     Grid the input data and write to an output grid file.
     
-    'input' is a list of (longitude, latitude, value) sequences where latitude and longitude are in degrees.
+    'input' is a (N, 3) NumPy array (or a list of (longitude, latitude, value) sequences) where latitude and longitude are in degrees.
     'grid_spacing_degrees' is spacing of output grid points in degrees.
-    If 'xyz_filename' is specified then an xyz file is also created (from 'input').
+    If 'xyz_filename' is specified then an xyz file is also created (from 'input') in the format 'xyz_format' (one of 'XYZ_FORMATS').
+    'gridder' is one of 'GRIDDERS'.
     """
     
-    # Create a multiline string (one line per lon/lat/value row).
-    input_data = ''.join(
-            ' '.join(str(item) for item in row) + '\n' for row in input)
+    if gridder == GRIDDER_NATIVE:
+        _write_grid_native(input, grid_spacing_degrees, grid_filename)
+        
+        # Also create an xyz file (from 'input') if requested.
+        if xyz_filename is not None:
+            write_xyz(xyz_filename, input, xyz_format)
+        
+        return
+    
+    input_data = _get_xyz_data(input)
 
     # The command-line strings to execute GMT 'nearneighbor'.
     #
@@ -1158,25 +2325,119 @@ def _write_grid(
     
     # Also create an xyz file (from 'input') if requested.
     if xyz_filename is not None:
-        with open(xyz_filename, 'w') as xyz_file:
-            xyz_file.write(input_data)
+        if xyz_format == XYZ_FORMAT_TEXT:
+            # Same as 'write_xyz()' but avoids formatting the text again.
+            with open(xyz_filename, 'w') as xyz_file:
+                xyz_file.write(input_data)
+        else:
+            write_xyz(xyz_filename, input, xyz_format)
+
+
+def _write_grid_native(
+        input,
+        grid_spacing_degrees,
+        grid_filename):
+    """
+    Same as the GMT gridder in '_write_grid()' but done in-process (and writes the NetCDF grid file directly).
+    """
+    
+    gridder = _get_nearneighbor_gridder(grid_spacing_degrees)
+    grid = _grid_native(input, grid_spacing_degrees)
+    
+    write_netcdf_grid(grid_filename, grid, gridder.longitudes, gridder.latitudes, title='Paleo bathymetry')
+
+
+def _grid_native(
+        input,
+        grid_spacing_degrees):
+    """
+    Grid the input data (in-process) and return a 2D NumPy array (indexed by latitude then longitude).
+    """
+    
+    # The grid nodes (and their spatial index) are the same for all reconstruction times, so they're only created once per process.
+    gridder = _get_nearneighbor_gridder(grid_spacing_degrees)
+    
+    # Use a larger search radius to avoid aliasing (same as the second GMT 'nearneighbor' in '_write_grid()'), and
+    # mask out nodes without data within a small search radius (same as the first GMT 'nearneighbor' and 'grdmath' in '_write_grid()').
+    #
+    # Both are found with a single search (for points within the larger radius).
+    return gridder.grid(input, 3.0 * grid_spacing_degrees, num_sectors=8, min_sectors=6, mask_search_radius_degrees=0.9 * grid_spacing_degrees)
+
+
+def _get_nearneighbor_gridder(grid_spacing_degrees):
+    """
+    Return a gridder of global grids with the specified grid spacing (only created once per process).
+    """
+    
+    return _get_cached_model(
+        'nearneighbor_gridder',
+        partial(NearNeighborGridder, grid_spacing_degrees),
+        (),
+        grid_spacing_degrees)
+
+
+def _get_xyz_data(input):
+    """
+    Return a multiline string (one line per lon/lat/value row of 'input').
+    """
+    
+    # Note: Converting the array to (Python) floats before formatting is faster (and formats values the same as Python floats).
+    #       And formatting a float with '{}' is the same as 'str()'.
+    return ''.join(itertools.starmap('{0} {1} {2}\n'.format, np.asarray(input, dtype=float).reshape(-1, 3).tolist()))
+
+
+def _get_xyz_format(output_xyz):
+    """
+    Return the xyz format (one of 'XYZ_FORMATS') requested by 'output_xyz' (a bool or one of 'XYZ_FORMATS'), or None if not requested.
+    
+    Raises ValueError if 'output_xyz' is not recognised.
+    """
+    
+    if output_xyz is None or output_xyz is False:
+        return None
+    if output_xyz is True:
+        return XYZ_FORMAT_TEXT
+    if output_xyz in XYZ_FORMATS:
+        return output_xyz
+    
+    raise ValueError('Output xyz "{0}" is neither a bool nor one of {1}'.format(output_xyz, XYZ_FORMATS))
+
+
+def _get_xyz_filename(output_file_prefix, reconstruction_time, xyz_format):
+    
+    # The xyz format is also the filename extension.
+    return '{0}_{1}.{2}'.format(output_file_prefix, reconstruction_time, xyz_format)
 
 
 def _write_grid_multiprocessing(
         paleo_bathymetry_and_reconstruction_time,
         grid_spacing,
         grid_file_prefix,
-        output_xyz):
+        xyz_format,
+        gridder):
     
     paleo_bathymetry, reconstruction_time = paleo_bathymetry_and_reconstruction_time
     # Generate paleo bathymetry grid from list of reconstructed points.
     paleo_bathymetry_grid_filename = '{0}_{1}.nc'.format(grid_file_prefix, reconstruction_time)
     # Also create xyz file if requested.
     paleo_bathymetry_xyz_filename = None
-    if output_xyz:
-        paleo_bathymetry_xyz_filename, _ = os.path.splitext(paleo_bathymetry_grid_filename)
-        paleo_bathymetry_xyz_filename += '.xyz'
-    _write_grid(paleo_bathymetry, grid_spacing, paleo_bathymetry_grid_filename, paleo_bathymetry_xyz_filename)
+    if xyz_format:
+        paleo_bathymetry_xyz_filename = _get_xyz_filename(grid_file_prefix, reconstruction_time, xyz_format)
+    _write_grid(paleo_bathymetry, grid_spacing, paleo_bathymetry_grid_filename, paleo_bathymetry_xyz_filename, gridder, xyz_format)
+
+
+def _grid_cube_slice_multiprocessing(
+        paleo_bathymetry_and_reconstruction_time,
+        grid_spacing,
+        grid_file_prefix,
+        xyz_format):
+    
+    paleo_bathymetry, reconstruction_time = paleo_bathymetry_and_reconstruction_time
+    # Also create xyz file if requested.
+    if xyz_format:
+        write_xyz(_get_xyz_filename(grid_file_prefix, reconstruction_time, xyz_format), paleo_bathymetry, xyz_format)
+    # Generate paleo bathymetry grid from list of reconstructed points (as 32-bit floats to halve the cost of returning to the main process).
+    return _grid_native(paleo_bathymetry, grid_spacing).astype(np.float32)
 
 
 def write_bathymetry_grids(
@@ -1184,81 +2445,172 @@ def write_bathymetry_grids(
         grid_spacing_degrees,
         output_file_prefix,
         output_xyz=False,
-        use_all_cpus=False):
+        use_all_cpus=False,
+        worker_pool=None,
+        gridder=DEFAULT_GRIDDER,
+        output_grid_cube=False):
     """write_paleo_bathymetry_grids(\
         paleo_bathymetry,\
         grid_spacing_degrees,\
         output_file_prefix,\
         output_xyz=False,\
-        use_all_cpus=False)
-    Grid paleo bathymetry into a NetCDF grid for each time step.
+        use_all_cpus=False,\
+        worker_pool=None,\
+        gridder='native',\
+        output_grid_cube=False)
+    Grid paleo bathymetry into a NetCDF grid for each time step (or into a single NetCDF4 grid cube).
     
     Parameters
     ----------
     paleo_bathymetry : dict
-        A dict mapping each reconstructed time to a list of 3-tuple (longitude, latitude, bathymetry)
+        A dict mapping each reconstructed time to a numpy array of shape (N, 3) (or a list of 3-tuple)
         The reconstructed paleo bathymetry points over a sequence of reconstructed times.
-        Each key in the returned dict is one of those times and each value in the dict is a list of reconstructed paleo bathymetries
-        represented as a 3-tuple containing reconstructed longitude, reconstructed latitude and paleo bathmetry.
+        Each key in the dict is one of those times and each value in the dict contains reconstructed paleo bathymetries
+        with each row (or 3-tuple) containing reconstructed longitude, reconstructed latitude and paleo bathmetry.
     grid_spacing_degrees : float
         Lat/lon grid spacing (in degrees). Ideally this should match the spacing of the input points used to generate the paleo bathymetries.
     output_file_prefix : string
         The prefix of the output paleo bathymetry grid filenames over time, with "_<time>.nc" appended.
-    output_xyz : bool, optional
-        Whether to also create a GMT xyz file (with ".xyz" extension) for each output paleo bathymetry grid.
-        Each row of each xyz file contains "longitude latitude bathymetry".
+    output_xyz : bool or {'xyz', 'npy', 'npz', 'bin', 'parquet'}, optional
+        Whether to also create an xyz file for each output paleo bathymetry grid, and in which format (also its filename extension).
+        If ``True`` (or ``'xyz'``) then each row of each GMT xyz text file contains "longitude latitude bathymetry".
+        The other formats are binary (and much faster to write and read) and contain the same longitudes, latitudes and bathymetries:
+        ``'npy'`` is a NumPy file containing a (N, 3) array, ``'npz'`` is a compressed NumPy file containing ``longitude``,
+        ``latitude`` and ``value`` arrays, ``'bin'`` is raw little-endian 32-bit floats (three per row), and ``'parquet'`` is an
+        Apache Parquet file containing ``longitude``, ``latitude`` and ``value`` columns (requiring the ``pyarrow`` package).
         Default is to only create grid files (no xyz).
     use_all_cpus : bool or int, optional
         If ``False`` (or zero) then use a single CPU.
         If ``True`` then distribute CPU processing across all CPUs (cores).
         If a positive integer then use that many CPUs (cores).
         Defaults to ``False`` (single CPU).
+    worker_pool : ``pybacktrack.util.worker_pool.WorkerPool``, optional
+        An existing pool of worker processes to distribute the grids across (in which case ``use_all_cpus`` is ignored).
+        The pool is not closed (it is owned by the caller).
+        Defaults to None (a pool is created, and closed when finished, if ``use_all_cpus`` specifies more than one CPU).
+    gridder : {'native', 'gmt'}, optional
+        How the paleo bathymetry points are gridded.
+        If ``'native'`` then gridding is done in-process (and each NetCDF grid file is written directly).
+        If ``'gmt'`` then gridding is done by GMT ``nearneighbor`` and ``grdmath`` (requiring GMT to be installed).
+        Both use the same nearest neighbour algorithm (GMT's search radii, sectors and weights), so their grids only differ by
+        numerical round-off (although the native grid files are NetCDF3 rather than GMT's default NetCDF4). Defaults to ``'native'``.
+    output_grid_cube : bool, optional
+        Whether to write the grids into a single NetCDF4 grid cube file (with ".nc" appended to ``output_file_prefix``),
+        with dimensions (time, lat, lon), instead of a grid file for each time. If the grid cube file already exists then the grids
+        are added to it (replacing any grids at the same times), so a time series can be written incrementally (eg, one window of times
+        at a time). The grids are compressed in chunks suited to reading both maps (at a time) and time series (at a location).
+        This requires the ``netCDF4`` package to be installed (and ``gridder`` to be ``'native'``). Defaults to ``False``.
+    
+    Raises
+    ------
+    ValueError
+        If ``gridder`` or ``output_xyz`` is not recognised (or ``gridder`` is not ``'native'`` when ``output_grid_cube`` is ``True``).
+    ImportError
+        If ``output_grid_cube`` is ``True`` and the ``netCDF4`` package is not installed
+        (or ``output_xyz`` is ``'parquet'`` and the ``pyarrow`` package is not installed).
         
     Notes
     -----
     .. versionadded:: 1.4
+
+    .. versionchanged:: 1.5
+        - Paleo bathymetry at each time can be a numpy array (as returned by :func:`pybacktrack.reconstruct_paleo_bathymetry`).
+        - Added ``worker_pool`` argument.
+        - Added ``gridder`` argument (gridding no longer requires GMT by default).
+        - Added ``output_grid_cube`` argument.
+        - ``output_xyz`` can also specify a (binary) format.
     """
     
+    if gridder not in GRIDDERS:
+        raise ValueError('Gridder "{0}" is not one of {1}'.format(gridder, GRIDDERS))
+    if output_grid_cube and gridder != GRIDDER_NATIVE:
+        raise ValueError('Writing a grid cube requires the "{0}" gridder'.format(GRIDDER_NATIVE))
+    xyz_format = _get_xyz_format(output_xyz)
+    
+    with stage('gridding'):
+        count('gridding.grids', len(paleo_bathymetry))
+        with use_worker_pool(worker_pool, get_num_cpus(use_all_cpus)) as worker_pool:
+            if output_grid_cube:
+                _write_bathymetry_grid_cube(paleo_bathymetry, grid_spacing_degrees, output_file_prefix, xyz_format, worker_pool)
+            else:
+                _write_bathymetry_grids(paleo_bathymetry, grid_spacing_degrees, output_file_prefix, xyz_format, worker_pool, gridder)
+
+
+def _write_bathymetry_grids(
+        paleo_bathymetry,
+        grid_spacing_degrees,
+        output_file_prefix,
+        xyz_format,
+        worker_pool,
+        gridder):
+    
     # Generate a paleo bathymetry grid file for each reconstruction time in the requested time period.
-    if not use_all_cpus:
+    if worker_pool is None:
         for reconstruction_time, paleo_bathymetry_at_reconstruction_time in paleo_bathymetry.items():
-            # Get the list of (reconstructed_longitude, reconstructed_latitude, reconstructed_bathymetry) at current reconstruction time.
-            # Generate paleo bathymetry grid from list of reconstructed points.
+            # Get the (reconstructed_longitude, reconstructed_latitude, reconstructed_bathymetry) rows at current reconstruction time.
+            # Generate paleo bathymetry grid from the reconstructed points.
             paleo_bathymetry_grid_filename = '{0}_{1}.nc'.format(output_file_prefix, reconstruction_time)
             # Also create xyz file if requested.
             paleo_bathymetry_xyz_filename = None
-            if output_xyz:
-                paleo_bathymetry_xyz_filename, _ = os.path.splitext(paleo_bathymetry_grid_filename)
-                paleo_bathymetry_xyz_filename += '.xyz'
-            _write_grid(paleo_bathymetry_at_reconstruction_time, grid_spacing_degrees, paleo_bathymetry_grid_filename, paleo_bathymetry_xyz_filename)
-
-    else:  # Use 'multiprocessing' pools to distribute across CPUs...
-
-        # If 'use_all_cpus' is a bool (and therefore must be True) then use all available CPUs...
-        if isinstance(use_all_cpus, bool):
-            try:
-                num_cpus = multiprocessing.cpu_count()
-            except NotImplementedError:
-                num_cpus = 1
-        # else 'use_all_cpus' is a positive integer specifying the number of CPUs to use...
-        elif isinstance(use_all_cpus, int) and use_all_cpus > 0:
-            num_cpus = use_all_cpus
-        else:
-            raise TypeError('{} is neither a bool nor a positive integer'.format(use_all_cpus))
+            if xyz_format:
+                paleo_bathymetry_xyz_filename = _get_xyz_filename(output_file_prefix, reconstruction_time, xyz_format)
+            _write_grid(paleo_bathymetry_at_reconstruction_time, grid_spacing_degrees, paleo_bathymetry_grid_filename, paleo_bathymetry_xyz_filename, gridder, xyz_format)
+
+    else:  # Use the worker pool to distribute across CPUs...
         
         # Distribute writing of each grid to a different CPU.
-        with multiprocessing.Pool(num_cpus) as pool:
-            pool.map(
-                    partial(
-                        _write_grid_multiprocessing,
-                        grid_spacing=grid_spacing_degrees,
-                        grid_file_prefix=output_file_prefix,
-                        output_xyz=output_xyz),
-                    (
-                        (paleo_bathymetry_at_reconstruction_time, reconstruction_time)
-                            for reconstruction_time, paleo_bathymetry_at_reconstruction_time in paleo_bathymetry.items()
-                    ),
-                    1) # chunksize
+        worker_pool.map(
+            partial(
+                _write_grid_multiprocessing,
+                grid_spacing=grid_spacing_degrees,
+                grid_file_prefix=output_file_prefix,
+                xyz_format=xyz_format,
+                gridder=gridder),
+            [
+                (paleo_bathymetry_at_reconstruction_time, reconstruction_time)
+                for reconstruction_time, paleo_bathymetry_at_reconstruction_time in paleo_bathymetry.items()
+            ],
+            1)  # chunksize
+
+
+def _write_bathymetry_grid_cube(
+        paleo_bathymetry,
+        grid_spacing_degrees,
+        output_file_prefix,
+        xyz_format,
+        worker_pool):
+    
+    # Write the grids in order of time (so they're appended to the grid cube in order).
+    reconstruction_times = sorted(paleo_bathymetry.keys())
+    grid_cube_slice_function = partial(
+        _grid_cube_slice_multiprocessing,
+        grid_spacing=grid_spacing_degrees,
+        grid_file_prefix=output_file_prefix,
+        xyz_format=xyz_format)
+    grid_cube_slice_inputs = [
+        (paleo_bathymetry[reconstruction_time], reconstruction_time)
+        for reconstruction_time in reconstruction_times]
+    
+    # Generate the paleo bathymetry grid at each reconstruction time.
+    if worker_pool is None:
+        grids = [grid_cube_slice_function(grid_cube_slice_input) for grid_cube_slice_input in grid_cube_slice_inputs]
+    else:  # Use the worker pool to distribute across CPUs...
+        grids = worker_pool.map(grid_cube_slice_function, grid_cube_slice_inputs, 1)
+    
+    # Add the grids to the grid cube (all at once so that the compressed chunks, spanning multiple times, are written efficiently).
+    gridder = _get_nearneighbor_gridder(grid_spacing_degrees)
+    write_netcdf_grid_cube(
+        _get_grid_cube_filename(output_file_prefix),
+        reconstruction_times,
+        grids,
+        gridder.longitudes,
+        gridder.latitudes,
+        title='Paleo bathymetry')
+
+
+def _get_grid_cube_filename(output_file_prefix):
+    
+    return '{0}.nc'.format(output_file_prefix)
 
 
 def reconstruct_backtrack_bathymetry_and_write_grids(
@@ -1282,7 +2634,13 @@ def reconstruct_backtrack_bathymetry_and_write_grids(
         anchor_plate_id=0,
         output_positive_bathymetry_below_sea_level=False,
         output_xyz=False,
-        use_all_cpus=False):
+        use_all_cpus=False,
+        worker_pool_backend=DEFAULT_WORKER_POOL_BACKEND,
+        progress_callback=None,
+        checkpoint_directory=None,
+        resume=False,
+        gridder=DEFAULT_GRIDDER,
+        output_grid_cube=False):
     # Adding function signature on first line of docstring otherwise Sphinx autodoc will print out
     # the expanded values of the bundle filenames.
     """reconstruct_paleo_bathymetry_grids(\
@@ -1306,7 +2664,13 @@ def reconstruct_backtrack_bathymetry_and_write_grids(
         anchor_plate_id=0,\
         output_positive_bathymetry_below_sea_level=False,\
         output_xyz=False,\
-        use_all_cpus=False)
+        use_all_cpus=False,\
+        worker_pool_backend='multiprocessing',\
+        progress_callback=None,\
+        checkpoint_directory=None,\
+        resume=False,\
+        gridder='native',\
+        output_grid_cube=False)
     Same as :func:`pybacktrack.reconstruct_paleo_bathymetry` but also generates present day input points on a lat/lon grid and
     outputs paleobathymetry as a NetCDF grid for each time step.
     
@@ -1389,20 +2753,50 @@ def reconstruct_backtrack_bathymetry_and_write_grids(
         Whether to output positive bathymetry values below sea level (the same as backtracked water depths at a drill site).
         However topography/bathymetry grids typically have negative values below sea level (and positive above).
         So the default (``False``) matches typical topography/bathymetry grids (ie, outputs negative bathymetry values below sea level).
-    output_xyz : bool, optional
-        Whether to also create a GMT xyz file (with ".xyz" extension) for each output paleo bathymetry grid.
-        Each row of each xyz file contains "longitude latitude bathymetry".
+    output_xyz : bool or {'xyz', 'npy', 'npz', 'bin', 'parquet'}, optional
+        Whether to also create an xyz file for each output paleo bathymetry grid, and in which format (also its filename extension).
+        If ``True`` (or ``'xyz'``) then each row of each GMT xyz text file contains "longitude latitude bathymetry".
+        The other formats are binary (see :func:`pybacktrack.write_paleo_bathymetry_grids`).
         Default is to only create grid files (no xyz).
     use_all_cpus : bool or int, optional
         If ``False`` (or zero) then use a single CPU.
         If ``True`` then distribute CPU processing across all CPUs (cores).
         If a positive integer then use that many CPUs (cores).
         Defaults to ``False`` (single CPU).
+    worker_pool_backend : {'multiprocessing', 'concurrent.futures'}, optional
+        The library used to create the pool of worker processes (if ``use_all_cpus`` specifies more than one CPU).
+        The same worker processes are used for all stages (generating paleo bathymetry and writing grids).
+        Defaults to ``'multiprocessing'``.
+    progress_callback : callable, optional
+        A function accepting a single argument that is called with the fraction (between 0 and 1) of the paleo bathymetry generated so far.
+        Defaults to None (no progress reported).
+    checkpoint_directory : string, optional
+        Directory to save checkpoints in (so that an interrupted run can be resumed with ``resume``).
+        Checkpoints include the grid samples (after assigning plate IDs and excluding near trenches, and after calculating their
+        time-independent parameters) and the times whose grids have been written. They are named using a hash of the arguments
+        (and input files), so they are only used by a run with the same arguments, and are removed when the run completes.
+        Note that there are no checkpoints (and a warning is emitted) if ``ocean_age_to_depth_model`` is a function that was not
+        read from a file (using :func:`pybacktrack.read_interpolate_function`), since it cannot be identified across runs.
+        Defaults to None (no checkpoints).
+    resume : bool, optional
+        Whether to resume from the checkpoints (in ``checkpoint_directory``) saved by a previous interrupted run with the same arguments.
+        Completed stages are skipped, as are times whose grids have already been written.
+        If ``False`` then any such checkpoints are removed first. Defaults to ``False``.
+    gridder : {'native', 'gmt'}, optional
+        How the paleo bathymetry points are gridded (see :func:`pybacktrack.write_paleo_bathymetry_grids`). Defaults to ``'native'``.
+    output_grid_cube : bool, optional
+        Whether to write all grids into a single NetCDF4 grid cube file named ``<output_file_prefix>.nc`` (with dimensions time, lat and lon)
+        instead of a grid file for each time (see :func:`pybacktrack.write_paleo_bathymetry_grids`).
+        The grid cube is written incrementally (as each window of times is generated). Defaults to ``False``.
     
     Raises
     ------
     ValueError
-        If ``oldest_time`` is negative (if specified) or if ``time_increment`` is not positive.
+        If ``oldest_time`` is negative (if specified), if ``time_increment`` is not positive or if ``worker_pool_backend``, ``gridder`` or
+        ``output_xyz`` is not recognised (or ``gridder`` is not ``'native'`` when ``output_grid_cube`` is ``True``).
+    ImportError
+        If ``output_grid_cube`` is ``True`` and the ``netCDF4`` package is not installed
+        (or ``output_xyz`` is ``'parquet'`` and the ``pyarrow`` package is not installed).
 
     Notes
     -----
@@ -1414,41 +2808,169 @@ def reconstruct_backtrack_bathymetry_and_write_grids(
     .. versionadded:: 1.4
 
     .. versionchanged:: 1.5
-        ``oldest_time`` no longer needs to be specified (defaults to oldest of ocean crust ages and continental rift start ages of grid points).
+        - ``oldest_time`` no longer needs to be specified (defaults to oldest of ocean crust ages and continental rift start ages of grid points).
+        - Grids are written as the paleo bathymetry is generated (rather than after generating paleo bathymetry at all times) to limit memory usage.
+        - The same pool of worker processes is used for all stages (and can use ``concurrent.futures`` via ``worker_pool_backend``).
+        - Points are distributed across CPUs according to their (estimated) cost, and progress can be reported via ``progress_callback``.
+        - Interrupted runs can be resumed using ``checkpoint_directory`` and ``resume``.
+        - Grids are written in-process by default (GMT is no longer required), see ``gridder``.
+        - All grids can be written into a single grid cube, see ``output_grid_cube``.
+        - ``output_xyz`` can also specify a (binary) format.
     """
 
+    # Check the gridder now (rather than after generating the paleo bathymetry).
+    if gridder not in GRIDDERS:
+        raise ValueError('Gridder "{0}" is not one of {1}'.format(gridder, GRIDDERS))
+    if output_grid_cube and gridder != GRIDDER_NATIVE:
+        raise ValueError('Writing a grid cube requires the "{0}" gridder'.format(GRIDDER_NATIVE))
+    # Check the xyz format now.
+    _get_xyz_format(output_xyz)
+    
     # Generate a global latitude/longitude grid of points (with the requested grid spacing).
     input_points = generate_lon_lat_points(grid_spacing_degrees)
     
-    # Generate reconstructed paleo bathymetry points over the requested time period.
-    paleo_bathymetry = reconstruct_backtrack_bathymetry(
-        input_points,
-        oldest_time,
-        time_increment,
-        lithology_filenames,
-        age_grid_filename,
-        topography_filename,
-        total_sediment_thickness_filename,
-        crustal_thickness_filename,
-        rotation_filenames,
-        static_polygon_filename,
-        dynamic_topography_model,
-        sea_level_model,
-        lithology_name,
-        ocean_age_to_depth_model,
-        exclude_distances_to_trenches_kms,
-        region_plate_ids,
-        anchor_plate_id,
-        output_positive_bathymetry_below_sea_level,
-        use_all_cpus)
+    # Checkpoints are named using a hash of all arguments that affect the output grids (including the signatures of input files).
+    checkpoint = None
+    if checkpoint_directory is not None:
+        try:
+            checkpoint_key_items = [_get_checkpoint_key_item(argument) for argument in (
+                output_file_prefix,
+                grid_spacing_degrees,
+                oldest_time,
+                time_increment,
+                lithology_filenames,
+                age_grid_filename,
+                topography_filename,
+                total_sediment_thickness_filename,
+                crustal_thickness_filename,
+                rotation_filenames,
+                static_polygon_filename,
+                dynamic_topography_model,
+                sea_level_model,
+                lithology_name,
+                ocean_age_to_depth_model,
+                exclude_distances_to_trenches_kms,
+                region_plate_ids,
+                anchor_plate_id,
+                output_positive_bathymetry_below_sea_level,
+                output_xyz,
+                gridder,
+                output_grid_cube)]
+        except ValueError as error:
+            # An argument cannot be identified across runs, so a checkpoint could be resumed by a run with different arguments.
+            warnings.warn('Not checkpointing (or resuming): {0}'.format(error), RuntimeWarning)
+        else:
+            checkpoint = Checkpoint(checkpoint_directory, pybacktrack.version.__version__, *checkpoint_key_items)
+            if not resume:
+                checkpoint.remove()
+    
+    # Grids are added to an existing grid cube, so remove any grid cube not written by the run being resumed (if any).
+    if output_grid_cube and not (checkpoint and checkpoint.load_completed_times()):
+        grid_cube_filename = _get_grid_cube_filename(output_file_prefix)
+        if os.path.exists(grid_cube_filename):
+            os.remove(grid_cube_filename)
+    
+    # Start a single pool of worker processes (if more than one CPU) that is used by all stages below.
+    # Each worker process loads the rotation model, static polygons and trenches once (when it starts).
+    num_cpus = get_num_cpus(use_all_cpus)
+    if num_cpus > 1:
+        worker_pool = WorkerPool(
+            num_cpus,
+            worker_pool_backend,
+            initializer=_initialise_worker_process,
+            initargs=(rotation_filenames, static_polygon_filename, exclude_distances_to_trenches_kms))
+    else:
+        worker_pool = None
     
-    # Generate a NetCDF grid for each reconstructed time of the paleobathmetry.
-    write_bathymetry_grids(
-        paleo_bathymetry,
-        grid_spacing_degrees,
-        output_file_prefix,
-        output_xyz,
-        use_all_cpus)
+    try:
+        # Generate reconstructed paleo bathymetry points over the requested time period.
+        #
+        # Note: These are generated one time at a time (and written to grids a window of times at a time) so that
+        #       we don't need to hold the paleo bathymetry at all times in memory.
+        paleo_bathymetry_iter = reconstruct_backtrack_bathymetry_iter(
+            input_points,
+            oldest_time,
+            time_increment,
+            lithology_filenames,
+            age_grid_filename,
+            topography_filename,
+            total_sediment_thickness_filename,
+            crustal_thickness_filename,
+            rotation_filenames,
+            static_polygon_filename,
+            dynamic_topography_model,
+            sea_level_model,
+            lithology_name,
+            ocean_age_to_depth_model,
+            exclude_distances_to_trenches_kms,
+            region_plate_ids,
+            anchor_plate_id,
+            output_positive_bathymetry_below_sea_level,
+            worker_pool=worker_pool,
+            progress_callback=progress_callback,
+            checkpoint=checkpoint)
+        
+        paleo_bathymetry = {}
+        for time, paleo_bathymetry_at_time in paleo_bathymetry_iter:
+            paleo_bathymetry[time] = paleo_bathymetry_at_time
+            
+            # Generate a NetCDF grid for each reconstructed time of the paleobathmetry (in the current window of times).
+            if len(paleo_bathymetry) == DEFAULT_TIMES_PER_WINDOW:
+                write_bathymetry_grids(
+                    paleo_bathymetry,
+                    grid_spacing_degrees,
+                    output_file_prefix,
+                    output_xyz,
+                    worker_pool=worker_pool,
+                    gridder=gridder,
+                    output_grid_cube=output_grid_cube)
+                # Record the times whose grids have been written (so they're skipped if resumed after an interruption).
+                if checkpoint:
+                    checkpoint.add_completed_times(paleo_bathymetry.keys())
+                paleo_bathymetry = {}
+        
+        # Generate a NetCDF grid for each remaining reconstructed time of the paleobathmetry.
+        if paleo_bathymetry:
+            write_bathymetry_grids(
+                paleo_bathymetry,
+                grid_spacing_degrees,
+                output_file_prefix,
+                output_xyz,
+                worker_pool=worker_pool,
+                gridder=gridder,
+                output_grid_cube=output_grid_cube)
+        
+        # The run has completed so its checkpoints are no longer needed.
+        if checkpoint:
+            checkpoint.remove()
+    finally:
+        if worker_pool is not None:
+            worker_pool.close()
+
+
+def _get_checkpoint_key_item(argument):
+    """
+    Return an item (for a checkpoint key) that identifies an argument of 'reconstruct_backtrack_bathymetry_and_write_grids()'.
+    
+    Filenames are replaced by their file signatures (so that checkpoints are not used after an input file changes).
+    
+    Raises ValueError if the argument is a function not read from a curve file (since it cannot be identified across runs).
+    """
+    
+    if isinstance(argument, str):
+        if os.path.isfile(argument):
+            return get_file_signature(argument)
+        return argument
+    if isinstance(argument, (list, tuple)):
+        return tuple(_get_checkpoint_key_item(item) for item in argument)
+    if callable(argument):
+        # Eg, an age-to-depth model read from a file (using 'pybacktrack.util.interpolate.read_curve_function()').
+        curve_file_arguments = getattr(argument, 'curve_file_arguments', None)
+        if curve_file_arguments is not None:
+            return _get_checkpoint_key_item(curve_file_arguments)
+        # Any other function (its 'repr' contains its memory address, which differs between runs, and its name does not identify its behaviour).
+        raise ValueError('Function {0!r} was not read from a curve file, so cannot be identified in a checkpoint.'.format(argument))
+    return argument
 
 
 ########################
@@ -1718,10 +3240,32 @@ def main():
              'So the default matches typical topography/bathymetry grids (outputs negative bathymetry values below sea level).')
     
     parser.add_argument(
-        '--output_xyz', action='store_true',
-        help='Also create a GMT xyz file (with ".xyz" extension) for each output paleo bathymetry grid. '
-             'Each row of each xyz file contains "longitude latitude bathymetry". '
-             'Default is to only create grid files (no xyz).')
+        '--output_xyz', nargs='?', choices=XYZ_FORMATS,
+        const=XYZ_FORMAT_TEXT, default=False,
+        metavar='FORMAT',
+        help='Also create an xyz file for each output paleo bathymetry grid, optionally in the specified format '
+             '(which is also the filename extension). Choices include {0}. Defaults to "{1}" (if no format is specified) '
+             'where each row of each GMT xyz text file contains "longitude latitude bathymetry". '
+             'The other formats are binary and much faster to write and read: "npy" is a NumPy (N, 3) array, '
+             '"npz" is compressed NumPy "longitude", "latitude" and "value" arrays, "bin" is raw little-endian 32-bit floats '
+             '(three per row) and "parquet" is an Apache Parquet file (requires "pyarrow"). '
+             'Default is to only create grid files (no xyz).'.format(
+                ', '.join('"{0}"'.format(xyz_format) for xyz_format in XYZ_FORMATS), XYZ_FORMAT_TEXT))
+    
+    parser.add_argument(
+        '--output_grid_cube', action='store_true',
+        help='Write all paleo bathymetry grids into a single NetCDF4 grid cube file named "<output_file_prefix>.nc" '
+             '(with dimensions time, lat and lon) instead of a grid file for each time. '
+             'This requires the "netCDF4" package to be installed.')
+    
+    parser.add_argument(
+        '--gridder', type=str, choices=GRIDDERS,
+        default=DEFAULT_GRIDDER,
+        help='How the paleo bathymetry points are gridded. '
+             'If "{0}" then gridding is done in-process. If "{1}" then gridding is done by GMT "nearneighbor" and "grdmath" '
+             '(requiring GMT to be installed). Both use the same nearest neighbour algorithm (GMT\'s search radii, sectors and weights). '
+             'Defaults to "{2}".'.format(
+                 GRIDDER_NATIVE, GRIDDER_GMT, DEFAULT_GRIDDER))
     
     parser.add_argument(
         '--use_all_cpus', nargs='?', type=parse_positive_integer,
@@ -1729,6 +3273,33 @@ def main():
         metavar='NUM_CPUS',
         help='Use all CPUs (cores), or if an optional integer is also specified then use the specified number of CPUs. '
              'Defaults to using a single CPU.')
+    parser.add_argument(
+        '--worker_pool_backend', type=str, choices=WORKER_POOL_BACKENDS,
+        default=DEFAULT_WORKER_POOL_BACKEND,
+        help='The library used to create the pool of worker processes (when using more than one CPU). '
+             'Choices include {0}. Defaults to "{1}".'.format(
+                 ', '.join('"{0}"'.format(backend) for backend in WORKER_POOL_BACKENDS), DEFAULT_WORKER_POOL_BACKEND))
+    parser.add_argument(
+        '--show_progress', action='store_true',
+        help='Print the percentage of paleo bathymetry generated so far (to standard error).')
+    
+    parser.add_argument(
+        '--checkpoint_dir', type=argparse_unicode,
+        metavar='checkpoint_dir',
+        help='Directory to save checkpoints in, so that an interrupted run can be resumed (with "--resume"). '
+             'Checkpoints are only used by a run with the same arguments, and are removed when the run completes. '
+             'Defaults to "{0}" in the pybacktrack cache directory.'.format(_CHECKPOINT_DIRECTORY_NAME))
+    parser.add_argument(
+        '--resume', action='store_true',
+        help='Resume from the checkpoints saved by a previous interrupted run with the same arguments '
+             '(skipping completed stages and times whose grids have already been written). '
+             'By default any such checkpoints are ignored (and removed).')
+    parser.add_argument(
+        '--profile_report', type=argparse_unicode,
+        metavar='profile_report_filename',
+        help='Write a JSON report of the time spent in each stage of the pipeline (such as grid sampling, decompaction and gridding) '
+             'and counters (such as the number of points in and out of each stage) to the specified file. '
+             'Times and counters in worker processes are added together. By default no report is written.')
 
     parser.add_argument('oldest_time', nargs='?', type=parse_non_negative_float,
             metavar='oldest_time',
@@ -1782,29 +3353,54 @@ def main():
     else:
         sea_level_model = None
     
-    # Generate reconstructed paleo bathymetry grids over the requested time period.
-    paleo_bathymetry = reconstruct_backtrack_bathymetry_and_write_grids(
-        args.output_file_prefix,
-        grid_spacing_degrees,
-        args.oldest_time,
-        args.time_increment,
-        args.lithology_filenames,
-        args.age_grid_filename,
-        args.topography_filename,
-        args.total_sediment_thickness_filename,
-        args.crustal_thickness_filename,
-        args.rotation_filenames,
-        args.static_polygon_filename,
-        dynamic_topography_model,
-        sea_level_model,
-        args.lithology_name,
-        args.ocean_age_to_depth_model,
-        args.exclude_distances_to_trenches_kms,
-        args.region_plate_ids,
-        args.anchor_plate_id,
-        args.output_positive_bathymetry_below_sea_level,
-        args.output_xyz,
-        args.use_all_cpus)
+    if args.checkpoint_dir:
+        checkpoint_directory = args.checkpoint_dir
+    else:
+        checkpoint_directory = os.path.join(get_cache_directory(), _CHECKPOINT_DIRECTORY_NAME)
+    
+    if args.show_progress:
+        def progress_callback(fraction_completed):
+            sys.stderr.write('\rGenerated {0:.1f}% of paleo bathymetry'.format(100.0 * fraction_completed))
+            if fraction_completed >= 1:
+                sys.stderr.write('\n')
+            sys.stderr.flush()
+    else:
+        progress_callback = None
+    
+    # Record stage times and counters if requested.
+    with profiling(enabled=bool(args.profile_report)) as profile:
+        # Generate reconstructed paleo bathymetry grids over the requested time period.
+        reconstruct_backtrack_bathymetry_and_write_grids(
+            args.output_file_prefix,
+            grid_spacing_degrees,
+            args.oldest_time,
+            args.time_increment,
+            args.lithology_filenames,
+            args.age_grid_filename,
+            args.topography_filename,
+            args.total_sediment_thickness_filename,
+            args.crustal_thickness_filename,
+            args.rotation_filenames,
+            args.static_polygon_filename,
+            dynamic_topography_model,
+            sea_level_model,
+            args.lithology_name,
+            args.ocean_age_to_depth_model,
+            args.exclude_distances_to_trenches_kms,
+            args.region_plate_ids,
+            args.anchor_plate_id,
+            args.output_positive_bathymetry_below_sea_level,
+            args.output_xyz,
+            args.use_all_cpus,
+            args.worker_pool_backend,
+            progress_callback,
+            checkpoint_directory,
+            args.resume,
+            args.gridder,
+            args.output_grid_cube)
+    
+    if args.profile_report:
+        profile.write_report(args.profile_report)
 
 
 if __name__ == '__main__':
@@ -30,7 +30,7 @@ from __future__ import print_function
 
 import math
 import numpy as np
-from scipy.optimize import minimize_scalar
+from pybacktrack.util.profiling import count
 import sys
 
 
@@ -228,6 +228,9 @@ def estimate_beta(
     # (perhaps a more realistic limit would be some percentage of lithospheric thickness?).
     max_beta = _y_l / present_day_crustal_thickness
     
+    # Note: Imported here (rather than at the top of this module) since it is slow to import.
+    from scipy.optimize import minimize_scalar
+    
     # Run SciPy minimization.
     #
     # We bound the range of allowed beta values to [min_beta, max_beta].
@@ -239,6 +242,7 @@ def estimate_beta(
         bounds=(min_beta, max_beta),
         method='bounded',
         options={'maxiter': 100})
+    count('beta_estimation.solver_iterations', res['nit'])
     
     # Return estimated beta and the minimum residual between present day subsidence and
     # subsidence calculated using the estimated beta.
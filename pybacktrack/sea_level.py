@@ -32,7 +32,6 @@ from __future__ import print_function
 import pybacktrack.bundle_data
 import pybacktrack.util.interpolate
 import math
-import scipy.integrate
 import warnings
 
 
@@ -97,9 +96,10 @@ class SeaLevel(object):
         
         Parameters
         ----------
-        sea_level_model_or_bundled_model_name : string
+        sea_level_model_or_bundled_model_name : string or :class:`pybacktrack.SeaLevel`
             Either a user-provided model specified as a text filename containing sea level curve (see :meth:`pybacktrack.SeaLevel.__init__`), or
-            name of a bundled model (see :meth:`pybacktrack.SeaLevel.create_from_bundled_model`), .
+            name of a bundled model (see :meth:`pybacktrack.SeaLevel.create_from_bundled_model`), or
+            an already loaded sea level model (which is returned as is).
         
         Returns
         -------
@@ -109,8 +109,15 @@ class SeaLevel(object):
         Notes
         -----
         .. versionadded:: 1.4
+        
+        .. versionchanged:: 1.5
+            - Also accepts an already loaded :class:`pybacktrack.SeaLevel`.
         """
         
+        # If already loaded then there's nothing to do.
+        if isinstance(sea_level_model_or_bundled_model_name, SeaLevel):
+            return sea_level_model_or_bundled_model_name
+        
         # If a sea level *bundled model name* was specified then create it from a bundled sea level model.
         if sea_level_model_or_bundled_model_name in pybacktrack.bundle_data.BUNDLE_SEA_LEVEL_MODEL_NAMES:
             return SeaLevel.create_from_bundled_model(sea_level_model_or_bundled_model_name)
@@ -148,6 +155,9 @@ class SeaLevel(object):
         # changes in sea level curve at these points.
         times = [time for time in self.sea_level_times if time <= begin_time and time >= end_time]
         
+        # Note: Imported here (rather than at the top of this module) since it is slow to import.
+        import scipy.integrate
+        
         # Integrate sea level curve over time interval.
         sea_level_integral, sea_level_integral_error = scipy.integrate.quad(
             self.sea_level_function,
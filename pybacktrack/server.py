@@ -0,0 +1,794 @@
+
+"""
+    Copyright (C) 2026 The University of Sydney, Australia
+
+    This program is free software; you can redistribute it and/or modify it under
+    the terms of the GNU General Public License, version 2, as published by
+    the Free Software Foundation.
+
+    This program is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+
+##################################################################################################
+# A long-running local server (and client) for backtrack, backstrip and paleo bathymetry requests. #
+##################################################################################################
+
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from functools import partial
+import json
+import numpy as np
+import os
+import os.path
+import pybacktrack.bundle_data
+from pybacktrack.lithology import read_lithologies_files
+import pybacktrack.version
+from pybacktrack.util.cache import get_file_signature
+from pybacktrack.util.worker_pool import DEFAULT_WORKER_POOL_BACKEND, WORKER_POOL_BACKENDS, WorkerPool, get_num_cpus
+import socket
+try:
+    import socketserver
+except ImportError:
+    # Python 2.
+    import SocketServer as socketserver
+import sys
+import threading
+import warnings
+
+
+#
+# The methods that can be requested.
+#
+METHOD_PING = 'ping'
+METHOD_BACKTRACK = 'backtrack'
+METHOD_BACKSTRIP = 'backstrip'
+METHOD_PALEO_BATHYMETRY = 'paleo_bathymetry'
+METHODS = (METHOD_PING, METHOD_BACKTRACK, METHOD_BACKSTRIP, METHOD_PALEO_BATHYMETRY)
+
+# Default address of the server (only accepts connections from the local host).
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Request parameters that are tuples (but are lists after a round trip through JSON).
+_TUPLE_PARAMETERS = ('well_location', 'dynamic_topography_model')
+
+# Errors raised by a request are returned to the client and raised again there (as the same type, if one of these).
+_CLIENT_ERROR_TYPES = dict((error_type.__name__, error_type) for error_type in (ValueError, TypeError, KeyError, IndexError, OSError, ImportError))
+
+# Warnings emitted by a request are returned to the client and emitted again there (as the same category, if one of these).
+_CLIENT_WARNING_CATEGORIES = dict((category.__name__, category) for category in (UserWarning, DeprecationWarning, RuntimeWarning, FutureWarning))
+
+
+def handle_request(request):
+    """handle_request(request)
+    Handle a single request (a dict decoded from JSON) and return the response (a dict that can be encoded as JSON).
+    
+    Parameters
+    ----------
+    request : dict
+        Contains the requested ``'method'`` (one of ``pybacktrack.server.METHODS``), its ``'params'`` (a dict of
+        keyword arguments) and an optional ``'id'`` (returned unchanged in the response).
+    
+    Returns
+    -------
+    dict
+        Contains the ``'id'`` of the request and either a ``'result'`` or, if the request failed, an ``'error'``
+        (a dict containing the error ``'type'`` and ``'message'``). Any warnings emitted while handling the request
+        are also returned in ``'warnings'`` (a list of dicts each containing the warning ``'category'`` and ``'message'``).
+    
+    Notes
+    -----
+    A ``'backtrack'`` request accepts the keyword arguments of :func:`pybacktrack.backtrack_well`, and a ``'backstrip'``
+    request accepts those of :func:`pybacktrack.backstrip_well`. Both also accept ``'decompacted_columns'`` (a list of
+    column names, as used by the ``-d`` command-line option). Their result contains the ``'longitude'`` and ``'latitude'``
+    of the well and the requested ``'columns'`` (a dict mapping each column name to a list of values).
+    
+    A ``'paleo_bathymetry'`` request accepts the keyword arguments of :func:`pybacktrack.reconstruct_paleo_bathymetry`
+    (except ``use_all_cpus``, since the server owns the worker processes). Its result is a list of dicts (in order of time)
+    each containing a ``'time'`` and the reconstructed ``'points'`` (a list of longitude, latitude, bathymetry rows).
+    
+    .. versionadded:: 1.5
+    """
+    
+    return _handle_request(request, None)
+
+
+def _handle_request(request, worker_pool):
+    """
+    Handle 'request', optionally distributing a paleo bathymetry request across the processes in 'worker_pool'.
+    """
+    
+    # Collect the warnings emitted (by this thread) while handling the request, and return them with the response.
+    _install_show_warning()
+    _request_warnings.warnings = []
+    try:
+        response = _dispatch_request(request, worker_pool)
+        if _request_warnings.warnings:
+            response['warnings'] = _request_warnings.warnings
+    finally:
+        _request_warnings.warnings = None
+    
+    return response
+
+
+def _dispatch_request(request, worker_pool):
+    """
+    Call the requested method and return the response containing its result (or its error).
+    """
+    
+    request_id = request.get('id') if isinstance(request, dict) else None
+    try:
+        if not isinstance(request, dict):
+            raise ValueError('Request is not a JSON object')
+        
+        method = request.get('method')
+        params = request.get('params', {})
+        if not isinstance(params, dict):
+            raise ValueError('Request parameters are not a JSON object')
+        # Convert parameters that are tuples (their JSON round trip converted them to lists).
+        params = dict((name, tuple(value) if name in _TUPLE_PARAMETERS and isinstance(value, list) else value) for name, value in params.items())
+        
+        if method == METHOD_PING:
+            result = {'version': pybacktrack.version.__version__}
+        elif method == METHOD_BACKTRACK:
+            import pybacktrack.backtrack as backtrack
+            result = _decompact_well(backtrack, backtrack.backtrack_well, params)
+        elif method == METHOD_BACKSTRIP:
+            import pybacktrack.backstrip as backstrip
+            result = _decompact_well(backstrip, backstrip.backstrip_well, params)
+        elif method == METHOD_PALEO_BATHYMETRY:
+            result = _reconstruct_paleo_bathymetry(params, worker_pool)
+        else:
+            raise ValueError('Unknown method "{0}" (must be one of {1})'.format(method, ', '.join(METHODS)))
+    except Exception as exc:
+        # Return the most specific error type known to the client (eg, 'OSError' for a 'FileNotFoundError').
+        error_type = next((error_class.__name__ for error_class in type(exc).__mro__ if error_class.__name__ in _CLIENT_ERROR_TYPES), type(exc).__name__)
+        return {'id': request_id, 'error': {'type': error_type, 'message': str(exc)}}
+    
+    return {'id': request_id, 'result': result}
+
+
+def _decompact_well(decompaction_module, decompact_well, params):
+    """
+    Backtrack or backstrip (using 'decompact_well' in 'decompaction_module') the well in 'params' and return its decompacted columns.
+    """
+    
+    decompacted_column_names = params.pop('decompacted_columns', decompaction_module.DEFAULT_DECOMPACTED_COLUMN_NAMES)
+    try:
+        decompacted_columns = [decompaction_module.DECOMPACTED_COLUMNS_BY_NAME[column_name] for column_name in decompacted_column_names]
+    except KeyError as exc:
+        raise ValueError('Unknown decompacted column {0}'.format(exc))
+    
+    # Use the lithologies and models already loaded by this process (by a previous request), or load them now (for subsequent requests).
+    params['lithology_filenames'] = _get_lithologies(params.get('lithology_filenames', [pybacktrack.bundle_data.DEFAULT_BUNDLE_LITHOLOGY_FILENAME]))
+    if params.get('sea_level_model'):
+        params['sea_level_model'] = _get_sea_level(params['sea_level_model'])
+    if params.get('dynamic_topography_model'):
+        params['dynamic_topography_model'] = _get_dynamic_topography_model(params['dynamic_topography_model'])
+    
+    well, decompaction_result = decompact_well(**params)
+    
+    columns = decompaction_module.get_decompacted_columns(decompaction_result, decompacted_columns)
+    
+    return {
+        'longitude': well.longitude,
+        'latitude': well.latitude,
+        'columns': dict((column_name, list(column) if isinstance(column, list) else column.tolist())
+                        for column_name, column in zip(decompacted_column_names, columns))}
+
+
+def _reconstruct_paleo_bathymetry(params, worker_pool):
+    """
+    Reconstruct the paleo bathymetry of the input points in 'params' and return the points at each time (in order of time).
+    """
+    
+    import pybacktrack.paleo_bathymetry as paleo_bathymetry
+    
+    if 'use_all_cpus' in params:
+        raise ValueError('Paleo bathymetry requests cannot specify "use_all_cpus" (the server determines the number of CPUs)')
+    
+    paleo_bathymetry_iter = paleo_bathymetry.reconstruct_backtrack_bathymetry_iter(worker_pool=worker_pool, **params)
+    return [{'time': time, 'points': points.tolist()} for time, points in paleo_bathymetry_iter]
+
+
+def _get_lithologies(lithology_filenames):
+    """
+    Return the lithologies read from 'lithology_filenames' (only read once per process, unless a file is modified).
+    """
+    
+    # It used to be a single filename (instead of a list) so handle that case to be backward compatible.
+    if isinstance(lithology_filenames, str):
+        lithology_filenames = [lithology_filenames]
+    
+    return _get_cached_model('lithologies', lithology_filenames, partial(read_lithologies_files, lithology_filenames))
+
+
+def _get_sea_level(sea_level_model):
+    """
+    Return the sea level model loaded from a bundled model name or a filename (only loaded once per process, unless the file is modified).
+    """
+    
+    from pybacktrack.sea_level import SeaLevel
+    
+    sea_level_filename = pybacktrack.bundle_data.BUNDLE_SEA_LEVEL_MODELS.get(sea_level_model, sea_level_model)
+    
+    return _get_cached_model('sea_level', [sea_level_filename], partial(SeaLevel, sea_level_filename))
+
+
+def _get_dynamic_topography_model(dynamic_topography_model):
+    """
+    Return the dynamic topography model (bundled model name or 3-tuple of filenames) with its static polygons and rotations loaded
+    (only loaded once per process, unless a file is modified).
+    
+    A dynamic topography model is specific to a well location, so only the model files shared by all locations are loaded.
+    """
+    
+    from pybacktrack.dynamic_topography import DynamicTopography
+    import pygplates
+    
+    if isinstance(dynamic_topography_model, str):
+        grid_list_filename, static_polygon_filename, rotation_filenames = DynamicTopography.get_bundled_model(dynamic_topography_model)
+    else:
+        grid_list_filename, static_polygon_filename, rotation_filenames = dynamic_topography_model
+    if isinstance(rotation_filenames, str):
+        rotation_filenames = [rotation_filenames]
+    
+    static_polygons = _get_cached_model('static_polygons', [static_polygon_filename], partial(pygplates.FeatureCollection, static_polygon_filename))
+    rotation_model = _get_cached_model('rotation_model', rotation_filenames, partial(pygplates.RotationModel, rotation_filenames))
+    
+    return grid_list_filename, static_polygons, rotation_model
+
+
+def _get_cached_model(model_name, filenames, create_model):
+    """
+    Return the model created by 'create_model()' from 'filenames', but only create it once per process (and return the cached model thereafter).
+    
+    The model is cached against the name, the filenames and the signatures of the files (so a modified file is loaded again).
+    """
+    
+    try:
+        cache_key = (model_name, tuple((filename, get_file_signature(filename)) for filename in filenames))
+    except (TypeError, OSError):
+        # Not all filenames (or a file does not exist). Let 'create_model()' deal with that (eg, raise an error).
+        return create_model()
+    
+    model = _cached_models.get(cache_key)
+    if model is None:
+        model = create_model()
+        # Keep the cache bounded (simply start again when it's full).
+        if len(_cached_models) >= _MAX_CACHED_MODELS:
+            _cached_models.clear()
+        _cached_models[cache_key] = model
+    
+    return model
+
+
+# Lithologies and models loaded by requests (in the current process), so that they stay loaded across requests.
+#
+# Note: Requests handled in the server process are handled one at a time, and each worker process handles one request at a time,
+#       so this is not accessed by multiple threads at the same time.
+_cached_models = {}
+_MAX_CACHED_MODELS = 32
+
+
+def _show_warning(message, category, filename, lineno, file=None, line=None):
+    """
+    Collect a warning emitted by a thread handling a request (or show it as usual if emitted by any other thread).
+    """
+    
+    request_warnings = getattr(_request_warnings, 'warnings', None)
+    if request_warnings is None:
+        return _show_warning_default(message, category, filename, lineno, file, line)
+    
+    request_warnings.append({'category': category.__name__, 'message': str(message)})
+
+
+def _install_show_warning():
+    """
+    Route warnings through '_show_warning()' (if not already).
+    
+    This is only done once (rather than temporarily replacing the warning state for each request with 'warnings.catch_warnings()',
+    which is not thread-safe since requests are handled by multiple threads).
+    """
+    
+    global _show_warning_default
+    
+    with _show_warning_lock:
+        if warnings.showwarning is not _show_warning:
+            _show_warning_default = warnings.showwarning
+            warnings.showwarning = _show_warning
+
+
+# The warnings emitted by the thread handling a request (None if not handling a request).
+_request_warnings = threading.local()
+# How warnings were shown before '_install_show_warning()' (used for warnings emitted outside requests).
+_show_warning_default = warnings.showwarning
+_show_warning_lock = threading.Lock()
+
+
+def _initialise_worker_process():
+    """
+    Import the modules and load the bundled models (used by requests) once, when a server process starts.
+    """
+    
+    import pybacktrack.backstrip
+    import pybacktrack.backtrack
+    import pybacktrack.paleo_bathymetry as paleo_bathymetry
+    
+    # Load the bundled rotation model, static polygons and trenches (used by paleo bathymetry requests).
+    paleo_bathymetry._initialise_worker_process(
+        pybacktrack.bundle_data.BUNDLE_RECONSTRUCTION_ROTATION_FILENAMES,
+        pybacktrack.bundle_data.BUNDLE_RECONSTRUCTION_STATIC_POLYGON_FILENAME,
+        None)
+    
+    # Read the default lithologies (used by backtrack and backstrip requests that don't specify lithologies).
+    _get_lithologies([pybacktrack.bundle_data.DEFAULT_BUNDLE_LITHOLOGY_FILENAME])
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handles a client connection, one JSON request per line (and one JSON response per line).
+    """
+    
+    def handle(self):
+        for request_line in self.rfile:
+            if not request_line.strip():
+                continue
+            
+            try:
+                request = json.loads(request_line.decode('utf-8'))
+            except ValueError as exc:
+                response = {'id': None, 'error': {'type': 'ValueError', 'message': 'Invalid JSON request: {0}'.format(exc)}}
+            else:
+                response = self.server.backtrack_server._handle_request(request)
+            
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, 'UnixStreamServer'):
+    class _UnixStreamServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+else:
+    # Unix sockets are not available on this platform (eg, Windows).
+    _UnixStreamServer = None
+
+
+class BacktrackServer(object):
+    """
+    A long-running local server that handles backtrack, backstrip and paleo bathymetry requests from clients
+    (such as :class:`pybacktrack.BacktrackClient`).
+    
+    Starting a new Python process for each well (or group of points) repeats the cost of importing pyBacktrack and
+    loading its models. The server only does this once. Its worker processes import the modules, and load the bundled
+    rotation model, static polygons and default lithologies, when they start. And the lithologies, sea level models and
+    dynamic topography models (static polygons and rotations) used by requests then stay loaded (in each process) across
+    requests (keyed by filename, so a modified file is loaded again).
+    
+    Each client connection is handled in its own thread. Requests arrive (and responses are returned) as one JSON object per line.
+    
+    .. versionadded:: 1.5
+    """
+    
+    def __init__(self, address=(DEFAULT_HOST, DEFAULT_PORT), use_all_cpus=False, worker_pool_backend=DEFAULT_WORKER_POOL_BACKEND):
+        """__init__(address=(pybacktrack.server.DEFAULT_HOST, pybacktrack.server.DEFAULT_PORT), use_all_cpus=False, worker_pool_backend='multiprocessing')
+        Start listening on ``address`` (requests are not handled until :meth:`serve_forever` is called).
+        
+        Parameters
+        ----------
+        address : tuple or str, optional
+            Either a (host, port) tuple, or the filename of a Unix domain socket (not available on Windows).
+            A port of zero chooses an unused port (see :attr:`address`).
+            Defaults to port 8765 on the local host (so only local clients can connect).
+        use_all_cpus : bool or int, optional
+            If ``False`` (or zero) then requests are handled one at a time (in this process).
+            If ``True`` then concurrent requests are distributed across all available CPUs (cores).
+            If a positive integer then concurrent requests are distributed across that number of CPUs (cores).
+        worker_pool_backend : str, optional
+            The library used to create the pool of worker processes (when using more than one CPU).
+            One of ``pybacktrack.util.worker_pool.WORKER_POOL_BACKENDS``. Defaults to ``'multiprocessing'``.
+        
+        Raises
+        ------
+        ValueError
+            If ``address`` is a Unix domain socket filename and Unix domain sockets are not available on this platform.
+        """
+        
+        if isinstance(address, str):
+            if _UnixStreamServer is None:
+                raise ValueError('Unix domain sockets are not available on this platform')
+            # Remove a socket file left over from a previous server (that was not closed).
+            if os.path.exists(address):
+                os.remove(address)
+            self._server = _UnixStreamServer(address, _RequestHandler)
+        else:
+            self._server = _TCPServer(tuple(address), _RequestHandler)
+        self._server.backtrack_server = self
+        
+        num_cpus = get_num_cpus(use_all_cpus)
+        if num_cpus > 1:
+            self._worker_pool = WorkerPool(num_cpus, worker_pool_backend, _initialise_worker_process)
+        else:
+            self._worker_pool = None
+            _initialise_worker_process()
+        
+        # Requests handled in this process (eg, when there's no worker pool) are handled one at a time.
+        self._lock = threading.Lock()
+    
+    @property
+    def address(self):
+        """
+        The address the server is listening on (a (host, port) tuple, or the filename of a Unix domain socket).
+        """
+        
+        return self._server.server_address
+    
+    def serve_forever(self):
+        """
+        Handle requests until :meth:`shutdown` is called (from another thread).
+        """
+        
+        self._server.serve_forever()
+    
+    def shutdown(self):
+        """
+        Stop :meth:`serve_forever` (must be called from a thread other than the one calling :meth:`serve_forever`).
+        """
+        
+        self._server.shutdown()
+    
+    def close(self):
+        """
+        Stop listening, stop the worker processes and remove the Unix domain socket file (if any).
+        """
+        
+        if self._server is not None:
+            self._server.server_close()
+            if isinstance(self._server.server_address, str) and os.path.exists(self._server.server_address):
+                os.remove(self._server.server_address)
+            self._server = None
+        if self._worker_pool is not None:
+            self._worker_pool.close()
+            self._worker_pool = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _handle_request(self, request):
+        # Paleo bathymetry requests distribute their own work across the worker processes (from this process).
+        # Other requests are each handled by a single worker process.
+        if self._worker_pool is not None and not (isinstance(request, dict) and request.get('method') == METHOD_PALEO_BATHYMETRY):
+            return self._worker_pool.map(handle_request, [request])[0]
+        
+        with self._lock:
+            return _handle_request(request, self._worker_pool)
+
+
+class BacktrackClient(object):
+    """
+    A client of a :class:`pybacktrack.BacktrackServer` (running in another process).
+    
+    Each client has its own connection to the server (a client should not be shared by threads that make requests at the same time).
+    
+    .. versionadded:: 1.5
+    """
+    
+    def __init__(self, address=(DEFAULT_HOST, DEFAULT_PORT), timeout=None):
+        """__init__(address=(pybacktrack.server.DEFAULT_HOST, pybacktrack.server.DEFAULT_PORT), timeout=None)
+        Connect to the server listening on ``address``.
+        
+        Parameters
+        ----------
+        address : tuple or str, optional
+            Either a (host, port) tuple, or the filename of a Unix domain socket.
+            Defaults to port 8765 on the local host.
+        timeout : float, optional
+            Number of seconds to wait for the server (to connect or respond) before raising ``socket.timeout``.
+            Defaults to waiting forever.
+        """
+        
+        if isinstance(address, str):
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            address = tuple(address)
+        self._socket.settimeout(timeout)
+        self._socket.connect(address)
+        self._file = self._socket.makefile('rwb')
+        self._next_request_id = 0
+    
+    def request(self, method, **params):
+        """request(method, **params)
+        Send a request to the server and return its result.
+        
+        Parameters
+        ----------
+        method : str
+            One of ``pybacktrack.server.METHODS``.
+        **params
+            The keyword arguments of the method (see :func:`pybacktrack.server.handle_request`).
+        
+        Returns
+        -------
+        The result decoded from JSON.
+        
+        Raises
+        ------
+        ValueError, TypeError, KeyError, IndexError, OSError or ImportError
+            If the request raised that error in the server.
+        RuntimeError
+            If the request raised any other error in the server.
+        ConnectionError
+            If the server closed the connection.
+        
+        Notes
+        -----
+        Warnings emitted by the request in the server are emitted again in the client (as the same category, if a built-in category,
+        otherwise as ``UserWarning``).
+        """
+        
+        request_id = self._next_request_id
+        self._next_request_id += 1
+        
+        self._file.write(json.dumps({'id': request_id, 'method': method, 'params': params}).encode('utf-8') + b'\n')
+        self._file.flush()
+        
+        response_line = self._file.readline()
+        if not response_line:
+            raise ConnectionError('Server closed the connection')
+        response = json.loads(response_line.decode('utf-8'))
+        
+        # Emit the warnings emitted by the request in the server.
+        for warning in response.get('warnings', []):
+            warnings.warn('{0} (emitted by server)'.format(warning['message']), _CLIENT_WARNING_CATEGORIES.get(warning['category'], UserWarning))
+        
+        error = response.get('error')
+        if error is not None:
+            raise _CLIENT_ERROR_TYPES.get(error['type'], RuntimeError)('{0} (raised by server)'.format(error['message']))
+        
+        return response['result']
+    
+    def ping(self):
+        """
+        Return the pyBacktrack version of the server (useful to check the server is running).
+        """
+        
+        return self.request(METHOD_PING)['version']
+    
+    def backtrack_well(self, well_filename, decompacted_columns=None, **kwargs):
+        """backtrack_well(well_filename, decompacted_columns=None, **kwargs)
+        Backtrack a well in the server.
+        
+        Parameters
+        ----------
+        well_filename : str
+            Name of well text file (opened by the server).
+        decompacted_columns : list of str, optional
+            The names of the decompacted columns to return (as used by the ``-d`` command-line option of ``backtrack_cli``).
+            Defaults to age and decompacted thickness.
+        **kwargs
+            Other keyword arguments of :func:`pybacktrack.backtrack_well`.
+            Any filenames are opened by the server (so relative filenames are relative to its working directory).
+        
+        Returns
+        -------
+        dict
+            Contains the ``'longitude'`` and ``'latitude'`` of the well, and its ``'columns'`` (a dict mapping each column name to
+            a numpy array, except the lithology column which is a list of strings).
+        """
+        
+        return self._decompact_well(METHOD_BACKTRACK, well_filename, decompacted_columns, kwargs)
+    
+    def backstrip_well(self, well_filename, decompacted_columns=None, **kwargs):
+        """backstrip_well(well_filename, decompacted_columns=None, **kwargs)
+        Backstrip a well in the server.
+        
+        Same as :meth:`backtrack_well` except the keyword arguments are those of :func:`pybacktrack.backstrip_well`.
+        """
+        
+        return self._decompact_well(METHOD_BACKSTRIP, well_filename, decompacted_columns, kwargs)
+    
+    def reconstruct_paleo_bathymetry(self, input_points, oldest_time=None, time_increment=1, **kwargs):
+        """reconstruct_paleo_bathymetry(input_points, oldest_time=None, time_increment=1, **kwargs)
+        Reconstruct paleo bathymetry in the server.
+        
+        Parameters
+        ----------
+        input_points, oldest_time, time_increment, **kwargs
+            See :func:`pybacktrack.reconstruct_paleo_bathymetry` (except ``use_all_cpus`` is not accepted).
+        
+        Returns
+        -------
+        dict
+            Same as :func:`pybacktrack.reconstruct_paleo_bathymetry` (maps each time to a numpy array of shape (N, 3)).
+        """
+        
+        params = dict(kwargs, input_points=[list(input_point) for input_point in input_points], oldest_time=oldest_time, time_increment=time_increment)
+        
+        return dict((time_points['time'], np.array(time_points['points'], dtype=float).reshape(-1, 3))
+                    for time_points in self.request(METHOD_PALEO_BATHYMETRY, **params))
+    
+    def close(self):
+        """
+        Close the connection to the server.
+        """
+        
+        if self._socket is not None:
+            self._file.close()
+            self._socket.close()
+            self._socket = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _decompact_well(self, method, well_filename, decompacted_columns, params):
+        # The server might have a different working directory.
+        params['well_filename'] = os.path.abspath(well_filename)
+        if decompacted_columns is not None:
+            params['decompacted_columns'] = list(decompacted_columns)
+        
+        result = self.request(method, **params)
+        
+        result['columns'] = dict((column_name, column if column_name == 'lithology' else np.array(column, dtype=float))
+                                 for column_name, column in result['columns'].items())
+        return result
+
+
+########################
+# Command-line parsing #
+########################
+
+def main():
+    
+    __description__ = \
+        """Runs a long-running local server that handles backtrack, backstrip and paleo bathymetry requests.
+    
+    The server imports pyBacktrack and loads the bundled models once (rather than once per well, as when running the
+    backtrack or backstrip scripts many times). Clients (see pybacktrack.BacktrackClient) send one JSON request per line
+    (containing the "method" and its "params") and receive one JSON response per line.
+    
+    The server listens on the local host only (or on a Unix domain socket). Press Ctrl-C to stop the server.
+    For example...
+
+    python -m pybacktrack.server_cli --port 8765 --use_all_cpus
+    """
+
+    import argparse
+
+    def argparse_unicode(value_string):
+        try:
+            if sys.version_info[0] >= 3:
+                filename = value_string
+            else:
+                # Filename uses the system encoding - decode from 'str' to 'unicode'.
+                filename = value_string.decode(sys.getfilesystemencoding())
+        except UnicodeDecodeError:
+            raise argparse.ArgumentTypeError("Unable to convert filename %s to unicode" % value_string)
+        
+        return filename
+
+    def parse_positive_integer(value_string):
+        try:
+            value = int(value_string)
+        except ValueError:
+            raise argparse.ArgumentTypeError("%s is not an integer" % value_string)
+        
+        if value <= 0:
+            raise argparse.ArgumentTypeError("%g is not a positive integer" % value)
+        
+        return value
+
+    def parse_port(value_string):
+        try:
+            value = int(value_string)
+        except ValueError:
+            raise argparse.ArgumentTypeError("%s is not an integer" % value_string)
+        
+        if value < 0 or value > 65535:
+            raise argparse.ArgumentTypeError("%d is not a valid port number" % value)
+        
+        return value
+
+    #
+    # Gather command-line options.
+    #
+    
+    # The command-line parser.
+    parser = argparse.ArgumentParser(description=__description__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    
+    parser.add_argument('--version', action='version', version=pybacktrack.version.__version__)
+    
+    parser.add_argument(
+        '--host', type=str, default=DEFAULT_HOST,
+        metavar='host',
+        help='The host to listen on. Defaults to "{0}" (only local clients can connect).'.format(DEFAULT_HOST))
+    parser.add_argument(
+        '-p', '--port', type=parse_port, default=DEFAULT_PORT,
+        metavar='port',
+        help='The port to listen on. Defaults to {0}.'.format(DEFAULT_PORT))
+    parser.add_argument(
+        '-u', '--unix_socket', type=argparse_unicode,
+        metavar='unix_socket_filename',
+        help='Listen on a Unix domain socket with this filename (instead of a host and port). Not available on Windows.')
+    
+    parser.add_argument(
+        '--use_all_cpus', nargs='?', type=parse_positive_integer,
+        const=True, default=False,
+        metavar='NUM_CPUS',
+        help='Handle concurrent requests using all CPUs (cores), or if an optional integer is also specified then use the specified number of CPUs. '
+             'Defaults to handling one request at a time.')
+    parser.add_argument(
+        '--worker_pool_backend', type=str, choices=WORKER_POOL_BACKENDS,
+        default=DEFAULT_WORKER_POOL_BACKEND,
+        help='The library used to create the pool of worker processes (when using more than one CPU). '
+             'Choices include {0}. Defaults to "{1}".'.format(
+                 ', '.join('"{0}"'.format(backend) for backend in WORKER_POOL_BACKENDS), DEFAULT_WORKER_POOL_BACKEND))
+    
+    # Parse command-line options.
+    args = parser.parse_args()
+    
+    if args.unix_socket is not None:
+        address = args.unix_socket
+    else:
+        address = (args.host, args.port)
+    
+    with BacktrackServer(address, args.use_all_cpus, args.worker_pool_backend) as server:
+        print('pyBacktrack {0} server listening on {1}'.format(pybacktrack.version.__version__, server.address), file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    
+    def warning_format(message, category, filename, lineno, file=None, line=None):
+        # return '{0}:{1}: {1}:{1}\n'.format(filename, lineno, category.__name__, message)
+        return '{0}: {1}\n'.format(category.__name__, message)
+
+    # Print the warnings without the filename and line number.
+    # Users are not going to want to see that.
+    warnings.formatwarning = warning_format
+    
+    #
+    # User should use 'server_cli' module (instead of this module 'server'), when executing as a script, to avoid Python 3 warning:
+    #
+    #   RuntimeWarning: 'pybacktrack.server' found in sys.modules after import of package 'pybacktrack',
+    #                   but prior to execution of 'pybacktrack.server'; this may result in unpredictable behaviour
+    #
+    # For more details see https://stackoverflow.com/questions/43393764/python-3-6-project-structure-leads-to-runtimewarning
+    #
+    # Importing this module (eg, 'import pybacktrack.server') is fine though.
+    #
+    warnings.warn("Use 'python -m pybacktrack.server_cli ...', instead of 'python -m pybacktrack.server ...'.", DeprecationWarning)
+
+    try:
+        main()
+        sys.exit(0)
+    except Exception as exc:
+        print('ERROR: {0}'.format(exc), file=sys.stderr)
+        # Uncomment this to print traceback to location of raised exception.
+        # import traceback; traceback.print_exc()
+        sys.exit(1)
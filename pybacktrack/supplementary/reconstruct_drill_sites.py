@@ -3,6 +3,7 @@ import numpy as np
 import os
 import os.path
 import pybacktrack
+from pybacktrack.util.static_polygon_raster import get_static_polygon_raster, partition_points_exactly
 import pygplates
 import sys
 
@@ -41,6 +42,9 @@ def reconstruct_drill_sites(
 
     # Static polygons partitioner used to assign plate IDs to the drill sites.
     plate_partitioner = pygplates.PlatePartitioner(static_polygon_features, rotation_model)
+    # Previously cached raster of static polygons (if static polygons and rotations are files), otherwise None.
+    # Note: Not worth creating a raster just for the drill sites (so only used if already cached).
+    static_polygon_raster = get_static_polygon_raster(static_polygon_features, rotation_features_or_model, 0)
 
 
     # Iterate over the drill sites.
@@ -77,12 +81,17 @@ def reconstruct_drill_sites(
         drill_site_location = pygplates.PointOnSphere(drill_site.latitude, drill_site.longitude)
         
         # Assign a plate ID to the drill site based on its location.
-        partitioning_plate = plate_partitioner.partition_point(drill_site_location)
-        if not partitioning_plate:
+        #
+        # First look up the cached static polygon raster (if any), and only partition exactly if drill site is near a polygon boundary.
+        if static_polygon_raster is not None:
+            plate_ids, _, is_partitioned, is_resolved = static_polygon_raster.lookup([drill_site.longitude], [drill_site.latitude])
+        if static_polygon_raster is None or not is_resolved[0]:
+            plate_ids, _, is_partitioned = partition_points_exactly(plate_partitioner, [drill_site.longitude], [drill_site.latitude])
+        if not is_partitioned[0]:
             # Not contained by any plates. Shouldn't happen since static polygons have global coverage,
             # but might if there's tiny cracks between polygons.
             raise ValueError('Unable to assign plate ID. Drill site does not intersect the static polygons.')
-        drill_site_plate_id = partitioning_plate.get_feature().get_reconstruction_plate_id()
+        drill_site_plate_id = int(plate_ids[0])
         
         # Output filename is the input filename appended with a suffix.
         drill_site_output_filename, _ = os.path.splitext(drill_site_filename)
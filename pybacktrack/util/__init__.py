@@ -0,0 +1,16 @@
+import importlib as _importlib
+
+
+# Submodules are imported when first accessed (eg, 'pybacktrack.util.call_system_command' after only 'import pybacktrack')
+# using a module '__getattr__' (PEP 562), since 'pybacktrack' no longer imports all its modules (and hence these submodules) up front.
+def __getattr__(name):
+    if not name.startswith('__'):
+        try:
+            # Note: Importing a submodule also sets it as an attribute of this package.
+            return _importlib.import_module('.' + name, __name__)
+        except ImportError as error:
+            # An import error inside an existing submodule (such as a missing dependency) should be raised as is.
+            if getattr(error, 'name', None) != __name__ + '.' + name:
+                raise
+    
+    raise AttributeError("module '{0}' has no attribute '{1}'".format(__name__, name))
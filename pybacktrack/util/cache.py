@@ -0,0 +1,158 @@
+
+"""
+    Copyright (C) 2026 The University of Sydney, Australia
+
+    This program is free software; you can redistribute it and/or modify it under
+    the terms of the GNU General Public License, version 2, as published by
+    the Free Software Foundation.
+
+    This program is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import hashlib
+import numpy as np
+import os
+import os.path
+from pybacktrack.util.profiling import count
+import tempfile
+import warnings
+
+
+# Environment variable that can be used to override the default cache directory.
+CACHE_DIRECTORY_ENVIRONMENT_VARIABLE = 'PYBACKTRACK_CACHE_DIR'
+
+
+try:
+    _replace_file = os.replace
+except AttributeError:
+    # Python 2 does not have 'os.replace()'.
+    def _replace_file(source_filename, destination_filename):
+        # On POSIX 'os.rename()' atomically replaces an existing destination file, but on Windows it raises OSError
+        # (so the destination file is removed first, which means the replacement is not atomic on Windows).
+        if os.name == 'nt' and os.path.exists(destination_filename):
+            os.remove(destination_filename)
+        os.rename(source_filename, destination_filename)
+
+
+def get_cache_directory():
+    """
+    Return the directory containing cached data (such as rasterised trench exclusion masks).
+
+    This is the directory specified by the ``PYBACKTRACK_CACHE_DIR`` environment variable (if set),
+    otherwise it is "pybacktrack" in the user's cache directory (eg, "~/.cache/pybacktrack").
+    """
+
+    cache_directory = os.environ.get(CACHE_DIRECTORY_ENVIRONMENT_VARIABLE)
+    if cache_directory:
+        return cache_directory
+
+    user_cache_directory = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(user_cache_directory, 'pybacktrack')
+
+
+def get_file_signature(filename):
+    """
+    Return a tuple identifying the current contents of a file (its absolute path, size and modification time).
+
+    This is used in cache keys so that cached data is regenerated when an input file changes.
+    """
+
+    filename = os.path.abspath(filename)
+    file_stat = os.stat(filename)
+    return (filename, file_stat.st_size, file_stat.st_mtime)
+
+
+def get_cache_key(*key_items):
+    """
+    Return a hash string (suitable for use in a filename) of a sequence of key items.
+
+    Each key item should have a ``repr`` that uniquely identifies it (eg, strings, numbers, and tuples/lists of them).
+    """
+
+    return hashlib.sha1(repr(key_items).encode('utf-8')).hexdigest()
+
+
+def write_file_atomically(filename, write, suffix=''):
+    """
+    Write a file atomically (so concurrent processes never see a partially written file).
+
+    ``write`` is called with a binary file object (of a temporary file in the same directory as ``filename``),
+    and the temporary file is then renamed to ``filename`` (replacing any existing file).
+    The temporary file is removed if ``write`` raises an exception (which is then re-raised).
+    """
+
+    directory = os.path.dirname(os.path.abspath(filename))
+
+    # Write to a temporary file in the same directory and then rename it (which is atomic).
+    temporary_file_descriptor, temporary_filename = tempfile.mkstemp(suffix=suffix, dir=directory)
+    try:
+        with os.fdopen(temporary_file_descriptor, 'wb') as temporary_file:
+            write(temporary_file)
+        _replace_file(temporary_filename, filename)
+    except Exception:
+        os.remove(temporary_filename)
+        raise
+
+
+def _get_cache_filename(cache_name, cache_key, cache_directory):
+    if cache_directory is None:
+        cache_directory = get_cache_directory()
+    return os.path.join(cache_directory, '{0}_{1}.npz'.format(cache_name, cache_key))
+
+
+def load_arrays(cache_name, cache_key, cache_directory=None):
+    """
+    Load cached NumPy arrays previously saved with :func:`save_arrays`.
+
+    Returns a dict mapping array names to arrays, or None if nothing is cached (or the cache file cannot be read).
+    """
+
+    cache_filename = _get_cache_filename(cache_name, cache_key, cache_directory)
+    if not os.path.isfile(cache_filename):
+        count('cache.{0}.misses'.format(cache_name))
+        return None
+
+    try:
+        with np.load(cache_filename, allow_pickle=False) as cache_file:
+            arrays = dict((array_name, cache_file[array_name]) for array_name in cache_file.files)
+    except Exception:
+        # Cache file is corrupt (eg, partially written by an older version) - it'll get overwritten when next saved.
+        count('cache.{0}.misses'.format(cache_name))
+        return None
+
+    count('cache.{0}.hits'.format(cache_name))
+    return arrays
+
+
+def save_arrays(cache_name, cache_key, arrays, cache_directory=None):
+    """
+    Save a dict of NumPy arrays to the cache (so they can later be loaded with :func:`load_arrays`).
+
+    The cache file is written atomically (so concurrent processes never see a partially written file).
+    Returns True on success. A failure to write (eg, a read-only cache directory) only emits a warning and returns False.
+    """
+
+    cache_filename = _get_cache_filename(cache_name, cache_key, cache_directory)
+    cache_directory = os.path.dirname(cache_filename)
+
+    try:
+        if not os.path.isdir(cache_directory):
+            os.makedirs(cache_directory)
+
+        write_file_atomically(cache_filename, lambda cache_file: np.savez_compressed(cache_file, **arrays), suffix='.npz')
+    except (IOError, OSError) as error:
+        warnings.warn('Unable to write cache file "{0}": {1}'.format(cache_filename, error))
+        return False
+
+    return True
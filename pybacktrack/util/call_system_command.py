@@ -18,6 +18,7 @@
 
 from __future__ import print_function
 
+from pybacktrack.util.profiling import count, stage
 import subprocess
 import sys
 
@@ -67,9 +68,11 @@ def call_system_command(
         stderr_pipe = None
     
     # Execute command.
+    count('subprocess.calls')
     try:
-        command = subprocess.Popen(args, stdin=stdin_pipe, stdout=stdout_pipe, stderr=stderr_pipe, universal_newlines=True, **subprocess_options)
-        stdout, stderr = command.communicate(stdin)
+        with stage('subprocess'):
+            command = subprocess.Popen(args, stdin=stdin_pipe, stdout=stdout_pipe, stderr=stderr_pipe, universal_newlines=True, **subprocess_options)
+            stdout, stderr = command.communicate(stdin)
     except ValueError as e:
         if print_errors:
             print("System command called with invalid arguments: {0}".format(e), file=sys.stderr)
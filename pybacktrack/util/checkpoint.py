@@ -0,0 +1,100 @@
+
+"""
+    Copyright (C) 2026 The University of Sydney, Australia
+
+    This program is free software; you can redistribute it and/or modify it under
+    the terms of the GNU General Public License, version 2, as published by
+    the Free Software Foundation.
+
+    This program is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import glob
+import numpy as np
+import os
+import os.path
+from pybacktrack.util.cache import get_cache_key, load_arrays, save_arrays
+
+
+# Name of the checkpoint containing the times that have been completed.
+_COMPLETED_TIMES_NAME = 'completed_times'
+
+
+class Checkpoint(object):
+    """
+    On-disk checkpoints of the intermediate results of a long running computation (so that it can be resumed if interrupted).
+
+    Each checkpoint is a named dict of NumPy arrays (such as the results of a stage of the computation).
+    The checkpoint files are stored in a directory and named using a hash of the input parameters of the computation,
+    so that checkpoints saved by a computation with different input parameters are never used.
+    """
+
+    def __init__(self, directory, *key_items):
+        """
+        Checkpoints stored in ``directory`` for a computation with input parameters ``key_items``.
+
+        Each key item should have a ``repr`` that uniquely identifies it (see :func:`pybacktrack.util.cache.get_cache_key`).
+        Input files should be represented by their signatures (see :func:`pybacktrack.util.cache.get_file_signature`)
+        so that checkpoints are not used after an input file changes.
+        """
+
+        self.directory = directory
+        self.key = get_cache_key(*key_items)
+
+    def load_arrays(self, name):
+        """
+        Load the named checkpoint (a dict of NumPy arrays), or return None if it has not been saved.
+        """
+
+        return load_arrays(name, self.key, self.directory)
+
+    def save_arrays(self, name, arrays):
+        """
+        Save the named checkpoint (a dict of NumPy arrays).
+
+        The checkpoint file is written atomically (so an interruption never leaves a partially written checkpoint).
+        """
+
+        save_arrays(name, self.key, arrays, self.directory)
+
+    def load_completed_times(self):
+        """
+        Return the set of times that have been completed (see :meth:`add_completed_times`).
+        """
+
+        arrays = self.load_arrays(_COMPLETED_TIMES_NAME)
+        if arrays is None:
+            return set()
+
+        return set(arrays['times'].tolist())
+
+    def add_completed_times(self, times):
+        """
+        Record that the computation has completed (and saved the results of) the specified times.
+        """
+
+        completed_times = self.load_completed_times()
+        completed_times.update(times)
+        self.save_arrays(_COMPLETED_TIMES_NAME, {'times': np.array(sorted(completed_times), dtype=float)})
+
+    def remove(self):
+        """
+        Remove all checkpoints (eg, when the computation has completed).
+        """
+
+        for checkpoint_filename in glob.glob(os.path.join(self.directory, '*_{0}.npz'.format(self.key))):
+            try:
+                os.remove(checkpoint_filename)
+            except OSError:
+                pass
@@ -0,0 +1,177 @@
+
+"""
+    Copyright (C) 2026 The University of Sydney, Australia
+
+    This program is free software; you can redistribute it and/or modify it under
+    the terms of the GNU General Public License, version 2, as published by
+    the Free Software Foundation.
+
+    This program is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+
+import csv
+import itertools
+import numpy as np
+from scipy.io import netcdf_file
+
+
+# Formats of files containing decompacted output columns (the format is also the filename extension).
+DECOMPACTED_FORMAT_TEXT = 'txt'  # fixed-width text columns (preceded by '# name = value' metadata and a header of column names)
+DECOMPACTED_FORMAT_CSV = 'csv'  # comma-separated values (a header row of column names followed by full precision values)
+DECOMPACTED_FORMAT_PARQUET = 'parquet'  # Apache Parquet file containing one column per output column (requires 'pyarrow')
+DECOMPACTED_FORMAT_NETCDF = 'nc'  # NetCDF (classic) file containing one variable per output column
+DECOMPACTED_FORMATS = (DECOMPACTED_FORMAT_TEXT, DECOMPACTED_FORMAT_CSV, DECOMPACTED_FORMAT_PARQUET, DECOMPACTED_FORMAT_NETCDF)
+
+# Minimum width of each text column (wider if the column name is longer).
+_TEXT_MIN_COLUMN_WIDTH = 9
+
+# Name of the NetCDF dimension indexing the rows.
+_NETCDF_ROW_DIMENSION_NAME = 'row'
+
+
+def write_decompacted_columns(filename, column_names, columns, metadata=(), output_format=DECOMPACTED_FORMAT_TEXT):
+    """
+    Write columns of decompacted output to a file in the specified format (one of 'DECOMPACTED_FORMATS').
+
+    'columns' contains the values of each column (in the same order as 'column_names').
+    Each column is either a 1D NumPy array of floats or a list of strings (eg, lithology components), with one value per row.
+    'metadata' is a sequence of (name, float value) pairs.
+
+    Text files contain the '# name = value' metadata (values have 4 decimal places), a header of column names and then
+    a fixed-width row of values (floats have 3 decimal places). Note that the strings are not separated from the next column
+    by more than a single space (so only the last column should contain strings that themselves contain spaces).
+    CSV files contain a header row followed by the full precision values (the metadata is not written).
+    Parquet files store the metadata in the schema metadata, and NetCDF files store it in global attributes
+    (and store each string column as a 2D character variable). In these non-text formats the whitespace padding
+    in each string is collapsed into single spaces.
+
+    The columns are formatted in bulk (rather than value by value), which is significantly faster for large outputs.
+
+    Raises ValueError if 'output_format' is not recognised, and ImportError if the Parquet format is requested but ``pyarrow`` is not installed.
+    """
+
+    columns = [column if _is_string_column(column) else np.asarray(column, dtype=float) for column in columns]
+    if len(columns) != len(column_names):
+        raise ValueError('Number of decompacted columns does not match number of column names.')
+    num_rows = len(columns[0]) if columns else 0
+    if any(len(column) != num_rows for column in columns):
+        raise ValueError('Decompacted columns have different lengths.')
+
+    if output_format == DECOMPACTED_FORMAT_TEXT:
+        _write_text(filename, column_names, columns, metadata)
+
+    elif output_format == DECOMPACTED_FORMAT_CSV:
+        with open(filename, 'w', newline='') as csv_file:
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(column_names)
+            # Note: Converting to (Python) floats writes them with full precision (using 'repr()').
+            csv_writer.writerows(zip(*[_collapse_strings(column) if _is_string_column(column) else column.tolist()
+                                       for column in columns]))
+
+    elif output_format == DECOMPACTED_FORMAT_PARQUET:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError('Writing the "{0}" format requires the "pyarrow" package to be installed'.format(DECOMPACTED_FORMAT_PARQUET))
+        table = pyarrow.table(dict(
+            (column_name, _collapse_strings(column) if _is_string_column(column) else column)
+            for column_name, column in zip(column_names, columns)))
+        table = table.replace_schema_metadata(dict((str(name), str(value)) for name, value in metadata))
+        pyarrow.parquet.write_table(table, filename)
+
+    elif output_format == DECOMPACTED_FORMAT_NETCDF:
+        _write_netcdf(filename, column_names, columns, metadata, num_rows)
+
+    else:
+        raise ValueError('Decompacted output format "{0}" is not one of {1}'.format(output_format, DECOMPACTED_FORMATS))
+
+
+def format_lithology_components(lithology_components):
+    """
+    Format the lithology components (a sequence of (lithology name, fraction) tuples) of each stratigraphic unit as a string.
+
+    Returns a list of strings (one per stratigraphic unit) that can be written as a (last) column by 'write_decompacted_columns()'.
+    """
+
+    # Many stratigraphic units typically have the same components (so format each distinct combination only once).
+    lithology_component_strings = {}
+    formatted_strings = []
+    for components in lithology_components:
+        components = tuple(map(tuple, components))
+        lithology_component_string = lithology_component_strings.get(components)
+        if lithology_component_string is None:
+            lithology_component_string = ''.join('{0:<15} {1:<10.2f} '.format(lithology_name, fraction)
+                                                 for lithology_name, fraction in components)
+            lithology_component_strings[components] = lithology_component_string
+        formatted_strings.append(lithology_component_string)
+
+    return formatted_strings
+
+
+def _is_string_column(column):
+    return not isinstance(column, np.ndarray) and len(column) > 0 and isinstance(column[0], str)
+
+
+def _collapse_strings(strings):
+    return [' '.join(string.split()) for string in strings]
+
+
+def _write_text(filename, column_names, columns, metadata):
+    # Each column is at least as wide as its name.
+    column_widths = [max(_TEXT_MIN_COLUMN_WIDTH, len(column_name)) for column_name in column_names]
+
+    # A single format string for an entire row (the first column has an extra space to account for '#' in header).
+    column_prefixes = ['  '] + [' '] * (len(columns) - 1)
+    format_row = (''.join(
+        '{0}{{{1}:<{2}{3}}}'.format(column_prefix, column_index, column_width, '' if _is_string_column(column) else '.3f')
+        for column_index, (column_prefix, column_width, column) in enumerate(zip(column_prefixes, column_widths, columns))) +
+        '\n').format
+
+    with open(filename, 'w') as text_file:
+        # Metadata (in the same format as the original well file).
+        text_file.write(''.join('# {0} = {1:.4f}\n'.format(name, value) for name, value in metadata))
+        text_file.write('#\n')
+
+        # Header showing each column name.
+        text_file.write('# ' + ' '.join(
+            '{0:<{width}}'.format(column_name, width=column_width) for column_name, column_width in zip(column_names, column_widths)) +
+            '\n')
+
+        # Note: Formatting (Python) floats gives the same text as formatting each value separately.
+        if columns:
+            text_file.write(''.join(itertools.starmap(
+                format_row,
+                zip(*[column if _is_string_column(column) else column.tolist() for column in columns]))))
+
+
+def _write_netcdf(filename, column_names, columns, metadata, num_rows):
+    with netcdf_file(filename, 'w') as netcdf_file_:
+        for name, value in metadata:
+            # Note: A Python float is written as a single-precision attribute, so write as double precision (like the columns).
+            setattr(netcdf_file_, name, np.float64(value))
+
+        netcdf_file_.createDimension(_NETCDF_ROW_DIMENSION_NAME, num_rows)
+        for column_name, column in zip(column_names, columns):
+            if _is_string_column(column):
+                # Store strings as a 2D array of characters (classic NetCDF has no string type).
+                strings = np.array([string.encode('utf-8') for string in _collapse_strings(column)])
+                string_length_dimension_name = column_name + '_length'
+                netcdf_file_.createDimension(string_length_dimension_name, max(1, strings.dtype.itemsize))
+                variable = netcdf_file_.createVariable(column_name, 'c', (_NETCDF_ROW_DIMENSION_NAME, string_length_dimension_name))
+                variable[:] = strings.astype('S{0}'.format(max(1, strings.dtype.itemsize))).view('S1').reshape(num_rows, -1)
+            else:
+                variable = netcdf_file_.createVariable(column_name, 'd', (_NETCDF_ROW_DIMENSION_NAME,))
+                variable[:] = column
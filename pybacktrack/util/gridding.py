@@ -0,0 +1,396 @@
+
+"""
+    Copyright (C) 2026 The University of Sydney, Australia
+
+    This program is free software; you can redistribute it and/or modify it under
+    the terms of the GNU General Public License, version 2, as published by
+    the Free Software Foundation.
+
+    This program is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import math
+import numpy as np
+import os.path
+from pybacktrack.util.spatial_index import angle_to_chord_length, lon_lat_to_xyz
+from scipy.io import netcdf_file
+from scipy.spatial import cKDTree
+
+
+# Approximate number of grid nodes in each spatial index of grid nodes (limits the memory used by the node/point pairs of each search).
+_NUM_NODES_PER_SPATIAL_INDEX = 50000
+
+# Default chunk sizes (number of times, latitudes and longitudes) of grid cubes written by 'write_netcdf_grid_cube()'.
+#
+# Each chunk is compressed separately, so reading a map (at one time) decompresses all chunks at that time, and reading
+# a time series (at one location) decompresses all chunks at that location. These sizes are a compromise between the two.
+DEFAULT_GRID_CUBE_CHUNK_SIZES = (10, 128, 128)
+
+# Default compression level (1 to 9) of grid cubes written by 'write_netcdf_grid_cube()'.
+DEFAULT_GRID_CUBE_COMPRESSION_LEVEL = 4
+
+# Small angular tolerance (in radians) added to search radii to guard against numerical round-off
+# (points are then tested exactly against the search radius).
+_SEARCH_RADIUS_TOLERANCE_RADIANS = 1e-6
+
+
+def get_global_grid_node_lon_lats(grid_spacing_degrees):
+    """
+    Return the longitudes and latitudes (each a 1D NumPy array) of the nodes of a global gridline-registered grid.
+
+    This matches the nodes of the GMT region ``-Rg`` with increment ``-I<grid_spacing_degrees>``. That is, longitudes
+    range from 0 to 360 (inclusive) and latitudes from -90 to 90 (inclusive).
+    """
+
+    num_longitudes = int(round(360.0 / grid_spacing_degrees)) + 1
+    num_latitudes = int(round(180.0 / grid_spacing_degrees)) + 1
+
+    return np.linspace(0.0, 360.0, num_longitudes), np.linspace(-90.0, 90.0, num_latitudes)
+
+
+class NearNeighborGridder(object):
+    """
+    Grids data onto a global gridline-registered grid using a nearest neighbour algorithm (like GMT ``nearneighbor``).
+
+    The grid nodes (their coordinates, unit vectors and a spatial index of them) are created once, and then
+    reused to grid each data set (such as the paleo bathymetry at each reconstruction time). Only the input points need to be
+    spatially indexed for each data set.
+    """
+
+    def __init__(self, grid_spacing_degrees):
+        """
+        Create the nodes of a global grid with the specified spacing (see 'get_global_grid_node_lon_lats()').
+        """
+
+        self.grid_spacing_degrees = grid_spacing_degrees
+        self.longitudes, self.latitudes = get_global_grid_node_lon_lats(grid_spacing_degrees)
+
+        # The last column (longitude 360) duplicates the first (longitude 0) so it is not searched.
+        #
+        # Note: Unlike the last column, the nodes of each pole row are all searched (even though they coincide) because,
+        #       like GMT, the sector containing a point depends on the longitude of the node (see '_grid_nodes()').
+        node_rows, node_columns = np.meshgrid(
+            np.arange(len(self.latitudes)), np.arange(len(self.longitudes) - 1), indexing='ij')
+        self._node_rows = node_rows.ravel()
+        self._node_columns = node_columns.ravel()
+
+        # The node longitudes and latitudes are used to find the sector (around each node) containing each point.
+        self._node_lons = self.longitudes[self._node_columns]
+        self._node_lats = self.latitudes[self._node_rows]
+        node_xyz = lon_lat_to_xyz(self._node_lons, self._node_lats)
+
+        # Spatially index contiguous groups of nodes (so that each search only finds the node/point pairs of one group).
+        self._node_spatial_indices = [
+            (start_node, cKDTree(node_xyz[start_node:start_node + _NUM_NODES_PER_SPATIAL_INDEX]))
+            for start_node in range(0, len(node_xyz), _NUM_NODES_PER_SPATIAL_INDEX)]
+
+    def grid(
+            self,
+            input,
+            search_radius_degrees,
+            num_sectors=4,
+            min_sectors=None,
+            mask_search_radius_degrees=None):
+        """
+        Grid the input data onto the grid nodes.
+
+        'input' is a (N, 3) NumPy array (or a list of (longitude, latitude, value) sequences) where latitude and longitude are in degrees.
+
+        The search radius (in degrees) around each grid node is divided into 'num_sectors' sectors and the node is only assigned a value
+        if at least 'min_sectors' sectors (defaults to all sectors) contain an input point. The node value is then the weighted mean of the
+        nearest input point in each sector, where the weight of a point at distance 'r' is '1 / (1 + (3r/R)^2)' and 'R' is the search radius.
+        This is the same as GMT ``gmt nearneighbor -N<num_sectors>+m<min_sectors> -S<search_radius_degrees>d -I<grid_spacing_degrees> -Rg -fg``.
+        In particular, like GMT, distances are great circle distances but sectors are defined in longitude/latitude space (not in the
+        plane tangent to the globe at the node), and the first of equally near input points in a sector is used.
+
+        If 'mask_search_radius_degrees' is specified then nodes without an input point within that radius are also not assigned a value.
+        This is the same as (but faster than) masking with another grid that has a single sector with that search radius.
+
+        Returns a 2D NumPy array (indexed by latitude then longitude) containing NaN at nodes that are not assigned a value.
+
+        Raises ValueError if 'mask_search_radius_degrees' is larger than 'search_radius_degrees'.
+        """
+
+        if min_sectors is None:
+            min_sectors = num_sectors
+
+        if mask_search_radius_degrees is not None and mask_search_radius_degrees > search_radius_degrees:
+            raise ValueError('Mask search radius {0} is larger than search radius {1}'.format(
+                mask_search_radius_degrees, search_radius_degrees))
+
+        input = np.asarray(input, dtype=float).reshape(-1, 3)
+        point_xyz = lon_lat_to_xyz(input[:, 0], input[:, 1])
+        point_tree = cKDTree(point_xyz)
+        point_lon_lats = np.ascontiguousarray(input[:, 0]), np.ascontiguousarray(input[:, 1])
+        point_values = input[:, 2]
+
+        search_radius_radians = math.radians(search_radius_degrees)
+        mask_search_radius_radians = math.radians(mask_search_radius_degrees) if mask_search_radius_degrees is not None else None
+
+        node_values = np.full(len(self._node_rows), np.nan)
+        for start_node, node_tree in self._node_spatial_indices:
+            node_values[start_node:start_node + node_tree.n] = self._grid_nodes(
+                start_node,
+                node_tree,
+                point_tree,
+                point_lon_lats,
+                point_values,
+                search_radius_radians,
+                num_sectors,
+                min_sectors,
+                mask_search_radius_radians)
+
+        grid = np.full((len(self.latitudes), len(self.longitudes)), np.nan)
+        grid[self._node_rows, self._node_columns] = node_values
+        # Copy the first column (longitude 0) to the last column (longitude 360).
+        grid[:, -1] = grid[:, 0]
+
+        return grid
+
+    def _grid_nodes(
+            self,
+            start_node,
+            node_tree,
+            point_tree,
+            point_lon_lats,
+            point_values,
+            search_radius_radians,
+            num_sectors,
+            min_sectors,
+            mask_search_radius_radians):
+        """
+        Return the nearest neighbour values (or NaN) at the grid nodes in 'node_tree' (see 'grid()').
+
+        'point_lon_lats' is the longitudes and latitudes (each a contiguous 1D array) of the points in 'point_tree'.
+        """
+
+        point_lons, point_lats = point_lon_lats
+
+        num_nodes = node_tree.n
+        node_values = np.full(num_nodes, np.nan)
+
+        # Find all (node, point) pairs within the search radius.
+        max_chord_length = angle_to_chord_length(search_radius_radians + _SEARCH_RADIUS_TOLERANCE_RADIANS)
+        pairs = node_tree.sparse_distance_matrix(point_tree, max_chord_length, output_type='ndarray')
+        pair_nodes = pairs['i'].astype(np.intp)
+        pair_points = pairs['j'].astype(np.intp)
+        pair_distances = 2.0 * np.arcsin(np.minimum(0.5 * pairs['v'], 1.0))
+
+        # Exclude pairs outside the exact search radius.
+        within_search_radius = pair_distances <= search_radius_radians
+        pair_nodes = pair_nodes[within_search_radius]
+        pair_points = pair_points[within_search_radius]
+        pair_distances = pair_distances[within_search_radius]
+        if len(pair_nodes) == 0:
+            return node_values
+
+        # Find the sector (around the node) containing each point.
+        #
+        # Like GMT, the angle of each point is measured anti-clockwise from east using its longitude and latitude differences from the node
+        # (with the longitude difference wrapped into the range [-180, 180]), and offset by 180 degrees (so that the first sector starts at west).
+        if num_sectors > 1:
+            pair_node_indices = start_node + pair_nodes
+            pair_delta_lons = np.fmod(point_lons[pair_points] - self._node_lons[pair_node_indices], 360.0)
+            is_wrapped = np.abs(pair_delta_lons) > 180.0
+            pair_delta_lons[is_wrapped] = np.copysign(360.0 - np.abs(pair_delta_lons[is_wrapped]), -pair_delta_lons[is_wrapped])
+            pair_delta_lats = point_lats[pair_points] - self._node_lats[pair_node_indices]
+            pair_sectors = (np.floor((np.arctan2(pair_delta_lats, pair_delta_lons) + math.pi) * (num_sectors / (2 * math.pi))).astype(np.intp)) % num_sectors
+        else:
+            pair_sectors = np.zeros(len(pair_nodes), dtype=np.intp)
+
+        # Keep only the nearest point in each sector of each node (and, like GMT, the first input point of any that are equally near).
+        #
+        # Note: Unbuffered reductions (with 'ufunc.at()') are much faster than sorting the pairs by sector and distance.
+        num_node_sectors = num_nodes * num_sectors
+        pair_node_sectors = pair_nodes * num_sectors + pair_sectors
+        node_sector_min_distances = np.full(num_node_sectors, np.inf)
+        np.minimum.at(node_sector_min_distances, pair_node_sectors, pair_distances)
+        nearest_candidates = np.flatnonzero(pair_distances == node_sector_min_distances[pair_node_sectors])
+        node_sector_nearest_points = np.full(num_node_sectors, len(point_values))
+        np.minimum.at(node_sector_nearest_points, pair_node_sectors[nearest_candidates], pair_points[nearest_candidates])
+        nearest_node_sectors = np.flatnonzero(node_sector_nearest_points < len(point_values))
+        nearest_nodes = nearest_node_sectors // num_sectors
+        nearest_distances = node_sector_min_distances[nearest_node_sectors]
+        nearest_values = point_values[node_sector_nearest_points[nearest_node_sectors]]
+
+        # Weighted mean of the nearest points in each sector (at nodes with enough sectors containing points).
+        weights = 1.0 / (1.0 + (3.0 * nearest_distances / search_radius_radians) ** 2)
+        sum_weights = np.bincount(nearest_nodes, weights, minlength=num_nodes)
+        sum_weighted_values = np.bincount(nearest_nodes, weights * nearest_values, minlength=num_nodes)
+        num_sectors_with_points = np.bincount(nearest_nodes, minlength=num_nodes)
+
+        has_value = num_sectors_with_points >= min_sectors
+        # Also require a point within the mask search radius (if requested).
+        if mask_search_radius_radians is not None:
+            has_value &= np.bincount(pair_nodes[pair_distances <= mask_search_radius_radians], minlength=num_nodes) > 0
+        node_values[has_value] = sum_weighted_values[has_value] / sum_weights[has_value]
+
+        return node_values
+
+
+def nearneighbor(
+        input,
+        grid_spacing_degrees,
+        search_radius_degrees,
+        num_sectors=4,
+        min_sectors=None,
+        mask_search_radius_degrees=None):
+    """
+    Grid the input data onto a global gridline-registered grid using a nearest neighbour algorithm (like GMT ``nearneighbor``).
+
+    'grid_spacing_degrees' is spacing of output grid nodes in degrees (see 'get_global_grid_node_lon_lats()').
+    See 'NearNeighborGridder.grid()' for the remaining arguments (and the returned grid).
+
+    To grid many data sets onto the same grid it is faster to create a single 'NearNeighborGridder' (and reuse it).
+    """
+
+    return NearNeighborGridder(grid_spacing_degrees).grid(input, search_radius_degrees, num_sectors, min_sectors, mask_search_radius_degrees)
+
+
+def write_netcdf_grid(grid_filename, grid, longitudes, latitudes, title=''):
+    """
+    Write a 2D grid (indexed by latitude then longitude) to a (COARDS-compliant) NetCDF grid file.
+
+    'longitudes' and 'latitudes' are the 1D coordinates (in degrees) of the grid nodes (see 'get_global_grid_node_lon_lats()').
+    NaN values represent nodes without data. The grid values are stored as 32-bit floats (like GMT).
+    """
+
+    grid = np.asarray(grid, dtype=np.float32)
+
+    # Use the 64-bit offset format so that very large grids (over 2GB) can be written.
+    with netcdf_file(grid_filename, 'w', version=2) as grid_file:
+        grid_file.Conventions = 'COARDS, CF-1.5'
+        grid_file.title = title
+        grid_file.node_offset = 0  # gridline registration
+
+        grid_file.createDimension('lon', len(longitudes))
+        lon_variable = grid_file.createVariable('lon', 'd', ('lon',))
+        lon_variable.long_name = 'longitude'
+        lon_variable.units = 'degrees_east'
+        lon_variable.actual_range = np.array([longitudes[0], longitudes[-1]], dtype=float)
+        lon_variable[:] = longitudes
+
+        grid_file.createDimension('lat', len(latitudes))
+        lat_variable = grid_file.createVariable('lat', 'd', ('lat',))
+        lat_variable.long_name = 'latitude'
+        lat_variable.units = 'degrees_north'
+        lat_variable.actual_range = np.array([latitudes[0], latitudes[-1]], dtype=float)
+        lat_variable[:] = latitudes
+
+        z_variable = grid_file.createVariable('z', 'f', ('lat', 'lon'))
+        z_variable.long_name = 'z'
+        z_variable._FillValue = np.float32(np.nan)
+        if np.isnan(grid).all():
+            z_variable.actual_range = np.array([np.nan, np.nan])
+        else:
+            z_variable.actual_range = np.array([np.nanmin(grid), np.nanmax(grid)], dtype=float)
+        z_variable[:] = grid
+
+
+def write_netcdf_grid_cube(
+        cube_filename,
+        times,
+        grids,
+        longitudes,
+        latitudes,
+        title='',
+        chunk_sizes=DEFAULT_GRID_CUBE_CHUNK_SIZES,
+        compression_level=DEFAULT_GRID_CUBE_COMPRESSION_LEVEL):
+    """
+    Add 2D grids (each indexed by latitude then longitude) at the specified times to a NetCDF4 grid cube with dimensions (time, lat, lon).
+
+    If the grid cube file does not exist then it is created, otherwise the grids are added to it (so a time series can be written
+    incrementally as the grids at each time become available). A grid at a time that is already in the cube replaces it.
+    The grid values are stored as 32-bit floats compressed in chunks of 'chunk_sizes' (number of times, latitudes and longitudes).
+
+    'longitudes' and 'latitudes' are the 1D coordinates (in degrees) of the grid nodes (see 'get_global_grid_node_lon_lats()').
+
+    Raises ImportError if the ``netCDF4`` package is not installed, and ValueError if the grid nodes differ from those in an existing cube.
+    """
+
+    try:
+        import netCDF4
+    except ImportError:
+        raise ImportError('Writing a NetCDF4 grid cube requires the "netCDF4" package to be installed')
+
+    longitudes = np.asarray(longitudes, dtype=float)
+    latitudes = np.asarray(latitudes, dtype=float)
+
+    if os.path.exists(cube_filename):
+        cube_file = netCDF4.Dataset(cube_filename, 'a')
+    else:
+        cube_file = netCDF4.Dataset(cube_filename, 'w', format='NETCDF4')
+        _create_netcdf_grid_cube(cube_file, longitudes, latitudes, title, chunk_sizes, compression_level)
+
+    try:
+        if (not np.array_equal(cube_file.variables['lon'][:], longitudes) or
+            not np.array_equal(cube_file.variables['lat'][:], latitudes)):
+            raise ValueError('Grid nodes differ from those in existing grid cube "{0}"'.format(cube_filename))
+
+        time_variable = cube_file.variables['time']
+        z_variable = cube_file.variables['z']
+
+        # Each time replaces that time in the cube (if present), otherwise it is appended to the cube.
+        time_indices = dict((time, time_index) for time_index, time in enumerate(np.asarray(time_variable[:], dtype=float).tolist()))
+        for time in times:
+            if time not in time_indices:
+                time_indices[time] = len(time_indices)
+        cube_time_indices = [time_indices[time] for time in times]
+
+        # Write runs of consecutive time indices together (so that whole chunks are written at once, rather than one time at a time).
+        run_start = 0
+        for run_end in range(1, len(cube_time_indices) + 1):
+            if run_end == len(cube_time_indices) or cube_time_indices[run_end] != cube_time_indices[run_end - 1] + 1:
+                start_time_index = cube_time_indices[run_start]
+                end_time_index = start_time_index + run_end - run_start
+                time_variable[start_time_index:end_time_index] = np.asarray(times[run_start:run_end], dtype=float)
+                z_variable[start_time_index:end_time_index] = np.asarray(grids[run_start:run_end], dtype=np.float32)
+                run_start = run_end
+    finally:
+        cube_file.close()
+
+
+def _create_netcdf_grid_cube(cube_file, longitudes, latitudes, title, chunk_sizes, compression_level):
+    """
+    Create the dimensions and variables of an empty grid cube (see 'write_netcdf_grid_cube()').
+    """
+
+    cube_file.Conventions = 'CF-1.7'
+    cube_file.title = title
+    cube_file.node_offset = 0  # gridline registration
+
+    cube_file.createDimension('time', None)  # unlimited (so times can be appended)
+    time_variable = cube_file.createVariable('time', 'f8', ('time',))
+    time_variable.long_name = 'reconstruction time'
+    time_variable.units = 'Ma'
+
+    cube_file.createDimension('lat', len(latitudes))
+    lat_variable = cube_file.createVariable('lat', 'f8', ('lat',))
+    lat_variable.long_name = 'latitude'
+    lat_variable.units = 'degrees_north'
+    lat_variable[:] = latitudes
+
+    cube_file.createDimension('lon', len(longitudes))
+    lon_variable = cube_file.createVariable('lon', 'f8', ('lon',))
+    lon_variable.long_name = 'longitude'
+    lon_variable.units = 'degrees_east'
+    lon_variable[:] = longitudes
+
+    num_times_per_chunk, num_latitudes_per_chunk, num_longitudes_per_chunk = chunk_sizes
+    z_variable = cube_file.createVariable(
+        'z', 'f4', ('time', 'lat', 'lon'),
+        zlib=True, complevel=compression_level, shuffle=True,
+        chunksizes=(num_times_per_chunk, min(num_latitudes_per_chunk, len(latitudes)), min(num_longitudes_per_chunk, len(longitudes))),
+        fill_value=np.float32(np.nan))
+    z_variable.long_name = 'z'
@@ -29,7 +29,6 @@
 from __future__ import print_function
 import pybacktrack.version
 import math
-import scipy.interpolate
 import sys
 import warnings
 
@@ -79,6 +78,9 @@ def read_curve_function(
     -----
     The returned `x` and `y` columns are useful if integrating the curve function with ``scipy.integrate.quad``
     (since can pass x column to its `points` argument and `len(x)` to its `limit`).
+    
+    The returned curve function has a `curve_file_arguments` attribute containing the tuple
+    (`curve_filename`, `x_column_index`, `y_column_index`, `out_of_bounds`) that it was read with.
         
     .. versionchanged:: 1.5
         Added `out_of_bounds` argument.
@@ -139,6 +141,10 @@ def read_curve_function(
     if not x_column:
         raise ValueError('Curve file {0} contains no data.'.format(curve_filename))
     
+    # Note: Imported here (rather than at the top of this module) since it is slow to import and
+    #       is not needed by command-line scripts that import this module but do not read a curve file.
+    import scipy.interpolate
+    
     # Handling of out-of-bounds (when x is outside the range [xmin, xmax]).
     if out_of_bounds == 'clamp':
         # Clamp y to boundary value when x is outside range [xmin, xmax].
@@ -163,6 +169,9 @@ def read_curve_function(
         # Wrap in 'float()' since scipy.interpolate.interp1d can return np.array(np.nan) which isn't really a float.
         return float(y)
     
+    # Record the curve file (and how it was read) so that the curve function can be identified (eg, in checkpoint keys).
+    interpolate_func_wrapper.curve_file_arguments = (curve_filename, x_column_index, y_column_index, out_of_bounds)
+    
     return interpolate_func_wrapper, x_column, y_column
 
 
@@ -0,0 +1,256 @@
+
+"""
+    Copyright (C) 2026 The University of Sydney, Australia
+
+    This program is free software; you can redistribute it and/or modify it under
+    the terms of the GNU General Public License, version 2, as published by
+    the Free Software Foundation.
+
+    This program is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+
+#
+# Optional instrumentation (stage timers and counters) used to find out where the time goes in a long run.
+#
+# For example:
+#
+#     with profiling() as profile:
+#         ...
+#         with stage('grid_sampling'):
+#             ...
+#             count('grid_sampling.points_in', len(points))
+#     profile.write_report('profile_report.json')
+#
+# When profiling is not enabled, 'stage()' returns a shared do-nothing context manager and 'count()' returns immediately,
+# so instrumented code is essentially as fast as uninstrumented code.
+#
+# However, entering a stage still has a small cost, so code executed many times (such as the body of a per-point loop) should
+# instead sum 'timer()' differences locally and record them once (with 'add_stage_time()') after the loop.
+#
+
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import contextlib
+import json
+import time
+
+# Timer (in seconds) used to time stages.
+try:
+    from time import perf_counter as timer
+except ImportError:
+    # Python 2.
+    from time import time as timer
+
+
+# The profile currently recording stage times and counters (None when not profiling).
+_active_profile = None
+
+
+class Profile(object):
+    """
+    The accumulated time spent in each stage (and number of times each stage was entered), and the value of each counter.
+    
+    Stages can be nested, in which case the time spent in the inner stage is also included in the outer stage.
+    """
+    
+    def __init__(self):
+        # Map each stage name to a 2-list of [number of calls, total seconds].
+        self.stages = {}
+        # Map each counter name to its value.
+        self.counters = {}
+        self._start_time = time.time()
+    
+    def add_stage_time(self, name, seconds, calls=1):
+        stage_calls_and_seconds = self.stages.get(name)
+        if stage_calls_and_seconds is None:
+            self.stages[name] = [calls, seconds]
+        else:
+            stage_calls_and_seconds[0] += calls
+            stage_calls_and_seconds[1] += seconds
+    
+    def add_count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+    
+    def merge(self, other):
+        """
+        Add the stage times and counters of another profile (such as one recorded in a worker process).
+        
+        ``other`` can be a :class:`Profile` or a dict returned by :meth:`to_dict`.
+        """
+        
+        if isinstance(other, Profile):
+            other = other.to_dict()
+        
+        for name, stage in other['stages'].items():
+            self.add_stage_time(name, stage['seconds'], stage['calls'])
+        for name, value in other['counters'].items():
+            self.add_count(name, value)
+    
+    def to_dict(self):
+        """
+        Return the stage times and counters as a dict (that can be converted to JSON).
+        """
+        
+        return {
+            'stages': dict((name, {'calls': calls, 'seconds': seconds}) for name, (calls, seconds) in self.stages.items()),
+            'counters': dict(self.counters)}
+    
+    def write_report(self, report_filename):
+        """
+        Write the stage times, counters and elapsed (wall clock) time to a JSON file.
+        
+        The stages are sorted by decreasing time (so the slowest stage is first).
+        """
+        
+        report = {
+            'elapsed_seconds': time.time() - self._start_time,
+            'stages': [
+                {'name': name, 'calls': calls, 'seconds': seconds}
+                for name, (calls, seconds) in sorted(self.stages.items(), key=lambda item: item[1][1], reverse=True)],
+            'counters': dict(sorted(self.counters.items()))}
+        
+        with open(report_filename, 'w') as report_file:
+            json.dump(report, report_file, indent=2)
+            report_file.write('\n')
+
+
+@contextlib.contextmanager
+def profiling(profile=None, enabled=True):
+    """
+    Context manager that records stage times and counters (in this process, and in worker processes) into a :class:`Profile`.
+    
+    A new profile is created (and returned by the context manager) unless ``profile`` is specified.
+    If ``enabled`` is False then nothing is recorded (and the context manager returns None).
+    """
+    
+    global _active_profile
+    
+    if not enabled:
+        yield None
+        return
+    
+    if profile is None:
+        profile = Profile()
+    
+    previous_profile = _active_profile
+    _active_profile = profile
+    try:
+        yield profile
+    finally:
+        _active_profile = previous_profile
+
+
+def get_profile():
+    """
+    Return the profile currently recording stage times and counters, or None if not profiling.
+    """
+    
+    return _active_profile
+
+
+class _Stage(object):
+    
+    __slots__ = ('_profile', '_name', '_start_time')
+    
+    def __init__(self, profile, name):
+        self._profile = profile
+        self._name = name
+    
+    def __enter__(self):
+        self._start_time = timer()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._profile.add_stage_time(self._name, timer() - self._start_time)
+
+
+class _NullStage(object):
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name):
+    """
+    Return a context manager that adds the time spent inside it to stage ``name`` (if profiling).
+    """
+    
+    if _active_profile is None:
+        return _NULL_STAGE
+    
+    return _Stage(_active_profile, name)
+
+
+def add_stage_time(name, seconds, calls=1):
+    """
+    Add ``seconds`` (and ``calls``) to stage ``name`` (if profiling).
+    
+    This is an alternative to :func:`stage` when the times are summed locally (using :func:`timer`).
+    """
+    
+    if _active_profile is not None:
+        _active_profile.add_stage_time(name, seconds, calls)
+
+
+def count(name, value=1):
+    """
+    Add ``value`` to counter ``name`` (if profiling).
+    """
+    
+    if _active_profile is not None:
+        _active_profile.add_count(name, value)
+
+
+def profiled(function):
+    """
+    Return a function that calls ``function`` (typically in a worker process) and also returns the profile recorded while calling it.
+    
+    The returned function returns a 2-tuple of the result of ``function`` and a dict of the stage times and counters
+    (to be merged into the profile of this process with :func:`merge_profiled_result`).
+    """
+    
+    return _ProfiledFunction(function)
+
+
+def merge_profiled_result(profiled_result):
+    """
+    Merge the profile returned (with the result) by a function returned by :func:`profiled` and return the result.
+    """
+    
+    result, profile_dict = profiled_result
+    if _active_profile is not None:
+        _active_profile.merge(profile_dict)
+    
+    return result
+
+
+class _ProfiledFunction(object):
+    # Note: This is a class (rather than a closure) so that it can be pickled (and sent to worker processes).
+    
+    def __init__(self, function):
+        self.function = function
+    
+    def __call__(self, *args):
+        with profiling() as profile:
+            result = self.function(*args)
+        
+        return result, profile.to_dict()
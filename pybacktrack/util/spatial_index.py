@@ -0,0 +1,204 @@
+
+"""
+    Copyright (C) 2026 The University of Sydney, Australia
+
+    This program is free software; you can redistribute it and/or modify it under
+    the terms of the GNU General Public License, version 2, as published by
+    the Free Software Foundation.
+
+    This program is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import math
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+# Default maximum angular length (in radians) of the segments of geometries added to a 'GeometryVertexIndex'.
+# Geometries are tessellated (densified) to this resolution before their vertices are added to the spatial index.
+# About 0.5 degrees (~55 kms) - small compared to typical search radii, but without generating too many vertices.
+DEFAULT_TESSELLATE_RADIANS = math.radians(0.5)
+
+# Small angular tolerance (in radians) added to search radii to guard against numerical round-off.
+_SEARCH_RADIUS_TOLERANCE_RADIANS = 1e-6
+
+
+def lon_lat_to_xyz(longitudes, latitudes):
+    """
+    Convert longitudes and latitudes (in degrees) to 3D unit vectors.
+
+    Returns a (N, 3) NumPy array of x, y, z unit vector components.
+    """
+
+    lons = np.radians(np.asarray(longitudes, dtype=float))
+    lats = np.radians(np.asarray(latitudes, dtype=float))
+    cos_lats = np.cos(lats)
+
+    return np.column_stack((cos_lats * np.cos(lons), cos_lats * np.sin(lons), np.sin(lats)))
+
+
+def angle_to_chord_length(angle_radians):
+    """
+    Convert an angular distance (in radians) on the unit sphere to the straight-line (chord) distance through the sphere.
+
+    The chord length is what a KD-tree of 3D unit vectors measures (angles of pi radians or more map to the diameter).
+    """
+
+    return 2.0 * math.sin(0.5 * min(angle_radians, math.pi))
+
+
+class GeometryVertexIndex(object):
+    """
+    Spatial index of the (densified) vertices of a sequence of geometries.
+
+    Each geometry is tessellated so that none of its segments are longer than ``tessellate_radians`` and
+    the resulting vertices (as 3D unit vectors) are stored in a KD-tree. Every point on a geometry is then
+    within half the tessellation distance of one of its vertices, so querying the vertices within a search radius
+    (expanded by that amount) returns a *conservative* set of candidate geometries. That is, any geometry that is
+    within the search radius of a query point is guaranteed to be a candidate (but not all candidates are necessarily
+    within the search radius - that needs to be tested exactly by the caller).
+    """
+
+    def __init__(self, geometries, tessellate_radians=DEFAULT_TESSELLATE_RADIANS):
+        """
+        Build the spatial index from a sequence of ``pygplates.GeometryOnSphere``.
+
+        The index of each geometry in ``geometries`` is what gets returned by queries.
+        """
+
+        self.tessellate_radians = tessellate_radians
+        self.num_geometries = len(geometries)
+
+        vertex_xyz_arrays = []
+        vertex_geometry_index_arrays = []
+        for geometry_index, geometry in enumerate(geometries):
+            # Polylines and polygons can be tessellated (points and multipoints are already just vertices).
+            if hasattr(geometry, 'to_tessellated'):
+                geometry = geometry.to_tessellated(tessellate_radians)
+
+            vertex_xyz_array = np.asarray(geometry.to_xyz_array(), dtype=float).reshape(-1, 3)
+            vertex_xyz_arrays.append(vertex_xyz_array)
+            vertex_geometry_index_arrays.append(np.full(len(vertex_xyz_array), geometry_index, dtype=int))
+
+        if vertex_xyz_arrays:
+            self._vertex_xyz = np.concatenate(vertex_xyz_arrays)
+            self._vertex_geometry_indices = np.concatenate(vertex_geometry_index_arrays)
+        else:
+            self._vertex_xyz = np.empty((0, 3))
+            self._vertex_geometry_indices = np.empty(0, dtype=int)
+
+        self._vertex_tree = cKDTree(self._vertex_xyz) if len(self._vertex_xyz) else None
+
+    def _get_search_chord_length(self, radius_radians):
+        # A point within 'radius_radians' of a geometry is within 'radius_radians + tessellate_radians / 2' of one of its vertices.
+        return angle_to_chord_length(radius_radians + 0.5 * self.tessellate_radians + _SEARCH_RADIUS_TOLERANCE_RADIANS)
+
+    def query_candidate_geometries(self, points_xyz, radius_radians):
+        """
+        Find the candidate geometries within ``radius_radians`` of each point (a (N, 3) array of unit vectors).
+
+        Returns a list (one entry per point) of sorted NumPy integer arrays of geometry indices.
+        The candidates are conservative (see class description).
+        """
+
+        points_xyz = np.asarray(points_xyz, dtype=float).reshape(-1, 3)
+        if self._vertex_tree is None or len(points_xyz) == 0:
+            return [np.empty(0, dtype=int) for _ in range(len(points_xyz))]
+
+        vertex_indices_per_point = self._vertex_tree.query_ball_point(points_xyz, self._get_search_chord_length(radius_radians))
+
+        return [np.unique(self._vertex_geometry_indices[vertex_indices]) if vertex_indices else np.empty(0, dtype=int)
+                for vertex_indices in vertex_indices_per_point]
+
+    def is_near_any_geometry(self, points_xyz, radius_radians):
+        """
+        Conservatively determine which points (a (N, 3) array of unit vectors) might be within ``radius_radians`` of any geometry.
+
+        Returns a boolean NumPy array (one per point). A ``False`` value means the point is definitely further than
+        ``radius_radians`` from all geometries, whereas ``True`` means it might be within that distance.
+        """
+
+        points_xyz = np.asarray(points_xyz, dtype=float).reshape(-1, 3)
+        if self._vertex_tree is None or len(points_xyz) == 0:
+            return np.zeros(len(points_xyz), dtype=bool)
+
+        # Distance to nearest vertex (or infinity if there are no vertices within the search distance).
+        search_chord_length = self._get_search_chord_length(radius_radians)
+        nearest_chord_lengths, _ = self._vertex_tree.query(points_xyz, distance_upper_bound=search_chord_length)
+
+        return nearest_chord_lengths <= search_chord_length
+
+
+class LatLonCells(object):
+    """
+    A global raster of cells uniformly spaced in longitude and latitude.
+
+    Cell rows start at latitude -90 and cell columns start at longitude -180.
+    If the resolution does not evenly divide 180 (or 360) then the last row (or column) of cells is narrower.
+    """
+
+    def __init__(self, resolution_degrees):
+
+        if resolution_degrees <= 0:
+            raise ValueError('Raster resolution must be positive (and non-zero).')
+
+        self.resolution_degrees = resolution_degrees
+        self.num_rows = int(math.ceil(180.0 / resolution_degrees - 1e-9))
+        self.num_columns = int(math.ceil(360.0 / resolution_degrees - 1e-9))
+
+    def get_cell_indices(self, longitudes, latitudes):
+        """
+        Return the (row, column) indices (as two NumPy integer arrays) of the cells containing the specified points (in degrees).
+        """
+
+        # Wrap longitudes into the range [-180, 180).
+        longitudes = np.mod(np.asarray(longitudes, dtype=float) + 180.0, 360.0)
+        latitudes = np.asarray(latitudes, dtype=float) + 90.0
+
+        row_indices = np.clip(np.floor(latitudes / self.resolution_degrees).astype(int), 0, self.num_rows - 1)
+        column_indices = np.clip(np.floor(longitudes / self.resolution_degrees).astype(int), 0, self.num_columns - 1)
+
+        return row_indices, column_indices
+
+    def _get_row_latitude_bounds(self, row_index):
+        return -90.0 + row_index * self.resolution_degrees, min(90.0, -90.0 + (row_index + 1) * self.resolution_degrees)
+
+    def get_row_cell_centres(self, row_index):
+        """
+        Return the centres of all cells in a row (as a (num_columns, 3) NumPy array of unit vectors).
+        """
+
+        min_latitude, max_latitude = self._get_row_latitude_bounds(row_index)
+        column_min_longitudes = -180.0 + np.arange(self.num_columns) * self.resolution_degrees
+        column_max_longitudes = np.minimum(180.0, column_min_longitudes + self.resolution_degrees)
+
+        return lon_lat_to_xyz(
+            0.5 * (column_min_longitudes + column_max_longitudes),
+            np.full(self.num_columns, 0.5 * (min_latitude + max_latitude)))
+
+    def get_row_cell_radius(self, row_index):
+        """
+        Return the maximum angular distance (in radians) from the centre of any cell in a row to any point in that cell.
+
+        The furthest point in a lon/lat cell from its centre is one of its corners.
+        A full-width cell is used (the narrower last column, if any, is contained within it).
+        """
+
+        min_latitude, max_latitude = self._get_row_latitude_bounds(row_index)
+        centre_xyz = lon_lat_to_xyz([0.5 * self.resolution_degrees], [0.5 * (min_latitude + max_latitude)])[0]
+        corners_xyz = lon_lat_to_xyz(
+            [0.0, 0.0, self.resolution_degrees, self.resolution_degrees],
+            [min_latitude, max_latitude, min_latitude, max_latitude])
+
+        return math.acos(max(-1.0, min(1.0, np.dot(corners_xyz, centre_xyz).min())))
@@ -0,0 +1,360 @@
+
+"""
+    Copyright (C) 2026 The University of Sydney, Australia
+
+    This program is free software; you can redistribute it and/or modify it under
+    the terms of the GNU General Public License, version 2, as published by
+    the Free Software Foundation.
+
+    This program is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+# Assign plate IDs and appearance ages to present day points using a (cached) raster of static polygons.
+#
+# Partitioning many points into static polygons (with 'pygplates.PlatePartitioner') is slow.
+# So the static polygons are rasterised (once) into cells and cached on disk. Points in cells entirely inside the same
+# static polygons are answered by lookup, and only points in cells straddling polygon boundaries are partitioned exactly.
+# The results are the same as partitioning all points exactly.
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import math
+import numpy as np
+import os
+import os.path
+from pybacktrack.util.cache import get_cache_key, get_file_signature, load_arrays, save_arrays
+from pybacktrack.util.spatial_index import DEFAULT_TESSELLATE_RADIANS, GeometryVertexIndex, LatLonCells
+import pygplates
+from scipy import ndimage
+import sys
+
+
+# Default resolution (in degrees) of the cells of a static polygon raster.
+DEFAULT_RESOLUTION_DEGREES = 0.1
+
+# Creating a static polygon raster takes a little while (although it only needs to be done once, and is then cached).
+# So only create it if there are at least this many points to partition (otherwise it's faster to partition the points exactly).
+# Once created (and cached) it is used regardless of the number of points.
+MIN_POINTS_TO_CREATE_RASTER = 100000
+
+# Cache name of static polygon rasters (see 'pybacktrack.util.cache').
+_CACHE_NAME = 'static_polygon_raster'
+# Increment this if the format of the cached raster changes.
+_CACHE_VERSION = 1
+
+
+def partition_points_exactly(plate_partitioner, longitudes, latitudes):
+    """
+    Partition points (in degrees) into the static polygons of a ``pygplates.PlatePartitioner``.
+
+    Returns a 3-tuple of NumPy arrays (plate IDs, appearance ages, is partitioned) with one entry per point.
+    Points not contained by any static polygon have a plate ID of zero, an appearance age of zero and are not partitioned.
+    """
+
+    num_points = len(longitudes)
+    plate_ids = np.zeros(num_points, dtype=int)
+    appearance_ages = np.zeros(num_points, dtype=float)
+    is_partitioned = np.zeros(num_points, dtype=bool)
+
+    for point_index in range(num_points):
+        partitioning_plate = plate_partitioner.partition_point(
+            pygplates.PointOnSphere(latitudes[point_index], longitudes[point_index]))
+        if partitioning_plate:
+            partitioning_feature = partitioning_plate.get_feature()
+            plate_ids[point_index] = partitioning_feature.get_reconstruction_plate_id()
+            appearance_ages[point_index], _ = partitioning_feature.get_valid_time()
+            is_partitioned[point_index] = True
+
+    return plate_ids, appearance_ages, is_partitioned
+
+
+class StaticPolygonRaster(object):
+    """
+    Static polygons rasterised into cells of plate IDs and appearance ages.
+
+    Cells straddling a polygon boundary are not assigned a plate ID (their points must be partitioned exactly).
+    """
+
+    def __init__(self, resolution_degrees, cell_labels, label_plate_ids, label_appearance_ages, label_is_partitioned):
+        # Use 'create()' or 'load()' instead.
+        self.cells = LatLonCells(resolution_degrees)
+        # Each cell is labelled with a region of connected cells that are all in the same static polygons
+        # (label zero is for cells straddling polygon boundaries).
+        self._cell_labels = cell_labels
+        self._label_plate_ids = label_plate_ids
+        self._label_appearance_ages = label_appearance_ages
+        self._label_is_partitioned = label_is_partitioned
+
+    @staticmethod
+    def _get_cache_key(static_polygon_filename, rotation_filenames, resolution_degrees):
+        # Include all files associated with the static polygon file (eg, a Shapefile has its plate IDs in the '.dbf' file).
+        # Note: Not using 'glob' since the filename might contain glob special characters (and 'glob.escape()' requires Python 3.4).
+        static_polygon_dirname, static_polygon_basename = os.path.split(os.path.abspath(static_polygon_filename))
+        static_polygon_basename_root, _ = os.path.splitext(static_polygon_basename)
+        static_polygon_file_signatures = [
+            get_file_signature(os.path.join(static_polygon_dirname, filename))
+            for filename in sorted(os.listdir(static_polygon_dirname))
+            if filename.startswith(static_polygon_basename_root + '.')]
+
+        return get_cache_key(
+            _CACHE_NAME,
+            _CACHE_VERSION,
+            get_file_signature(static_polygon_filename),
+            static_polygon_file_signatures,
+            [get_file_signature(rotation_filename) for rotation_filename in rotation_filenames],
+            resolution_degrees)
+
+    @staticmethod
+    def load(static_polygon_filename, rotation_filenames, resolution_degrees=DEFAULT_RESOLUTION_DEGREES):
+        """
+        Load a previously created (and cached) static polygon raster, or return None if not cached.
+        """
+
+        cached_arrays = load_arrays(
+            _CACHE_NAME,
+            StaticPolygonRaster._get_cache_key(static_polygon_filename, rotation_filenames, resolution_degrees))
+        if cached_arrays is None:
+            return None
+
+        return StaticPolygonRaster(
+            resolution_degrees,
+            cached_arrays['cell_labels'],
+            cached_arrays['label_plate_ids'],
+            cached_arrays['label_appearance_ages'],
+            cached_arrays['label_is_partitioned'])
+
+    @staticmethod
+    def create(static_polygon_filename, rotation_filenames, resolution_degrees=DEFAULT_RESOLUTION_DEGREES):
+        """
+        Rasterise the static polygons (and cache the raster on disk so that it can be loaded next time).
+        """
+
+        # The static polygons at present day (these are what the plate partitioner partitions into).
+        reconstructed_static_polygons = []
+        pygplates.reconstruct(static_polygon_filename, rotation_filenames, reconstructed_static_polygons, 0.0)
+        # Tessellate polygon boundaries finer than the cell size (otherwise the conservative vertex search radius,
+        # which is expanded by half the tessellation distance, would classify too many cells as straddling a boundary).
+        static_polygon_spatial_index = GeometryVertexIndex(
+            [reconstructed_static_polygon.get_reconstructed_geometry() for reconstructed_static_polygon in reconstructed_static_polygons],
+            min(DEFAULT_TESSELLATE_RADIANS, 0.5 * math.radians(resolution_degrees)))
+
+        cells = LatLonCells(resolution_degrees)
+
+        # Find the cells that no polygon boundary passes through (all points in such a cell are inside the same polygons).
+        is_interior_cell = np.empty((cells.num_rows, cells.num_columns), dtype=bool)
+        for row_index in range(cells.num_rows):
+            # Slightly expand the cell radius to guard against numerical round-off.
+            cell_radius = cells.get_row_cell_radius(row_index) + 1e-7
+            is_interior_cell[row_index] = ~static_polygon_spatial_index.is_near_any_geometry(
+                cells.get_row_cell_centres(row_index), cell_radius)
+
+        # Adjacent interior cells are inside the same polygons (since no polygon boundary separates them).
+        # So label the connected regions of interior cells, and then we only need to partition one cell centre per region.
+        cell_labels, num_labels = ndimage.label(is_interior_cell)
+        cell_labels = cell_labels.astype(np.int32)
+
+        # Find one (the first) cell in each labelled region.
+        flattened_cell_labels = cell_labels.ravel()
+        _, first_cell_indices = np.unique(flattened_cell_labels, return_index=True)
+        first_cell_indices = first_cell_indices[1:]  # skip label zero (cells straddling polygon boundaries)
+        first_cell_row_indices, first_cell_column_indices = np.unravel_index(first_cell_indices, cell_labels.shape)
+        # Use cell centres (noting the last row/column of cells can be narrower).
+        first_cell_min_latitudes = -90.0 + first_cell_row_indices * resolution_degrees
+        first_cell_min_longitudes = -180.0 + first_cell_column_indices * resolution_degrees
+        first_cell_latitudes = 0.5 * (first_cell_min_latitudes + np.minimum(90.0, first_cell_min_latitudes + resolution_degrees))
+        first_cell_longitudes = 0.5 * (first_cell_min_longitudes + np.minimum(180.0, first_cell_min_longitudes + resolution_degrees))
+
+        plate_partitioner = pygplates.PlatePartitioner(static_polygon_filename, rotation_filenames)
+        plate_ids, appearance_ages, is_partitioned = partition_points_exactly(
+            plate_partitioner, first_cell_longitudes, first_cell_latitudes)
+
+        # Label zero (boundary cells) is a dummy entry.
+        label_plate_ids = np.concatenate(([0], plate_ids)).astype(np.int32)
+        label_appearance_ages = np.concatenate(([0.0], appearance_ages))
+        label_is_partitioned = np.concatenate(([False], is_partitioned))
+
+        save_arrays(
+            _CACHE_NAME,
+            StaticPolygonRaster._get_cache_key(static_polygon_filename, rotation_filenames, resolution_degrees),
+            {
+                'cell_labels': cell_labels,
+                'label_plate_ids': label_plate_ids,
+                'label_appearance_ages': label_appearance_ages,
+                'label_is_partitioned': label_is_partitioned
+            })
+
+        return StaticPolygonRaster(resolution_degrees, cell_labels, label_plate_ids, label_appearance_ages, label_is_partitioned)
+
+    def lookup(self, longitudes, latitudes):
+        """
+        Look up the plate IDs and appearance ages of points (in degrees).
+
+        Returns a 4-tuple of NumPy arrays (plate IDs, appearance ages, is partitioned, is resolved) with one entry per point.
+        Points that are not resolved are in cells straddling polygon boundaries and must be partitioned exactly
+        (their other values are undefined).
+        """
+
+        row_indices, column_indices = self.cells.get_cell_indices(longitudes, latitudes)
+        labels = self._cell_labels[row_indices, column_indices]
+
+        return (self._label_plate_ids[labels].astype(int),
+                self._label_appearance_ages[labels],
+                self._label_is_partitioned[labels],
+                labels != 0)
+
+
+def partition_points(
+        static_polygon_filename,
+        rotation_filenames,
+        longitudes,
+        latitudes,
+        resolution_degrees=DEFAULT_RESOLUTION_DEGREES):
+    """
+    Partition points (in degrees) into static polygons using a cached static polygon raster (when available).
+
+    The raster is used if it has been cached, or if there are enough points to make creating (and caching) it worthwhile.
+    Otherwise all points are partitioned exactly.
+
+    Returns a 3-tuple of NumPy arrays (plate IDs, appearance ages, is partitioned) with one entry per point
+    (see :func:`partition_points_exactly`).
+    """
+
+    longitudes = np.asarray(longitudes, dtype=float)
+    latitudes = np.asarray(latitudes, dtype=float)
+
+    static_polygon_raster = get_static_polygon_raster(static_polygon_filename, rotation_filenames, len(longitudes), resolution_degrees)
+    if static_polygon_raster is None:
+        return partition_points_exactly(
+            pygplates.PlatePartitioner(static_polygon_filename, rotation_filenames),
+            longitudes, latitudes)
+
+    plate_ids, appearance_ages, is_partitioned, is_resolved = static_polygon_raster.lookup(longitudes, latitudes)
+
+    # Partition the points in cells straddling polygon boundaries exactly.
+    unresolved_point_indices = np.where(~is_resolved)[0]
+    if len(unresolved_point_indices):
+        (plate_ids[unresolved_point_indices],
+         appearance_ages[unresolved_point_indices],
+         is_partitioned[unresolved_point_indices]) = partition_points_exactly(
+            pygplates.PlatePartitioner(static_polygon_filename, rotation_filenames),
+            longitudes[unresolved_point_indices],
+            latitudes[unresolved_point_indices])
+
+    return plate_ids, appearance_ages, is_partitioned
+
+
+def get_static_polygon_raster(
+        static_polygon_filename,
+        rotation_filenames,
+        num_points,
+        resolution_degrees=DEFAULT_RESOLUTION_DEGREES):
+    """
+    Return the static polygon raster if it's cached (or if ``num_points`` is large enough to warrant creating it), otherwise None.
+
+    Returns None if the static polygons or rotations are not all filenames (eg, are feature collections or a rotation model),
+    since they cannot be cached.
+    """
+
+    if isinstance(rotation_filenames, str):
+        rotation_filenames = [rotation_filenames]
+    if not isinstance(static_polygon_filename, str):
+        return None
+    try:
+        rotation_filenames = list(rotation_filenames)
+    except TypeError:
+        # Eg, a 'pygplates.RotationModel'.
+        return None
+    if not all(isinstance(rotation_filename, str) for rotation_filename in rotation_filenames):
+        return None
+
+    static_polygon_raster = StaticPolygonRaster.load(static_polygon_filename, rotation_filenames, resolution_degrees)
+    if static_polygon_raster is None and num_points >= MIN_POINTS_TO_CREATE_RASTER:
+        static_polygon_raster = StaticPolygonRaster.create(static_polygon_filename, rotation_filenames, resolution_degrees)
+
+    return static_polygon_raster
+
+
+########################
+# Command-line parsing #
+########################
+
+def main():
+
+    __description__ = \
+        """
+    Rasterise static polygons (into plate IDs and appearance ages) and store in the pybacktrack cache directory.
+
+    The cached raster is then used by pybacktrack to speed up assigning plate IDs to points (eg, when generating paleo bathymetry grids).
+    It is automatically created when needed (when there are enough points), so this is only needed to create it in advance
+    (or at a non-default resolution).
+
+    NOTE: Separate the positional and optional arguments with '--' (workaround for bug in argparse module).
+    For example...
+
+    python -m pybacktrack.util.static_polygon_raster_cli -r 0.05
+        """
+
+    import argparse
+    import pybacktrack.bundle_data
+    import pybacktrack.version
+
+    def parse_positive_float(value_string):
+        try:
+            value = float(value_string)
+        except ValueError:
+            raise argparse.ArgumentTypeError("%s is not a (floating-point) number" % value_string)
+
+        if value <= 0:
+            raise argparse.ArgumentTypeError("%g is not a positive (floating-point) number" % value)
+
+        return value
+
+    #
+    # Gather command-line options.
+    #
+
+    # The command-line parser.
+    parser = argparse.ArgumentParser(description=__description__, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    parser.add_argument('--version', action='version', version=pybacktrack.version.__version__)
+
+    parser.add_argument(
+        '-p', '--static_polygon_filename', type=str,
+        default=pybacktrack.bundle_data.BUNDLE_RECONSTRUCTION_STATIC_POLYGON_FILENAME,
+        metavar='static_polygon_filename',
+        help='File containing static polygons. Defaults to the bundled static polygons "{0}".'.format(
+                pybacktrack.bundle_data.BUNDLE_RECONSTRUCTION_STATIC_POLYGON_FILENAME))
+
+    parser.add_argument(
+        '-rf', '--rotation_filenames', type=str, nargs='+',
+        default=pybacktrack.bundle_data.BUNDLE_RECONSTRUCTION_ROTATION_FILENAMES,
+        metavar='rotation_filename',
+        help='One or more rotation files associated with the static polygons. Defaults to the bundled rotations {0}.'.format(
+                pybacktrack.bundle_data.BUNDLE_RECONSTRUCTION_ROTATION_FILENAMES))
+
+    parser.add_argument(
+        '-r', '--resolution_degrees', type=parse_positive_float, default=DEFAULT_RESOLUTION_DEGREES,
+        metavar='resolution_degrees',
+        help='The resolution (in degrees) of raster cells. Defaults to {0} degrees.'.format(DEFAULT_RESOLUTION_DEGREES))
+
+    # Parse command-line options.
+    args = parser.parse_args()
+
+    StaticPolygonRaster.create(args.static_polygon_filename, args.rotation_filenames, args.resolution_degrees)
+
+
+if __name__ == '__main__':
+
+    # User should not be using this module as a script. They should use 'static_polygon_raster' when importing and 'static_polygon_raster_cli' as a script.
+    # raise RuntimeError("Use 'python -m pybacktrack.util.static_polygon_raster_cli ...', instead of 'python -m pybacktrack.util.static_polygon_raster ...'.")
+    print("ERROR: Use 'python -m pybacktrack.util.static_polygon_raster_cli ...', instead of 'python -m pybacktrack.util.static_polygon_raster ...'.", file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,204 @@
+
+"""
+    Copyright (C) 2026 The University of Sydney, Australia
+
+    This program is free software; you can redistribute it and/or modify it under
+    the terms of the GNU General Public License, version 2, as published by
+    the Free Software Foundation.
+
+    This program is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import contextlib
+from functools import partial
+import multiprocessing
+from pybacktrack.util.profiling import get_profile, merge_profiled_result, profiled
+
+try:
+    from multiprocessing import resource_tracker
+except ImportError:
+    # Python < 3.8.
+    resource_tracker = None
+
+
+# Worker pool backends.
+WORKER_POOL_BACKEND_MULTIPROCESSING = 'multiprocessing'  # multiprocessing.Pool
+WORKER_POOL_BACKEND_CONCURRENT_FUTURES = 'concurrent.futures'  # concurrent.futures.ProcessPoolExecutor
+WORKER_POOL_BACKENDS = (WORKER_POOL_BACKEND_MULTIPROCESSING, WORKER_POOL_BACKEND_CONCURRENT_FUTURES)
+
+DEFAULT_WORKER_POOL_BACKEND = WORKER_POOL_BACKEND_MULTIPROCESSING
+
+
+def get_num_cpus(use_all_cpus):
+    """
+    Return the number of CPUs to use.
+
+    If ``use_all_cpus`` is ``False`` (or zero) then returns 1.
+    If ``True`` then returns the number of available CPUs (cores).
+    If a positive integer then returns that number.
+
+    Raises ``TypeError`` if ``use_all_cpus`` is neither a bool nor a positive integer.
+    """
+
+    if not use_all_cpus:
+        return 1
+
+    # If 'use_all_cpus' is a bool (and therefore is True) then use all available CPUs...
+    if isinstance(use_all_cpus, bool):
+        try:
+            return multiprocessing.cpu_count()
+        except NotImplementedError:
+            return 1
+
+    # else 'use_all_cpus' is a positive integer specifying the number of CPUs to use...
+    if isinstance(use_all_cpus, int) and use_all_cpus > 0:
+        return use_all_cpus
+
+    raise TypeError('{} is neither a bool nor a positive integer'.format(use_all_cpus))
+
+
+class WorkerPool(object):
+    """
+    A pool of worker processes that persists across multiple (parallel) map calls.
+
+    The worker processes are started once (and optionally initialised once, such as loading rotation files) and then reused by
+    all map calls until the pool is closed. This avoids the cost of starting (and initialising) new processes for each map call.
+
+    The pool can be backed by ``multiprocessing.Pool`` or ``concurrent.futures.ProcessPoolExecutor``.
+    """
+
+    def __init__(self, num_workers, backend=DEFAULT_WORKER_POOL_BACKEND, initializer=None, initargs=()):
+        """
+        Start a pool of ``num_workers`` worker processes.
+
+        If ``initializer`` is specified then each worker process calls ``initializer(*initargs)`` when it starts.
+
+        Raises ``ValueError`` if ``backend`` is not one of ``WORKER_POOL_BACKENDS``.
+        """
+
+        if backend not in WORKER_POOL_BACKENDS:
+            raise ValueError('Worker pool backend "{0}" is not one of {1}'.format(backend, WORKER_POOL_BACKENDS))
+
+        self.num_workers = num_workers
+        self.backend = backend
+
+        # Make sure the resource tracker (that cleans up leaked shared memory) is running before the worker processes are started.
+        # The worker processes then share it with this process. Otherwise each worker process starts its own tracker, which
+        # unlinks (and warns about) any shared memory, owned by this process, that the worker process attached to when it exits.
+        if resource_tracker is not None:
+            resource_tracker.ensure_running()
+
+        if backend == WORKER_POOL_BACKEND_MULTIPROCESSING:
+            self._pool = multiprocessing.Pool(num_workers, initializer, initargs)
+            self._executor = None
+        else:
+            import concurrent.futures
+            self._pool = None
+            self._executor = concurrent.futures.ProcessPoolExecutor(num_workers, initializer=initializer, initargs=initargs)
+
+    def map(self, function, iterable, chunksize=1):
+        """
+        Call ``function`` on each item of ``iterable`` in the worker processes and return a list of the results (in order).
+        """
+
+        # If profiling then the stage times and counters recorded in the worker processes are merged into this process.
+        if get_profile() is not None:
+            return [merge_profiled_result(result) for result in self._map(profiled(function), iterable, chunksize)]
+
+        return self._map(function, iterable, chunksize)
+
+    def _map(self, function, iterable, chunksize):
+        if self._pool is not None:
+            return self._pool.map(function, iterable, chunksize)
+
+        return list(self._executor.map(function, iterable, chunksize=chunksize))
+
+    def starmap(self, function, iterable, chunksize=1):
+        """
+        Same as :meth:`map` except each item of ``iterable`` is a sequence of arguments to unpack when calling ``function``.
+        """
+
+        if self._pool is not None and get_profile() is None:
+            return self._pool.starmap(function, iterable, chunksize)
+
+        return self.map(partial(_call_with_unpacked_arguments, function), iterable, chunksize)
+
+    def imap_unordered(self, function, iterable, chunksize=1):
+        """
+        Same as :meth:`map` except returns an iterator over the results in the order they *complete* (rather than in order).
+
+        Each worker process is given the next item (or ``chunksize`` items) as soon as it becomes free, so items that take
+        longer than others do not hold up the remaining items. Submitting the most expensive items first balances the load best.
+        """
+
+        # If profiling then the stage times and counters recorded in the worker processes are merged into this process.
+        if get_profile() is not None:
+            return (merge_profiled_result(result) for result in self._imap_unordered(profiled(function), iterable, chunksize))
+
+        return self._imap_unordered(function, iterable, chunksize)
+
+    def _imap_unordered(self, function, iterable, chunksize):
+        if self._pool is not None:
+            return self._pool.imap_unordered(function, iterable, chunksize)
+
+        import concurrent.futures
+        # Note: 'chunksize' only applies to 'ProcessPoolExecutor.map()', so each item is submitted separately.
+        futures = [self._executor.submit(function, item) for item in iterable]
+        return (future.result() for future in concurrent.futures.as_completed(futures))
+
+    def close(self):
+        """
+        Stop the worker processes (any outstanding work is abandoned).
+        """
+
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        if self._executor is not None:
+            try:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+            except TypeError:
+                # Python < 3.9 (no 'cancel_futures' argument).
+                self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _call_with_unpacked_arguments(function, arguments):
+    return function(*arguments)
+
+
+@contextlib.contextmanager
+def use_worker_pool(worker_pool, num_workers, backend=DEFAULT_WORKER_POOL_BACKEND, initializer=None, initargs=()):
+    """
+    Context manager that provides a worker pool (or None if only one worker process is needed).
+
+    If ``worker_pool`` is not None then it is used (and it is *not* closed on exit, since it is owned by the caller).
+    Otherwise, if ``num_workers`` is greater than one then a new :class:`WorkerPool` is started (and closed on exit),
+    else None is provided (meaning all work should be done in the current process).
+    """
+
+    if worker_pool is not None:
+        yield worker_pool
+    elif num_workers > 1:
+        with WorkerPool(num_workers, backend, initializer, initargs) as new_worker_pool:
+            yield new_worker_pool
+    else:
+        yield None
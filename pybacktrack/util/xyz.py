@@ -0,0 +1,121 @@
+
+"""
+    Copyright (C) 2026 The University of Sydney, Australia
+
+    This program is free software; you can redistribute it and/or modify it under
+    the terms of the GNU General Public License, version 2, as published by
+    the Free Software Foundation.
+
+    This program is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import itertools
+import numpy as np
+import os.path
+
+
+# Formats of files containing (longitude, latitude, value) rows (the format is also the filename extension).
+XYZ_FORMAT_TEXT = 'xyz'  # GMT xyz text (each row contains "longitude latitude value")
+XYZ_FORMAT_NPY = 'npy'  # NumPy '.npy' file containing a (N, 3) array of 64-bit floats
+XYZ_FORMAT_NPZ = 'npz'  # compressed NumPy '.npz' file containing 'longitude', 'latitude' and 'value' arrays of 64-bit floats
+XYZ_FORMAT_BINARY = 'bin'  # raw little-endian 32-bit floats (longitude, latitude and value of each row in turn)
+XYZ_FORMAT_PARQUET = 'parquet'  # Apache Parquet file containing 'longitude', 'latitude' and 'value' columns (requires 'pyarrow')
+XYZ_FORMATS = (XYZ_FORMAT_TEXT, XYZ_FORMAT_NPY, XYZ_FORMAT_NPZ, XYZ_FORMAT_BINARY, XYZ_FORMAT_PARQUET)
+
+# Number of rows formatted together when writing a text xyz file (limits the size of each formatted string).
+_NUM_TEXT_ROWS_PER_WRITE = 100000
+
+# Names of the columns in '.npz' and Parquet files.
+_COLUMN_NAMES = ('longitude', 'latitude', 'value')
+
+
+def write_xyz(xyz_filename, xyz, xyz_format=XYZ_FORMAT_TEXT):
+    """
+    Write (longitude, latitude, value) rows to a file in the specified format (one of 'XYZ_FORMATS').
+
+    'xyz' is a (N, 3) NumPy array (or a list of (longitude, latitude, value) sequences).
+
+    Text files contain the same text as formatting each value with 'str()'. The other formats are written directly from the array.
+
+    Raises ValueError if 'xyz_format' is not recognised, and ImportError if the Parquet format is requested but ``pyarrow`` is not installed.
+    """
+
+    xyz = np.asarray(xyz, dtype=float).reshape(-1, 3)
+
+    if xyz_format == XYZ_FORMAT_TEXT:
+        # Note: Formatting a float with '{}' is the same as 'str()', and converting the array to (Python) floats
+        #       before formatting is faster (and formats values the same as Python floats).
+        format_row = '{0} {1} {2}\n'.format
+        with open(xyz_filename, 'w') as xyz_file:
+            for start_row in range(0, len(xyz), _NUM_TEXT_ROWS_PER_WRITE):
+                xyz_file.write(''.join(itertools.starmap(format_row, xyz[start_row:start_row + _NUM_TEXT_ROWS_PER_WRITE].tolist())))
+
+    elif xyz_format == XYZ_FORMAT_NPY:
+        # Write to an open file (otherwise NumPy appends '.npy' to a filename not ending with '.npy').
+        with open(xyz_filename, 'wb') as xyz_file:
+            np.save(xyz_file, xyz)
+
+    elif xyz_format == XYZ_FORMAT_NPZ:
+        with open(xyz_filename, 'wb') as xyz_file:
+            np.savez_compressed(xyz_file, **dict(zip(_COLUMN_NAMES, xyz.T)))
+
+    elif xyz_format == XYZ_FORMAT_BINARY:
+        xyz.astype('<f4').tofile(xyz_filename)
+
+    elif xyz_format == XYZ_FORMAT_PARQUET:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError('Writing the "{0}" format requires the "pyarrow" package to be installed'.format(XYZ_FORMAT_PARQUET))
+        pyarrow.parquet.write_table(pyarrow.table(dict(zip(_COLUMN_NAMES, xyz.T))), xyz_filename)
+
+    else:
+        raise ValueError('xyz format "{0}" is not one of {1}'.format(xyz_format, XYZ_FORMATS))
+
+
+def read_xyz(xyz_filename, xyz_format=None):
+    """
+    Read (longitude, latitude, value) rows written by 'write_xyz()' and return them as a (N, 3) NumPy array.
+
+    If 'xyz_format' is not specified then it is the filename extension.
+
+    Raises ValueError if 'xyz_format' is not recognised, and ImportError if the Parquet format is requested but ``pyarrow`` is not installed.
+    """
+
+    if xyz_format is None:
+        xyz_format = os.path.splitext(xyz_filename)[1][1:]
+
+    if xyz_format == XYZ_FORMAT_TEXT:
+        return np.loadtxt(xyz_filename, dtype=float, ndmin=2).reshape(-1, 3)
+
+    if xyz_format == XYZ_FORMAT_NPY:
+        return np.load(xyz_filename)
+
+    if xyz_format == XYZ_FORMAT_NPZ:
+        with np.load(xyz_filename) as xyz_file:
+            return np.column_stack([xyz_file[column_name] for column_name in _COLUMN_NAMES])
+
+    if xyz_format == XYZ_FORMAT_BINARY:
+        return np.fromfile(xyz_filename, dtype='<f4').astype(float).reshape(-1, 3)
+
+    if xyz_format == XYZ_FORMAT_PARQUET:
+        try:
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError('Reading the "{0}" format requires the "pyarrow" package to be installed'.format(XYZ_FORMAT_PARQUET))
+        table = pyarrow.parquet.read_table(xyz_filename)
+        return np.column_stack([table.column(column_name).to_numpy() for column_name in _COLUMN_NAMES])
+
+    raise ValueError('xyz format "{0}" is not one of {1}'.format(xyz_format, XYZ_FORMATS))
@@ -30,6 +30,8 @@ from __future__ import print_function
 
 import copy
 import math
+import numbers
+import numpy as np
 from pybacktrack.lithology import create_lithology_from_components
 import warnings
 
@@ -38,6 +40,11 @@ import warnings
 _DENSITY_WATER = 1030.0
 _DENSITY_MANTLE = 3330.0
 
+# Attributes of every stratigraphic unit (any other attributes are extra attributes such as 'min_water_depth').
+_STRATIGRAPHIC_UNIT_ATTRIBUTE_NAMES = set([
+    'top_age', 'bottom_age', 'top_depth', 'bottom_depth', 'decompacted_top_depth', 'decompacted_bottom_depth',
+    'lithology', 'lithology_components', '_fully_decompacted_thickness'])
+
 
 class StratigraphicUnit(object):
     """
@@ -99,13 +106,26 @@ class StratigraphicUnit(object):
             (when :func:`pybacktrack.backstrip_well` or :func:`pybacktrack.backstrip_and_write_well` has been called).
         """
         
+        # Create a combined lithology (if necessary) from multiple weighted lithologies.
+        self._init(top_age, bottom_age, top_depth, bottom_depth,
+                   lithology_components, create_lithology_from_components(lithology_components, lithologies),
+                   other_attributes)
+    
+    @classmethod
+    def _create_from_lithology(cls, top_age, bottom_age, top_depth, bottom_depth, lithology_components, lithology, other_attributes=None):
+        # Same as '__init__()' except the combined lithology (of the lithology components) has already been created.
+        # This avoids re-creating the same combined lithology for many units (eg, when reading well files).
+        unit = cls.__new__(cls)
+        unit._init(top_age, bottom_age, top_depth, bottom_depth, lithology_components, lithology, other_attributes)
+        return unit
+    
+    def _init(self, top_age, bottom_age, top_depth, bottom_depth, lithology_components, lithology, other_attributes):
         self.top_age = top_age
         self.bottom_age = bottom_age
         self.top_depth = top_depth
         self.bottom_depth = bottom_depth
         
-        # Create a combined lithology (if necessary) from multiple weighted lithologies.
-        self.lithology = create_lithology_from_components(lithology_components, lithologies)
+        self.lithology = lithology
         self.lithology_components = lithology_components
 
         # Full decompacted thickness is calculated on first call to 'self.get_fully_decompacted_thickness()'.
@@ -572,6 +592,9 @@ class Well(object):
         
         self.stratigraphic_units = []
         
+        # Well arrays are created on first call to 'self.get_arrays()'.
+        self._arrays = None
+        
         if stratigraphic_units is None:
             return
         
@@ -647,6 +670,31 @@ class Well(object):
         stratigraphic_unit.decompacted_bottom_depth = stratigraphic_unit.decompacted_top_depth + stratigraphic_unit.get_fully_decompacted_thickness()
         
         self.stratigraphic_units.append(stratigraphic_unit)
+        
+        # Well arrays (if any) no longer contain all the units.
+        self._arrays = None
+    
+    def get_arrays(self):
+        """
+        Get the stratigraphic units of this well as columns (numpy arrays).
+        
+        Returns
+        -------
+        :class:`pybacktrack.WellArrays`
+            The stratigraphic units (sorted by age) as columns.
+        
+        Notes
+        -----
+        The well arrays are created on first call (and re-created after another unit is added to this well).
+        So the stratigraphic units should not be modified after calling this method.
+        
+        .. versionadded:: 1.5
+        """
+        
+        if getattr(self, '_arrays', None) is None:
+            self._arrays = WellArrays.from_stratigraphic_units(self.stratigraphic_units)
+        
+        return self._arrays
     
     def decompact(
             self,
@@ -754,6 +802,414 @@ class Well(object):
         return decompacted_well
 
 
+class WellArrays(object):
+    """
+    Class containing the stratigraphic units of a well as columns (numpy arrays) rather than one object per unit.
+    
+    Each column contains one value per stratigraphic unit, with units sorted by age (from youngest to oldest).
+    
+    Attributes
+    ----------
+    top_ages : numpy.ndarray
+        Age of top of each stratigraphic unit (in Ma).
+    bottom_ages : numpy.ndarray
+        Age of bottom of each stratigraphic unit (in Ma).
+    top_depths : numpy.ndarray
+        Depth of top of each stratigraphic unit (in metres).
+    bottom_depths : numpy.ndarray
+        Depth of bottom of each stratigraphic unit (in metres).
+    decompacted_top_depths : numpy.ndarray
+        Fully decompacted depth of top of each stratigraphic unit (in metres).
+    decompacted_bottom_depths : numpy.ndarray
+        Fully decompacted depth of bottom of each stratigraphic unit (in metres).
+    fully_decompacted_thicknesses : numpy.ndarray
+        Fully decompacted thickness of each stratigraphic unit (in metres).
+    densities : numpy.ndarray
+        Density of the (combined) lithology of each stratigraphic unit (in kg/m3).
+    surface_porosities : numpy.ndarray
+        Surface porosity of the (combined) lithology of each stratigraphic unit.
+    porosity_decays : numpy.ndarray
+        Porosity decay of the (combined) lithology of each stratigraphic unit (in metres).
+    lithologies : list of :class:`pybacktrack.Lithology`
+        The (combined) lithology of each stratigraphic unit.
+    lithology_components : list of sequence of tuples (str, float)
+        The lithology components (name, fraction) of each stratigraphic unit.
+    other_attributes : dict
+        Dictionary mapping the name of each extra attribute (such as ``min_water_depth``) to a numpy array of its values.
+        A value is NaN if the associated stratigraphic unit does not have the attribute.
+    
+    Notes
+    -----
+    Indexing (or iterating over) a ``WellArrays`` returns lightweight read-only :class:`pybacktrack.well.StratigraphicUnitView`
+    objects that have the same attributes and methods as :class:`pybacktrack.StratigraphicUnit`.
+    
+    .. versionadded:: 1.5
+    """
+    
+    def __init__(self, top_ages, bottom_ages, top_depths, bottom_depths, lithology_components, lithologies, other_attributes=None):
+        """
+        Create well arrays from the top and bottom ages, top and bottom depths and lithology components of stratigraphic units.
+        
+        Parameters
+        ----------
+        top_ages : sequence of float
+            Age of top of each stratigraphic unit (in Ma).
+        bottom_ages : sequence of float
+            Age of bottom of each stratigraphic unit (in Ma).
+        top_depths : sequence of float
+            Depth of top of each stratigraphic unit (in metres).
+        bottom_depths : sequence of float
+            Depth of bottom of each stratigraphic unit (in metres).
+        lithology_components : sequence of sequence of tuples (str, float)
+            The lithology components (name, fraction) of each stratigraphic unit.
+        lithologies : dict
+            A dictionary mapping lithology names to :class:`pybacktrack.Lithology` objects.
+        other_attributes : dict, optional
+            A dictionary mapping extra attribute names to a sequence of values (one per stratigraphic unit).
+        
+        Raises
+        ------
+        ValueError
+            If:
+            
+            #. Youngest unit does not have zero depth, or
+            #. adjacent units do not have matching top and bottom ages and depths.
+        
+            ...this ensures the units are contiguous in depth from the surface (ie, no gaps).
+        
+        Notes
+        -----
+        The stratigraphic units must be sorted by age (from youngest to oldest).
+        """
+        
+        self._init_columns(
+            top_ages, bottom_ages, top_depths, bottom_depths,
+            lithology_components,
+            [create_lithology_from_components(components, lithologies) for components in lithology_components],
+            other_attributes)
+        
+        if len(self):
+            # Same checks as when adding units to a Well.
+            if self.top_depths[0] != 0.0:
+                raise ValueError('Top stratigraphic unit in well must have zero top depth.')
+            if (np.abs(self.bottom_ages[:-1] - self.top_ages[1:]) > 1e-6).any():
+                raise ValueError('Adjacent stratigraphic units in well must have matching top and bottom ages.')
+            if (np.abs(self.bottom_depths[:-1] - self.top_depths[1:]) > 1e-6).any():
+                raise ValueError('Adjacent stratigraphic units in well must have matching top and bottom depths.')
+        
+        self._init_decompacted_depths()
+    
+    @classmethod
+    def from_stratigraphic_units(cls, stratigraphic_units):
+        """from_stratigraphic_units(stratigraphic_units)
+        Create well arrays from stratigraphic units that have been added to a well.
+        
+        Parameters
+        ----------
+        stratigraphic_units : sequence of :class:`pybacktrack.StratigraphicUnit`
+            Stratigraphic units sorted by age (from youngest to oldest), such as ``Well.stratigraphic_units``.
+        
+        Returns
+        -------
+        :class:`pybacktrack.WellArrays`
+        
+        Notes
+        -----
+        The lithology and fully decompacted thickness/depths of each unit are copied (not recalculated).
+        
+        .. seealso:: :meth:`pybacktrack.Well.get_arrays`
+        """
+        
+        # Extra (numeric) attributes added to any of the units (eg, 'min_water_depth' when backstripping).
+        other_attribute_names = set()
+        for unit in stratigraphic_units:
+            other_attribute_names.update(
+                name for name, value in vars(unit).items()
+                if name not in _STRATIGRAPHIC_UNIT_ATTRIBUTE_NAMES and isinstance(value, numbers.Real))
+        
+        well_arrays = cls.__new__(cls)
+        well_arrays._init_columns(
+            [unit.top_age for unit in stratigraphic_units],
+            [unit.bottom_age for unit in stratigraphic_units],
+            [unit.top_depth for unit in stratigraphic_units],
+            [unit.bottom_depth for unit in stratigraphic_units],
+            [unit.lithology_components for unit in stratigraphic_units],
+            [unit.lithology for unit in stratigraphic_units],
+            {name: [getattr(unit, name, float('nan')) for unit in stratigraphic_units] for name in other_attribute_names})
+        well_arrays.fully_decompacted_thicknesses = np.array(
+            [unit.get_fully_decompacted_thickness() for unit in stratigraphic_units], dtype=float)
+        # Note: Units not added to a well do not have fully decompacted top/bottom depths (so use NaN).
+        well_arrays.decompacted_top_depths = np.array(
+            [getattr(unit, 'decompacted_top_depth', float('nan')) for unit in stratigraphic_units], dtype=float)
+        well_arrays.decompacted_bottom_depths = np.array(
+            [getattr(unit, 'decompacted_bottom_depth', float('nan')) for unit in stratigraphic_units], dtype=float)
+        
+        return well_arrays
+    
+    def _init_columns(self, top_ages, bottom_ages, top_depths, bottom_depths, lithology_components, lithologies, other_attributes):
+        self.top_ages = np.array(top_ages, dtype=float)
+        self.bottom_ages = np.array(bottom_ages, dtype=float)
+        self.top_depths = np.array(top_depths, dtype=float)
+        self.bottom_depths = np.array(bottom_depths, dtype=float)
+        
+        self.lithology_components = list(lithology_components)
+        self.lithologies = list(lithologies)
+        self.densities = np.array([lithology.density for lithology in self.lithologies], dtype=float)
+        self.surface_porosities = np.array([lithology.surface_porosity for lithology in self.lithologies], dtype=float)
+        self.porosity_decays = np.array([lithology.porosity_decay for lithology in self.lithologies], dtype=float)
+        
+        self.other_attributes = {}
+        if other_attributes is not None:
+            for name, values in other_attributes.items():
+                self.other_attributes[name] = np.array(values, dtype=float)
+    
+    def _init_decompacted_depths(self):
+        self.fully_decompacted_thicknesses = self._calc_fully_decompacted_thicknesses()
+        # Fully decompacted top depth is decompacted bottom depth of layer above, otherwise zero (since at surface at present day).
+        self.decompacted_bottom_depths = np.cumsum(self.fully_decompacted_thicknesses)
+        self.decompacted_top_depths = np.concatenate(([0.0], self.decompacted_bottom_depths[:-1]))[:len(self)]
+    
+    def __len__(self):
+        return len(self.top_ages)
+    
+    def __getitem__(self, unit_index):
+        num_units = len(self)
+        if unit_index < 0:
+            unit_index += num_units
+        if unit_index < 0 or unit_index >= num_units:
+            raise IndexError('Stratigraphic unit index out of range.')
+        
+        return StratigraphicUnitView(self, unit_index)
+    
+    def __iter__(self):
+        for unit_index in range(len(self)):
+            yield StratigraphicUnitView(self, unit_index)
+    
+    def get_decompacted_sediment_rates(self):
+        """
+        Return fully decompacted sediment rate of each stratigraphic unit.
+        
+        Returns
+        -------
+        numpy.ndarray
+            Decompacted sediment rates (in units of metres/Ma).
+        
+        Notes
+        -----
+        This is a vectorised equivalent of :meth:`pybacktrack.StratigraphicUnit.get_decompacted_sediment_rate`.
+        """
+        
+        deposition_intervals = self.bottom_ages - self.top_ages
+        
+        decompacted_sediment_rates = np.zeros(len(self), dtype=float)
+        np.divide(
+            self.fully_decompacted_thicknesses, deposition_intervals,
+            out=decompacted_sediment_rates, where=(self.fully_decompacted_thicknesses != 0.0) & (deposition_intervals != 0.0))
+        
+        return decompacted_sediment_rates
+    
+    def calc_decompacted_thicknesses(self, decompacted_depths_to_top, unit_indices=None):
+        """
+        Calculate decompacted thicknesses when the tops of stratigraphic units are at decompacted depths.
+        
+        Parameters
+        ----------
+        decompacted_depths_to_top : float or sequence of float
+            Decompacted depth of the top of each stratigraphic unit.
+        unit_indices : sequence of int, optional
+            Indices of the stratigraphic units (the same unit can be repeated). Defaults to all units.
+        
+        Returns
+        -------
+        numpy.ndarray
+            Decompacted thicknesses.
+        
+        Notes
+        -----
+        This is a vectorised equivalent of :meth:`pybacktrack.StratigraphicUnit.calc_decompacted_thickness`.
+        """
+        
+        if unit_indices is None:
+            unit_indices = np.arange(len(self))
+        unit_indices, decompacted_depths_to_top = np.broadcast_arrays(
+            np.asarray(unit_indices, dtype=int), np.asarray(decompacted_depths_to_top, dtype=float))
+        unit_indices = unit_indices.ravel()
+        decompacted_depths_to_top = decompacted_depths_to_top.ravel()
+        
+        top_depths = self.top_depths[unit_indices]
+        present_day_thicknesses = self.bottom_depths[unit_indices] - top_depths
+        surface_porosities = self.surface_porosities[unit_indices]
+        porosity_decays = self.porosity_decays[unit_indices]
+        
+        # See 'StratigraphicUnit.calc_decompacted_thickness()' for the derivation of 'a' and 'b' in:
+        #
+        #    T = a * exp(-T/decay) + b
+        #
+        a = -porosity_decays * surface_porosities * np.exp(-decompacted_depths_to_top / porosity_decays)
+        b = (-a + present_day_thicknesses +
+             porosity_decays * surface_porosities * np.exp(-top_depths / porosity_decays) *
+             (np.exp(-present_day_thicknesses / porosity_decays) - 1))
+        
+        # Start out with initial estimate - choose the present day thickness.
+        decompacted_thicknesses = present_day_thicknesses.copy()
+        
+        # Iterate each thickness until it converges (units with zero present day thickness have zero decompacted thickness).
+        # Each thickness stops iterating as soon as it converges (the same as 'StratigraphicUnit.calc_decompacted_thickness()').
+        unconverged_indices = np.where(present_day_thicknesses != 0.0)[0]
+        for iteration in range(1000):
+            if not len(unconverged_indices):
+                break
+            
+            new_decompacted_thicknesses = (
+                a[unconverged_indices] *
+                np.exp(-decompacted_thicknesses[unconverged_indices] / porosity_decays[unconverged_indices]) +
+                b[unconverged_indices])
+            
+            is_converged = np.abs(new_decompacted_thicknesses - decompacted_thicknesses[unconverged_indices]) < 1e-6
+            decompacted_thicknesses[unconverged_indices] = new_decompacted_thicknesses
+            unconverged_indices = unconverged_indices[~is_converged]
+        
+        return decompacted_thicknesses
+    
+    def calc_decompacted_densities(self, decompacted_thicknesses, decompacted_depths_to_top, unit_indices=None):
+        """
+        Calculate average decompacted densities when the tops of stratigraphic units are at decompacted depths.
+        
+        Parameters
+        ----------
+        decompacted_thicknesses : float or sequence of float
+            Decompacted thickness of each stratigraphic unit as returned by
+            :meth:`pybacktrack.WellArrays.calc_decompacted_thicknesses`.
+        decompacted_depths_to_top : float or sequence of float
+            Decompacted depth of the top of each stratigraphic unit.
+        unit_indices : sequence of int, optional
+            Indices of the stratigraphic units (the same unit can be repeated). Defaults to all units.
+        
+        Returns
+        -------
+        numpy.ndarray
+            Decompacted densities.
+        
+        Notes
+        -----
+        This is a vectorised equivalent of :meth:`pybacktrack.StratigraphicUnit.calc_decompacted_density`.
+        """
+        
+        if unit_indices is None:
+            unit_indices = np.arange(len(self))
+        unit_indices, decompacted_thicknesses, decompacted_depths_to_top = np.broadcast_arrays(
+            np.asarray(unit_indices, dtype=int),
+            np.asarray(decompacted_thicknesses, dtype=float),
+            np.asarray(decompacted_depths_to_top, dtype=float))
+        unit_indices = unit_indices.ravel()
+        decompacted_thicknesses = decompacted_thicknesses.ravel()
+        decompacted_depths_to_top = decompacted_depths_to_top.ravel()
+        
+        densities = self.densities[unit_indices]
+        surface_porosities = self.surface_porosities[unit_indices]
+        porosity_decays = self.porosity_decays[unit_indices]
+        
+        # See 'StratigraphicUnit.calc_decompacted_density()' for the derivation.
+        decompacted_densities = np.zeros(len(unit_indices), dtype=float)
+        is_non_zero = decompacted_thicknesses != 0.0
+        decompacted_densities[is_non_zero] = (
+            densities[is_non_zero] +
+            (_DENSITY_WATER - densities[is_non_zero]) * porosity_decays[is_non_zero] * surface_porosities[is_non_zero] *
+            np.exp(-decompacted_depths_to_top[is_non_zero] / porosity_decays[is_non_zero]) *
+            (1 - np.exp(-decompacted_thicknesses[is_non_zero] / porosity_decays[is_non_zero])) / decompacted_thicknesses[is_non_zero])
+        
+        return decompacted_densities
+    
+    def _calc_fully_decompacted_thicknesses(self):
+        # See 'StratigraphicUnit._calc_fully_decompacted_thickness()' for the derivation.
+        present_day_thicknesses = self.bottom_depths - self.top_depths
+        fully_decompacted_thicknesses = (
+            (present_day_thicknesses +
+                self.porosity_decays * self.surface_porosities * np.exp(-self.top_depths / self.porosity_decays) *
+                (np.exp(-present_day_thicknesses / self.porosity_decays) - 1)) /
+            (1 - self.surface_porosities)
+        )
+        fully_decompacted_thicknesses[present_day_thicknesses == 0.0] = 0.0
+        
+        return fully_decompacted_thicknesses
+
+
+class StratigraphicUnitView(object):
+    """
+    Lightweight read-only view of a stratigraphic unit in :class:`pybacktrack.WellArrays`.
+    
+    Has the same attributes and methods as :class:`pybacktrack.StratigraphicUnit`
+    (including any extra attributes such as ``min_water_depth``), but they are looked up in the columns of the well arrays.
+    
+    .. versionadded:: 1.5
+    """
+    
+    __slots__ = ('_well_arrays', '_unit_index')
+    
+    def __init__(self, well_arrays, unit_index):
+        self._well_arrays = well_arrays
+        self._unit_index = unit_index
+    
+    @property
+    def top_age(self):
+        return float(self._well_arrays.top_ages[self._unit_index])
+    
+    @property
+    def bottom_age(self):
+        return float(self._well_arrays.bottom_ages[self._unit_index])
+    
+    @property
+    def top_depth(self):
+        return float(self._well_arrays.top_depths[self._unit_index])
+    
+    @property
+    def bottom_depth(self):
+        return float(self._well_arrays.bottom_depths[self._unit_index])
+    
+    @property
+    def decompacted_top_depth(self):
+        return float(self._well_arrays.decompacted_top_depths[self._unit_index])
+    
+    @property
+    def decompacted_bottom_depth(self):
+        return float(self._well_arrays.decompacted_bottom_depths[self._unit_index])
+    
+    @property
+    def lithology(self):
+        return self._well_arrays.lithologies[self._unit_index]
+    
+    @property
+    def lithology_components(self):
+        return self._well_arrays.lithology_components[self._unit_index]
+    
+    def __getattr__(self, name):
+        # Only called for attributes not found above (eg, 'min_water_depth').
+        if not name.startswith('_'):
+            values = self._well_arrays.other_attributes.get(name)
+            if values is not None:
+                value = float(values[self._unit_index])
+                # A NaN value means this unit does not have the attribute.
+                if not math.isnan(value):
+                    return value
+        
+        raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, name))
+    
+    def get_fully_decompacted_thickness(self):
+        """
+        Get fully decompacted thickness.
+        
+        .. seealso:: :meth:`pybacktrack.StratigraphicUnit.get_fully_decompacted_thickness`
+        """
+        
+        return float(self._well_arrays.fully_decompacted_thicknesses[self._unit_index])
+    
+    # The remaining methods are the same as those in StratigraphicUnit (they only query the attributes above).
+    calc_decompacted_thickness = StratigraphicUnit.__dict__['calc_decompacted_thickness']
+    calc_decompacted_density = StratigraphicUnit.__dict__['calc_decompacted_density']
+    get_decompacted_sediment_rate = StratigraphicUnit.__dict__['get_decompacted_sediment_rate']
+    _calc_compacted_depth = StratigraphicUnit.__dict__['_calc_compacted_depth']
+
+
 class DecompactedStratigraphicUnit(object):
     """
     Class to hold data for a *decompacted* stratigraphic unit (decompacted at a specific age).
@@ -1223,6 +1679,342 @@ class DecompactedWell(object):
         return getattr(self, 'dynamic_topography', default_dynamic_topography)
 
 
+class DecompactionResult(object):
+    """
+    Class containing the decompacted well data at the top age of each stratigraphic unit in a well, as columns (numpy arrays).
+    
+    Each column contains one value per age (from youngest to oldest).
+    This is also a sequence of :class:`pybacktrack.DecompactedWell` (one per age) that are only created when accessed.
+    
+    Attributes
+    ----------
+    well_arrays : :class:`pybacktrack.WellArrays`
+        The stratigraphic units of the well (the surface unit of each age is the unit at the same index).
+    ages : numpy.ndarray
+        Age of the surface of each decompacted column of the well.
+    total_compacted_thicknesses : numpy.ndarray
+        Total compacted thickness of all stratigraphic units at each age.
+    total_decompacted_thicknesses : numpy.ndarray
+        Total decompacted thickness of all decompacted stratigraphic units at each age.
+    average_decompacted_densities : numpy.ndarray
+        Average density of the entire decompacted column of the well at each age.
+    sediment_isostatic_corrections : numpy.ndarray
+        Isostatic correction of the decompacted column of the well at each age.
+    decompacted_thicknesses : numpy.ndarray or None
+        2D array of the decompacted thickness of each stratigraphic unit (column) at each age (row).
+        Units above the surface unit of an age are NaN. None if created from existing decompacted wells.
+    decompacted_densities : numpy.ndarray or None
+        2D array of the decompacted density of each stratigraphic unit (column) at each age (row).
+        Units above the surface unit of an age are NaN. None if created from existing decompacted wells.
+    tectonic_subsidences : numpy.ndarray or None
+        Tectonic subsidence (in metres) at each age. Only available when backtracking (otherwise None).
+    min_water_depths : numpy.ndarray or None
+        Minimum water depth (in metres) at each age. Only available when backstripping (otherwise None).
+    max_water_depths : numpy.ndarray or None
+        Maximum water depth (in metres) at each age. Only available when backstripping (otherwise None).
+    sea_levels : numpy.ndarray or None
+        Sea level (in metres) relative to present day at each age. Only available if a sea level model was specified (otherwise None).
+    dynamic_topographies : numpy.ndarray or None
+        Dynamic topography elevation *relative to present day* (in metres) at each age.
+        Only available when backtracking with a dynamic topography model (otherwise None).
+    
+    Notes
+    -----
+    The optional columns (such as ``tectonic_subsidences``) should be set before accessing any decompacted wells
+    (since each decompacted well copies them when it is first accessed).
+    
+    .. versionadded:: 1.5
+    """
+    
+    def __init__(self, well):
+        """
+        Decompact a well at the top age of each of its stratigraphic units.
+        
+        Parameters
+        ----------
+        well : :class:`pybacktrack.Well`
+            The well to decompact.
+        
+        Notes
+        -----
+        This is equivalent to :meth:`pybacktrack.Well.decompact` (with no age specified) but all ages are decompacted together.
+        """
+        
+        self._stratigraphic_units = list(well.stratigraphic_units)
+        self.well_arrays = well_arrays = well.get_arrays()
+        num_units = len(well_arrays)
+        
+        self.decompacted_thicknesses = np.full((num_units, num_units), np.nan)
+        self.decompacted_densities = np.full((num_units, num_units), np.nan)
+        self.total_compacted_thicknesses = np.zeros(num_units)
+        self.total_decompacted_thicknesses = np.zeros(num_units)
+        total_decompacted_thicknesses_times_densities = np.zeros(num_units)
+        
+        present_day_thicknesses = well_arrays.bottom_depths - well_arrays.top_depths
+        
+        # Decompact each unit (from top to bottom of well) at all ages (at which it is buried) at once.
+        # At each age the unit is beneath the total decompacted thickness (so far) of the units above it (at that age).
+        for unit_index in range(num_units):
+            # The ages at which the current unit is buried (ie, surface unit at or above the current unit).
+            num_ages = unit_index + 1
+            unit_decompacted_thicknesses = well_arrays.calc_decompacted_thicknesses(
+                self.total_decompacted_thicknesses[:num_ages], unit_index)
+            unit_decompacted_densities = well_arrays.calc_decompacted_densities(
+                unit_decompacted_thicknesses, self.total_decompacted_thicknesses[:num_ages], unit_index)
+            
+            self.decompacted_thicknesses[:num_ages, unit_index] = unit_decompacted_thicknesses
+            self.decompacted_densities[:num_ages, unit_index] = unit_decompacted_densities
+            
+            self.total_compacted_thicknesses[:num_ages] += present_day_thicknesses[unit_index]
+            self.total_decompacted_thicknesses[:num_ages] += unit_decompacted_thicknesses
+            total_decompacted_thicknesses_times_densities[:num_ages] += unit_decompacted_densities * unit_decompacted_thicknesses
+        
+        self.ages = well_arrays.top_ages.copy()
+        
+        self.average_decompacted_densities = np.zeros(num_units)
+        np.divide(
+            total_decompacted_thicknesses_times_densities, self.total_decompacted_thicknesses,
+            out=self.average_decompacted_densities, where=(self.total_decompacted_thicknesses != 0.0))
+        self._init_sediment_isostatic_corrections()
+        
+        # Only available when backtracking.
+        self.tectonic_subsidences = None
+        self.dynamic_topographies = None
+        # Only available when backstripping (if the surface units have 'min_water_depth' and 'max_water_depth' attributes).
+        self.min_water_depths = well_arrays.other_attributes.get('min_water_depth')
+        self.max_water_depths = well_arrays.other_attributes.get('max_water_depth')
+        # Only available if a sea level model was specified.
+        self.sea_levels = None
+        
+        # The decompacted wells are created when first accessed.
+        self._decompacted_wells = [None] * num_units
+    
+    @classmethod
+    def from_decompacted_wells(cls, decompacted_wells):
+        """from_decompacted_wells(decompacted_wells)
+        Create columns from existing decompacted wells (such as those returned by :meth:`pybacktrack.Well.decompact`).
+        
+        Parameters
+        ----------
+        decompacted_wells : sequence of :class:`pybacktrack.DecompactedWell`
+            The decompacted wells (one per age).
+        
+        Returns
+        -------
+        :class:`pybacktrack.DecompactionResult`
+            The columns of the decompacted wells (``decompacted_thicknesses`` and ``decompacted_densities`` are None).
+            Accessing the decompacted wells returns the original ``decompacted_wells``.
+        """
+        
+        decompacted_wells = list(decompacted_wells)
+        
+        def get_optional_column(attribute_name):
+            # Only available if all decompacted wells have the attribute.
+            if not decompacted_wells or not all(hasattr(decompacted_well, attribute_name) for decompacted_well in decompacted_wells):
+                return None
+            return np.array([getattr(decompacted_well, attribute_name) for decompacted_well in decompacted_wells], dtype=float)
+        
+        decompaction_result = cls.__new__(cls)
+        decompaction_result._stratigraphic_units = [decompacted_well.surface_unit for decompacted_well in decompacted_wells]
+        decompaction_result.well_arrays = WellArrays.from_stratigraphic_units(decompaction_result._stratigraphic_units)
+        decompaction_result.decompacted_thicknesses = None
+        decompaction_result.decompacted_densities = None
+        decompaction_result.ages = np.array([decompacted_well.get_age() for decompacted_well in decompacted_wells], dtype=float)
+        decompaction_result.total_compacted_thicknesses = np.array(
+            [decompacted_well.total_compacted_thickness for decompacted_well in decompacted_wells], dtype=float)
+        decompaction_result.total_decompacted_thicknesses = np.array(
+            [decompacted_well.total_decompacted_thickness for decompacted_well in decompacted_wells], dtype=float)
+        decompaction_result.average_decompacted_densities = np.array(
+            [decompacted_well.get_average_decompacted_density() for decompacted_well in decompacted_wells], dtype=float)
+        decompaction_result._init_sediment_isostatic_corrections()
+        decompaction_result.tectonic_subsidences = get_optional_column('tectonic_subsidence')
+        decompaction_result.dynamic_topographies = get_optional_column('dynamic_topography')
+        decompaction_result.min_water_depths = get_optional_column('min_water_depth')
+        decompaction_result.max_water_depths = get_optional_column('max_water_depth')
+        decompaction_result.sea_levels = get_optional_column('sea_level')
+        decompaction_result._decompacted_wells = decompacted_wells
+        
+        return decompaction_result
+    
+    def _init_sediment_isostatic_corrections(self):
+        # See 'DecompactedWell.get_sediment_isostatic_correction()'.
+        self.sediment_isostatic_corrections = (self.total_decompacted_thicknesses *
+                                               (_DENSITY_MANTLE - self.average_decompacted_densities) /
+                                               (_DENSITY_MANTLE - _DENSITY_WATER))
+    
+    def __len__(self):
+        return len(self.ages)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[age_index] for age_index in range(*index.indices(len(self)))]
+        
+        num_ages = len(self)
+        if index < 0:
+            index += num_ages
+        if index < 0 or index >= num_ages:
+            raise IndexError('Decompacted well index out of range.')
+        
+        decompacted_well = self._decompacted_wells[index]
+        if decompacted_well is None:
+            decompacted_well = self._create_decompacted_well(index)
+            self._decompacted_wells[index] = decompacted_well
+        
+        return decompacted_well
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+    
+    def _create_decompacted_well(self, age_index):
+        # The surface unit (at the age) and the units beneath it.
+        decompacted_well = DecompactedWell(self._stratigraphic_units[age_index])
+        for unit_index in range(age_index, len(self._stratigraphic_units)):
+            decompacted_well.add_decompacted_unit(
+                self._stratigraphic_units[unit_index],
+                float(self.decompacted_thicknesses[age_index, unit_index]),
+                float(self.decompacted_densities[age_index, unit_index]))
+        
+        if self.tectonic_subsidences is not None:
+            decompacted_well.tectonic_subsidence = float(self.tectonic_subsidences[age_index])
+        if self.dynamic_topographies is not None:
+            decompacted_well.dynamic_topography = float(self.dynamic_topographies[age_index])
+        if self.sea_levels is not None:
+            decompacted_well.sea_level = float(self.sea_levels[age_index])
+        
+        return decompacted_well
+    
+    def get_sea_levels(self, default_sea_level=0.0):
+        """
+        Returns the sea levels relative to present day, or ``default_sea_level`` (at all ages) if a sea level model was not specified.
+        
+        Returns
+        -------
+        numpy.ndarray or None
+            Sea level relative to present day at each age (None if no sea level model and ``default_sea_level`` is None).
+        
+        .. seealso:: :meth:`pybacktrack.DecompactedWell.get_sea_level`
+        """
+        
+        if self.sea_levels is not None:
+            return self.sea_levels
+        if default_sea_level is None:
+            return None
+        return np.full(len(self), default_sea_level, dtype=float)
+    
+    def get_dynamic_topographies(self, default_dynamic_topography=0.0):
+        """
+        Returns the dynamic topography elevations *relative to present day*, or ``default_dynamic_topography`` (at all ages)
+        if a dynamic topography model was not specified.
+        
+        Returns
+        -------
+        numpy.ndarray or None
+            Dynamic topography relative to present day at each age (None if no model and ``default_dynamic_topography`` is None).
+        
+        .. seealso:: :meth:`pybacktrack.DecompactedWell.get_dynamic_topography`
+        """
+        
+        if self.dynamic_topographies is not None:
+            return self.dynamic_topographies
+        if default_dynamic_topography is None:
+            return None
+        return np.full(len(self), default_dynamic_topography, dtype=float)
+    
+    def get_min_max_tectonic_subsidences(self):
+        """
+        Returns the minimum and maximum tectonic subsidence at each age obtained directly from subsidence model (if backtracking) or
+        indirectly from minimum and maximum water depth and sea level (if backstripping).
+        
+        Returns
+        -------
+        min_tectonic_subsidences : numpy.ndarray
+            Minimum tectonic subsidence (unloaded water depth) at each age.
+        max_tectonic_subsidences : numpy.ndarray
+            Maximum tectonic subsidence (unloaded water depth) at each age.
+        
+        .. seealso:: :meth:`pybacktrack.DecompactedWell.get_min_max_tectonic_subsidence`
+        """
+        
+        if self.tectonic_subsidences is not None:
+            # Backtracking.
+            return self.tectonic_subsidences, self.tectonic_subsidences  # Min and max are the same.
+        
+        # Backstripping.
+        isostatic_corrections = self._get_isostatic_corrections_including_sea_level()
+        return self.min_water_depths + isostatic_corrections, self.max_water_depths + isostatic_corrections
+    
+    def get_tectonic_subsidences(self):
+        """
+        Returns the tectonic subsidence at each age obtained directly from subsidence model (if backtracking) or
+        indirectly from average of minimum and maximum water depth and sea level (if backstripping).
+        
+        Returns
+        -------
+        numpy.ndarray
+            Tectonic subsidence (unloaded water depth) at each age.
+        
+        .. seealso:: :meth:`pybacktrack.DecompactedWell.get_tectonic_subsidence`
+        """
+        
+        if self.tectonic_subsidences is not None:
+            # Backtracking.
+            return self.tectonic_subsidences
+        
+        # Backstripping.
+        min_tectonic_subsidences, max_tectonic_subsidences = self.get_min_max_tectonic_subsidences()
+        return (min_tectonic_subsidences + max_tectonic_subsidences) / 2.0
+    
+    def get_min_max_water_depths(self):
+        """
+        Returns the minimum and maximum water depth at each age obtained directly from minimum and maximum water depth (if backstripping) or
+        indirectly from tectonic subsidence model and sea level (if backtracking).
+        
+        Returns
+        -------
+        min_water_depths : numpy.ndarray
+            Minimum water depth at each age.
+        max_water_depths : numpy.ndarray
+            Maximum water depth at each age.
+        
+        .. seealso:: :meth:`pybacktrack.DecompactedWell.get_min_max_water_depth`
+        """
+        
+        if self.tectonic_subsidences is not None:
+            # Backtracking.
+            water_depths = self.tectonic_subsidences - self._get_isostatic_corrections_including_sea_level()
+            return water_depths, water_depths  # Min and max are the same.
+        
+        # Backstripping.
+        return self.min_water_depths, self.max_water_depths
+    
+    def get_water_depths(self):
+        """
+        Returns the water depth at each age obtained directly from average of minimum and maximum water depth (if backstripping) or
+        indirectly from tectonic subsidence model and sea level (if backtracking).
+        
+        Returns
+        -------
+        numpy.ndarray
+            Water depth at each age.
+        
+        .. seealso:: :meth:`pybacktrack.DecompactedWell.get_water_depth`
+        """
+        
+        if self.tectonic_subsidences is not None:
+            # Backtracking.
+            return self.tectonic_subsidences - self._get_isostatic_corrections_including_sea_level()
+        
+        # Backstripping.
+        return (self.min_water_depths + self.max_water_depths) / 2.0
+    
+    def _get_isostatic_corrections_including_sea_level(self):
+        # See 'DecompactedWell.get_min_max_tectonic_subsidence_from_water_depth()'.
+        if self.sea_levels is None:
+            return self.sediment_isostatic_corrections
+        return self.sediment_isostatic_corrections - self.sea_levels * (_DENSITY_MANTLE / (_DENSITY_MANTLE - _DENSITY_WATER))
+
+
 def read_well_file(
         well_filename,
         lithologies,
@@ -1279,12 +2071,103 @@ def read_well_file(
     
     If file contains ``SurfaceAge = <age>`` in commented (``#``) lines then the top age of the
     youngest stratigraphic unit will have that age, otherwise it defaults to 0Ma (present day).
+    
+    .. versionchanged:: 1.5
+        - Each distinct lithology (strings in lithology columns) is only parsed once, and its combined
+          :class:`pybacktrack.Lithology` is only created once (and shared by stratigraphic units).
+        - See :func:`pybacktrack.read_well_files` to read many well files.
+    """
+    
+    return _read_well_file(
+        well_filename,
+        lithologies,
+        bottom_age_column,
+        bottom_depth_column,
+        lithology_column,
+        other_columns,
+        well_attributes,
+        {})
+
+
+def read_well_files(
+        well_filenames,
+        lithologies,
+        bottom_age_column=0,
+        bottom_depth_column=1,
+        lithology_column=2,
+        other_columns=None,
+        well_attributes=None):
+    """
+    Reads many well text files (such as a catalogue of DSDP/ODP/IODP wells).
+    
+    Parameters
+    ----------
+    well_filenames : sequence of str
+        Names of well text files.
+    lithologies : dict
+        Dictionary mapping lithology names to :class:`pybacktrack.Lithology` objects.
+    well_bottom_age_column : int, optional
+        The column of each well file containing bottom age. Defaults to 0.
+    well_bottom_depth_column : int, optional
+        The column of each well file containing bottom depth. Defaults to 1.
+    well_lithology_column : int, optional
+        The column of each well file containing lithology(s). Defaults to 2.
+    other_columns : dict, optional
+        Dictionary of extra columns (besides age, depth and lithology(s)). See :func:`pybacktrack.read_well_file`.
+    well_attributes : dict, optional
+        Attributes to read from the metadata of each well file. See :func:`pybacktrack.read_well_file`.
+    
+    Returns
+    -------
+    list of :class:`pybacktrack.Well`
+        Wells read from files (in the same order as ``well_filenames``).
+    
+    Raises
+    ------
+    ValueError
+        If ``lithology_column`` is not the largest column number (must be last column).
+    
+    Notes
+    -----
+    This is the same as calling :func:`pybacktrack.read_well_file` for each well file, except the combined
+    :class:`pybacktrack.Lithology` of each distinct set of lithology components is only created once (for all wells).
+    
+    .. versionadded:: 1.5
     """
     
+    # Combined lithologies shared by all wells.
+    lithology_cache = {}
+    
+    return [_read_well_file(
+        well_filename,
+        lithologies,
+        bottom_age_column,
+        bottom_depth_column,
+        lithology_column,
+        other_columns,
+        well_attributes,
+        lithology_cache)
+        for well_filename in well_filenames]
+
+
+def _read_well_file(
+        well_filename,
+        lithologies,
+        bottom_age_column,
+        bottom_depth_column,
+        lithology_column,
+        other_columns,
+        well_attributes,
+        lithology_cache):
+    # Note: 'lithology_cache' maps each tuple of lithology components to its combined lithology.
+    
     if (max(bottom_age_column, bottom_depth_column) >= lithology_column or
         (other_columns is not None and max(other_columns.values()) >= lithology_column)):
         raise ValueError('Lithology columns must be the last column in well text file.')
     
+    if well_attributes is None:
+        well_attributes = {}
+    
     # All requested well attributes default to None if not found in well file.
     attributes = {}
     for _, (well_attribute_name, _) in well_attributes.items():
@@ -1294,98 +2177,107 @@ def read_well_file(
     # If it's not found then it defaults to zero (present day).
     surface_age = 0.0
     
+    # Maps the strings in the lithology columns to the lithology components they contain.
+    lithology_components_dict = {}
+    
     stratigraphic_units = []
+    
     with open(well_filename, 'r') as well_file:
-        for line_number, line in enumerate(well_file):
+        lines = well_file.read().splitlines()
+    
+    for line_number, line in enumerate(lines):
         
-            # Make line number 1-based instead of 0-based.
-            line_number = line_number + 1
-            
-            # Split the line into strings (separated by whitespace).
-            line_string_list = line.split()
-            
-            num_strings = len(line_string_list)
-            
-            # If just a line containing white-space then skip to next line.
-            if num_strings == 0:
-                continue
-            
-            # If line starts with '#' then search for well metadata and then skip to next line.
-            if line_string_list[0].startswith('#'):
-                comment = line[1:]
-                # See if comment contains "name=value".
-                comment_data = comment.split('=')
-                # See if it's a metadata line (has a single '=' char).
-                if len(comment_data) == 2:
-                    name = comment_data[0].strip()  # Note: Case-insensitive comparison.
-                    value = comment_data[1].strip()
-                    
-                    # See if current line contains a well attribute requested by caller.
-                    if name in well_attributes:
-                        attribute_name, attribute_conversion = well_attributes[name]
-                        try:
-                            attributes[attribute_name] = attribute_conversion(value)
-                        except Exception as exc:
-                            warnings.warn('Line {0} of "{1}": Ignoring {2}: {3}.' .format(
-                                          line_number, well_filename, name, exc))
-                    
-                    # else read 'SurfaceAge'...
-                    elif name == 'SurfaceAge':
-                        try:
-                            age = float(value)
-                            if age < 0:
-                                raise ValueError
-                            surface_age = age
-                        except ValueError:
-                            warnings.warn('Line {0} of "{1}": Ignoring SurfaceAge: '
-                                          '{2} is not a number >= 0.' .format(line_number, well_filename, value))
+        # Make line number 1-based instead of 0-based.
+        line_number = line_number + 1
+        
+        # Split the line into strings (separated by whitespace).
+        line_string_list = line.split()
+        
+        num_strings = len(line_string_list)
+        
+        # If just a line containing white-space then skip to next line.
+        if num_strings == 0:
+            continue
+        
+        # If line starts with '#' then search for well metadata and then skip to next line.
+        if line_string_list[0].startswith('#'):
+            comment = line[1:]
+            # See if comment contains "name=value".
+            comment_data = comment.split('=')
+            # See if it's a metadata line (has a single '=' char).
+            if len(comment_data) == 2:
+                name = comment_data[0].strip()  # Note: Case-insensitive comparison.
+                value = comment_data[1].strip()
                 
-                continue
-            
-            # The number of columns must include the lithology name and fraction
-            # (starting with lithology column - extra strings if more than one lithology component).
-            if num_strings < lithology_column + 2:
-                warnings.warn('Line {0} of "{1}": Ignoring lithology: line does not have at least '
-                              '{2} white-space separated strings.'.format(line_number, well_filename, lithology_column + 2))
-                continue
+                # See if current line contains a well attribute requested by caller.
+                if name in well_attributes:
+                    attribute_name, attribute_conversion = well_attributes[name]
+                    try:
+                        attributes[attribute_name] = attribute_conversion(value)
+                    except Exception as exc:
+                        warnings.warn('Line {0} of "{1}": Ignoring {2}: {3}.' .format(
+                                      line_number, well_filename, name, exc))
+                
+                # else read 'SurfaceAge'...
+                elif name == 'SurfaceAge':
+                    try:
+                        age = float(value)
+                        if age < 0:
+                            raise ValueError
+                        surface_age = age
+                    except ValueError:
+                        warnings.warn('Line {0} of "{1}": Ignoring SurfaceAge: '
+                                      '{2} is not a number >= 0.' .format(line_number, well_filename, value))
             
-            # Need an odd number of strings per line (each lithology component is 2 strings).
-            if ((num_strings - lithology_column) % 2) == 1:
-                warnings.warn('Line {0} of "{1}": Ignoring lithology: each extra lithology must have two '
-                              'strings (name and fraction).'.format(line_number, well_filename))
-                continue
+            continue
+        
+        # The number of columns must include the lithology name and fraction
+        # (starting with lithology column - extra strings if more than one lithology component).
+        if num_strings < lithology_column + 2:
+            warnings.warn('Line {0} of "{1}": Ignoring lithology: line does not have at least '
+                          '{2} white-space separated strings.'.format(line_number, well_filename, lithology_column + 2))
+            continue
+        
+        # Need an odd number of strings per line (each lithology component is 2 strings).
+        if ((num_strings - lithology_column) % 2) == 1:
+            warnings.warn('Line {0} of "{1}": Ignoring lithology: each extra lithology must have two '
+                          'strings (name and fraction).'.format(line_number, well_filename))
+            continue
+        
+        # Attempt to read/convert the column strings.
+        try:
+            bottom_age = float(line_string_list[bottom_age_column])
+            bottom_depth = float(line_string_list[bottom_depth_column])
             
-            # Attempt to read/convert the column strings.
+            # Read the lithology components (name, fraction) pairs.
+            #
+            # Each distinct lithology (strings in lithology columns) is only parsed once.
+            lithology_strings = tuple(line_string_list[lithology_column:])
+            lithology_components = lithology_components_dict.get(lithology_strings)
+            if lithology_components is None:
+                lithology_components = tuple(
+                    (lithology_strings[index], float(lithology_strings[index + 1]))
+                    for index in range(0, len(lithology_strings), 2))
+                lithology_components_dict[lithology_strings] = lithology_components
+        except ValueError:
+            warnings.warn('Line {0} of "{1}": Ignoring stratigraphic unit: cannot '
+                          'read age/depth/lithology values.' .format(line_number, well_filename))
+            continue
+        
+        # Read any extra columns if requested.
+        other_attributes = None
+        if other_columns is not None:
+            other_attributes = {}
             try:
-                bottom_age = float(line_string_list[bottom_age_column])
-                bottom_depth = float(line_string_list[bottom_depth_column])
-                
-                # Read the lithology components (name, fraction) pairs.
-                lithology_components = []
-                num_lithology_components = (num_strings - lithology_column) // 2
-                for index in range(num_lithology_components):
-                    name = line_string_list[lithology_column + 2 * index]
-                    fraction = float(line_string_list[lithology_column + 2 * index + 1])
-                    lithology_components.append((name, fraction))
+                for column_name, column in other_columns.items():
+                    column_value = float(line_string_list[column])
+                    other_attributes[column_name] = column_value
             except ValueError:
-                warnings.warn('Line {0} of "{1}": Ignoring stratigraphic unit: cannot '
-                              'read age/depth/lithology values.' .format(line_number, well_filename))
+                warnings.warn('Line {0} of "{1}": Ignoring stratigraphic unit: cannot read {2} '
+                              'value at column index {3}.' .format(line_number, well_filename, column_name, column))
                 continue
-            
-            # Read any extra columns if requested.
-            other_attributes = None
-            if other_columns is not None:
-                other_attributes = {}
-                try:
-                    for column_name, column in other_columns.items():
-                        column_value = float(line_string_list[column])
-                        other_attributes[column_name] = column_value
-                except ValueError:
-                    warnings.warn('Line {0} of "{1}": Ignoring stratigraphic unit: cannot read {2} '
-                                  'value at column index {3}.' .format(line_number, well_filename, column_name, column))
-                    continue
-            
-            stratigraphic_units.append((bottom_age, bottom_depth, lithology_components, other_attributes))
+        
+        stratigraphic_units.append((bottom_age, bottom_depth, lithology_components, other_attributes))
     
     well = Well(attributes)
     
@@ -1393,32 +2285,55 @@ def read_well_file(
         # Sort the units in order of age (the first entry in each tuple in list of units).
         stratigraphic_units = sorted(stratigraphic_units, key=lambda unit: unit[0])
         
-        # Add youngest stratigraphic unit (the unit on the surface).
-        surface_unit_bottom_age, surface_unit_bottom_depth, surface_unit_lithology_components, surface_unit_other_attributes = stratigraphic_units[0]
-        surface_unit_top_age = surface_age
-        surface_unit_top_depth = 0.0
-        well.add_compacted_unit(
-            surface_unit_top_age, surface_unit_bottom_age,
-            surface_unit_top_depth, surface_unit_bottom_depth,
-            surface_unit_lithology_components, lithologies,
-            surface_unit_other_attributes)
-        
-        # Add the remaining units in order of age (starting with second youngest).
-        for unit_index in range(1, len(stratigraphic_units)):
-            # Bottom age and depth recorded for stratigraphic unit.
-            bottom_age, bottom_depth, lithology_components, other_attributes = stratigraphic_units[unit_index]
-            # Top age and depth is same as bottom age and depth of next younger stratigraphic unit.
-            top_age, top_depth, _, _ = stratigraphic_units[unit_index - 1]
-            
-            well.add_compacted_unit(
-                top_age, bottom_age,
-                top_depth, bottom_depth,
-                lithology_components, lithologies,
-                other_attributes)
+        _add_contiguous_compacted_units(well, surface_age, stratigraphic_units, lithologies, lithology_cache)
     
     return well
 
 
+def _add_contiguous_compacted_units(well, surface_age, stratigraphic_units, lithologies, lithology_cache):
+    # Add stratigraphic units (to a well with no units) that are each a tuple of (bottom_age, bottom_depth, lithology_components, other_attributes).
+    #
+    # The units must be sorted by age. Each unit's top age and depth is the bottom age and depth of the next younger unit
+    # (and the youngest unit has top age 'surface_age' and top depth zero). And 'lithology_cache' maps each tuple of
+    # lithology components to its combined lithology (and is updated with any combined lithologies created here).
+    
+    # The top age and depth of the youngest stratigraphic unit (the unit on the surface).
+    top_age = surface_age
+    top_depth = 0.0
+    # Fully decompacted top depth of the surface unit is zero (since at surface at present day).
+    decompacted_top_depth = 0.0
+    
+    # Add the units in order of age (starting with the youngest).
+    #
+    # Note: The units are contiguous in age and depth (by construction), so they are added directly
+    #       (instead of via 'Well.add_compacted_unit()', which also checks that).
+    for bottom_age, bottom_depth, lithology_components, other_attributes in stratigraphic_units:
+        # Create a combined lithology (if necessary) only once for each distinct set of lithology components.
+        lithology_components = tuple(lithology_components)
+        lithology = lithology_cache.get(lithology_components)
+        if lithology is None:
+            lithology = create_lithology_from_components(lithology_components, lithologies)
+            lithology_cache[lithology_components] = lithology
+        
+        stratigraphic_unit = StratigraphicUnit._create_from_lithology(
+            top_age, bottom_age,
+            top_depth, bottom_depth,
+            list(lithology_components), lithology,
+            other_attributes)
+        
+        # Fully decompacted bottom depth increases top depth by fully decompacted thickness (using surface porosity only).
+        stratigraphic_unit.decompacted_top_depth = decompacted_top_depth
+        stratigraphic_unit.decompacted_bottom_depth = decompacted_top_depth + stratigraphic_unit.get_fully_decompacted_thickness()
+        
+        well.stratigraphic_units.append(stratigraphic_unit)
+        
+        # Top of next unit is same as bottom of current unit.
+        top_age, top_depth, decompacted_top_depth = bottom_age, bottom_depth, stratigraphic_unit.decompacted_bottom_depth
+    
+    # Well arrays (if any) no longer contain all the units.
+    well._arrays = None
+
+
 def write_well_file(well, well_filename, other_column_attribute_names=None, well_attributes=None):
     """
     Writes a text file with each row representing a stratigraphic unit.
@@ -1525,7 +2440,15 @@ def write_well_metadata(well_file, well, well_attributes=None):
         Not that the attributes must exist in ``well`` (but can be set to None).
     """
     
-    # List of 2-tuples of metadata to write to file.
+    # Write the metadata (sorted by name).
+    for well_metadata_name, well_metadata_value in _get_well_metadata(well, well_attributes):
+        well_file.write('# {0} = {1:.4f}\n'.format(well_metadata_name, well_metadata_value))
+
+
+def _get_well_metadata(well, well_attributes=None):
+    # Returns list of 2-tuples (name, value) of well metadata (sorted by name).
+    # See 'write_well_metadata()' for a description of 'well_attributes'.
+    
     metadata = []
     
     if well_attributes:
@@ -1540,6 +2463,4 @@ def write_well_metadata(well_file, well, well_attributes=None):
     surface_age = well.stratigraphic_units[0].top_age
     metadata.append(('SurfaceAge', surface_age))
     
-    # Write the metadata (sorted by name).
-    for well_metadata_name, well_metadata_value in sorted(metadata):
-        well_file.write('# {0} = {1:.4f}\n'.format(well_metadata_name, well_metadata_value))
+    return sorted(metadata)
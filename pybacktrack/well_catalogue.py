@@ -0,0 +1,675 @@
+
+"""
+    Copyright (C) 2026 The University of Sydney, Australia
+
+    This program is free software; you can redistribute it and/or modify it under
+    the terms of the GNU General Public License, version 2, as published by
+    the Free Software Foundation.
+
+    This program is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+
+########################################################################################
+# A binary catalogue of many wells (to avoid re-parsing well text files on every run). #
+########################################################################################
+
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import glob
+import math
+import numbers
+import numpy as np
+import os
+import os.path
+import pybacktrack.bundle_data
+from pybacktrack.lithology import create_lithology_from_components, read_lithologies_files
+from pybacktrack.util.cache import write_file_atomically
+import pybacktrack.version
+from pybacktrack.well import Well, WellArrays, _add_contiguous_compacted_units, read_well_files
+import struct
+import sys
+import warnings
+import zipfile
+
+
+# Version of the catalogue file format (incremented when the format changes incompatibly).
+_CATALOGUE_FORMAT_VERSION = 1
+
+# Well metadata read by default when converting well text files to a catalogue.
+DEFAULT_WELL_ATTRIBUTES = {'SiteLongitude': ('longitude', float), 'SiteLatitude': ('latitude', float)}
+
+
+class WellCatalogue(object):
+    """
+    Class providing random access to the wells in a binary well catalogue file.
+    
+    The catalogue file is memory-mapped (by default) so opening a catalogue does not read all its wells,
+    and each well is located in constant time (by name or index).
+    
+    Attributes
+    ----------
+    well_names : list of str
+        The name of each well in the catalogue (in catalogue order).
+    lithologies : dict
+        Dictionary mapping lithology names to :class:`pybacktrack.Lithology` objects.
+    
+    Notes
+    -----
+    A catalogue can be created from wells using :func:`pybacktrack.write_well_catalogue`, or from a directory
+    of well text files using :func:`pybacktrack.create_well_catalogue`.
+    
+    .. versionadded:: 1.5
+    """
+    
+    def __init__(self, catalogue_filename, lithologies, mmap=True):
+        """
+        Open a well catalogue file.
+        
+        Parameters
+        ----------
+        catalogue_filename : str
+            Name of well catalogue file.
+        lithologies : dict
+            Dictionary mapping lithology names to :class:`pybacktrack.Lithology` objects.
+            Used to create the lithology of each stratigraphic unit (from its lithology components).
+        mmap : bool, optional
+            Whether to memory-map the catalogue file (instead of reading it all into memory). Defaults to True.
+        
+        Raises
+        ------
+        ValueError
+            If the catalogue file was written with an unsupported catalogue format version.
+        """
+        
+        arrays = _load_arrays(catalogue_filename, mmap)
+        
+        format_version = int(arrays['format_version'][0])
+        if format_version > _CATALOGUE_FORMAT_VERSION:
+            raise ValueError('Well catalogue "{0}" has format version {1} but only versions up to {2} are supported.'.format(
+                             catalogue_filename, format_version, _CATALOGUE_FORMAT_VERSION))
+        
+        self.lithologies = lithologies
+        
+        self.well_names = arrays['well_names'].tolist()
+        self._well_indices = dict((well_name, well_index) for well_index, well_name in enumerate(self.well_names))
+        self._well_attribute_names = arrays['well_attribute_names'].tolist()
+        self._well_attributes = arrays['well_attributes']
+        
+        self._unit_offsets = arrays['unit_offsets']
+        self._top_ages = arrays['top_ages']
+        self._bottom_ages = arrays['bottom_ages']
+        self._top_depths = arrays['top_depths']
+        self._bottom_depths = arrays['bottom_depths']
+        self._other_attribute_names = arrays['other_attribute_names'].tolist()
+        self._other_attributes = arrays['other_attributes']
+        
+        self._lithology_names = arrays['lithology_names'].tolist()
+        self._component_offsets = arrays['component_offsets']
+        self._component_lithology_indices = arrays['component_lithology_indices']
+        self._component_fractions = arrays['component_fractions']
+        
+        # Maps each tuple of lithology components to its combined lithology (shared by all wells).
+        self._lithology_cache = {}
+    
+    def __len__(self):
+        return len(self.well_names)
+    
+    def __contains__(self, well_name):
+        return well_name in self._well_indices
+    
+    def __iter__(self):
+        return iter(self.well_names)
+    
+    def get_well_index(self, well):
+        """
+        Return the index of a well in the catalogue.
+        
+        Parameters
+        ----------
+        well : str or int
+            The name or index of a well.
+        
+        Returns
+        -------
+        int
+            The index of the well.
+        
+        Raises
+        ------
+        KeyError
+            If there is no well with the specified name in the catalogue.
+        IndexError
+            If the specified index is out of range.
+        """
+        
+        if isinstance(well, numbers.Integral):
+            num_wells = len(self.well_names)
+            well_index = well + num_wells if well < 0 else well
+            if well_index < 0 or well_index >= num_wells:
+                raise IndexError('Well index {0} out of range.'.format(well))
+            return well_index
+        
+        try:
+            return self._well_indices[well]
+        except KeyError:
+            raise KeyError('Well "{0}" is not in the well catalogue.'.format(well))
+    
+    def get_well(self, well):
+        """
+        Return a well in the catalogue.
+        
+        Parameters
+        ----------
+        well : str or int
+            The name or index of a well.
+        
+        Returns
+        -------
+        :class:`pybacktrack.Well`
+            The well (the same as reading the original well text file).
+        
+        Raises
+        ------
+        KeyError
+            If there is no well with the specified name in the catalogue, or if a lithology name is not found in ``lithologies``.
+        IndexError
+            If the specified index is out of range.
+        """
+        
+        well_index = self.get_well_index(well)
+        begin_unit_index, end_unit_index = self._get_unit_range(well_index)
+        
+        well = Well(self._get_well_attributes(well_index))
+        
+        if end_unit_index > begin_unit_index:
+            # Note: Each unit's top age and depth is the bottom age and depth of the unit above it.
+            stratigraphic_units = [
+                (bottom_age, bottom_depth, lithology_components, other_attributes)
+                for bottom_age, bottom_depth, lithology_components, other_attributes in zip(
+                    self._bottom_ages[begin_unit_index:end_unit_index].tolist(),
+                    self._bottom_depths[begin_unit_index:end_unit_index].tolist(),
+                    self._get_lithology_components(begin_unit_index, end_unit_index),
+                    self._get_other_attributes(begin_unit_index, end_unit_index))]
+            surface_age = float(self._top_ages[begin_unit_index])
+            
+            _add_contiguous_compacted_units(well, surface_age, stratigraphic_units, self.lithologies, self._lithology_cache)
+        
+        return well
+    
+    def get_well_arrays(self, well):
+        """
+        Return the stratigraphic units of a well in the catalogue as columns.
+        
+        This avoids creating a :class:`pybacktrack.StratigraphicUnit` object for each unit in the well.
+        
+        Parameters
+        ----------
+        well : str or int
+            The name or index of a well.
+        
+        Returns
+        -------
+        :class:`pybacktrack.WellArrays`
+            The stratigraphic units of the well.
+        
+        Raises
+        ------
+        KeyError
+            If there is no well with the specified name in the catalogue, or if a lithology name is not found in ``lithologies``.
+        IndexError
+            If the specified index is out of range.
+        
+        Notes
+        -----
+        The fully decompacted thicknesses (and depths) are calculated with numpy and so can differ (by numerical precision)
+        from those of the units of the well returned by :meth:`get_well`.
+        """
+        
+        well_index = self.get_well_index(well)
+        begin_unit_index, end_unit_index = self._get_unit_range(well_index)
+        
+        lithology_components = self._get_lithology_components(begin_unit_index, end_unit_index)
+        
+        well_arrays = WellArrays.__new__(WellArrays)
+        well_arrays._init_columns(
+            self._top_ages[begin_unit_index:end_unit_index],
+            self._bottom_ages[begin_unit_index:end_unit_index],
+            self._top_depths[begin_unit_index:end_unit_index],
+            self._bottom_depths[begin_unit_index:end_unit_index],
+            [list(components) for components in lithology_components],
+            [self._get_lithology(components) for components in lithology_components],
+            dict((other_attribute_name, self._other_attributes[begin_unit_index:end_unit_index, other_attribute_index])
+                 for other_attribute_index, other_attribute_name in enumerate(self._other_attribute_names)))
+        well_arrays._init_decompacted_depths()
+        
+        return well_arrays
+    
+    def _get_unit_range(self, well_index):
+        return int(self._unit_offsets[well_index]), int(self._unit_offsets[well_index + 1])
+    
+    def _get_well_attributes(self, well_index):
+        # Missing attributes are stored as NaN (but are None in a well).
+        return dict((well_attribute_name, None if math.isnan(well_attribute_value) else well_attribute_value)
+                    for well_attribute_name, well_attribute_value in zip(
+                        self._well_attribute_names, self._well_attributes[well_index].tolist()))
+    
+    def _get_lithology_components(self, begin_unit_index, end_unit_index):
+        component_offsets = self._component_offsets[begin_unit_index:end_unit_index + 1].tolist()
+        begin_component_index, end_component_index = component_offsets[0], component_offsets[-1]
+        
+        lithology_names = [self._lithology_names[lithology_index]
+                           for lithology_index in self._component_lithology_indices[begin_component_index:end_component_index].tolist()]
+        fractions = self._component_fractions[begin_component_index:end_component_index].tolist()
+        
+        return [tuple(zip(lithology_names[begin_offset - begin_component_index:end_offset - begin_component_index],
+                          fractions[begin_offset - begin_component_index:end_offset - begin_component_index]))
+                for begin_offset, end_offset in zip(component_offsets[:-1], component_offsets[1:])]
+    
+    def _get_other_attributes(self, begin_unit_index, end_unit_index):
+        if not self._other_attribute_names:
+            return [None] * (end_unit_index - begin_unit_index)
+        
+        # Missing attributes are stored as NaN (and are not added to the unit).
+        return [dict((other_attribute_name, other_attribute_value)
+                     for other_attribute_name, other_attribute_value in zip(self._other_attribute_names, unit_other_attributes)
+                     if not math.isnan(other_attribute_value))
+                for unit_other_attributes in self._other_attributes[begin_unit_index:end_unit_index].tolist()]
+    
+    def _get_lithology(self, lithology_components):
+        lithology = self._lithology_cache.get(lithology_components)
+        if lithology is None:
+            lithology = create_lithology_from_components(lithology_components, self.lithologies)
+            self._lithology_cache[lithology_components] = lithology
+        return lithology
+
+
+def write_well_catalogue(catalogue_filename, wells, well_names, well_attribute_names=None):
+    """
+    Write wells to a binary well catalogue file.
+    
+    Parameters
+    ----------
+    catalogue_filename : str
+        Name of well catalogue file (typically with a ".npz" extension).
+    wells : sequence of :class:`pybacktrack.Well`
+        The wells to write.
+    well_names : sequence of str
+        The unique name of each well (used to look up wells in a :class:`pybacktrack.WellCatalogue`).
+    well_attribute_names : sequence of str, optional
+        Names of the (numeric) attributes of each :class:`pybacktrack.Well` object to write (such as ``longitude`` and ``latitude``).
+        An attribute that is missing (or None) in a well is written as missing.
+        Defaults to all numeric attributes of all wells.
+    
+    Raises
+    ------
+    ValueError
+        If the number of wells and well names differ, or the well names are not unique.
+    
+    Notes
+    -----
+    Stratigraphic units store their age and depth ranges, lithology components and any extra numeric attributes
+    (such as ``min_water_depth`` and ``max_water_depth`` when backstripping).
+    
+    The catalogue is an uncompressed NumPy ".npz" file (so that it can be memory-mapped by :class:`pybacktrack.WellCatalogue`).
+    The file is written atomically (so a partially written catalogue is never seen).
+    
+    .. versionadded:: 1.5
+    """
+    
+    wells = list(wells)
+    well_names = list(well_names)
+    if len(wells) != len(well_names):
+        raise ValueError('Number of wells and well names differ.')
+    if len(set(well_names)) != len(well_names):
+        raise ValueError('Well names must be unique.')
+    
+    if well_attribute_names is None:
+        well_attribute_names = sorted(set(
+            name for well in wells for name, value in vars(well).items()
+            if not name.startswith('_') and isinstance(value, numbers.Real) and not isinstance(value, bool)))
+    well_attributes = np.array(
+        [[_get_numeric_value(well, name) for name in well_attribute_names] for well in wells],
+        dtype=float).reshape(len(wells), len(well_attribute_names))
+    
+    all_well_arrays = [well.get_arrays() for well in wells]
+    
+    other_attribute_names = sorted(set(name for well_arrays in all_well_arrays for name in well_arrays.other_attributes))
+    
+    unit_offsets = np.zeros(len(wells) + 1, dtype=np.int64)
+    unit_offsets[1:] = np.cumsum([len(well_arrays) for well_arrays in all_well_arrays])
+    num_units = int(unit_offsets[-1])
+    
+    def concatenate_columns(get_column):
+        if not all_well_arrays:
+            return np.zeros(0, dtype=float)
+        return np.concatenate([np.asarray(get_column(well_arrays), dtype=float) for well_arrays in all_well_arrays])
+    
+    other_attributes = np.full((num_units, len(other_attribute_names)), np.nan)
+    for well_index, well_arrays in enumerate(all_well_arrays):
+        for other_attribute_index, other_attribute_name in enumerate(other_attribute_names):
+            if other_attribute_name in well_arrays.other_attributes:
+                other_attributes[unit_offsets[well_index]:unit_offsets[well_index + 1], other_attribute_index] = \
+                    well_arrays.other_attributes[other_attribute_name]
+    
+    # The lithology components of all units (indexing into a table of distinct lithology names).
+    lithology_indices = {}
+    component_offsets = [0]
+    component_lithology_indices = []
+    component_fractions = []
+    for well_arrays in all_well_arrays:
+        for lithology_components in well_arrays.lithology_components:
+            for lithology_name, fraction in lithology_components:
+                component_lithology_indices.append(lithology_indices.setdefault(lithology_name, len(lithology_indices)))
+                component_fractions.append(fraction)
+            component_offsets.append(len(component_fractions))
+    lithology_names = sorted(lithology_indices, key=lithology_indices.get)
+    
+    arrays = {
+        'format_version': np.array([_CATALOGUE_FORMAT_VERSION], dtype=np.int64),
+        'well_names': _as_str_array(well_names),
+        'well_attribute_names': _as_str_array(well_attribute_names),
+        'well_attributes': well_attributes,
+        'unit_offsets': unit_offsets,
+        'top_ages': concatenate_columns(lambda well_arrays: well_arrays.top_ages),
+        'bottom_ages': concatenate_columns(lambda well_arrays: well_arrays.bottom_ages),
+        'top_depths': concatenate_columns(lambda well_arrays: well_arrays.top_depths),
+        'bottom_depths': concatenate_columns(lambda well_arrays: well_arrays.bottom_depths),
+        'other_attribute_names': _as_str_array(other_attribute_names),
+        'other_attributes': other_attributes,
+        'lithology_names': _as_str_array(lithology_names),
+        'component_offsets': np.array(component_offsets, dtype=np.int64),
+        'component_lithology_indices': np.array(component_lithology_indices, dtype=np.int64),
+        'component_fractions': np.array(component_fractions, dtype=float)}
+    
+    # Note: Not compressed (so the arrays can be memory-mapped).
+    write_file_atomically(catalogue_filename, lambda catalogue_file: np.savez(catalogue_file, **arrays), suffix='.npz')
+
+
+def create_well_catalogue(
+        catalogue_filename,
+        well_directory,
+        lithology_filenames=[pybacktrack.bundle_data.DEFAULT_BUNDLE_LITHOLOGY_FILENAME],
+        well_filename_pattern='*.txt',
+        bottom_age_column=0,
+        bottom_depth_column=1,
+        lithology_column=2,
+        other_columns=None,
+        well_attributes=DEFAULT_WELL_ATTRIBUTES):
+    # Adding function signature on first line of docstring otherwise Sphinx autodoc will print out
+    # the expanded values of the bundle filenames.
+    """create_well_catalogue(\
+        catalogue_filename,\
+        well_directory,\
+        lithology_filenames=[pybacktrack.DEFAULT_BUNDLE_LITHOLOGY_FILENAME],\
+        well_filename_pattern='*.txt',\
+        bottom_age_column=0,\
+        bottom_depth_column=1,\
+        lithology_column=2,\
+        other_columns=None,\
+        well_attributes=pybacktrack.WELL_CATALOGUE_DEFAULT_WELL_ATTRIBUTES)
+    Convert a directory of well text files to a binary well catalogue file.
+    
+    Parameters
+    ----------
+    catalogue_filename : str
+        Name of well catalogue file to write (typically with a ".npz" extension).
+    well_directory : str
+        Directory containing the well text files.
+    lithology_filenames : list of str, optional
+        One or more text files containing lithologies (used to check the lithology names in the well files).
+    well_filename_pattern : str, optional
+        Glob pattern matching the well text files in ``well_directory``. Defaults to '*.txt'.
+    bottom_age_column : int, optional
+        The column of each well file containing bottom age. Defaults to 0.
+    bottom_depth_column : int, optional
+        The column of each well file containing bottom depth. Defaults to 1.
+    lithology_column : int, optional
+        The column of each well file containing lithology(s). Defaults to 2.
+    other_columns : dict, optional
+        Dictionary of extra columns (besides age, depth and lithology(s)). See :func:`pybacktrack.read_well_file`.
+    well_attributes : dict, optional
+        Numeric attributes to read from the metadata of each well file. See :func:`pybacktrack.read_well_file`.
+        Defaults to reading 'SiteLongitude' and 'SiteLatitude' into ``longitude`` and ``latitude``.
+    
+    Returns
+    -------
+    list of str
+        The names of the wells in the catalogue (the well filenames without directory and extension), sorted by name.
+    
+    Notes
+    -----
+    The lithologies are not stored in the catalogue (only the lithology components of each stratigraphic unit),
+    so a catalogue can be opened with different lithologies (see :class:`pybacktrack.WellCatalogue`).
+    
+    .. versionadded:: 1.5
+    """
+    
+    well_filenames = sorted(glob.glob(os.path.join(well_directory, well_filename_pattern)))
+    well_names = [os.path.splitext(os.path.basename(well_filename))[0] for well_filename in well_filenames]
+    
+    lithologies = read_lithologies_files(lithology_filenames)
+    
+    wells = read_well_files(
+        well_filenames,
+        lithologies,
+        bottom_age_column,
+        bottom_depth_column,
+        lithology_column,
+        other_columns,
+        well_attributes)
+    
+    write_well_catalogue(
+        catalogue_filename,
+        wells,
+        well_names,
+        [well_attribute_name for well_attribute_name, _ in well_attributes.values()] if well_attributes else [])
+    
+    return well_names
+
+
+def _get_numeric_value(object, attribute_name):
+    # Missing (or None) values are NaN.
+    value = getattr(object, attribute_name, None)
+    return float('nan') if value is None else value
+
+
+def _as_str_array(strings):
+    # Note: An empty array still needs a string dtype.
+    return np.array(strings, dtype=str) if strings else np.zeros(0, dtype='U1')
+
+
+def _load_arrays(npz_filename, mmap):
+    # Load the arrays in an (uncompressed) '.npz' file, optionally memory-mapping them.
+    #
+    # Note: 'numpy.load()' does not memory-map arrays in '.npz' files, so each (uncompressed) array in the zip file
+    #       is memory-mapped directly (at the offset of its array data in the file).
+    if not mmap:
+        with np.load(npz_filename, allow_pickle=False) as npz_file:
+            return dict((array_name, npz_file[array_name]) for array_name in npz_file.files)
+    
+    arrays = {}
+    with zipfile.ZipFile(npz_filename, 'r') as zip_file, open(npz_filename, 'rb') as npz_file:
+        for zip_info in zip_file.infolist():
+            array_name = zip_info.filename[:-len('.npy')] if zip_info.filename.endswith('.npy') else zip_info.filename
+            
+            array = None
+            if zip_info.compress_type == zipfile.ZIP_STORED:
+                # The array data follows the local file header (30 bytes plus the file name and extra field).
+                npz_file.seek(zip_info.header_offset + 26)
+                file_name_length, extra_field_length = struct.unpack('<HH', npz_file.read(4))
+                npz_file.seek(zip_info.header_offset + 30 + file_name_length + extra_field_length)
+                
+                version = np.lib.format.read_magic(npz_file)
+                if version == (1, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(npz_file)
+                elif version == (2, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(npz_file)
+                else:
+                    shape = None
+                
+                if shape is not None and not dtype.hasobject:
+                    if int(np.prod(shape)) == 0:
+                        # Cannot memory-map an empty array.
+                        array = np.zeros(shape, dtype=dtype)
+                    else:
+                        array = np.memmap(npz_filename, dtype=dtype, mode='r', offset=npz_file.tell(), shape=shape,
+                                          order='F' if fortran_order else 'C')
+            
+            if array is None:
+                # Compressed (or unsupported) array, so read it into memory instead.
+                with zip_file.open(zip_info) as array_file:
+                    array = np.lib.format.read_array(array_file, allow_pickle=False)
+            
+            arrays[array_name] = array
+    
+    return arrays
+
+
+def main():
+    
+    __description__ = \
+        """Converts a directory of well text files to a binary well catalogue file.
+    
+    The well catalogue can then be opened (with pybacktrack.WellCatalogue) to access its wells without re-parsing the well text files.
+    Each well in the catalogue is named after its filename (without directory and extension).
+    
+    NOTE: Separate the positional and optional arguments with '--' (workaround for bug in argparse module).
+    For example...
+
+    python -m pybacktrack.well_catalogue_cli -l primary extended -- wells/ well_catalogue.npz
+    """
+
+    import argparse
+    from pybacktrack.lithology import ArgParseLithologyAction, DEFAULT_BUNDLED_LITHOLOGY_SHORT_NAME, BUNDLED_LITHOLOGY_SHORT_NAMES
+
+    def argparse_unicode(value_string):
+        try:
+            if sys.version_info[0] >= 3:
+                filename = value_string
+            else:
+                # Filename uses the system encoding - decode from 'str' to 'unicode'.
+                filename = value_string.decode(sys.getfilesystemencoding())
+        except UnicodeDecodeError:
+            raise argparse.ArgumentTypeError("Unable to convert filename %s to unicode" % value_string)
+        
+        return filename
+
+    def argparse_non_negative_integer(value_string):
+        try:
+            value = int(value_string)
+        except ValueError:
+            raise argparse.ArgumentTypeError("%s is not an integer" % value_string)
+        
+        if value < 0:
+            raise argparse.ArgumentTypeError("%g is a negative number" % value)
+        
+        return value
+
+    # Basically an argparse.RawDescriptionHelpFormatter that will also preserve formatting of
+    # argument help messages if they start with "R|".
+    class PreserveHelpFormatter(argparse.RawDescriptionHelpFormatter):
+        def _split_lines(self, text, width):
+            if text.startswith('R|'):
+                return text[2:].splitlines()
+            return super(PreserveHelpFormatter, self)._split_lines(text, width)
+
+    #
+    # Gather command-line options.
+    #
+    
+    # The command-line parser.
+    parser = argparse.ArgumentParser(description=__description__, formatter_class=PreserveHelpFormatter)
+    
+    parser.add_argument('--version', action='version', version=pybacktrack.version.__version__)
+    
+    # Allow user to override the default lithology filename, and also specify bundled lithologies.
+    parser.add_argument(
+        '-l', '--lithology_filenames', nargs='+', action=ArgParseLithologyAction,
+        metavar='lithology_filename',
+        default=[pybacktrack.bundle_data.DEFAULT_BUNDLE_LITHOLOGY_FILENAME],
+        help='R|Optional lithology filenames used to check the lithology names in the well files.\n'
+             'You can also choose built-in (bundled) lithologies (in any order) - choices include {}\n'
+             '(see {}).\n'
+             'Defaults to "{}" if nothing specified.'
+             .format(
+                 ', '.join('"{0}"'.format(short_name) for short_name in BUNDLED_LITHOLOGY_SHORT_NAMES),
+                 pybacktrack.bundle_data.BUNDLE_LITHOLOGY_DOC_URL,
+                 DEFAULT_BUNDLED_LITHOLOGY_SHORT_NAME))
+    
+    parser.add_argument(
+        '-p', '--well_filename_pattern', type=str, default='*.txt',
+        metavar='well_filename_pattern',
+        help='Glob pattern matching the well text files in the well directory. Defaults to "*.txt".')
+    
+    parser.add_argument(
+        '-c', '--well_columns', type=argparse_non_negative_integer, nargs=3, default=[0, 1, 2],
+        metavar=('bottom_age_column', 'bottom_depth_column', 'lithology_column'),
+        help='The well file column indices for bottom age, bottom depth and lithology(s). '
+             'Defaults to 0 1 2.')
+    
+    parser.add_argument(
+        'well_directory', type=argparse_unicode,
+        metavar='well_directory',
+        help='The directory containing the well text files.')
+    
+    parser.add_argument(
+        'catalogue_filename', type=argparse_unicode,
+        metavar='catalogue_filename',
+        help='The well catalogue file to write (typically with a ".npz" extension).')
+    
+    # Parse command-line options.
+    args = parser.parse_args()
+    
+    create_well_catalogue(
+        args.catalogue_filename,
+        args.well_directory,
+        args.lithology_filenames,
+        args.well_filename_pattern,
+        args.well_columns[0],  # bottom_age_column
+        args.well_columns[1],  # bottom_depth_column
+        args.well_columns[2])  # lithology_column
+
+
+if __name__ == '__main__':
+
+    import traceback
+    
+    def warning_format(message, category, filename, lineno, file=None, line=None):
+        # return '{0}:{1}: {1}:{1}\n'.format(filename, lineno, category.__name__, message)
+        return '{0}: {1}\n'.format(category.__name__, message)
+
+    # Print the warnings without the filename and line number.
+    # Users are not going to want to see that.
+    warnings.formatwarning = warning_format
+    
+    #
+    # User should use 'well_catalogue_cli' module (instead of this module 'well_catalogue'), when executing as a script, to avoid Python 3 warning:
+    #
+    #   RuntimeWarning: 'pybacktrack.well_catalogue' found in sys.modules after import of package 'pybacktrack',
+    #                   but prior to execution of 'pybacktrack.well_catalogue'; this may result in unpredictable behaviour
+    #
+    # For more details see https://stackoverflow.com/questions/43393764/python-3-6-project-structure-leads-to-runtimewarning
+    #
+    # Importing this module (eg, 'import pybacktrack.well_catalogue') is fine though.
+    #
+    warnings.warn("Use 'python -m pybacktrack.well_catalogue_cli ...', instead of 'python -m pybacktrack.well_catalogue ...'.", DeprecationWarning)
+
+    try:
+        main()
+        sys.exit(0)
+    except Exception as exc:
+        print('ERROR: {0}'.format(exc), file=sys.stderr)
+        # Uncomment this to print traceback to location of raised exception.
+        # traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,43 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy as np
+import os
+import pytest
+from pybacktrack.util.cache import load_arrays, save_arrays, write_file_atomically
+
+
+def test_write_file_atomically(tmpdir):
+    """Test a file is replaced atomically, and left unchanged (with no temporary file) if writing fails."""
+
+    filename = str(tmpdir.join('file.bin'))
+    write_file_atomically(filename, lambda file: file.write(b'first'))
+    write_file_atomically(filename, lambda file: file.write(b'second'))
+    with open(filename, 'rb') as file:
+        assert file.read() == b'second'
+
+    def write_and_fail(file):
+        file.write(b'partial')
+        raise ValueError('write failed')
+
+    with pytest.raises(ValueError):
+        write_file_atomically(filename, write_and_fail, suffix='.bin')
+    with open(filename, 'rb') as file:
+        assert file.read() == b'second'
+    assert os.listdir(str(tmpdir)) == ['file.bin']
+
+
+def test_save_and_load_arrays(tmpdir):
+    """Test arrays saved to the cache are loaded again (and nothing is loaded for a different key)."""
+
+    cache_directory = str(tmpdir.join('cache'))
+    arrays = {'values': np.arange(10, dtype=float), 'indices': np.array([3, 1, 2])}
+    assert save_arrays('test', 'key', arrays, cache_directory)
+
+    loaded_arrays = load_arrays('test', 'key', cache_directory)
+    assert sorted(loaded_arrays) == sorted(arrays)
+    for name, array in arrays.items():
+        assert np.array_equal(loaded_arrays[name], array)
+
+    assert load_arrays('test', 'other key', cache_directory) is None
@@ -0,0 +1,145 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import csv
+import numpy as np
+import py
+import pybacktrack
+from pybacktrack.util.decompacted_output import DECOMPACTED_FORMAT_CSV, DECOMPACTED_FORMAT_NETCDF, DECOMPACTED_FORMAT_PARQUET, DECOMPACTED_FORMAT_TEXT, \
+    format_lithology_components, write_decompacted_columns
+import pytest
+from scipy.io import netcdf_file
+import warnings
+
+
+# Test data directory is inside the pybacktrack module.
+TEST_DATA_DIR = py.path.local(__file__).dirpath('test_data')
+
+
+def _create_columns():
+    random_state = np.random.RandomState(1)
+    ages = np.sort(random_state.uniform(0.0, 100.0, 50))
+    thicknesses = random_state.uniform(0.0, 5000.0, 50)
+    lithology_components = [[('Shale', 0.7), ('Sand', 0.3)] if index % 3 else [('Chalk', 1.0)] for index in range(50)]
+
+    column_names = ['age', 'decompacted_thickness', 'lithology']
+    columns = [ages, thicknesses, format_lithology_components(lithology_components)]
+    # Note: The longitude is not exactly representable in single precision.
+    metadata = [('SiteLatitude', -20.5), ('SiteLongitude', 110.123456789), ('SurfaceAge', 0.0)]
+
+    return column_names, columns, metadata
+
+
+def test_write_decompacted_columns_text(tmpdir):
+    """Test text output matches formatting each value separately."""
+
+    column_names, columns, metadata = _create_columns()
+
+    text_filename = str(tmpdir.join('decompacted.txt'))
+    write_decompacted_columns(text_filename, column_names, columns, metadata, DECOMPACTED_FORMAT_TEXT)
+
+    expected_text = ''.join('# {0} = {1:.4f}\n'.format(name, value) for name, value in metadata)
+    expected_text += '#\n'
+    expected_text += '# {0:<9} {1:<21} {2:<9}\n'.format(*column_names)
+    for age, thickness, lithology in zip(*columns):
+        expected_text += '  {0:<9.3f} {1:<21.3f} {2:<9}\n'.format(age, thickness, lithology)
+
+    with open(text_filename, 'r') as text_file:
+        assert text_file.read() == expected_text
+
+    with pytest.raises(ValueError):
+        write_decompacted_columns(text_filename, column_names, columns, metadata, 'unknown format')
+
+
+def test_write_decompacted_columns_csv(tmpdir):
+    """Test CSV output preserves full precision."""
+
+    column_names, columns, metadata = _create_columns()
+
+    csv_filename = str(tmpdir.join('decompacted.csv'))
+    write_decompacted_columns(csv_filename, column_names, columns, metadata, DECOMPACTED_FORMAT_CSV)
+
+    with open(csv_filename, 'r', newline='') as csv_file:
+        rows = list(csv.reader(csv_file))
+
+    assert rows[0] == column_names
+    assert np.array_equal([float(row[0]) for row in rows[1:]], columns[0])
+    assert np.array_equal([float(row[1]) for row in rows[1:]], columns[1])
+    assert [row[2] for row in rows[1:]] == [' '.join(lithology.split()) for lithology in columns[2]]
+
+
+def test_write_decompacted_columns_netcdf(tmpdir):
+    """Test NetCDF output stores columns as variables and metadata as global attributes."""
+
+    column_names, columns, metadata = _create_columns()
+
+    netcdf_filename = str(tmpdir.join('decompacted.nc'))
+    write_decompacted_columns(netcdf_filename, column_names, columns, metadata, DECOMPACTED_FORMAT_NETCDF)
+
+    with netcdf_file(netcdf_filename, 'r', mmap=False) as netcdf_file_:
+        assert np.array_equal(netcdf_file_.variables['age'][:], columns[0])
+        assert np.array_equal(netcdf_file_.variables['decompacted_thickness'][:], columns[1])
+        lithologies = [b''.join(row).decode('utf-8') for row in netcdf_file_.variables['lithology'][:]]
+        assert lithologies == [' '.join(lithology.split()) for lithology in columns[2]]
+        # Metadata should be stored at full (double) precision.
+        # Note: Comparing as Python floats (since comparing a float32 with a Python float is done in single precision with NumPy 2).
+        for name, value in metadata:
+            assert float(getattr(netcdf_file_, name)) == value
+
+
+def test_write_decompacted_columns_parquet(tmpdir):
+    """Test Parquet output stores columns and metadata."""
+
+    pyarrow_parquet = pytest.importorskip('pyarrow.parquet')
+
+    column_names, columns, metadata = _create_columns()
+
+    parquet_filename = str(tmpdir.join('decompacted.parquet'))
+    write_decompacted_columns(parquet_filename, column_names, columns, metadata, DECOMPACTED_FORMAT_PARQUET)
+
+    table = pyarrow_parquet.read_table(parquet_filename)
+    assert table.column_names == column_names
+    assert np.array_equal(table.column('age').to_numpy(), columns[0])
+    assert np.array_equal(table.column('decompacted_thickness').to_numpy(), columns[1])
+    assert float(table.schema.metadata[b'SiteLongitude']) == 110.25
+
+
+def test_write_backstrip_well(tmpdir):
+    """Test writing a decompaction result gives the same text as writing its decompacted wells."""
+
+    with warnings.catch_warnings():
+        # Ignore user warnings related to well thickness being larger than total sediment thickness.
+        warnings.simplefilter("ignore", UserWarning)
+
+        well, decompaction_result = pybacktrack.backstrip_well(
+            str(TEST_DATA_DIR.join('sunrise_lithology.txt')),
+            [pybacktrack.PRIMARY_BUNDLE_LITHOLOGY_FILENAME, pybacktrack.EXTENDED_BUNDLE_LITHOLOGY_FILENAME],
+            total_sediment_thickness_filename=None,
+            sea_level_model='Haq87_SealevelCurve_Longterm')
+
+    decompacted_columns = [
+        pybacktrack.BACKSTRIP_COLUMN_AGE, pybacktrack.BACKSTRIP_COLUMN_COMPACTED_DEPTH, pybacktrack.BACKSTRIP_COLUMN_DECOMPACTED_DENSITY,
+        pybacktrack.BACKSTRIP_COLUMN_DECOMPACTED_SEDIMENT_RATE, pybacktrack.BACKSTRIP_COLUMN_DECOMPACTED_DEPTH,
+        pybacktrack.BACKSTRIP_COLUMN_AVERAGE_TECTONIC_SUBSIDENCE, pybacktrack.BACKSTRIP_COLUMN_AVERAGE_WATER_DEPTH,
+        pybacktrack.BACKSTRIP_COLUMN_LITHOLOGY]
+    well_attributes = {'longitude': 'SiteLongitude', 'latitude': 'SiteLatitude'}
+
+    result_filename = tmpdir.join('result.txt')
+    pybacktrack.write_backstrip_well(decompaction_result, str(result_filename), well, well_attributes, decompacted_columns)
+    decompacted_wells_filename = tmpdir.join('decompacted_wells.txt')
+    pybacktrack.write_backstrip_well(list(decompaction_result), str(decompacted_wells_filename), well, well_attributes, decompacted_columns)
+    assert result_filename.read() == decompacted_wells_filename.read()
+
+    # Each row is a decompacted well.
+    rows = [line.split() for line in result_filename.readlines() if not line.startswith('#')]
+    assert len(rows) == len(decompaction_result)
+    for row, decompacted_well in zip(rows, decompaction_result):
+        assert row[0] == '{0:.3f}'.format(decompacted_well.get_age())
+        assert row[6] == '{0:.3f}'.format(decompacted_well.get_water_depth())
+
+    # Lithology must be the last column.
+    with pytest.raises(ValueError):
+        pybacktrack.write_backstrip_well(
+            decompaction_result, str(result_filename), well, well_attributes,
+            [pybacktrack.BACKSTRIP_COLUMN_LITHOLOGY, pybacktrack.BACKSTRIP_COLUMN_AGE])
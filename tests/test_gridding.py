@@ -0,0 +1,197 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import math
+import numpy as np
+import pybacktrack.paleo_bathymetry as paleo_bathymetry
+from pybacktrack.util.gridding import NearNeighborGridder, get_global_grid_node_lon_lats, nearneighbor, write_netcdf_grid, write_netcdf_grid_cube
+from pybacktrack.util.call_system_command import call_system_command
+import py
+import pygplates
+import pytest
+import random
+from scipy.io import netcdf_file
+
+
+TEST_DATA_DIR = py.path.local(__file__).dirpath('test_data')
+
+
+def _nearneighbor_brute_force(input, grid_spacing_degrees, search_radius_degrees, num_sectors, min_sectors):
+    # Test every grid node against every input point (without a spatial index).
+    node_longitudes, node_latitudes = get_global_grid_node_lon_lats(grid_spacing_degrees)
+    search_radius_radians = math.radians(search_radius_degrees)
+    grid = np.full((len(node_latitudes), len(node_longitudes)), np.nan)
+    for row, node_latitude in enumerate(node_latitudes):
+        for column, node_longitude in enumerate(node_longitudes):
+            nearest_in_sectors = {}
+            for longitude, latitude, value in input:
+                distance = pygplates.GeometryOnSphere.distance(
+                    pygplates.PointOnSphere(node_latitude, node_longitude), pygplates.PointOnSphere(latitude, longitude))
+                if distance > search_radius_radians:
+                    continue
+                # Same sectors as GMT (in longitude/latitude space, with the longitude difference wrapped into [-180, 180]).
+                delta_longitude = math.fmod(longitude - node_longitude, 360.0)
+                if math.fabs(delta_longitude) > 180.0:
+                    delta_longitude = math.copysign(360.0 - math.fabs(delta_longitude), -delta_longitude)
+                delta_latitude = latitude - node_latitude
+                sector = int(math.floor((math.atan2(delta_latitude, delta_longitude) + math.pi) * num_sectors / (2 * math.pi))) % num_sectors
+                # The first of equally near points is used.
+                if sector not in nearest_in_sectors or distance < nearest_in_sectors[sector][0]:
+                    nearest_in_sectors[sector] = distance, value
+            if len(nearest_in_sectors) >= min_sectors:
+                weights = [1.0 / (1.0 + (3.0 * distance / search_radius_radians) ** 2) for distance, _ in nearest_in_sectors.values()]
+                grid[row, column] = (sum(weight * value for weight, (_, value) in zip(weights, nearest_in_sectors.values())) /
+                                     sum(weights))
+
+    return grid
+
+
+def test_nearneighbor():
+    """Test nearest neighbour gridding (using a spatial index) matches testing every node against every point."""
+
+    # Random points with random values (densely covering one hemisphere, so some nodes are not assigned a value).
+    random.seed(1)
+    input = [(random.uniform(-180.0, 180.0), math.degrees(math.asin(random.uniform(-1.0, 1.0))), random.uniform(-5000.0, 0.0))
+             for _ in range(1000)]
+    input = [point for point in input if point[0] < 0.0]
+
+    for search_radius_degrees, num_sectors, min_sectors in ((9.0, 1, 1), (30.0, 8, 6)):
+        grid = nearneighbor(input, 10.0, search_radius_degrees, num_sectors, min_sectors)
+        assert grid.shape == (19, 37)
+
+        # Some, but not all, nodes should have been assigned a value.
+        assert 0 < np.isnan(grid).sum() < grid.size
+
+        brute_force_grid = _nearneighbor_brute_force(input, 10.0, search_radius_degrees, num_sectors, min_sectors)
+        assert (np.isnan(grid) == np.isnan(brute_force_grid)).all()
+        assert np.allclose(grid[~np.isnan(grid)], brute_force_grid[~np.isnan(brute_force_grid)])
+
+
+def _has_gmt():
+    # Returns None if GMT cannot be executed.
+    return call_system_command(['gmt', '--version'], raise_errors=False, print_errors=False, return_stdout=True) is not None
+
+
+@pytest.mark.skipif(not _has_gmt(), reason='requires GMT to be installed')
+def test_nearneighbor_matches_gmt(tmpdir):
+    """Test nearest neighbour gridding matches a grid generated by GMT 'nearneighbor' (from the same input points)."""
+
+    input_filename = TEST_DATA_DIR.join('nearneighbor_points.xyz')
+    input = np.loadtxt(str(input_filename))
+
+    for search_radius_degrees, num_sectors, min_sectors in ((9.0, 1, 1), (30.0, 8, 6)):
+        gmt_grid_filename = str(tmpdir.join('gmt_grid.nc'))
+        call_system_command([
+            'gmt', 'nearneighbor', str(input_filename),
+            '-N{0}+m{1}'.format(num_sectors, min_sectors), '-S{0}d'.format(search_radius_degrees), '-I10', '-Rg', '-fg',
+            '-G{0}'.format(gmt_grid_filename)])
+        gmt_xyz = call_system_command(['gmt', 'grd2xyz', gmt_grid_filename], return_stdout=True)
+
+        grid = nearneighbor(input, 10.0, search_radius_degrees, num_sectors, min_sectors)
+        node_longitudes, node_latitudes = get_global_grid_node_lon_lats(10.0)
+        gmt_grid = np.full(grid.shape, np.nan)
+        for longitude, latitude, value in np.loadtxt(gmt_xyz.splitlines()).reshape(-1, 3):
+            gmt_grid[np.argmin(np.abs(node_latitudes - latitude)), np.argmin(np.abs(node_longitudes - longitude))] = value
+
+        # Some, but not all, nodes should have been assigned a value.
+        assert 0 < np.isnan(grid).sum() < grid.size
+
+        # GMT stores grid values as 32-bit floats.
+        assert (np.isnan(grid) == np.isnan(gmt_grid)).all()
+        assert np.allclose(grid[~np.isnan(grid)], gmt_grid[~np.isnan(gmt_grid)], rtol=1e-6)
+
+
+def test_nearneighbor_gridder():
+    """Test reusing a gridder for many data sets (and masking with a smaller search radius) matches separate gridding."""
+
+    gridder = NearNeighborGridder(5.0)
+
+    random.seed(2)
+    for _ in range(3):
+        input = np.array([(random.uniform(-180.0, 0.0), random.uniform(-90.0, 90.0), random.uniform(-5000.0, 0.0)) for _ in range(2000)])
+
+        grid = gridder.grid(input, 15.0, 8, 6, mask_search_radius_degrees=4.5)
+
+        expected_grid = nearneighbor(input, 5.0, 15.0, 8, 6)
+        expected_grid[np.isnan(nearneighbor(input, 5.0, 4.5, 1, 1))] = np.nan
+        assert np.array_equal(grid, expected_grid, equal_nan=True)
+
+    with pytest.raises(ValueError):
+        gridder.grid(input, 15.0, mask_search_radius_degrees=20.0)
+
+
+def test_write_grid_native(tmpdir):
+    """Test the native gridder writes a NetCDF grid that is only non-NaN near the input points."""
+
+    # Points covering a region (on a 1 degree grid) with a constant value.
+    longitudes, latitudes = np.meshgrid(np.arange(-30.0, 30.5, 1.0), np.arange(-20.0, 20.5, 1.0))
+    input = np.column_stack((longitudes.ravel(), latitudes.ravel(), np.full(longitudes.size, -2000.0)))
+
+    grid_filename = str(tmpdir.join('grid.nc'))
+    paleo_bathymetry._write_grid(input, 1.0, grid_filename, gridder=paleo_bathymetry.GRIDDER_NATIVE)
+
+    with netcdf_file(grid_filename, 'r', mmap=False) as grid_file:
+        grid_longitudes = grid_file.variables['lon'][:].copy()
+        grid_latitudes = grid_file.variables['lat'][:].copy()
+        grid = grid_file.variables['z'][:].copy()
+
+    assert grid.shape == (181, 361)
+    assert (grid_longitudes == np.arange(0.0, 360.5, 1.0)).all()
+    assert (grid_latitudes == np.arange(-90.0, 90.5, 1.0)).all()
+
+    # A weighted mean of a constant value is that constant.
+    assert np.allclose(grid[~np.isnan(grid)], -2000.0)
+
+    # The output should not extend beyond the input points (due to the non-NaN mask).
+    grid_longitudes, grid_latitudes = np.meshgrid(grid_longitudes, grid_latitudes)
+    grid_longitudes = np.where(grid_longitudes > 180.0, grid_longitudes - 360.0, grid_longitudes)
+    is_inside_region = (np.abs(grid_longitudes) <= 30.0) & (np.abs(grid_latitudes) <= 20.0)
+    assert np.isnan(grid[~is_inside_region]).all()
+    # But it should cover the interior of the region (where all sectors contain points).
+    is_interior_of_region = (np.abs(grid_longitudes) <= 27.0) & (np.abs(grid_latitudes) <= 17.0)
+    assert not np.isnan(grid[is_interior_of_region]).any()
+
+
+def test_write_netcdf_grid(tmpdir):
+    """Test writing a NetCDF grid preserves grid values (including NaN)."""
+
+    longitudes, latitudes = get_global_grid_node_lon_lats(30.0)
+    grid = np.arange(len(latitudes) * len(longitudes), dtype=float).reshape(len(latitudes), len(longitudes))
+    grid[0, :] = np.nan
+
+    grid_filename = str(tmpdir.join('grid.nc'))
+    write_netcdf_grid(grid_filename, grid, longitudes, latitudes)
+
+    with netcdf_file(grid_filename, 'r', mmap=False) as grid_file:
+        z = grid_file.variables['z']
+        assert z.dimensions == ('lat', 'lon')
+        assert np.array_equal(z[:], grid.astype(np.float32), equal_nan=True)
+        assert list(z.actual_range) == [grid[1:].min(), grid[1:].max()]
+
+
+def test_write_netcdf_grid_cube(tmpdir):
+    """Test grids are added to a NetCDF4 grid cube incrementally (replacing grids at times already in the cube)."""
+
+    netCDF4 = pytest.importorskip('netCDF4')
+
+    longitudes, latitudes = get_global_grid_node_lon_lats(10.0)
+    grids = np.random.RandomState(3).uniform(-5000.0, 0.0, (6, len(latitudes), len(longitudes))).astype(np.float32)
+    grids[:, 0, :] = np.nan
+
+    cube_filename = str(tmpdir.join('cube.nc'))
+    write_netcdf_grid_cube(cube_filename, [0.0, 1.0, 2.0], grids[:3], longitudes, latitudes)
+    # Replace the grid at time 2 and append grids at times 3 and 4.
+    write_netcdf_grid_cube(cube_filename, [2.0, 3.0, 4.0], grids[3:], longitudes, latitudes)
+
+    with netCDF4.Dataset(cube_filename) as cube_file:
+        assert cube_file.variables['z'].dimensions == ('time', 'lat', 'lon')
+        assert list(cube_file.variables['time'][:]) == [0.0, 1.0, 2.0, 3.0, 4.0]
+        z = np.ma.filled(cube_file.variables['z'][:], np.nan)
+    assert np.array_equal(z, np.concatenate((grids[:2], grids[3:])), equal_nan=True)
+
+    # Grid nodes must match those in the existing cube.
+    other_longitudes, other_latitudes = get_global_grid_node_lon_lats(5.0)
+    with pytest.raises(ValueError):
+        write_netcdf_grid_cube(
+            cube_filename, [5.0], np.zeros((1, len(other_latitudes), len(other_longitudes))), other_longitudes, other_latitudes)
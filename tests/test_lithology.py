@@ -0,0 +1,42 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import pybacktrack
+import pytest
+
+
+def test_create_lithology_from_components():
+    """Test combined lithologies are shared (read-only) instances for the same components and lithologies."""
+
+    lithologies = pybacktrack.read_lithologies_files(pybacktrack.BUNDLE_LITHOLOGY_FILENAMES)
+
+    lithology = pybacktrack.create_lithology_from_components([('Shale', 0.7), ('Sand', 0.3)], lithologies)
+    shale, sand = lithologies['Shale'], lithologies['Sand']
+    assert lithology.density == pytest.approx(0.7 * shale.density + 0.3 * sand.density)
+    assert lithology.porosity_decay == pytest.approx(0.7 * shale.porosity_decay + 0.3 * sand.porosity_decay)
+
+    # Same components (in a list, tuple or iterator) return the same shared lithology.
+    assert pybacktrack.create_lithology_from_components((('Shale', 0.7), ('Sand', 0.3)), lithologies) is lithology
+    assert pybacktrack.create_lithology_from_components([['Shale', 0.7], ['Sand', 0.3]], lithologies) is lithology
+    assert pybacktrack.create_lithology_from_components(iter([('Shale', 0.7), ('Sand', 0.3)]), lithologies) is lithology
+
+    with pytest.raises(AttributeError):
+        lithology.density = 0.0
+
+    # Re-reading the same lithologies also returns the same shared lithology.
+    other_lithologies = pybacktrack.read_lithologies_files(pybacktrack.BUNDLE_LITHOLOGY_FILENAMES)
+    assert pybacktrack.create_lithology_from_components([('Shale', 0.7), ('Sand', 0.3)], other_lithologies) is lithology
+
+    # Replacing, or modifying, a lithology in the dictionary is not hidden by the cache.
+    other_lithologies['Sand'] = pybacktrack.Lithology(2000.0, 0.5, 1000.0)
+    assert pybacktrack.create_lithology_from_components([('Shale', 0.7), ('Sand', 0.3)], other_lithologies).density == \
+        pytest.approx(0.7 * shale.density + 0.3 * 2000.0)
+    other_lithologies['Shale'].density += 500.0
+    assert pybacktrack.create_lithology_from_components([('Shale', 0.7), ('Sand', 0.3)], other_lithologies).density == \
+        pytest.approx(0.7 * (shale.density + 500.0) + 0.3 * 2000.0)
+
+    with pytest.raises(KeyError):
+        pybacktrack.create_lithology_from_components([('Unknown', 1.0)], lithologies)
+    with pytest.raises(ValueError):
+        pybacktrack.create_lithology_from_components([('Shale', 0.7), ('Sand', 0.2)], lithologies)
@@ -0,0 +1,50 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import pybacktrack
+import pytest
+import subprocess
+import sys
+
+
+def test_public_api():
+    """Test every name in the public API can be accessed (they are imported lazily)."""
+
+    for name in pybacktrack.__all__:
+        assert getattr(pybacktrack, name) is not None
+        assert name in dir(pybacktrack)
+
+    assert pybacktrack.write_backtrack_well is pybacktrack.backtrack.write_well
+    assert pybacktrack.AGE_TO_DEPTH_DEFAULT_MODEL == pybacktrack.age_to_depth.DEFAULT_MODEL
+
+
+def test_lazy_import():
+    """Test importing a lightweight module does not import the modules (and dependencies) it does not need."""
+
+    # Use a new Python process since the current process has already imported everything.
+    imported_modules = subprocess.check_output([
+        sys.executable, '-c',
+        'import sys, pybacktrack.age_to_depth_cli; print(" ".join(sys.modules))']).decode().split()
+
+    assert 'pybacktrack.age_to_depth' in imported_modules
+    for module in ('pybacktrack.backtrack', 'pybacktrack.paleo_bathymetry', 'pygplates', 'scipy.interpolate', 'scipy.integrate'):
+        assert module not in imported_modules
+
+
+def test_submodule_attributes():
+    """Test submodules can be accessed as attributes after only 'import pybacktrack' (as the supplementary scripts do)."""
+
+    # Use a new Python process since the current process has already imported everything.
+    output = subprocess.check_output([
+        sys.executable, '-c',
+        'import pybacktrack; '
+        'print(pybacktrack.age_to_depth.DEFAULT_MODEL is pybacktrack.AGE_TO_DEPTH_DEFAULT_MODEL, '
+        'callable(pybacktrack.util.call_system_command.call_system_command), '
+        'callable(pybacktrack.backtrack.backtrack_well))']).decode().split()
+    assert output == ['True', 'True', 'True']
+
+    with pytest.raises(AttributeError):
+        pybacktrack.no_such_submodule
+    with pytest.raises(AttributeError):
+        pybacktrack.util.no_such_submodule
@@ -0,0 +1,288 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy as np
+import pytest
+import pybacktrack
+import pybacktrack.paleo_bathymetry as paleo_bathymetry
+import py
+import pygplates
+from pybacktrack.util.checkpoint import Checkpoint
+from pybacktrack.util.spatial_index import LatLonCells
+import random
+
+
+# Test data directory is inside the pybacktrack module.
+TEST_DATA_DIR = py.path.local(__file__).dirpath('test_data')
+
+
+def _exclude_grid_samples_near_trenches_brute_force(grid_samples, threshold_distances_to_trenches_kms):
+    # Test every grid sample against every trench (without a spatial index).
+    subducting_boundary_polygons_dict = {
+        feature.get_feature_id().get_string(): feature.get_geometry(lambda property: True)
+        for feature in pygplates.FeatureCollection(pybacktrack.BUNDLE_SUBDUCTING_BOUNDARIES_FILENAME)}
+    trenches = []
+    for trench_feature in pygplates.FeatureCollection(pybacktrack.BUNDLE_TRENCHES_FILENAME):
+        subducting_boundary_polygon = subducting_boundary_polygons_dict.get(trench_feature.get_shapefile_attribute('subducting_boundary_feature_id'))
+        if not subducting_boundary_polygon:
+            continue
+        trenches.append((
+            trench_feature.get_geometry(lambda property: True),
+            threshold_distances_to_trenches_kms[0] / pygplates.Earth.mean_radius_in_kms,
+            threshold_distances_to_trenches_kms[1] / pygplates.Earth.mean_radius_in_kms,
+            subducting_boundary_polygon))
+
+    included_grid_samples = []
+    for grid_sample in grid_samples:
+        grid_location = pygplates.PointOnSphere(grid_sample[1], grid_sample[0])
+        mask_grid_location = False
+        for trench_geometry, subduction_distance_radians, overriding_distance_radians, subducting_boundary_polygon in trenches:
+            distance = pygplates.GeometryOnSphere.distance(grid_location, trench_geometry)
+            is_on_subducting_side = subducting_boundary_polygon.is_point_in_polygon(grid_location)
+            if ((subduction_distance_radians and distance <= subduction_distance_radians and is_on_subducting_side) or
+                (overriding_distance_radians and distance <= overriding_distance_radians and not is_on_subducting_side)):
+                mask_grid_location = True
+                break
+        if not mask_grid_location:
+            included_grid_samples.append(grid_sample)
+
+    return included_grid_samples
+
+
+def test_exclude_grid_samples_near_trenches():
+    """Test excluding grid samples near trenches (using a spatial index) matches testing against all trenches."""
+
+    # Random points (with a total sediment thickness value) densely covering the western Pacific subduction zones.
+    random.seed(1)
+    grid_samples = [(random.uniform(120.0, 180.0), random.uniform(-50.0, 50.0), 100.0) for _ in range(1000)]
+
+    for threshold_distances_to_trenches_kms in ((300.0, 100.0), (0.0, 500.0)):
+        included_grid_samples = paleo_bathymetry._exclude_grid_samples_near_trenches(
+            grid_samples,
+            pybacktrack.BUNDLE_TRENCHES_FILENAME,
+            pybacktrack.BUNDLE_SUBDUCTING_BOUNDARIES_FILENAME,
+            threshold_distances_to_trenches_kms)
+
+        # Some, but not all, grid samples should have been excluded.
+        assert 0 < len(included_grid_samples) < len(grid_samples)
+
+        assert included_grid_samples == _exclude_grid_samples_near_trenches_brute_force(grid_samples, threshold_distances_to_trenches_kms)
+
+
+def test_trench_exclusion_raster(tmpdir, monkeypatch):
+    """Test the trench exclusion raster only classifies cells as entirely included/excluded when all their points are."""
+
+    # Cache the raster in a temporary directory (provided by pytest 'tmpdir' fixture).
+    monkeypatch.setenv('PYBACKTRACK_CACHE_DIR', str(tmpdir))
+
+    resolution_degrees = 1.0
+    threshold_distances_to_trenches_kms = (300.0, 100.0)
+    trench_exclusion_raster = paleo_bathymetry._get_trench_exclusion_raster(
+        pybacktrack.BUNDLE_TRENCHES_FILENAME,
+        pybacktrack.BUNDLE_SUBDUCTING_BOUNDARIES_FILENAME,
+        threshold_distances_to_trenches_kms,
+        resolution_degrees)
+    assert trench_exclusion_raster.shape == (180, 360)
+
+    # Second time should be loaded from the cache.
+    assert (trench_exclusion_raster == paleo_bathymetry._get_trench_exclusion_raster(
+            pybacktrack.BUNDLE_TRENCHES_FILENAME,
+            pybacktrack.BUNDLE_SUBDUCTING_BOUNDARIES_FILENAME,
+            threshold_distances_to_trenches_kms,
+            resolution_degrees,
+            create_if_not_cached=False)).all()
+
+    random.seed(2)
+    grid_samples = [(random.uniform(120.0, 180.0), random.uniform(-50.0, 50.0), 100.0) for _ in range(2000)]
+    near_trenches = paleo_bathymetry._find_grid_samples_near_trenches(
+        grid_samples,
+        pybacktrack.BUNDLE_TRENCHES_FILENAME,
+        pybacktrack.BUNDLE_SUBDUCTING_BOUNDARIES_FILENAME,
+        threshold_distances_to_trenches_kms)
+
+    row_indices, column_indices = LatLonCells(resolution_degrees).get_cell_indices(
+        [grid_sample[0] for grid_sample in grid_samples],
+        [grid_sample[1] for grid_sample in grid_samples])
+    for near_trench, cell_state in zip(near_trenches, trench_exclusion_raster[row_indices, column_indices]):
+        if cell_state == paleo_bathymetry._TRENCH_EXCLUSION_RASTER_INCLUDED:
+            assert not near_trench
+        elif cell_state == paleo_bathymetry._TRENCH_EXCLUSION_RASTER_EXCLUDED:
+            assert near_trench
+
+
+def test_reconstruct_backtrack_bathymetry_time_windows():
+    """Test the paleo bathymetry generated for each time does not depend on how many times are processed together."""
+
+    lithologies = pybacktrack.read_lithologies_files([pybacktrack.DEFAULT_BUNDLE_LITHOLOGY_FILENAME])
+    lithology_components = [(pybacktrack.DEFAULT_PALEO_BATHYMETRY_LITHOLOGY_NAME, 1.0)]
+
+    # Random oceanic and continental grid samples (with plate ID 701 and random ages, sediment thicknesses, etc).
+    random.seed(4)
+    oceanic_grid_samples = [
+        (random.uniform(-30.0, 30.0), random.uniform(-30.0, 0.0), random.uniform(0.0, 2000.0), random.uniform(1000.0, 6000.0),
+         701, random.uniform(0.0, 30.0))
+        for _ in range(20)]
+    continental_grid_samples = []
+    for _ in range(20):
+        rift_start_age = random.uniform(5.0, 50.0)
+        continental_grid_samples.append(
+            (random.uniform(-30.0, 30.0), random.uniform(-30.0, 0.0), random.uniform(0.0, 3000.0), random.uniform(0.0, 3000.0),
+             701, random.uniform(10.0, 100.0), random.uniform(15000.0, 35000.0), rift_start_age, random.uniform(0.0, rift_start_age)))
+
+    time_range = [float(time) for time in range(0, 31)]
+    oceanic_grid_samples = paleo_bathymetry._prepare_oceanic_grid_samples(
+        oceanic_grid_samples, time_range[-1], pybacktrack.AGE_TO_DEPTH_DEFAULT_MODEL, lithologies, lithology_components)
+    continental_grid_samples = paleo_bathymetry._prepare_continental_grid_samples(
+        continental_grid_samples, time_range[-1], lithologies, lithology_components, None)
+
+    paleo_bathymetry_list = []
+    for times_per_window in (1, 7, len(time_range)):
+        progress = []
+        paleo_bathymetry_list.append(list(paleo_bathymetry._reconstruct_backtrack_bathymetry_time_windows(
+            None,  # no multiprocessing pool
+            oceanic_grid_samples,
+            continental_grid_samples,
+            time_range,
+            times_per_window,
+            pybacktrack.AGE_TO_DEPTH_DEFAULT_MODEL,
+            lithologies,
+            lithology_components,
+            None,  # no dynamic topography
+            None,  # no sea levels
+            pybacktrack.BUNDLE_RECONSTRUCTION_ROTATION_FILENAMES,
+            0,  # anchor plate
+            False,
+            progress_callback=progress.append)))
+        # Progress should increase to completion.
+        assert progress == sorted(progress) and progress[-1] == 1.0
+
+    # Times should be generated in order (from present day).
+    assert [time for time, _ in paleo_bathymetry_list[0]] == time_range
+    # Present day should have bathymetry at all grid samples (as a (N, 3) array of longitude, latitude and bathymetry).
+    assert paleo_bathymetry_list[0][0][1].shape == (len(oceanic_grid_samples) + len(continental_grid_samples), 3)
+
+    for other_paleo_bathymetry in paleo_bathymetry_list[1:]:
+        for (time, paleo_bathymetry_at_time), (other_time, other_paleo_bathymetry_at_time) in zip(paleo_bathymetry_list[0], other_paleo_bathymetry):
+            assert time == other_time
+            assert (paleo_bathymetry_at_time == other_paleo_bathymetry_at_time).all()
+
+
+def test_divide_into_groups_by_cost():
+    """Test grid samples are divided into contiguous groups of roughly equal cost."""
+
+    random.seed(5)
+    grid_samples = list(range(1000))
+    # Costs vary enormously (like the number of time steps of young and old oceanic crust).
+    costs = [random.choice((1, 200)) for _ in grid_samples]
+
+    groups = paleo_bathymetry._divide_into_groups_by_cost(grid_samples, costs, 8)
+
+    # Groups are contiguous and contain all grid samples (in order).
+    assert [grid_sample for group in groups for grid_sample in group] == grid_samples
+    # No group should cost more than its share of the total cost plus the most expensive grid sample.
+    assert max(sum(costs[grid_sample] for grid_sample in group) for group in groups) <= sum(costs) / 8.0 + max(costs)
+
+
+def test_divide_workloads_into_tasks():
+    """Test heterogeneous workloads are divided into tasks in proportion to their cost."""
+
+    large_workload = list(range(900))
+    small_workload = list(range(100))
+    oceanic_tasks, continental_tasks = paleo_bathymetry._divide_workloads_into_tasks(
+        [(sum, large_workload, [1] * len(large_workload)), (len, small_workload, [1] * len(small_workload))],
+        10)
+
+    assert len(oceanic_tasks) == 9 and len(continental_tasks) == 1
+    assert [paleo_bathymetry._run_task(task) for task in continental_tasks] == [len(small_workload)]
+    assert sum(paleo_bathymetry._run_task(task) for task in oceanic_tasks) == sum(large_workload)
+
+
+def test_checkpoint(tmpdir):
+    """Test grid samples and completed times are checkpointed (and only used by a run with the same input parameters)."""
+
+    checkpoint = Checkpoint(str(tmpdir), 'input parameters', 1.0)
+    assert checkpoint.load_arrays(paleo_bathymetry._GRID_SAMPLES_CHECKPOINT_NAME) is None
+    assert checkpoint.load_completed_times() == set()
+
+    # Grid samples (with an integer plate ID in column 4) should survive a round trip through a checkpoint.
+    grid_samples = [(10.5, -20.25, 100.0, 2500.0, 701, 35.5), (-170.0, 60.0, 0.0, 0.0, 101, 120.0)]
+    checkpoint.save_arrays(paleo_bathymetry._GRID_SAMPLES_CHECKPOINT_NAME, {
+        'grid_samples': paleo_bathymetry._grid_samples_to_array(grid_samples, 6)})
+    loaded_grid_samples = paleo_bathymetry._grid_samples_from_array(
+        Checkpoint(str(tmpdir), 'input parameters', 1.0).load_arrays(paleo_bathymetry._GRID_SAMPLES_CHECKPOINT_NAME)['grid_samples'], 4)
+    assert loaded_grid_samples == grid_samples
+    assert all(isinstance(grid_sample[4], int) for grid_sample in loaded_grid_samples)
+
+    checkpoint.add_completed_times([0.0, 1.0])
+    checkpoint.add_completed_times([2.0])
+    assert checkpoint.load_completed_times() == set([0.0, 1.0, 2.0])
+
+    # Different input parameters should not see the checkpoints.
+    assert Checkpoint(str(tmpdir), 'input parameters', 2.0).load_completed_times() == set()
+
+    checkpoint.remove()
+    assert checkpoint.load_completed_times() == set()
+    assert checkpoint.load_arrays(paleo_bathymetry._GRID_SAMPLES_CHECKPOINT_NAME) is None
+
+
+def test_checkpoint_key_item(tmpdir):
+    """Test age-to-depth models read from different curve files have different checkpoint keys (and other functions cannot be keyed)."""
+
+    curve_filenames = [str(tmpdir.join('model1.txt')), str(tmpdir.join('model2.txt'))]
+    for curve_filename, depth in zip(curve_filenames, (2500.0, 3000.0)):
+        with open(curve_filename, 'w') as curve_file:
+            curve_file.write('0 {0}\n100 6000\n'.format(depth))
+    models = [pybacktrack.read_interpolate_function(curve_filename)[0] for curve_filename in curve_filenames]
+
+    key_items = [paleo_bathymetry._get_checkpoint_key_item(model) for model in models]
+    assert key_items[0] != key_items[1]
+    # The same curve file (read again) has the same key.
+    assert paleo_bathymetry._get_checkpoint_key_item(pybacktrack.read_interpolate_function(curve_filenames[0])[0]) == key_items[0]
+    # A different column in the same curve file has a different key.
+    assert paleo_bathymetry._get_checkpoint_key_item(pybacktrack.read_interpolate_function(curve_filenames[0], 1, 0)[0]) != key_items[0]
+
+    with pytest.raises(ValueError):
+        paleo_bathymetry._get_checkpoint_key_item(lambda age: 2500.0 + 350.0 * age ** 0.5)
+
+
+def test_assign_reconstruction_plate_ids():
+    """Test grid samples that are not partitioned (or outside the region plate IDs) are excluded, and plate IDs/ages are returned as arrays."""
+
+    grid_samples = np.array([(10.0, 20.0, 100.0), (30.0, 40.0, 200.0), (50.0, 60.0, 300.0), (70.0, 80.0, 400.0)])
+    reconstruction_plate_ids = [701, 801, 701, 901]
+    partitioning_plate_appearance_ages = [100.0, 200.0, 300.0, 400.0]
+    is_partitioned = [True, True, False, True]
+
+    included_grid_samples, included_plate_ids, included_ages = paleo_bathymetry._assign_reconstruction_plate_ids(
+        grid_samples, reconstruction_plate_ids, partitioning_plate_appearance_ages, is_partitioned)
+    assert (included_grid_samples == grid_samples[[0, 1, 3]]).all()
+    assert included_plate_ids.tolist() == [701, 801, 901]
+    assert included_ages.tolist() == [100.0, 200.0, 400.0]
+
+    included_grid_samples, included_plate_ids, included_ages = paleo_bathymetry._assign_reconstruction_plate_ids(
+        grid_samples, reconstruction_plate_ids, partitioning_plate_appearance_ages, is_partitioned, region_plate_ids=[701, 901])
+    assert (included_grid_samples == grid_samples[[0, 3]]).all()
+    assert included_plate_ids.tolist() == [701, 901]
+    assert included_ages.tolist() == [100.0, 400.0]
+
+
+def test_read_grid_array_empty():
+    """Test sampling a grid at no locations returns an empty array with one more column than the input."""
+
+    for num_columns in (2, 5):
+        assert paleo_bathymetry._read_grid_array(
+            np.empty((0, num_columns)), pybacktrack.BUNDLE_TOTAL_SEDIMENT_THICKNESS_FILENAME).shape == (0, num_columns + 1)
+
+
+def test_generate_lon_lat_points():
+    """Test the global grid of points is a (N, 2) array ordered by latitude then longitude."""
+
+    lon_lat_points = pybacktrack.generate_lon_lat_points(0.7)
+    assert lon_lat_points.shape == (258 * 515, 2)
+
+    expected_lon_lat_points = [(-180 + lon_index * 0.7, -90 + lat_index * 0.7) for lat_index in range(258) for lon_index in range(515)]
+    assert lon_lat_points.tolist() == [list(lon_lat_point) for lon_lat_point in expected_lon_lat_points]
+
+    with pytest.raises(ValueError):
+        pybacktrack.generate_lon_lat_points(0.0)
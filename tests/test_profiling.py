@@ -0,0 +1,134 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import json
+import pybacktrack
+import pybacktrack.paleo_bathymetry as paleo_bathymetry
+import pytest
+from pybacktrack.util.profiling import Profile, add_stage_time, count, get_profile, profiling, stage
+from pybacktrack.util.worker_pool import WORKER_POOL_BACKENDS, WorkerPool
+import random
+
+
+def _count_and_negate(x):
+    with stage('negate'):
+        count('negate.items')
+        count('negate.total', x)
+        return -x
+
+
+def test_profiling(tmpdir):
+    """Test stage times and counters are only recorded when profiling, and are written to a JSON report."""
+
+    # Not profiling, so nothing is recorded.
+    assert get_profile() is None
+    with stage('outer'):
+        count('items', 5)
+    add_stage_time('inner', 1.0)
+    with profiling(enabled=False) as profile:
+        assert profile is None and get_profile() is None
+
+    with profiling() as profile:
+        assert get_profile() is profile
+        for _ in range(3):
+            with stage('outer'):
+                with stage('inner'):
+                    count('items', 5)
+        count('other')
+        # Times summed locally are added to a stage.
+        add_stage_time('local', 2.0, 4)
+    assert get_profile() is None
+
+    assert profile.stages['outer'][0] == 3 and profile.stages['inner'][0] == 3
+    assert profile.stages['local'] == [4, 2.0]
+    # Nested stage times are included in the outer stage.
+    assert profile.stages['outer'][1] >= profile.stages['inner'][1]
+    assert profile.counters == {'items': 15, 'other': 1}
+
+    # Merging adds stage calls, times and counters.
+    other_profile = Profile()
+    other_profile.add_stage_time('inner', 10.0, 2)
+    other_profile.add_count('items', 1)
+    profile.merge(other_profile)
+    assert profile.stages['inner'][0] == 5 and profile.stages['inner'][1] >= 10.0
+    assert profile.counters == {'items': 16, 'other': 1}
+
+    report_filename = str(tmpdir.join('profile_report.json'))
+    profile.write_report(report_filename)
+    with open(report_filename, 'r') as report_file:
+        report = json.load(report_file)
+    # Slowest stage first.
+    assert [stage_report['name'] for stage_report in report['stages']] == ['inner', 'local', 'outer']
+    assert report['stages'][0]['calls'] == 5
+    assert report['counters'] == {'items': 16, 'other': 1}
+    assert report['elapsed_seconds'] >= 0.0
+
+
+@pytest.mark.parametrize('backend', WORKER_POOL_BACKENDS)
+def test_profiling_worker_pool(backend):
+    """Test stage times and counters recorded in worker processes are added to the profile of this process."""
+
+    with WorkerPool(2, backend) as worker_pool:
+        with profiling() as profile:
+            assert worker_pool.map(_count_and_negate, range(10)) == [-x for x in range(10)]
+            assert sorted(worker_pool.imap_unordered(_count_and_negate, range(10))) == sorted(-x for x in range(10))
+            assert worker_pool.starmap(_count_and_negate, [(x,) for x in range(10)]) == [-x for x in range(10)]
+
+        assert profile.stages['negate'][0] == 30
+        assert profile.counters == {'negate.items': 30, 'negate.total': 3 * sum(range(10))}
+
+        # Not profiling, so nothing is returned from the worker processes other than the results.
+        assert worker_pool.map(_count_and_negate, range(10)) == [-x for x in range(10)]
+        assert profile.stages['negate'][0] == 30
+
+
+def test_profiling_paleo_bathymetry():
+    """Test the paleo bathymetry pipeline records its stages and counters (and generates the same bathymetry when profiling)."""
+
+    lithologies = pybacktrack.read_lithologies_files([pybacktrack.DEFAULT_BUNDLE_LITHOLOGY_FILENAME])
+    lithology_components = [(pybacktrack.DEFAULT_PALEO_BATHYMETRY_LITHOLOGY_NAME, 1.0)]
+
+    # Random oceanic grid samples (with plate ID 701 and random ages, sediment thicknesses, etc).
+    random.seed(4)
+    oceanic_grid_samples = [
+        (random.uniform(-30.0, 30.0), random.uniform(-30.0, 0.0), random.uniform(0.0, 2000.0), random.uniform(1000.0, 6000.0),
+         701, random.uniform(0.0, 30.0))
+        for _ in range(10)]
+
+    time_range = [float(time) for time in range(0, 11)]
+
+    def reconstruct_paleo_bathymetry():
+        prepared_oceanic_grid_samples = paleo_bathymetry._prepare_oceanic_grid_samples(
+            oceanic_grid_samples, time_range[-1], pybacktrack.AGE_TO_DEPTH_DEFAULT_MODEL, lithologies, lithology_components)
+        return list(paleo_bathymetry._reconstruct_backtrack_bathymetry_time_windows(
+            None,  # no multiprocessing pool
+            prepared_oceanic_grid_samples,
+            [],  # no continental grid samples
+            time_range,
+            len(time_range),
+            pybacktrack.AGE_TO_DEPTH_DEFAULT_MODEL,
+            lithologies,
+            lithology_components,
+            None,  # no dynamic topography
+            None,  # no sea levels
+            pybacktrack.BUNDLE_RECONSTRUCTION_ROTATION_FILENAMES,
+            0,  # anchor plate
+            False))
+
+    with profiling() as profile:
+        profiled_paleo_bathymetry = reconstruct_paleo_bathymetry()
+    paleo_bathymetry_list = reconstruct_paleo_bathymetry()
+
+    for stage_name in ('decompaction', 'rotation', 'reconstruction'):
+        assert profile.stages[stage_name][0] > 0
+    # Each grid sample is output at each time it exists (ie, not older than its ocean crust age).
+    assert profile.counters['reconstruction.points_out'] == sum(len(paleo_bathymetry_at_time) for _, paleo_bathymetry_at_time in profiled_paleo_bathymetry)
+    # Decompaction times are summed over all grid samples (and times) in each task, but still count each decompaction as a call
+    # (once per grid sample when preparing, and once per grid sample output at each time when reconstructing).
+    assert profile.stages['decompaction'][0] == len(oceanic_grid_samples) + profile.counters['reconstruction.points_out']
+    assert profile.stages['rotation'][0] == profile.counters['reconstruction.points_out']
+
+    for (time, paleo_bathymetry_at_time), (other_time, other_paleo_bathymetry_at_time) in zip(paleo_bathymetry_list, profiled_paleo_bathymetry):
+        assert time == other_time
+        assert (paleo_bathymetry_at_time == other_paleo_bathymetry_at_time).all()
@@ -0,0 +1,116 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy as np
+import py
+import pybacktrack
+from pybacktrack.server import handle_request
+import pytest
+import threading
+import warnings
+
+
+# Test data directory is inside the pybacktrack module.
+TEST_DATA_DIR = py.path.local(__file__).dirpath('test_data')
+
+
+@pytest.fixture
+def server_address():
+    # Listen on an unused port (chosen by the operating system).
+    server = pybacktrack.BacktrackServer(('127.0.0.1', 0))
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.start()
+    
+    yield server.address
+    
+    server.shutdown()
+    server_thread.join()
+    server.close()
+
+
+def test_server(server_address):
+    """Test a backstrip request to the server gives the same result as backstripping in this process."""
+    
+    well_filename = str(TEST_DATA_DIR.join('sunrise_lithology.txt'))
+    lithology_filenames = [pybacktrack.PRIMARY_BUNDLE_LITHOLOGY_FILENAME, pybacktrack.EXTENDED_BUNDLE_LITHOLOGY_FILENAME]
+    
+    with warnings.catch_warnings():
+        # Ignore user warnings related to well thickness being larger than total sediment thickness.
+        warnings.simplefilter("ignore", UserWarning)
+        
+        _, decompaction_result = pybacktrack.backstrip_well(
+            well_filename,
+            lithology_filenames,
+            total_sediment_thickness_filename=None,
+            sea_level_model='Haq87_SealevelCurve_Longterm')
+    
+    with pybacktrack.BacktrackClient(server_address, timeout=60) as client:
+        assert client.ping() == pybacktrack.__version__
+        
+        # Two requests on the same connection.
+        for _ in range(2):
+            result = client.backstrip_well(
+                well_filename,
+                ['age', 'decompacted_thickness', 'average_water_depth', 'lithology'],
+                lithology_filenames=lithology_filenames,
+                total_sediment_thickness_filename=None,
+                sea_level_model='Haq87_SealevelCurve_Longterm')
+            
+            assert np.array_equal(result['columns']['age'], decompaction_result.ages)
+            assert np.array_equal(result['columns']['decompacted_thickness'], decompaction_result.total_decompacted_thicknesses)
+            assert len(result['columns']['lithology']) == len(decompaction_result)
+        
+        # Errors raised in the server are raised in the client (and the connection remains usable).
+        with pytest.raises(ValueError):
+            client.backstrip_well(well_filename, ['unknown column'], lithology_filenames=lithology_filenames, total_sediment_thickness_filename=None)
+        with pytest.raises(TypeError):
+            client.backstrip_well(well_filename, unknown_argument=1)
+        assert client.ping() == pybacktrack.__version__
+
+
+def test_handle_request():
+    """Test invalid requests return an error (instead of raising it)."""
+    
+    response = handle_request({'id': 3, 'method': 'unknown method'})
+    assert response['id'] == 3
+    assert response['error']['type'] == 'ValueError'
+    
+    response = handle_request({'id': 4, 'method': 'paleo_bathymetry', 'params': {'input_points': [(0, 0)], 'use_all_cpus': True}})
+    assert response['error']['type'] == 'ValueError'
+    
+    assert handle_request({'method': 'ping'})['result'] == {'version': pybacktrack.__version__}
+
+
+def test_handle_request_models_and_warnings(tmpdir):
+    """Test lithologies and models stay loaded across requests, and warnings are returned with the response."""
+    
+    import pybacktrack.server
+    
+    # A well file containing a line that cannot be read (and is ignored with a warning).
+    well_filename = tmpdir.join('well.txt')
+    well_filename.write(TEST_DATA_DIR.join('sunrise_lithology.txt').read() + '   110.000    invalid_depth\n')
+    
+    params = {
+        'well_filename': str(well_filename),
+        'lithology_filenames': [pybacktrack.PRIMARY_BUNDLE_LITHOLOGY_FILENAME, pybacktrack.EXTENDED_BUNDLE_LITHOLOGY_FILENAME],
+        'total_sediment_thickness_filename': None,
+        'sea_level_model': 'Haq87_SealevelCurve_Longterm'}
+    
+    with warnings.catch_warnings():
+        # Emit repeated warnings (so both requests return the warning).
+        warnings.simplefilter('always')
+        
+        responses = [handle_request({'method': 'backstrip', 'params': dict(params)}) for _ in range(2)]
+    
+    cached_models = dict(pybacktrack.server._cached_models)
+    assert [response['result'] for response in responses[1:]] == [responses[0]['result']]
+    for response in responses:
+        assert len(response['warnings']) == 1
+        assert response['warnings'][0]['category'] == 'UserWarning'
+        assert 'Ignoring lithology' in response['warnings'][0]['message']
+    
+    # The lithologies and sea level model were loaded by the first request and then used by the second request.
+    assert set(model_name for model_name, _ in cached_models) == set(['lithologies', 'sea_level'])
+    handle_request({'method': 'backstrip', 'params': dict(params)})
+    assert all(pybacktrack.server._cached_models[cache_key] is model for cache_key, model in cached_models.items())
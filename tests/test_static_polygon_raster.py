@@ -0,0 +1,45 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import pybacktrack
+from pybacktrack.util.static_polygon_raster import StaticPolygonRaster, partition_points, partition_points_exactly
+import pygplates
+import random
+
+
+def test_static_polygon_raster(tmpdir, monkeypatch):
+    """Test plate IDs and appearance ages looked up in the static polygon raster match partitioning exactly."""
+
+    # Cache the raster in a temporary directory (provided by pytest 'tmpdir' fixture).
+    monkeypatch.setenv('PYBACKTRACK_CACHE_DIR', str(tmpdir))
+
+    static_polygon_filename = pybacktrack.BUNDLE_RECONSTRUCTION_STATIC_POLYGON_FILENAME
+    rotation_filenames = pybacktrack.BUNDLE_RECONSTRUCTION_ROTATION_FILENAMES
+
+    # Use a coarse resolution so the test runs quickly.
+    resolution_degrees = 2.0
+    assert StaticPolygonRaster.load(static_polygon_filename, rotation_filenames, resolution_degrees) is None
+    StaticPolygonRaster.create(static_polygon_filename, rotation_filenames, resolution_degrees)
+    static_polygon_raster = StaticPolygonRaster.load(static_polygon_filename, rotation_filenames, resolution_degrees)
+    assert static_polygon_raster is not None
+
+    random.seed(3)
+    longitudes = [random.uniform(-180.0, 180.0) for _ in range(2000)]
+    latitudes = [random.uniform(-90.0, 90.0) for _ in range(2000)]
+
+    plate_ids, appearance_ages, is_partitioned = partition_points_exactly(
+        pygplates.PlatePartitioner(static_polygon_filename, rotation_filenames), longitudes, latitudes)
+
+    # Points in cells resolved by the raster should match partitioning exactly.
+    raster_plate_ids, raster_appearance_ages, raster_is_partitioned, raster_is_resolved = static_polygon_raster.lookup(longitudes, latitudes)
+    assert raster_is_resolved.any()
+    assert (raster_plate_ids[raster_is_resolved] == plate_ids[raster_is_resolved]).all()
+    assert (raster_appearance_ages[raster_is_resolved] == appearance_ages[raster_is_resolved]).all()
+    assert (raster_is_partitioned[raster_is_resolved] == is_partitioned[raster_is_resolved]).all()
+
+    # And all points should match when unresolved points are partitioned exactly.
+    for raster_partition, exact_partition in zip(
+            partition_points(static_polygon_filename, rotation_filenames, longitudes, latitudes, resolution_degrees),
+            (plate_ids, appearance_ages, is_partitioned)):
+        assert (raster_partition == exact_partition).all()
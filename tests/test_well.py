@@ -0,0 +1,180 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy as np
+import pybacktrack
+import py
+import pytest
+
+
+# Test data directory is inside the pybacktrack module.
+TEST_DATA_DIR = py.path.local(__file__).dirpath('test_data')
+
+
+def _read_test_well():
+    lithologies = pybacktrack.read_lithologies_files(pybacktrack.BUNDLE_LITHOLOGY_FILENAMES)
+    well = pybacktrack.read_well_file(
+        str(TEST_DATA_DIR.join('ODP-114-699-Lithology.txt')),
+        lithologies,
+        well_attributes={'SiteLongitude': ('longitude', float), 'SiteLatitude': ('latitude', float)})
+    return well, lithologies
+
+
+def test_well_arrays():
+    """Test well arrays (and their unit views) match the stratigraphic units of a well."""
+
+    well, lithologies = _read_test_well()
+    units = well.stratigraphic_units
+    # Add an extra attribute to some of the units.
+    for unit in units[::2]:
+        unit.min_water_depth = 100.0
+
+    well_arrays = pybacktrack.WellArrays.from_stratigraphic_units(units)
+    assert len(well_arrays) == len(units)
+    assert well_arrays.top_depths.tolist() == [unit.top_depth for unit in units]
+    assert well_arrays.decompacted_bottom_depths.tolist() == [unit.decompacted_bottom_depth for unit in units]
+
+    for unit, unit_view in zip(units, well_arrays):
+        for name in ('top_age', 'bottom_age', 'top_depth', 'bottom_depth', 'decompacted_top_depth', 'decompacted_bottom_depth'):
+            assert getattr(unit_view, name) == getattr(unit, name)
+        assert unit_view.lithology is unit.lithology
+        assert unit_view.lithology_components == unit.lithology_components
+        assert unit_view.get_fully_decompacted_thickness() == unit.get_fully_decompacted_thickness()
+        assert unit_view.get_decompacted_sediment_rate() == unit.get_decompacted_sediment_rate()
+        assert unit_view.calc_decompacted_thickness(500.0) == unit.calc_decompacted_thickness(500.0)
+        assert getattr(unit_view, 'min_water_depth', None) == getattr(unit, 'min_water_depth', None)
+    assert well_arrays[-1].bottom_age == units[-1].bottom_age
+    with pytest.raises(IndexError):
+        well_arrays[len(units)]
+
+    # Views are read-only and have no per-instance dict.
+    with pytest.raises(AttributeError):
+        well_arrays[0].top_age = 1.0
+    assert not hasattr(well_arrays[0], '__dict__')
+
+    # Creating well arrays directly from columns should match (to within numerical precision).
+    other_well_arrays = pybacktrack.WellArrays(
+        [unit.top_age for unit in units],
+        [unit.bottom_age for unit in units],
+        [unit.top_depth for unit in units],
+        [unit.bottom_depth for unit in units],
+        [unit.lithology_components for unit in units],
+        lithologies)
+    assert np.allclose(other_well_arrays.fully_decompacted_thicknesses, well_arrays.fully_decompacted_thicknesses)
+    assert np.allclose(other_well_arrays.decompacted_top_depths, well_arrays.decompacted_top_depths)
+    with pytest.raises(ValueError):
+        # Units not contiguous in depth.
+        pybacktrack.WellArrays([0.0, 10.0], [10.0, 20.0], [0.0, 100.0], [90.0, 200.0], [[('Shale', 1.0)]] * 2, lithologies)
+
+    # Well arrays are cached by the well.
+    assert well.get_arrays() is well.get_arrays()
+
+
+def test_well_arrays_decompaction():
+    """Test vectorised decompaction of well arrays matches decompacting each stratigraphic unit."""
+
+    well, _ = _read_test_well()
+    well_arrays = well.get_arrays()
+
+    # Decompact every unit at a range of depths (including a repeated unit).
+    unit_indices = np.repeat(np.arange(len(well_arrays)), 3)
+    decompacted_depths_to_top = np.tile([0.0, 250.0, 2000.0], len(well_arrays))
+
+    decompacted_thicknesses = well_arrays.calc_decompacted_thicknesses(decompacted_depths_to_top, unit_indices)
+    decompacted_densities = well_arrays.calc_decompacted_densities(decompacted_thicknesses, decompacted_depths_to_top, unit_indices)
+
+    for unit_index, decompacted_depth_to_top, decompacted_thickness, decompacted_density in zip(
+            unit_indices, decompacted_depths_to_top, decompacted_thicknesses, decompacted_densities):
+        unit = well.stratigraphic_units[unit_index]
+        expected_decompacted_thickness = unit.calc_decompacted_thickness(decompacted_depth_to_top)
+        assert decompacted_thickness == pytest.approx(expected_decompacted_thickness, rel=1e-9, abs=1e-9)
+        assert decompacted_density == pytest.approx(
+            unit.calc_decompacted_density(expected_decompacted_thickness, decompacted_depth_to_top), rel=1e-9)
+
+
+def test_decompaction_result():
+    """Test decompacting all ages at once matches decompacting each age separately."""
+
+    well, _ = _read_test_well()
+    decompacted_wells = well.decompact()
+
+    decompaction_result = pybacktrack.DecompactionResult(well)
+    assert len(decompaction_result) == len(decompacted_wells)
+    assert decompaction_result.ages.tolist() == [decompacted_well.get_age() for decompacted_well in decompacted_wells]
+    assert np.allclose(decompaction_result.total_decompacted_thicknesses,
+                       [decompacted_well.total_decompacted_thickness for decompacted_well in decompacted_wells])
+    assert np.allclose(decompaction_result.average_decompacted_densities,
+                       [decompacted_well.get_average_decompacted_density() for decompacted_well in decompacted_wells])
+    assert np.allclose(decompaction_result.sediment_isostatic_corrections,
+                       [decompacted_well.get_sediment_isostatic_correction() for decompacted_well in decompacted_wells])
+
+    # Set the optional columns (before accessing any decompacted wells).
+    decompaction_result.tectonic_subsidences = np.linspace(3000.0, 4000.0, len(decompaction_result))
+    decompaction_result.sea_levels = np.linspace(0.0, 50.0, len(decompaction_result))
+    assert decompaction_result.get_dynamic_topographies().tolist() == [0.0] * len(decompaction_result)
+
+    # Decompacted wells are created when accessed (and then cached).
+    assert decompaction_result[-1] is decompaction_result[len(decompaction_result) - 1]
+    assert len(decompaction_result[1:3]) == 2
+    with pytest.raises(IndexError):
+        decompaction_result[len(decompaction_result)]
+
+    water_depths = decompaction_result.get_water_depths()
+    for index, (decompacted_well, expected_decompacted_well) in enumerate(zip(decompaction_result, decompacted_wells)):
+        assert decompacted_well.surface_unit is expected_decompacted_well.surface_unit
+        assert len(decompacted_well.decompacted_stratigraphic_units) == len(expected_decompacted_well.decompacted_stratigraphic_units)
+        assert decompacted_well.total_decompacted_thickness == pytest.approx(expected_decompacted_well.total_decompacted_thickness)
+        assert decompacted_well.get_water_depth() == pytest.approx(water_depths[index])
+
+    # Columns can also be extracted from existing decompacted wells.
+    other_decompaction_result = pybacktrack.DecompactionResult.from_decompacted_wells(decompacted_wells)
+    assert other_decompaction_result[0] is decompacted_wells[0]
+    assert other_decompaction_result.tectonic_subsidences is None
+    assert np.allclose(other_decompaction_result.total_decompacted_thicknesses, decompaction_result.total_decompacted_thicknesses)
+
+
+def test_read_well_files(tmpdir):
+    """Test reading well files (skipping invalid rows) and sharing combined lithologies between units and wells."""
+
+    lithologies = pybacktrack.read_lithologies_files(pybacktrack.BUNDLE_LITHOLOGY_FILENAMES)
+
+    well_filename = str(tmpdir.join('well.txt'))
+    with open(well_filename, 'w') as well_file:
+        well_file.write(
+            '# SiteLongitude = 12.5\n'
+            '# SurfaceAge = 1.5\n'
+            '3.0  30.0  Shale 0.5 Sand 0.5\n'
+            '2.0  20.0  Shale 1.0\n'
+            '4.0\n'
+            '5.0  x     Shale 1.0\n'
+            '6.0  60.0  Shale y\n'
+            '7.0  70.0  Shale 0.5 Sand 0.5\n')
+
+    with pytest.warns(UserWarning):
+        wells = pybacktrack.read_well_files(
+            [well_filename, str(TEST_DATA_DIR.join('ODP-114-699-Lithology.txt')), well_filename],
+            lithologies,
+            well_attributes={'SiteLongitude': ('longitude', float), 'SiteLatitude': ('latitude', float)})
+    well, odp_well, other_well = wells
+
+    assert well.longitude == 12.5
+    assert well.latitude is None
+    units = well.stratigraphic_units
+    assert [(unit.top_age, unit.bottom_age, unit.top_depth, unit.bottom_depth) for unit in units] == [
+        (1.5, 2.0, 0.0, 20.0), (2.0, 3.0, 20.0, 30.0), (3.0, 7.0, 30.0, 70.0)]
+    assert units[1].lithology_components == [('Shale', 0.5), ('Sand', 0.5)]
+    assert units[2].decompacted_top_depth == units[1].decompacted_bottom_depth
+
+    # Units with the same lithology components (in the same or different wells) share the same combined lithology.
+    assert units[1].lithology is units[2].lithology
+    assert other_well.stratigraphic_units[1].lithology is units[1].lithology
+    assert units[0].lithology is not units[1].lithology
+
+    # Should match reading each well file separately.
+    expected_odp_well, _ = _read_test_well()
+    assert len(odp_well.stratigraphic_units) == len(expected_odp_well.stratigraphic_units)
+    for unit, expected_unit in zip(odp_well.stratigraphic_units, expected_odp_well.stratigraphic_units):
+        for name in ('top_age', 'bottom_age', 'top_depth', 'bottom_depth', 'decompacted_top_depth', 'decompacted_bottom_depth'):
+            assert getattr(unit, name) == getattr(expected_unit, name)
+        assert unit.lithology_components == expected_unit.lithology_components
@@ -0,0 +1,104 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy as np
+import pybacktrack
+import py
+import pytest
+
+
+# Test data directory is inside the pybacktrack module.
+TEST_DATA_DIR = py.path.local(__file__).dirpath('test_data')
+
+
+def _assert_wells_equal(well, expected_well):
+    assert (well.longitude, well.latitude) == (expected_well.longitude, expected_well.latitude)
+    assert len(well.stratigraphic_units) == len(expected_well.stratigraphic_units)
+    for unit, expected_unit in zip(well.stratigraphic_units, expected_well.stratigraphic_units):
+        for name in ('top_age', 'bottom_age', 'top_depth', 'bottom_depth', 'decompacted_top_depth', 'decompacted_bottom_depth',
+                     'lithology_components'):
+            assert getattr(unit, name) == getattr(expected_unit, name)
+        assert vars(unit.lithology) == vars(expected_unit.lithology)
+        assert getattr(unit, 'min_water_depth', None) == getattr(expected_unit, 'min_water_depth', None)
+
+
+@pytest.mark.parametrize('mmap', [True, False])
+def test_well_catalogue(tmpdir, mmap):
+    """Test wells accessed from a well catalogue match the wells written to it."""
+
+    lithologies = pybacktrack.read_lithologies_files(pybacktrack.BUNDLE_LITHOLOGY_FILENAMES)
+    well_attributes = {'SiteLongitude': ('longitude', float), 'SiteLatitude': ('latitude', float)}
+
+    odp_well = pybacktrack.read_well_file(
+        str(TEST_DATA_DIR.join('ODP-114-699-Lithology.txt')), lithologies, well_attributes=well_attributes)
+    dsdp_well = pybacktrack.read_well_file(
+        str(TEST_DATA_DIR.join('DSDP-36-327-Lithology.txt')), lithologies, well_attributes=well_attributes)
+    # A well with extra unit attributes (and missing longitude/latitude).
+    sunrise_well = pybacktrack.read_well_file(
+        str(TEST_DATA_DIR.join('sunrise_lithology.txt')), lithologies,
+        lithology_column=4, other_columns={'min_water_depth': 2, 'max_water_depth': 3}, well_attributes=well_attributes)
+    empty_well = pybacktrack.Well({'longitude': None, 'latitude': None})
+    wells = [odp_well, dsdp_well, sunrise_well, empty_well]
+    well_names = ['ODP-114-699', 'DSDP-36-327', 'sunrise', 'empty']
+
+    catalogue_filename = str(tmpdir.join('catalogue.npz'))
+    pybacktrack.write_well_catalogue(catalogue_filename, wells, well_names, ['longitude', 'latitude'])
+
+    catalogue = pybacktrack.WellCatalogue(catalogue_filename, lithologies, mmap=mmap)
+    assert len(catalogue) == len(wells)
+    assert list(catalogue) == well_names
+    assert 'sunrise' in catalogue and 'unknown' not in catalogue
+
+    for well_index, (well_name, expected_well) in enumerate(zip(well_names, wells)):
+        _assert_wells_equal(catalogue.get_well(well_name), expected_well)
+        _assert_wells_equal(catalogue.get_well(well_index), expected_well)
+
+        well_arrays = catalogue.get_well_arrays(well_name)
+        expected_well_arrays = expected_well.get_arrays()
+        assert len(well_arrays) == len(expected_well_arrays)
+        assert well_arrays.bottom_depths.tolist() == expected_well_arrays.bottom_depths.tolist()
+        assert well_arrays.lithology_components == expected_well_arrays.lithology_components
+        assert np.allclose(well_arrays.decompacted_bottom_depths, expected_well_arrays.decompacted_bottom_depths)
+        assert sorted(well_arrays.other_attributes) == ['max_water_depth', 'min_water_depth']
+        if well_name == 'sunrise':
+            assert well_arrays.other_attributes['min_water_depth'].tolist() == \
+                expected_well_arrays.other_attributes['min_water_depth'].tolist()
+        else:
+            assert np.isnan(well_arrays.other_attributes['min_water_depth']).all()
+
+    # Units with the same lithology components (in any well) share the same combined lithology.
+    assert catalogue.get_well('ODP-114-699').stratigraphic_units[0].lithology is \
+        catalogue.get_well('ODP-114-699').stratigraphic_units[0].lithology
+
+    assert catalogue.get_well(-1).stratigraphic_units == []
+    with pytest.raises(KeyError):
+        catalogue.get_well('unknown')
+    with pytest.raises(IndexError):
+        catalogue.get_well(len(wells))
+
+    with pytest.raises(ValueError):
+        # Well names must be unique.
+        pybacktrack.write_well_catalogue(catalogue_filename, wells[:2], ['well', 'well'])
+
+
+def test_create_well_catalogue(tmpdir):
+    """Test converting a directory of well text files to a well catalogue."""
+
+    well_directory = tmpdir.mkdir('wells')
+    for well_filename in ('ODP-114-699-Lithology.txt', 'DSDP-36-327-Lithology.txt'):
+        TEST_DATA_DIR.join(well_filename).copy(well_directory.join(well_filename))
+
+    catalogue_filename = str(tmpdir.join('catalogue.npz'))
+    well_names = pybacktrack.create_well_catalogue(
+        catalogue_filename, str(well_directory), pybacktrack.BUNDLE_LITHOLOGY_FILENAMES)
+    assert well_names == ['DSDP-36-327-Lithology', 'ODP-114-699-Lithology']
+
+    lithologies = pybacktrack.read_lithologies_files(pybacktrack.BUNDLE_LITHOLOGY_FILENAMES)
+    catalogue = pybacktrack.WellCatalogue(catalogue_filename, lithologies)
+    for well_name in well_names:
+        expected_well = pybacktrack.read_well_file(
+            str(well_directory.join(well_name + '.txt')), lithologies,
+            well_attributes=pybacktrack.WELL_CATALOGUE_DEFAULT_WELL_ATTRIBUTES)
+        assert expected_well.longitude is not None
+        _assert_wells_equal(catalogue.get_well(well_name), expected_well)
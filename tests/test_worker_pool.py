@@ -0,0 +1,46 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import pytest
+from pybacktrack.util.worker_pool import WORKER_POOL_BACKENDS, WorkerPool, get_num_cpus, use_worker_pool
+
+
+def _add(x, y):
+    return x + y
+
+
+def _negate(x):
+    return -x
+
+
+@pytest.mark.parametrize('backend', WORKER_POOL_BACKENDS)
+def test_worker_pool(backend):
+    """Test each worker pool backend returns the expected results, and can be reused across map calls."""
+
+    with WorkerPool(2, backend) as worker_pool:
+        assert worker_pool.map(_negate, range(10)) == [-x for x in range(10)]
+        assert worker_pool.starmap(_add, [(x, 2 * x) for x in range(10)]) == [3 * x for x in range(10)]
+        # Results can complete in any order.
+        assert sorted(worker_pool.imap_unordered(_negate, range(10))) == sorted(-x for x in range(10))
+
+
+def test_use_worker_pool():
+    """Test a worker pool is only created when needed (and an existing pool is reused)."""
+
+    with use_worker_pool(None, 1) as worker_pool:
+        assert worker_pool is None
+
+    with WorkerPool(2) as existing_worker_pool:
+        with use_worker_pool(existing_worker_pool, 4) as worker_pool:
+            assert worker_pool is existing_worker_pool
+        # Existing worker pool should not have been closed.
+        assert existing_worker_pool.map(_negate, [1, 2]) == [-1, -2]
+
+    with pytest.raises(ValueError):
+        WorkerPool(2, 'unknown backend')
+
+    assert get_num_cpus(False) == 1
+    assert get_num_cpus(3) == 3
+    with pytest.raises(TypeError):
+        get_num_cpus(-1)
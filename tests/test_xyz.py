@@ -0,0 +1,38 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy as np
+import pytest
+from pybacktrack.util.xyz import XYZ_FORMAT_BINARY, XYZ_FORMAT_PARQUET, XYZ_FORMAT_TEXT, XYZ_FORMATS, read_xyz, write_xyz
+
+
+@pytest.mark.parametrize('xyz_format', XYZ_FORMATS)
+def test_write_xyz(tmpdir, xyz_format):
+    """Test each xyz format reads back the rows written."""
+
+    if xyz_format == XYZ_FORMAT_PARQUET:
+        pytest.importorskip('pyarrow')
+
+    random_state = np.random.RandomState(1)
+    xyz = np.column_stack((
+        random_state.uniform(-180.0, 180.0, 1000),
+        random_state.uniform(-90.0, 90.0, 1000),
+        random_state.uniform(-6000.0, 0.0, 1000)))
+
+    xyz_filename = str(tmpdir.join('points.{0}'.format(xyz_format)))
+    write_xyz(xyz_filename, xyz, xyz_format)
+
+    if xyz_format == XYZ_FORMAT_BINARY:
+        # Binary format is 32-bit floats.
+        assert np.array_equal(read_xyz(xyz_filename), xyz.astype(np.float32))
+    else:
+        assert np.array_equal(read_xyz(xyz_filename), xyz)
+
+    if xyz_format == XYZ_FORMAT_TEXT:
+        # Text should be the same as formatting each value with 'str()'.
+        with open(xyz_filename, 'r') as xyz_file:
+            assert xyz_file.read() == ''.join(' '.join(str(item) for item in row) + '\n' for row in xyz.tolist())
+
+    with pytest.raises(ValueError):
+        write_xyz(xyz_filename, xyz, 'unknown format')